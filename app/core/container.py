@@ -2,18 +2,39 @@ import os
 
 import hvac
 from dependency_injector import containers, providers
-from elasticsearch import Elasticsearch
+from elasticsearch import AsyncElasticsearch, Elasticsearch
 
-from app.domain.repositories.agents import AgentRepository, AgentSettingRepository
-from app.domain.repositories.attachments import AttachmentRepository
-from app.domain.repositories.integrations import IntegrationRepository
+from app.domain.repositories.agents import (
+    AgentRepository,
+    AgentSettingRepository,
+    AsyncAgentRepository,
+    AsyncAgentSettingRepository,
+)
+from app.domain.repositories.attachments import (
+    AsyncAttachmentRepository,
+    AttachmentRepository,
+)
+from app.domain.repositories.integrations import (
+    AsyncIntegrationRepository,
+    IntegrationRepository,
+)
 from app.domain.repositories.language_models import (
+    AsyncLanguageModelRepository,
+    AsyncLanguageModelSettingRepository,
     LanguageModelRepository,
     LanguageModelSettingRepository,
 )
-from app.domain.repositories.messages import MessageRepository
-from app.infrastructure.database.checkpoints import GraphPersistenceFactory
-from app.infrastructure.database.sql import Database
+from app.domain.repositories.messages import AsyncMessageRepository, MessageRepository
+from app.infrastructure.cache.llm_cache import LLMResponseCache
+from app.infrastructure.cache.model_clients import ModelClientCache
+from app.infrastructure.cache.result_cache import ResultCache
+from app.infrastructure.cache.secret_cache import SecretCache
+from app.infrastructure.database.checkpoints import (
+    CheckpointRetention,
+    CheckpointThreads,
+    GraphPersistenceFactory,
+)
+from app.infrastructure.database.sql import AsyncDatabase, Database
 from app.infrastructure.database.vectors import DocumentRepository
 from app.infrastructure.metrics.tracer import Tracer
 from app.interface.mcp.default_tool_registrar import DefaultToolRegistrar
@@ -22,24 +43,38 @@ from app.interface.mcp.financial_analyst_v1_tool_registrar import (
 )
 from app.interface.mcp.news_tool_registrar import NewsToolRegistrar
 from app.interface.mcp.user_prompt_resolver import UserPromptResolver
-from app.services.agent_settings import AgentSettingService
+from app.services.agent_execution import AgentExecutionService
+from app.services.agent_settings import AgentSettingService, AsyncAgentSettingService
 from app.services.agent_types.base import AgentUtils
 from app.services.agent_types.registry import AgentRegistry
 from app.services.agent_types.quaks.insights.financial_analyst.v1.agent import (
     QuaksFinancialAnalystV1Agent,
 )
 from app.services.agent_types.quaks.insights.news.agent import QuaksNewsAnalystAgent
+from app.services.agent_types.quaks.insights.news.curation import NewsCurator
 from app.services.agent_types.test_echo.test_echo_agent import TestEchoAgent
-from app.services.agents import AgentService
-from app.services.attachments import AttachmentService
+from app.services.agents import AgentService, AsyncAgentService
+from app.services.attachments import AsyncAttachmentService, AttachmentService
 from app.services.auth import AuthService
-from app.services.integrations import IntegrationService
-from app.services.language_model_settings import LanguageModelSettingService
-from app.services.language_models import LanguageModelService
-from app.services.markets_insights import MarketsInsightsService
-from app.services.markets_news import MarketsNewsService
-from app.services.markets_stats import MarketsStatsService
-from app.services.messages import MessageService
+from app.services.integrations import AsyncIntegrationService, IntegrationService
+from app.services.language_model_settings import (
+    AsyncLanguageModelSettingService,
+    LanguageModelSettingService,
+)
+from app.services.language_models import (
+    AsyncLanguageModelService,
+    LanguageModelService,
+)
+from app.services.markets_insights import (
+    AsyncMarketsInsightsService,
+    MarketsInsightsService,
+)
+from app.services.markets_news import AsyncMarketsNewsService, MarketsNewsService
+from app.services.markets_stats import (
+    CachedAsyncMarketsStatsService,
+    MarketsStatsService,
+)
+from app.services.messages import AsyncMessageService, MessageService
 from app.services.published_content import PublishedContentService
 from app.services.tasks import TaskNotificationService
 from app.services.waitlist import WaitlistService
@@ -51,10 +86,12 @@ class Container(containers.DeclarativeContainer):
             "app.interface.api.agents.endpoints",
             "app.interface.api.attachments.endpoints",
             "app.interface.api.auth.endpoints",
+            "app.interface.api.cache_control",
             "app.interface.api.integrations.endpoints",
             "app.interface.api.language_models.endpoints",
             "app.interface.api.markets.endpoints",
             "app.interface.api.messages.endpoints",
+            "app.interface.api.status.endpoints",
             "app.interface.api.waitlist.endpoints",
         ]
     )
@@ -107,7 +144,15 @@ class Container(containers.DeclarativeContainer):
             "elasticsearch_api_key"
         ]
 
-    db = providers.Singleton(Database, db_url=config.db.url)
+    db = providers.Singleton(
+        Database,
+        db_url=config.db.url,
+        pool_size=config.db.pool.size,
+        max_overflow=config.db.pool.max_overflow,
+        pool_timeout=config.db.pool.timeout,
+        pool_recycle=config.db.pool.recycle,
+        pool_pre_ping=config.db.pool.pre_ping,
+    )
 
     es = providers.Singleton(
         lambda: Elasticsearch(
@@ -120,14 +165,61 @@ class Container(containers.DeclarativeContainer):
         )
     )
 
+    async_db = providers.Singleton(
+        AsyncDatabase,
+        db_url=config.db.url,
+        pool_size=config.db.pool.size,
+        max_overflow=config.db.pool.max_overflow,
+        pool_timeout=config.db.pool.timeout,
+        pool_recycle=config.db.pool.recycle,
+        pool_pre_ping=config.db.pool.pre_ping,
+    )
+
+    # pooled aiohttp transport shared by the async request handlers
+    async_es = providers.Singleton(
+        lambda: AsyncElasticsearch(
+            hosts=[os.getenv("ELASTICSEARCH_URL")],
+            connections_per_node=int(
+                os.getenv("ELASTICSEARCH_CONNECTIONS_PER_NODE", "25")
+            ),
+            **(
+                {"api_key": os.getenv("ELASTICSEARCH_API_KEY")}
+                if os.getenv("ELASTICSEARCH_API_KEY")
+                else {}
+            ),
+        )
+    )
+
     graph_persistence_factory = providers.Singleton(
         GraphPersistenceFactory, db_checkpoints=config.db.checkpoints
     )
 
+    checkpoint_threads = providers.Singleton(
+        CheckpointThreads,
+        mode=config.agents.checkpoints.thread_mode,
+        rolling_hours=config.agents.checkpoints.rolling_hours,
+    )
+
+    checkpoint_retention = providers.Singleton(
+        CheckpointRetention,
+        pool=graph_persistence_factory.provided.pool,
+        keep_last=config.agents.checkpoints.keep_last,
+        max_age_days=config.agents.checkpoints.max_age_days,
+        interval=config.agents.checkpoints.compaction_interval,
+    )
+
     vault_client = providers.Singleton(
         hvac.Client, url=config.vault.url, token=config.vault.token, verify=False
     )
 
+    secret_cache = providers.Singleton(
+        SecretCache,
+        vault_client=vault_client,
+        ttl=config.cache.secrets.ttl,
+        refresh_ahead=config.cache.secrets.refresh_ahead,
+        max_entries=config.cache.secrets.max_entries,
+    )
+
     document_repository = providers.Factory(
         DocumentRepository, db_url=config.db.vectors
     )
@@ -139,6 +231,7 @@ class Container(containers.DeclarativeContainer):
         realm=config.auth.realm,
         client_id=config.auth.client_id,
         client_secret=config.auth.client_secret,
+        db=db,
     )
 
     markets_insights_service = providers.Factory(
@@ -156,6 +249,31 @@ class Container(containers.DeclarativeContainer):
         es=es,
     )
 
+    async_markets_insights_service = providers.Factory(
+        AsyncMarketsInsightsService,
+        es=async_es,
+    )
+
+    async_markets_news_service = providers.Factory(
+        AsyncMarketsNewsService,
+        es=async_es,
+    )
+
+    markets_result_cache = providers.Singleton(
+        ResultCache,
+        namespace="quaks:markets",
+        redis_url=config.broker.url,
+        shared=config.cache.markets.shared,
+        max_entries=config.cache.markets.max_entries,
+        ttl=config.cache.markets.ttl,
+    )
+
+    async_markets_stats_service = providers.Factory(
+        CachedAsyncMarketsStatsService,
+        es=async_es,
+        result_cache=markets_result_cache,
+    )
+
     published_content_service = providers.Factory(
         PublishedContentService,
         es=es,
@@ -170,11 +288,29 @@ class Container(containers.DeclarativeContainer):
         IntegrationRepository,
         db=db,
         vault_client=vault_client,
+        secret_cache=secret_cache,
+    )
+
+    llm_response_cache = providers.Singleton(
+        LLMResponseCache,
+        namespace="quaks:llm",
+        redis_url=config.broker.url,
+        shared=config.cache.llm.shared,
+        max_entries=config.cache.llm.max_entries,
+        ttl=config.cache.llm.ttl,
+    )
+
+    model_client_cache = providers.Singleton(
+        ModelClientCache,
+        max_entries=config.cache.model_clients.max_entries,
+        binding_ttl=config.cache.model_clients.binding_ttl,
+        client_ttl=config.cache.model_clients.client_ttl,
     )
 
     integration_service = providers.Factory(
         IntegrationService,
         integration_repository=integration_repository,
+        model_client_cache=model_client_cache,
     )
 
     task_notification_service = providers.Factory(
@@ -182,6 +318,16 @@ class Container(containers.DeclarativeContainer):
         redis_url=config.broker.url,
     )
 
+    agent_execution_service = providers.Singleton(
+        AgentExecutionService,
+        task_notification_service=task_notification_service,
+        max_workers=config.agents.execution.workers,
+        queue_size=config.agents.execution.queue_size,
+        per_tenant_limit=config.agents.execution.per_tenant,
+        async_mode=config.agents.execution.async_mode,
+        max_async_tasks=config.agents.execution.async_tasks,
+    )
+
     language_model_setting_repository = providers.Factory(
         LanguageModelSettingRepository,
         db=db,
@@ -211,6 +357,7 @@ class Container(containers.DeclarativeContainer):
         language_model_setting_service=language_model_setting_service,
         integration_service=integration_service,
         vault_client=vault_client,
+        secret_cache=secret_cache,
     )
 
     agent_setting_repository = providers.Factory(AgentSettingRepository, db=db)
@@ -238,6 +385,75 @@ class Container(containers.DeclarativeContainer):
         attachment_service=attachment_service,
     )
 
+    async_integration_repository = providers.Factory(
+        AsyncIntegrationRepository,
+        db=async_db,
+        vault_client=vault_client,
+        secret_cache=secret_cache,
+    )
+
+    async_integration_service = providers.Factory(
+        AsyncIntegrationService,
+        integration_repository=async_integration_repository,
+        model_client_cache=model_client_cache,
+    )
+
+    async_language_model_setting_repository = providers.Factory(
+        AsyncLanguageModelSettingRepository,
+        db=async_db,
+    )
+
+    async_language_model_setting_service = providers.Factory(
+        AsyncLanguageModelSettingService,
+        language_model_setting_repository=async_language_model_setting_repository,
+    )
+
+    async_language_model_repository = providers.Factory(
+        AsyncLanguageModelRepository, db=async_db
+    )
+
+    async_language_model_service = providers.Factory(
+        AsyncLanguageModelService,
+        language_model_repository=async_language_model_repository,
+        language_model_setting_service=async_language_model_setting_service,
+        integration_service=async_integration_service,
+    )
+
+    async_attachment_repository = providers.Factory(
+        AsyncAttachmentRepository, db=async_db
+    )
+
+    async_attachment_service = providers.Factory(
+        AsyncAttachmentService,
+        attachment_repository=async_attachment_repository,
+    )
+
+    async_agent_setting_repository = providers.Factory(
+        AsyncAgentSettingRepository, db=async_db
+    )
+
+    async_agent_setting_service = providers.Factory(
+        AsyncAgentSettingService,
+        agent_setting_repository=async_agent_setting_repository,
+    )
+
+    async_agent_repository = providers.Factory(AsyncAgentRepository, db=async_db)
+
+    async_agent_service = providers.Factory(
+        AsyncAgentService,
+        agent_repository=async_agent_repository,
+        agent_setting_service=async_agent_setting_service,
+        language_model_service=async_language_model_service,
+    )
+
+    async_message_repository = providers.Factory(AsyncMessageRepository, db=async_db)
+
+    async_message_service = providers.Factory(
+        AsyncMessageService,
+        message_repository=async_message_repository,
+        agent_service=async_agent_service,
+    )
+
     agent_utils = providers.Factory(
         AgentUtils,
         config=config,
@@ -248,18 +464,32 @@ class Container(containers.DeclarativeContainer):
         language_model_setting_service=language_model_setting_service,
         integration_service=integration_service,
         vault_client=vault_client,
+        secret_cache=secret_cache,
         graph_persistence_factory=graph_persistence_factory,
+        checkpoint_threads=checkpoint_threads,
+        llm_response_cache=llm_response_cache,
         document_repository=document_repository,
         task_notification_service=task_notification_service,
+        model_client_cache=model_client_cache,
     )
 
     test_echo_agent = providers.Factory(TestEchoAgent, agent_utils=agent_utils)
 
+    news_curator = providers.Singleton(
+        NewsCurator,
+        fetch_size=config.agents.news.fetch_size,
+        token_budget=config.agents.news.token_budget,
+        article_max_tokens=config.agents.news.article_max_tokens,
+        duplicate_distance=config.agents.news.duplicate_distance,
+        source_weights=config.agents.news.source_weights,
+    )
+
     quaks_news_analyst_agent = providers.Factory(
         QuaksNewsAnalystAgent,
         agent_utils=agent_utils,
         markets_news_service=markets_news_service,
         markets_insights_service=markets_insights_service,
+        news_curator=news_curator,
     )
 
     quaks_financial_analyst_v1_agent = providers.Factory(
@@ -267,6 +497,8 @@ class Container(containers.DeclarativeContainer):
         agent_utils=agent_utils,
         markets_stats_service=markets_stats_service,
         markets_news_service=markets_news_service,
+        async_markets_stats_service=async_markets_stats_service,
+        async_markets_news_service=async_markets_news_service,
     )
 
     agent_registry = providers.Singleton(
@@ -71,3 +71,17 @@ class UnauthorizedSkillError(HTTPException):
 
 class PublishedContentNotFoundError(NotFoundError):
     entity_name = "PublishedContent"
+
+
+class TooManyRequestsError(HTTPException):
+    def __init__(self, reason, retry_after: int = 5):
+        super().__init__(
+            status_code=429,
+            detail=f"Too many requests: {reason}",
+            headers={"Retry-After": str(retry_after)},
+        )
+
+
+class NotModifiedError(HTTPException):
+    def __init__(self, headers: dict):
+        super().__init__(status_code=304, detail="Not modified", headers=headers)
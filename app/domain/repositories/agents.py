@@ -1,11 +1,12 @@
 from datetime import datetime
 from uuid import uuid4
 
+from sqlalchemy import delete, select
 from typing_extensions import Iterator
 
 from app.domain.exceptions.base import NotFoundError
 from app.domain.models import Agent, AgentSetting
-from app.infrastructure.database.sql import Database
+from app.infrastructure.database.sql import AsyncDatabase, Database
 
 
 class AgentRepository:
@@ -88,6 +89,75 @@ class AgentRepository:
             session.commit()
 
 
+class AsyncAgentRepository:
+    def __init__(
+        self,
+        db: AsyncDatabase,
+    ) -> None:
+        self.db = db
+
+    async def get_all(self, schema: str) -> list[Agent]:
+        async with self.db.session(schema_name=schema) as session:
+            result = await session.scalars(select(Agent).where(Agent.is_active))
+            return list(result.all())
+
+    async def get_by_id(self, agent_id: str, schema: str) -> Agent:
+        async with self.db.session(schema_name=schema) as session:
+            return await self._get_active(session, agent_id)
+
+    async def add(
+        self, agent_name: str, agent_type: str, language_model_id: str, schema: str
+    ) -> Agent:
+        gen_id = uuid4()
+        async with self.db.session(schema_name=schema) as session:
+            agent = Agent(
+                id=str(gen_id),
+                is_active=True,
+                created_at=datetime.now(),
+                agent_name=agent_name,
+                agent_type=agent_type,
+                agent_summary="",
+                language_model_id=language_model_id,
+            )
+            session.add(agent)
+            await session.commit()
+            await session.refresh(agent)
+            return agent
+
+    async def update_agent(
+        self,
+        agent_id: str,
+        agent_name: str,
+        language_model_id: str,
+        schema: str,
+        agent_summary: str = None,
+    ) -> Agent:
+        async with self.db.session(schema_name=schema) as session:
+            entity = await self._get_active(session, agent_id)
+            entity.agent_name = agent_name
+            entity.language_model_id = language_model_id
+            if agent_summary is not None:
+                entity.agent_summary = agent_summary
+            await session.commit()
+            await session.refresh(entity)
+            return entity
+
+    async def delete_by_id(self, agent_id: str, schema: str) -> None:
+        async with self.db.session(schema_name=schema) as session:
+            entity = await self._get_active(session, agent_id)
+            entity.is_active = False
+            await session.commit()
+
+    @staticmethod
+    async def _get_active(session, agent_id: str) -> Agent:
+        agent = await session.scalar(
+            select(Agent).where(Agent.id == agent_id, Agent.is_active).limit(1)
+        )
+        if not agent:
+            raise AgentNotFoundError(agent_id)
+        return agent
+
+
 class AgentNotFoundError(NotFoundError):
     entity_name: str = "Agent"
 
@@ -148,5 +218,60 @@ class AgentSettingRepository:
             session.commit()
 
 
+class AsyncAgentSettingRepository:
+    def __init__(self, db: AsyncDatabase) -> None:
+        self.db = db
+
+    async def get_all(self, agent_id: str, schema: str) -> list[AgentSetting]:
+        async with self.db.session(schema_name=schema) as session:
+            result = await session.scalars(
+                select(AgentSetting).where(AgentSetting.agent_id == agent_id)
+            )
+            return list(result.all())
+
+    async def add(
+        self, agent_id: str, setting_key: str, setting_value: str, schema: str
+    ) -> AgentSetting:
+        gen_id = uuid4()
+        async with self.db.session(schema_name=schema) as session:
+            agent_setting = AgentSetting(
+                id=str(gen_id),
+                agent_id=agent_id,
+                setting_key=setting_key,
+                setting_value=setting_value,
+            )
+            session.add(agent_setting)
+            await session.commit()
+            await session.refresh(agent_setting)
+            return agent_setting
+
+    async def update_by_key(
+        self, agent_id: str, setting_key: str, setting_value: str, schema: str
+    ) -> AgentSetting:
+        async with self.db.session(schema_name=schema) as session:
+            entity = await session.scalar(
+                select(AgentSetting)
+                .where(
+                    AgentSetting.agent_id == agent_id,
+                    AgentSetting.setting_key == setting_key,
+                )
+                .limit(1)
+            )
+            if not entity:
+                raise AgentSettingNotFoundError(agent_id)
+
+            entity.setting_value = setting_value
+            await session.commit()
+            await session.refresh(entity)
+            return entity
+
+    async def delete_by_agent_id(self, agent_id: str, schema: str) -> None:
+        async with self.db.session(schema_name=schema) as session:
+            await session.execute(
+                delete(AgentSetting).where(AgentSetting.agent_id == agent_id)
+            )
+            await session.commit()
+
+
 class AgentSettingNotFoundError(NotFoundError):
     entity_name: str = "AgentSetting"
@@ -1,11 +1,12 @@
 from datetime import datetime
 from uuid import uuid4
 
+from sqlalchemy import select
 from typing_extensions import Iterator
 
 from app.domain.exceptions.base import NotFoundError
 from app.domain.models import Attachment
-from app.infrastructure.database.sql import Database
+from app.infrastructure.database.sql import AsyncDatabase, Database
 
 
 class AttachmentRepository:
@@ -82,5 +83,73 @@ class AttachmentRepository:
             return entity
 
 
+class AsyncAttachmentRepository:
+    def __init__(self, db: AsyncDatabase) -> None:
+        self.db = db
+
+    async def get_all(self, schema: str) -> list[Attachment]:
+        async with self.db.session(schema_name=schema) as session:
+            result = await session.scalars(
+                select(Attachment).where(Attachment.is_active)
+            )
+            return list(result.all())
+
+    async def get_by_id(self, attachment_id: str, schema: str) -> Attachment:
+        async with self.db.session(schema_name=schema) as session:
+            return await self._get_active(session, attachment_id)
+
+    async def add(
+        self,
+        file_name: str,
+        raw_content: bytes,
+        parsed_content: str,
+        schema: str,
+        attachment_id: str = None,
+    ) -> Attachment:
+        if attachment_id is None:
+            attachment_id = str(uuid4())
+
+        async with self.db.session(schema_name=schema) as session:
+            attachment = Attachment(
+                id=attachment_id,
+                is_active=True,
+                created_at=datetime.now(),
+                file_name=file_name,
+                raw_content=raw_content,
+                parsed_content=parsed_content,
+            )
+            session.add(attachment)
+            await session.commit()
+            await session.refresh(attachment)
+            return attachment
+
+    async def delete_by_id(self, attachment_id: str, schema: str) -> None:
+        async with self.db.session(schema_name=schema) as session:
+            entity = await self._get_active(session, attachment_id)
+            await session.delete(entity)
+            await session.commit()
+
+    async def update_attachment(
+        self, attachment_id: str, embeddings_collection: str, schema: str
+    ) -> Attachment:
+        async with self.db.session(schema_name=schema) as session:
+            entity = await self._get_active(session, attachment_id)
+            entity.embeddings_collection = embeddings_collection
+            await session.commit()
+            await session.refresh(entity)
+            return entity
+
+    @staticmethod
+    async def _get_active(session, attachment_id: str) -> Attachment:
+        attachment = await session.scalar(
+            select(Attachment)
+            .where(Attachment.id == attachment_id, Attachment.is_active)
+            .limit(1)
+        )
+        if not attachment:
+            raise AttachmentNotFoundError(attachment_id)
+        return attachment
+
+
 class AttachmentNotFoundError(NotFoundError):
     entity_name: str = "Attachment"
@@ -1,12 +1,15 @@
+import asyncio
 from datetime import datetime
 from uuid import uuid4
 
 import hvac
+from sqlalchemy import select
 from typing_extensions import Iterator
 
 from app.domain.exceptions.base import NotFoundError
 from app.domain.models import Integration
-from app.infrastructure.database.sql import Database
+from app.infrastructure.cache.secret_cache import SecretCache
+from app.infrastructure.database.sql import AsyncDatabase, Database
 
 
 class IntegrationRepository:
@@ -14,9 +17,11 @@ class IntegrationRepository:
         self,
         db: Database,
         vault_client: hvac.Client,
+        secret_cache: SecretCache | None = None,
     ) -> None:
         self.db = db
         self.vault_client = vault_client
+        self.secret_cache = secret_cache
 
     def get_all(self, schema: str) -> Iterator[Integration]:
         with self.db.session(schema_name=schema) as session:
@@ -37,10 +42,12 @@ class IntegrationRepository:
         self, integration_type: str, api_endpoint: str, api_key: str, schema: str
     ) -> Integration:
         gen_id = uuid4()
+        secret = {"api_endpoint": api_endpoint, "api_key": api_key}
         self.vault_client.secrets.kv.v2.create_or_update_secret(
-            path=f"integration_{gen_id}",
-            secret={"api_endpoint": api_endpoint, "api_key": api_key},
+            path=f"integration_{gen_id}", secret=secret
         )
+        if self.secret_cache is not None:
+            self.secret_cache.put(f"integration_{gen_id}", secret)
 
         with self.db.session(schema_name=schema) as session:
             integration = Integration(
@@ -68,5 +75,71 @@ class IntegrationRepository:
             session.commit()
 
 
+class AsyncIntegrationRepository:
+    def __init__(
+        self,
+        db: AsyncDatabase,
+        vault_client: hvac.Client,
+        secret_cache: SecretCache | None = None,
+    ) -> None:
+        self.db = db
+        self.vault_client = vault_client
+        self.secret_cache = secret_cache
+
+    async def get_all(self, schema: str) -> list[Integration]:
+        async with self.db.session(schema_name=schema) as session:
+            result = await session.scalars(
+                select(Integration).where(Integration.is_active)
+            )
+            return list(result.all())
+
+    async def get_by_id(self, integration_id: str, schema: str) -> Integration:
+        async with self.db.session(schema_name=schema) as session:
+            return await self._get_active(session, integration_id)
+
+    async def add(
+        self, integration_type: str, api_endpoint: str, api_key: str, schema: str
+    ) -> Integration:
+        gen_id = uuid4()
+        secret = {"api_endpoint": api_endpoint, "api_key": api_key}
+        # hvac is synchronous; keep the Vault round trip off the event loop
+        await asyncio.to_thread(
+            self.vault_client.secrets.kv.v2.create_or_update_secret,
+            path=f"integration_{gen_id}",
+            secret=secret,
+        )
+        if self.secret_cache is not None:
+            self.secret_cache.put(f"integration_{gen_id}", secret)
+
+        async with self.db.session(schema_name=schema) as session:
+            integration = Integration(
+                id=str(gen_id),
+                created_at=datetime.now(),
+                is_active=True,
+                integration_type=integration_type,
+            )
+            session.add(integration)
+            await session.commit()
+            await session.refresh(integration)
+            return integration
+
+    async def delete_by_id(self, integration_id: str, schema: str) -> None:
+        async with self.db.session(schema_name=schema) as session:
+            entity = await self._get_active(session, integration_id)
+            entity.is_active = False
+            await session.commit()
+
+    @staticmethod
+    async def _get_active(session, integration_id: str) -> Integration:
+        integration = await session.scalar(
+            select(Integration)
+            .where(Integration.id == integration_id, Integration.is_active)
+            .limit(1)
+        )
+        if not integration:
+            raise IntegrationNotFoundError(integration_id)
+        return integration
+
+
 class IntegrationNotFoundError(NotFoundError):
     entity_name: str = "Integration"
@@ -1,11 +1,12 @@
 from datetime import datetime
 from uuid import uuid4
 
+from sqlalchemy import select
 from typing_extensions import Iterator
 
 from app.domain.exceptions.base import NotFoundError
 from app.domain.models import LanguageModel, LanguageModelSetting
-from app.infrastructure.database.sql import Database
+from app.infrastructure.database.sql import AsyncDatabase, Database
 
 
 class LanguageModelRepository:
@@ -83,6 +84,74 @@ class LanguageModelRepository:
             session.commit()
 
 
+class AsyncLanguageModelRepository:
+    def __init__(
+        self,
+        db: AsyncDatabase,
+    ) -> None:
+        self.db = db
+
+    async def get_all(self, schema: str) -> list[LanguageModel]:
+        async with self.db.session(schema_name=schema) as session:
+            result = await session.scalars(
+                select(LanguageModel).where(LanguageModel.is_active)
+            )
+            return list(result.all())
+
+    async def get_by_id(self, language_model_id: str, schema: str) -> LanguageModel:
+        async with self.db.session(schema_name=schema) as session:
+            return await self._get_active(session, language_model_id)
+
+    async def add(
+        self, integration_id: str, language_model_tag: str, schema: str
+    ) -> LanguageModel:
+        gen_id = uuid4()
+        async with self.db.session(schema_name=schema) as session:
+            language_model = LanguageModel(
+                id=str(gen_id),
+                is_active=True,
+                created_at=datetime.now(),
+                integration_id=integration_id,
+                language_model_tag=language_model_tag,
+            )
+            session.add(language_model)
+            await session.commit()
+            await session.refresh(language_model)
+            return language_model
+
+    async def update_language_model(
+        self,
+        language_model_id: str,
+        language_model_tag: str,
+        integration_id: str,
+        schema: str,
+    ) -> LanguageModel:
+        async with self.db.session(schema_name=schema) as session:
+            entity = await self._get_active(session, language_model_id)
+            entity.language_model_tag = language_model_tag
+            entity.integration_id = integration_id
+            await session.commit()
+            await session.refresh(entity)
+            return entity
+
+    async def delete_by_id(self, language_model_id: str, schema: str) -> None:
+        async with self.db.session(schema_name=schema) as session:
+            entity = await self._get_active(session, language_model_id)
+            entity.is_active = False
+            await session.commit()
+
+    @staticmethod
+    async def _get_active(session, language_model_id: str) -> LanguageModel:
+        language_model = await session.scalar(
+            select(LanguageModel)
+            .where(LanguageModel.id == language_model_id, LanguageModel.is_active)
+            .limit(1)
+        )
+        if not language_model:
+            raise LanguageModelNotFoundError(language_model_id)
+        return language_model
+
+
 class LanguageModelNotFoundError(NotFoundError):
     entity_name: str = "LanguageModel"
 
@@ -136,5 +205,55 @@ class LanguageModelSettingRepository:
             return entity
 
 
+class AsyncLanguageModelSettingRepository:
+    def __init__(self, db: AsyncDatabase) -> None:
+        self.db = db
+
+    async def get_all(self, model_id: str, schema: str) -> list[LanguageModelSetting]:
+        async with self.db.session(schema_name=schema) as session:
+            result = await session.scalars(
+                select(LanguageModelSetting).where(
+                    LanguageModelSetting.language_model_id == model_id
+                )
+            )
+            return list(result.all())
+
+    async def add(
+        self, language_model_id: str, setting_key: str, setting_value: str, schema: str
+    ) -> LanguageModelSetting:
+        gen_uid = uuid4()
+        async with self.db.session(schema_name=schema) as session:
+            language_model_settings = LanguageModelSetting(
+                id=str(gen_uid),
+                language_model_id=language_model_id,
+                setting_key=setting_key,
+                setting_value=setting_value,
+            )
+            session.add(language_model_settings)
+            await session.commit()
+            await session.refresh(language_model_settings)
+            return language_model_settings
+
+    async def update_by_key(
+        self, language_model_id: str, setting_key: str, setting_value: str, schema: str
+    ) -> LanguageModelSetting:
+        async with self.db.session(schema_name=schema) as session:
+            entity = await session.scalar(
+                select(LanguageModelSetting)
+                .where(
+                    LanguageModelSetting.language_model_id == language_model_id,
+                    LanguageModelSetting.setting_key == setting_key,
+                )
+                .limit(1)
+            )
+            if not entity:
+                raise LanguageModelNotFoundError(language_model_id)
+
+            entity.setting_value = setting_value
+            await session.commit()
+            await session.refresh(entity)
+            return entity
+
+
 class LanguageModelSettingNotFoundError(NotFoundError):
     entity_name: str = "LanguageModelSetting"
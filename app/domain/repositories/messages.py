@@ -1,11 +1,12 @@
 from datetime import datetime
 from uuid import uuid4
 
+from sqlalchemy import select
 from typing_extensions import Iterator
 
 from app.domain.exceptions.base import NotFoundError
 from app.domain.models import Message
-from app.infrastructure.database.sql import Database
+from app.infrastructure.database.sql import AsyncDatabase, Database
 
 
 class MessageRepository:
@@ -73,5 +74,64 @@ class MessageRepository:
             session.commit()
 
 
+class AsyncMessageRepository:
+    def __init__(self, db: AsyncDatabase) -> None:
+        self.db = db
+
+    async def get_all(self, agent_id: str, schema: str) -> list[Message]:
+        async with self.db.session(schema_name=schema) as session:
+            result = await session.scalars(
+                select(Message).where(Message.agent_id == agent_id, Message.is_active)
+            )
+            return list(result.all())
+
+    async def get_by_id(self, message_id: str, schema: str) -> Message:
+        async with self.db.session(schema_name=schema) as session:
+            return await self._get_active(session, message_id)
+
+    async def add(
+        self,
+        message_content: str,
+        message_role: str,
+        agent_id: str,
+        schema: str,
+        response_data: dict = None,
+        attachment_id: str = None,
+        replies_to: Message = None,
+    ) -> Message:
+        gen_id = uuid4()
+        async with self.db.session(schema_name=schema) as session:
+            message = Message(
+                id=str(gen_id),
+                is_active=True,
+                created_at=datetime.now(),
+                message_role=message_role,
+                message_content=message_content,
+                agent_id=agent_id,
+                response_data=response_data,
+                attachment_id=attachment_id,
+                replies_to=replies_to.id if replies_to is not None else None,
+            )
+            session.add(message)
+            await session.commit()
+            await session.refresh(message)
+            return message
+
+    async def delete_by_id(self, message_id: str, schema: str) -> None:
+        async with self.db.session(schema_name=schema) as session:
+            entity = await self._get_active(session, message_id)
+            entity.is_active = False
+            await session.commit()
+
+    @staticmethod
+    async def _get_active(session, message_id: str) -> Message:
+        message = await session.scalar(
+            select(Message).where(Message.id == message_id, Message.is_active).limit(1)
+        )
+        if not message:
+            raise MessageNotFoundError(message_id)
+        return message
+
+
 class MessageNotFoundError(NotFoundError):
     entity_name: str = "Message"
@@ -0,0 +1,167 @@
+import hashlib
+import logging
+import threading
+import time
+
+import redis
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.load import dumps, loads
+from typing_extensions import Any
+
+from app.infrastructure.cache.result_cache import LRUCache
+
+
+class LLMResponseCache(BaseCache):
+    """
+    Exact-match cache of chat model responses, attached to the chat models of
+    agents that opt in.
+
+    LangChain hands every lookup the serialized messages and a string of the
+    model's configuration, which covers the model tag, its parameters and any
+    bound tools, so both go into the key. Chat models are given a `scoped` view,
+    whose scope (the tenant schema and integration) goes into the key as well, so
+    tenants never read each other's responses. Entries live in a per-process LRU and,
+    when `shared`, in Redis too, where an index of insertion times trims the
+    oldest entries past `max_entries`. Every entry expires after `ttl` seconds.
+    """
+
+    def __init__(
+        self,
+        namespace: str = "quaks:llm",
+        redis_url: str | None = None,
+        shared: bool | None = None,
+        max_entries: int | None = None,
+        ttl: int | None = None,
+    ) -> None:
+        self.namespace = namespace
+        self.ttl = ttl or 86400
+        self.max_entries = max_entries or 1024
+        self.index_key = f"{namespace}:index"
+        self.logger = logging.getLogger(__name__)
+        self.local = LRUCache(self.max_entries, self.ttl)
+        self.redis = redis.Redis.from_url(redis_url) if shared and redis_url else None
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._saved_tokens = 0
+        self._scopes: dict[str, ScopedLLMResponseCache] = {}
+
+    def scoped(self, scope: str) -> "ScopedLLMResponseCache":
+        """The view of this cache whose entries are only visible within `scope`."""
+        with self._lock:
+            view = self._scopes.get(scope)
+            if view is None:
+                view = self._scopes[scope] = ScopedLLMResponseCache(self, scope)
+            return view
+
+    def key(self, prompt: str, llm_string: str, scope: str = "") -> str:
+        digest = hashlib.sha256(f"{scope}\0{llm_string}\0{prompt}".encode()).hexdigest()
+        return f"{self.namespace}:{digest}"
+
+    def lookup(
+        self, prompt: str, llm_string: str, scope: str = ""
+    ) -> RETURN_VAL_TYPE | None:
+        key = self.key(prompt, llm_string, scope)
+        generations = self.local.get(key)
+        if generations is None:
+            generations = self._get_shared(key)
+            if generations is not None:
+                self.local.set(key, generations)
+
+        with self._lock:
+            if generations is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._saved_tokens += sum(
+                    _total_tokens(generation) for generation in generations
+                )
+        return generations
+
+    def update(
+        self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE, scope: str = ""
+    ) -> None:
+        key = self.key(prompt, llm_string, scope)
+        self.local.set(key, return_val)
+        self._set_shared(key, return_val)
+
+    def clear(self, **kwargs: Any) -> None:
+        self.local.clear()
+        if self.redis is None:
+            return
+        try:
+            keys = self.redis.zrange(self.index_key, 0, -1)
+            self.redis.delete(self.index_key, *keys)
+        except Exception as e:
+            self.logger.warning(f"LLM cache -> shared clear failed: {e}")
+
+    def metrics(self) -> dict:
+        with self._lock:
+            counters = {
+                "hits": self._hits,
+                "misses": self._misses,
+                "saved_tokens": self._saved_tokens,
+            }
+        return {
+            **counters,
+            "local_entries": len(self.local),
+            "shared": self.redis is not None,
+        }
+
+    def close(self) -> None:
+        if self.redis is not None:
+            self.redis.close()
+
+    def _get_shared(self, key: str) -> RETURN_VAL_TYPE | None:
+        if self.redis is None:
+            return None
+        try:
+            cached = self.redis.get(key)
+            return None if cached is None else loads(cached.decode())
+        except Exception as e:
+            self.logger.warning(f"LLM cache -> shared read failed: {e}")
+            return None
+
+    def _set_shared(self, key: str, generations: RETURN_VAL_TYPE) -> None:
+        if self.redis is None:
+            return
+        now = time.time()
+        try:
+            pipeline = self.redis.pipeline()
+            pipeline.set(key, dumps(generations), ex=self.ttl)
+            pipeline.zadd(self.index_key, {key: now})
+            pipeline.zremrangebyscore(self.index_key, "-inf", now - self.ttl)
+            pipeline.zcard(self.index_key)
+            *_, size = pipeline.execute()
+            if size > self.max_entries:
+                evicted = [
+                    member
+                    for member, _ in self.redis.zpopmin(
+                        self.index_key, size - self.max_entries
+                    )
+                ]
+                self.redis.delete(*evicted)
+        except Exception as e:
+            self.logger.warning(f"LLM cache -> shared write failed: {e}")
+
+
+class ScopedLLMResponseCache(BaseCache):
+    """A scope's view of an `LLMResponseCache`; `clear` still empties the whole cache."""
+
+    def __init__(self, cache: LLMResponseCache, scope: str) -> None:
+        self.cache = cache
+        self.scope = scope
+
+    def lookup(self, prompt: str, llm_string: str) -> RETURN_VAL_TYPE | None:
+        return self.cache.lookup(prompt, llm_string, self.scope)
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        self.cache.update(prompt, llm_string, return_val, self.scope)
+
+    def clear(self, **kwargs: Any) -> None:
+        self.cache.clear(**kwargs)
+
+
+def _total_tokens(generation) -> int:
+    usage = getattr(getattr(generation, "message", None), "usage_metadata", None) or {}
+    return usage.get("total_tokens", 0)
@@ -0,0 +1,130 @@
+import hashlib
+import threading
+from dataclasses import dataclass
+
+from typing_extensions import Callable, Hashable, TypeVar
+
+from app.infrastructure.cache.result_cache import LRUCache
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class ModelBinding:
+    """The language model and integration an agent is configured to use."""
+
+    language_model_id: str
+    language_model_tag: str
+    integration_id: str
+    integration_type: str
+
+
+class ModelClientCache:
+    """
+    Process-wide cache of what an agent needs to reach its language model:
+
+    - bindings: agent -> language model -> integration lookups, per (schema, agent id),
+      along with the agent's response cache opt-in
+    - clients: chat, embeddings and SDK clients, per (integration id, kind, model tag)
+      and a fingerprint of the credentials, so rotated keys build a new client
+
+    Credentials themselves come from the `SecretCache`. Reusing a client also reuses
+    its HTTP connection pool. Both tiers expire on their own TTL, and
+    `invalidate_integration` drops whatever was derived from a deleted integration
+    right away.
+    """
+
+    def __init__(
+        self,
+        max_entries: int | None = None,
+        binding_ttl: int | None = None,
+        client_ttl: int | None = None,
+    ) -> None:
+        max_entries = max_entries or 256
+        self.bindings = LRUCache(max_entries, binding_ttl or 60)
+        self.clients = LRUCache(max_entries, client_ttl or 3600)
+        self._lock = threading.Lock()
+        self._loading: dict[tuple[int, Hashable], threading.Lock] = {}
+        self._hits = 0
+        self._misses = 0
+
+    def binding(
+        self, schema: str, agent_id: str, loader: Callable[[], ModelBinding]
+    ) -> ModelBinding:
+        return self._get_or_create(self.bindings, (schema, agent_id), loader)
+
+    def embeddings_model_name(
+        self, schema: str, language_model_id: str, loader: Callable[[], str]
+    ) -> str:
+        return self._get_or_create(
+            self.bindings, ("embeddings", schema, language_model_id), loader
+        )
+
+    def response_cache_enabled(
+        self, schema: str, agent_id: str, loader: Callable[[], bool]
+    ) -> bool:
+        return self._get_or_create(
+            self.bindings, ("response_cache", schema, agent_id), loader
+        )
+
+    def client(
+        self,
+        integration_id: str,
+        kind: str,
+        model_tag: str | None,
+        credentials: tuple[str, str],
+        factory: Callable[[], T],
+    ) -> T:
+        fingerprint = hashlib.sha256(
+            "\0".join(map(str, credentials)).encode()
+        ).hexdigest()[:16]
+        return self._get_or_create(
+            self.clients, (integration_id, kind, model_tag, fingerprint), factory
+        )
+
+    def invalidate_integration(self, integration_id: str) -> None:
+        self.clients.discard(lambda key, _: key[0] == integration_id)
+        self.bindings.discard(
+            lambda _, value: isinstance(value, ModelBinding)
+            and value.integration_id == integration_id
+        )
+
+    def clear(self) -> None:
+        self.bindings.clear()
+        self.clients.clear()
+
+    def metrics(self) -> dict:
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "bindings": len(self.bindings),
+            "clients": len(self.clients),
+        }
+
+    def _get_or_create(
+        self, tier: LRUCache, key: Hashable, factory: Callable[[], T]
+    ) -> T:
+        value = tier.get(key, _MISSING)
+        if value is not _MISSING:
+            self._hits += 1
+            return value
+
+        # one loader per key; callers missing on the same key wait for it
+        loading_key = (id(tier), key)
+        with self._lock:
+            loading = self._loading.setdefault(loading_key, threading.Lock())
+        with loading:
+            value = tier.get(key, _MISSING)
+            if value is not _MISSING:
+                self._hits += 1
+                return value
+            try:
+                self._misses += 1
+                value = factory()
+                tier.set(key, value)
+                return value
+            finally:
+                with self._lock:
+                    self._loading.pop(loading_key, None)
@@ -0,0 +1,195 @@
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+import redis.asyncio as redis
+from typing_extensions import Any, Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+
+class LRUCache:
+    """Thread-safe in-process LRU with a per-entry time to live."""
+
+    def __init__(self, max_entries: int, ttl: float) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, predicate: Callable[[Hashable, Any], bool]) -> int:
+        """Drop every entry for which `predicate(key, value)` holds; returns how many were dropped."""
+        with self._lock:
+            stale = [
+                key
+                for key, (_, value) in self._entries.items()
+                if predicate(key, value)
+            ]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ResultCache:
+    """
+    Two-tier cache for read-only query results: a per-process LRU in front of an
+    optional Redis tier shared by all API replicas.
+
+    Keys embed the current data generation, so bumping the generation counter in
+    Redis (done by the ingestion DAGs after a successful bulk load) invalidates
+    both tiers at once. The generation also rolls over every `ttl` seconds, which
+    bounds staleness when no one bumps it.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        redis_url: str | None = None,
+        shared: bool | None = None,
+        max_entries: int | None = None,
+        ttl: int | None = None,
+        generation_refresh: int | None = None,
+    ) -> None:
+        self.namespace = namespace
+        self.ttl = ttl or 3600
+        self.generation_key = f"{namespace}:generation"
+        self.generation_refresh = generation_refresh or 30
+        self.logger = logging.getLogger(__name__)
+        self.local = LRUCache(max_entries or 1024, self.ttl)
+        self.redis = redis.Redis.from_url(redis_url) if shared and redis_url else None
+        self._counter = "0"
+        self._counter_checked_at = float("-inf")
+        self._in_flight: dict[str, asyncio.Future] = {}
+        self._hits = 0
+        self._misses = 0
+
+    async def generation(self) -> str:
+        """Identifier of the data currently served; changes whenever cached results may be stale."""
+        if (
+            self.redis is not None
+            and time.monotonic() - self._counter_checked_at >= self.generation_refresh
+        ):
+            self._counter_checked_at = time.monotonic()
+            try:
+                counter = await self.redis.get(self.generation_key)
+                self._counter = counter.decode() if counter else "0"
+            except Exception as e:
+                self.logger.warning(f"Result cache -> generation lookup failed: {e}")
+        return f"{self._counter}.{int(time.time() // self.ttl)}"
+
+    async def bump_generation(self) -> None:
+        if self.redis is not None:
+            await self.redis.incr(self.generation_key)
+        self._counter_checked_at = float("-inf")
+        self.local.clear()
+
+    def key(self, generation: str, method: str, params: dict) -> str:
+        normalized = json.dumps(
+            params, sort_keys=True, separators=(",", ":"), default=str
+        )
+        digest = hashlib.sha256(normalized.encode()).hexdigest()[:32]
+        return f"{self.namespace}:{generation}:{method}:{digest}"
+
+    async def get_or_load(
+        self, method: str, loader: Callable[..., Awaitable[T]], **params
+    ) -> T:
+        """
+        Return the cached result of `loader(**params)`, loading it on a miss.
+        Concurrent misses for the same key share a single load.
+        """
+        key = self.key(await self.generation(), method, params)
+
+        value = self.local.get(key, _MISSING)
+        if value is not _MISSING:
+            self._hits += 1
+            return value
+
+        pending = self._in_flight.get(key)
+        if pending is not None:
+            self._hits += 1
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            value = await self._get_shared(key)
+            if value is _MISSING:
+                self._misses += 1
+                value = await loader(**params)
+                await self._set_shared(key, value)
+            else:
+                self._hits += 1
+            self.local.set(key, value)
+            future.set_result(value)
+            return value
+        except Exception as e:
+            future.set_exception(e)
+            # consumed here so an unawaited future does not log a warning
+            future.exception()
+            raise
+        finally:
+            if not future.done():
+                future.cancel()
+            del self._in_flight[key]
+
+    def metrics(self) -> dict:
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "local_entries": len(self.local),
+            "shared": self.redis is not None,
+        }
+
+    async def aclose(self) -> None:
+        if self.redis is not None:
+            await self.redis.aclose()
+
+    async def _get_shared(self, key: str):
+        if self.redis is None:
+            return _MISSING
+        try:
+            cached = await self.redis.get(key)
+        except Exception as e:
+            self.logger.warning(f"Result cache -> shared read failed: {e}")
+            return _MISSING
+        return _MISSING if cached is None else json.loads(cached)
+
+    async def _set_shared(self, key: str, value) -> None:
+        if self.redis is None:
+            return
+        try:
+            await self.redis.set(key, json.dumps(value, default=str), ex=self.ttl)
+        except Exception as e:
+            self.logger.warning(f"Result cache -> shared write failed: {e}")
@@ -0,0 +1,147 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+
+import hvac
+
+
+@dataclass
+class _CachedSecret:
+    data: dict
+    refresh_at: float
+    expires_at: float
+
+
+class SecretCache:
+    """
+    Read-through cache of Vault KV v2 secrets.
+
+    Hot reads are served from memory. Once an entry enters the last
+    `refresh_ahead` seconds of its lifetime it is re-read on a background thread
+    while callers keep getting the cached value, so Vault is only on the request
+    path for cold or expired paths. Concurrent misses for the same path share a
+    single read. The lifetime is the secret's lease when Vault sets one and `ttl`
+    otherwise.
+    """
+
+    def __init__(
+        self,
+        vault_client: hvac.Client,
+        ttl: int | None = None,
+        refresh_ahead: int | None = None,
+        max_entries: int | None = None,
+    ) -> None:
+        self.vault_client = vault_client
+        self.ttl = ttl or 300
+        self.refresh_ahead = refresh_ahead or 60
+        self.max_entries = max_entries or 256
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, _CachedSecret] = OrderedDict()
+        self._loading: dict[str, Future] = {}
+        self._refreshing: set[str] = set()
+        self._executor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="vault-refresh"
+        )
+        self._hits = 0
+        self._misses = 0
+        self._refreshes = 0
+        self._refresh_failures = 0
+
+    def read(self, path: str) -> dict:
+        """The `data` of the latest version of the secret at `path`."""
+        now = time.monotonic()
+        refresh = False
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry.expires_at > now:
+                self._entries.move_to_end(path)
+                self._hits += 1
+                refresh = entry.refresh_at <= now and path not in self._refreshing
+                if refresh:
+                    self._refreshing.add(path)
+            else:
+                entry = None
+                self._misses += 1
+                pending = self._loading.get(path)
+                if pending is None:
+                    loading = self._loading[path] = Future()
+
+        if entry is not None:
+            if refresh:
+                self._executor.submit(self._refresh, path)
+            return entry.data
+
+        if pending is not None:
+            return pending.result()
+
+        try:
+            data = self._load(path)
+            loading.set_result(data)
+            return data
+        except Exception as e:
+            loading.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._loading[path]
+
+    def put(self, path: str, data: dict) -> None:
+        """Cache a secret that was just written to Vault."""
+        self._store(path, data, self.ttl)
+
+    def invalidate(self, path: str) -> None:
+        with self._lock:
+            self._entries.pop(path, None)
+
+    def metrics(self) -> dict:
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "refreshes": self._refreshes,
+            "refresh_failures": self._refresh_failures,
+            "entries": len(self._entries),
+        }
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _load(self, path: str) -> dict:
+        secret = self.vault_client.secrets.kv.read_secret_version(
+            path=path, raise_on_deleted_version=False
+        )
+        data = secret["data"]["data"]
+        lease = secret.get("lease_duration")
+        self._store(
+            path, data, lease if isinstance(lease, int) and lease > 0 else self.ttl
+        )
+        return data
+
+    def _store(self, path: str, data: dict, lifetime: float) -> None:
+        now = time.monotonic()
+        entry = _CachedSecret(
+            data=data,
+            # short leases still get half their lifetime served from memory
+            refresh_at=now + max(lifetime - self.refresh_ahead, lifetime / 2),
+            expires_at=now + lifetime,
+        )
+        with self._lock:
+            self._entries[path] = entry
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _refresh(self, path: str) -> None:
+        try:
+            self._load(path)
+            self._refreshes += 1
+        except Exception as e:
+            # the cached value stays valid until it expires; the next read past expiry retries
+            self._refresh_failures += 1
+            self.logger.warning(f"Secret cache -> refresh of {path} failed: {e}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(path)
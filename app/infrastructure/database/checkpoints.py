@@ -1,10 +1,19 @@
+import asyncio
+import logging
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
 from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.checkpoint.postgres import PostgresSaver
-from psycopg_pool import ConnectionPool
+from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+from psycopg_pool import AsyncConnectionPool, ConnectionPool
 
 
 class GraphPersistenceFactory:
     def __init__(self, db_checkpoints: str):
+        self.db_checkpoints = db_checkpoints
         self.connection_kwargs = {
             "autocommit": True,
             "prepare_threshold": 0,
@@ -21,5 +30,223 @@ class GraphPersistenceFactory:
         checkpointer = PostgresSaver(self.pool)
         checkpointer.setup()
 
+        # opened on first use, from inside the event loop that will drive it
+        self.async_pool: AsyncConnectionPool | None = None
+        self._async_pool_lock = asyncio.Lock()
+
     def build_checkpoint_saver(self) -> BaseCheckpointSaver:
         return PostgresSaver(self.pool)
+
+    async def build_async_checkpoint_saver(self) -> BaseCheckpointSaver:
+        if self.async_pool is None:
+            async with self._async_pool_lock:
+                if self.async_pool is None:
+                    pool = AsyncConnectionPool(
+                        open=False,
+                        conninfo=self.db_checkpoints,
+                        max_size=20,
+                        kwargs=self.connection_kwargs,
+                    )
+                    await pool.open()
+                    self.async_pool = pool
+        return AsyncPostgresSaver(self.async_pool)
+
+    async def aclose(self) -> None:
+        if self.async_pool is not None:
+            await self.async_pool.close()
+            self.async_pool = None
+
+
+class CheckpointThreads:
+    """
+    Maps an agent to the checkpoint thread a run writes to.
+
+    - agent: one thread per agent for its whole life (the history grows without bound)
+    - rolling: a new thread per agent every `rolling_hours`
+    - run: a new thread per message
+    """
+
+    MODES = ("agent", "rolling", "run")
+
+    def __init__(
+        self, mode: str | None = None, rolling_hours: int | None = None
+    ) -> None:
+        self.mode = mode or "agent"
+        if self.mode not in self.MODES:
+            raise ValueError(f"Unknown checkpoint thread mode: {self.mode}")
+        self.rolling_seconds = (rolling_hours or 24) * 3600
+
+    def thread_id(self, agent_id: str) -> str:
+        if self.mode == "run":
+            return f"{agent_id}:{uuid.uuid4().hex}"
+        if self.mode == "rolling":
+            return f"{agent_id}:{int(time.time() // self.rolling_seconds)}"
+        return agent_id
+
+
+# Prune within one transaction: pick the checkpoints outside retention, remember the
+# blob versions they referenced, then delete the checkpoints, their pending writes
+# and the blobs no surviving checkpoint references. Blobs are only considered when a
+# pruned checkpoint referenced them, so blobs written ahead of an in-flight checkpoint
+# are never touched.
+_SELECT_PRUNED = """
+CREATE TEMP TABLE pruned_checkpoints ON COMMIT DROP AS
+WITH ranked AS (
+    SELECT thread_id, checkpoint_ns, checkpoint_id, checkpoint,
+           row_number() OVER (
+               PARTITION BY thread_id, checkpoint_ns ORDER BY checkpoint_id DESC
+           ) AS position,
+           max((checkpoint->>'ts')::timestamptz) OVER (PARTITION BY thread_id) AS last_active
+    FROM checkpoints
+)
+SELECT thread_id, checkpoint_ns, checkpoint_id, checkpoint->'channel_versions' AS channel_versions
+FROM ranked
+WHERE (%(keep_last)s::int IS NOT NULL AND position > %(keep_last)s::int)
+   OR (%(cutoff)s::timestamptz IS NOT NULL AND last_active < %(cutoff)s::timestamptz)
+"""
+
+_DELETE_CHECKPOINTS = """
+DELETE FROM checkpoints c USING pruned_checkpoints p
+WHERE c.thread_id = p.thread_id AND c.checkpoint_ns = p.checkpoint_ns AND c.checkpoint_id = p.checkpoint_id
+"""
+
+_DELETE_WRITES = """
+DELETE FROM checkpoint_writes w USING pruned_checkpoints p
+WHERE w.thread_id = p.thread_id AND w.checkpoint_ns = p.checkpoint_ns AND w.checkpoint_id = p.checkpoint_id
+"""
+
+_DELETE_BLOBS = """
+DELETE FROM checkpoint_blobs b
+USING (
+    SELECT DISTINCT p.thread_id, p.checkpoint_ns, v.key AS channel, v.value AS version
+    FROM pruned_checkpoints p, jsonb_each_text(p.channel_versions) v
+) v
+WHERE b.thread_id = v.thread_id AND b.checkpoint_ns = v.checkpoint_ns
+  AND b.channel = v.channel AND b.version = v.version
+  AND NOT EXISTS (
+      SELECT 1 FROM checkpoints c
+      WHERE c.thread_id = b.thread_id AND c.checkpoint_ns = b.checkpoint_ns
+        AND c.checkpoint->'channel_versions'->>b.channel = b.version
+  )
+"""
+
+_THREAD_SIZES = """
+SELECT thread_id, count(*) FILTER (WHERE kind = 'checkpoint') AS checkpoints, sum(bytes)::bigint AS bytes
+FROM (
+    SELECT thread_id, 'checkpoint' AS kind, pg_column_size(checkpoint) + pg_column_size(metadata) AS bytes
+    FROM checkpoints
+    UNION ALL
+    SELECT thread_id, 'blob', coalesce(length(blob), 0) FROM checkpoint_blobs
+    UNION ALL
+    SELECT thread_id, 'write', coalesce(length(blob), 0) FROM checkpoint_writes
+) sizes
+GROUP BY thread_id
+ORDER BY bytes DESC
+LIMIT %(limit)s
+"""
+
+# pg_try_advisory_xact_lock key, so only one replica compacts at a time
+_COMPACTION_LOCK = 0x71_75_61_6B
+
+
+class CheckpointRetention:
+    """
+    Keeps the checkpoint tables bounded: per thread, only the `keep_last` newest
+    checkpoints survive, and threads idle for more than `max_age_days` are dropped
+    entirely (0 or None disables either rule). `start()` runs `compact()` every
+    `interval` seconds on a daemon thread; replicas coordinate through an advisory
+    lock. `metrics()` reports the last run and the largest threads by bytes.
+    """
+
+    def __init__(
+        self,
+        pool: ConnectionPool,
+        keep_last: int | None = None,
+        max_age_days: int | None = None,
+        interval: int | None = None,
+        top_threads: int | None = None,
+    ) -> None:
+        self.pool = pool
+        self.keep_last = keep_last or None
+        self.max_age_days = max_age_days or None
+        self.interval = interval or 3600
+        self.top_threads = top_threads or 10
+        self.logger = logging.getLogger(__name__)
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._runs = 0
+        self._failures = 0
+        self._last_run: dict | None = None
+        self._threads: list[dict] = []
+
+    def compact(self) -> dict:
+        """Prune what falls outside retention. Returns the rows deleted per table."""
+        started = time.monotonic()
+        cutoff = (
+            datetime.now(timezone.utc) - timedelta(days=self.max_age_days)
+            if self.max_age_days
+            else None
+        )
+        result = {"checkpoints": 0, "writes": 0, "blobs": 0, "skipped": False}
+        with self.pool.connection() as conn, conn.transaction(), conn.cursor() as cur:
+            cur.execute("SELECT pg_try_advisory_xact_lock(%s)", (_COMPACTION_LOCK,))
+            if not cur.fetchone()[0]:
+                result["skipped"] = True
+            else:
+                cur.execute(
+                    _SELECT_PRUNED, {"keep_last": self.keep_last, "cutoff": cutoff}
+                )
+                cur.execute(_DELETE_WRITES)
+                result["writes"] = cur.rowcount
+                cur.execute(_DELETE_CHECKPOINTS)
+                result["checkpoints"] = cur.rowcount
+                cur.execute(_DELETE_BLOBS)
+                result["blobs"] = cur.rowcount
+        result["seconds"] = round(time.monotonic() - started, 3)
+        return result
+
+    def thread_sizes(self, limit: int | None = None) -> list[dict]:
+        """The largest threads, with their checkpoint count and bytes across all three tables."""
+        with self.pool.connection() as conn, conn.cursor() as cur:
+            cur.execute(_THREAD_SIZES, {"limit": limit or self.top_threads})
+            return [
+                {"thread_id": thread_id, "checkpoints": checkpoints, "bytes": size}
+                for thread_id, checkpoints, size in cur.fetchall()
+            ]
+
+    def run_once(self) -> None:
+        try:
+            self._last_run = self.compact()
+            self._threads = self.thread_sizes()
+            self._runs += 1
+            self.logger.info(f"Checkpoint retention -> {self._last_run}")
+        except Exception as e:
+            self._failures += 1
+            self.logger.warning(f"Checkpoint retention -> compaction failed: {e}")
+
+    def start(self) -> None:
+        if self._thread is not None or (
+            self.keep_last is None and self.max_age_days is None
+        ):
+            return
+        self._thread = threading.Thread(
+            target=self._loop, name="checkpoint-retention", daemon=True
+        )
+        self._thread.start()
+
+    def close(self) -> None:
+        self._stop.set()
+
+    def metrics(self) -> dict:
+        return {
+            "keep_last": self.keep_last,
+            "max_age_days": self.max_age_days,
+            "runs": self._runs,
+            "failures": self._failures,
+            "last_run": self._last_run,
+            "largest_threads": self._threads,
+        }
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.run_once()
@@ -0,0 +1,139 @@
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+SEARCH_PATH_KEY = "search_path"
+
+_SCHEMA_NAME_PATTERN = re.compile(r"^[A-Za-z_]\w*$")
+
+_requested_search_path: ContextVar[str | None] = ContextVar(
+    "requested_search_path", default=None
+)
+_checkout_started: ContextVar[float | None] = ContextVar(
+    "checkout_started", default=None
+)
+
+
+def validate_schema_name(schema_name: str) -> str:
+    """Reject anything that is not a plain identifier before it is interpolated into SQL."""
+    if not _SCHEMA_NAME_PATTERN.match(schema_name):
+        raise ValueError(f"Invalid schema name: {schema_name!r}")
+    return schema_name
+
+
+class SearchPathTracker:
+    """
+    Tags pooled connections with the search_path they were last set to.
+
+    On checkout, SET search_path is only issued (and committed, so a later rollback
+    does not undo it) when the connection is tagged with a different schema than
+    the one requested by the current session. Also records pool checkout metrics.
+    """
+
+    def __init__(self, engine: Engine) -> None:
+        self.engine = engine
+        self._lock = threading.Lock()
+        self._checkouts = 0
+        self._hits = 0
+        self._misses = 0
+        self._waits = 0
+        self._wait_seconds_total = 0.0
+        self._wait_seconds_max = 0.0
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "checkout", self._on_checkout)
+
+    @contextmanager
+    def bind(self, schema_name: str):
+        """Route connections checked out in this context to `schema_name`."""
+        token = _requested_search_path.set(validate_schema_name(schema_name))
+        try:
+            yield
+        finally:
+            _requested_search_path.reset(token)
+
+    def acquire(self, session: Session) -> None:
+        """Check out the session's connection now, timing the wait for the pool."""
+        token = _checkout_started.set(time.perf_counter())
+        try:
+            session.connection()
+        finally:
+            _checkout_started.reset(token)
+
+    async def acquire_async(self, session: AsyncSession) -> None:
+        token = _checkout_started.set(time.perf_counter())
+        try:
+            await session.connection()
+        finally:
+            _checkout_started.reset(token)
+
+    @staticmethod
+    def _on_connect(dbapi_connection, connection_record) -> None:
+        connection_record.info.pop(SEARCH_PATH_KEY, None)
+
+    def _on_checkout(
+        self, dbapi_connection, connection_record, connection_proxy
+    ) -> None:
+        started = _checkout_started.get()
+        waited = time.perf_counter() - started if started is not None else None
+        requested = _requested_search_path.get()
+
+        hit = None
+        if requested is not None:
+            hit = connection_record.info.get(SEARCH_PATH_KEY) == requested
+            if not hit:
+                cursor = dbapi_connection.cursor()
+                try:
+                    cursor.execute(f"SET search_path TO {requested}")
+                finally:
+                    cursor.close()
+                dbapi_connection.commit()
+                connection_record.info[SEARCH_PATH_KEY] = requested
+
+        with self._lock:
+            self._checkouts += 1
+            if hit is True:
+                self._hits += 1
+            elif hit is False:
+                self._misses += 1
+            if waited is not None:
+                self._waits += 1
+                self._wait_seconds_total += waited
+                self._wait_seconds_max = max(self._wait_seconds_max, waited)
+
+    def metrics(self) -> dict:
+        pool = self.engine.pool
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "pool": {
+                    "class": type(pool).__name__,
+                    "size": _pool_stat(pool, "size"),
+                    "checked_in": _pool_stat(pool, "checkedin"),
+                    "checked_out": _pool_stat(pool, "checkedout"),
+                    "overflow": _pool_stat(pool, "overflow"),
+                },
+                "checkouts": self._checkouts,
+                "wait_ms": {
+                    "avg": (self._wait_seconds_total / self._waits * 1000)
+                    if self._waits
+                    else 0.0,
+                    "max": self._wait_seconds_max * 1000,
+                },
+                "search_path": {
+                    "hits": self._hits,
+                    "misses": self._misses,
+                    "hit_rate": self._hits / lookups if lookups else 0.0,
+                },
+            }
+
+
+def _pool_stat(pool, name: str):
+    stat = getattr(pool, name, None)
+    return stat() if callable(stat) else None
@@ -1,18 +1,74 @@
+import asyncio
 import logging
-from contextlib import contextmanager
+import threading
+from contextlib import asynccontextmanager, contextmanager
 
-from sqlalchemy import create_engine, orm
+from sqlalchemy import create_engine, make_url, orm
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, declarative_base
 from sqlalchemy.sql import text
 
+from app.infrastructure.database.pool import (
+    SEARCH_PATH_KEY,
+    SearchPathTracker,
+    validate_schema_name,
+)
+
 logger = logging.getLogger(__name__)
 
 Base = declarative_base()
 
+# Process-wide registry of (database url, schema) pairs whose tables already exist.
+_provisioned_schemas: set[tuple[str, str]] = set()
+_provisioned_schemas_lock = threading.Lock()
+
+
+def _pool_options(**options) -> dict:
+    # unset options fall back to the SQLAlchemy defaults
+    return {key: value for key, value in options.items() if value is not None}
+
+
+def _registry_key(engine_url, schema_name: str) -> tuple[str, str]:
+    # keyed by backend rather than driver so sync and async engines share entries
+    url = engine_url.set(drivername=engine_url.get_backend_name())
+    return url.render_as_string(hide_password=True), schema_name
+
+
+def sanitize_schema_name(schema_name: str) -> str:
+    """Sanitize schema name by replacing invalid characters (e.g., hyphens)."""
+    return validate_schema_name(schema_name.replace("-", "_"))
+
+
+def to_async_url(db_url: str) -> str:
+    """Point a plain postgresql:// url at the psycopg 3 async driver."""
+    url = make_url(db_url)
+    if url.drivername in ("postgresql", "postgresql+psycopg2"):
+        url = url.set(drivername="postgresql+psycopg")
+    return url.render_as_string(hide_password=False)
+
 
 class Database:
-    def __init__(self, db_url: str) -> None:
-        self.engine = create_engine(db_url, echo=False)
+    def __init__(
+        self,
+        db_url: str,
+        pool_size: int | None = None,
+        max_overflow: int | None = None,
+        pool_timeout: float | None = None,
+        pool_recycle: int | None = None,
+        pool_pre_ping: bool | None = None,
+    ) -> None:
+        self.engine = create_engine(
+            db_url,
+            echo=False,
+            **_pool_options(
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                pool_timeout=pool_timeout,
+                pool_recycle=pool_recycle,
+                pool_pre_ping=pool_pre_ping,
+            ),
+        )
+        self.search_paths = SearchPathTracker(self.engine)
         self.session_factory = orm.scoped_session(
             orm.sessionmaker(
                 autocommit=False,
@@ -25,28 +81,154 @@ class Database:
 
     def sanitize_schema_name(self, schema_name: str) -> str:
         """Sanitize schema name by replacing invalid characters (e.g., hyphens)."""
-        return schema_name.replace("-", "_")
+        return sanitize_schema_name(schema_name)
+
+    def _registry_key(self, schema_name: str) -> tuple[str, str]:
+        return _registry_key(self.engine.url, self.sanitize_schema_name(schema_name))
 
     def create_database(self, schema_name: str = "public") -> None:
         sanitized_schema = self.sanitize_schema_name(schema_name)
         with self.engine.begin() as conn:
+            conn.info.pop(SEARCH_PATH_KEY, None)
             conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {sanitized_schema}"))
             conn.execute(text(f"SET search_path TO {sanitized_schema}"))
             Base.metadata.create_all(bind=conn)
+            conn.info[SEARCH_PATH_KEY] = sanitized_schema
+
+    def is_provisioned(self, schema_name: str) -> bool:
+        return self._registry_key(schema_name) in _provisioned_schemas
+
+    def provision_schema(self, schema_name: str = "public") -> None:
+        """Create the schema and its tables once per process; later calls are no-ops."""
+        key = self._registry_key(schema_name)
+        if key in _provisioned_schemas:
+            return
+        with _provisioned_schemas_lock:
+            if key in _provisioned_schemas:
+                return
+            self.create_database(schema_name=schema_name)
+            _provisioned_schemas.add(key)
+
+    def invalidate_schema(self, schema_name: str | None = None) -> None:
+        """
+        Forget that a schema was provisioned so the next session re-runs the DDL check.
+        Call after migrations; without a schema name every schema of this database is invalidated.
+        """
+        with _provisioned_schemas_lock:
+            if schema_name is not None:
+                _provisioned_schemas.discard(self._registry_key(schema_name))
+                return
+            url = self._registry_key(self.default_schema)[0]
+            for key in [k for k in _provisioned_schemas if k[0] == url]:
+                _provisioned_schemas.discard(key)
+
+    def drop_schema(self, schema_name: str) -> None:
+        sanitized_schema = self.sanitize_schema_name(schema_name)
+        with self.engine.begin() as conn:
+            conn.execute(text(f"DROP SCHEMA IF EXISTS {sanitized_schema} CASCADE"))
+        self.invalidate_schema(sanitized_schema)
 
     @contextmanager
     def session(self, schema_name: str = "public"):
         sanitized_schema = self.sanitize_schema_name(schema_name)
-        self.create_database(schema_name=sanitized_schema)
-        session: Session = self.session_factory()
-        try:
-            # Set the search_path on the session's connection immediately.
-            session.execute(text(f"SET search_path TO {sanitized_schema}"))
-            yield session
-        except Exception:
-            logger.exception("Session rollback because of exception")
-            session.rollback()
-            raise
-        finally:
-            session.close()
-            # Removed resetting of schema to default.
+        self.provision_schema(schema_name=sanitized_schema)
+        with self.search_paths.bind(sanitized_schema):
+            session: Session = self.session_factory()
+            try:
+                # Check out the connection immediately; the pool only issues
+                # SET search_path when the connection is tagged with another schema.
+                self.search_paths.acquire(session)
+                yield session
+            except Exception:
+                logger.exception("Session rollback because of exception")
+                session.rollback()
+                raise
+            finally:
+                session.close()
+
+    def pool_metrics(self) -> dict:
+        return self.search_paths.metrics()
+
+
+class AsyncDatabase:
+    """
+    asyncio counterpart of `Database` on SQLAlchemy's asyncio extension and psycopg 3.
+    Shares the provisioned-schema registry and the search_path connection tagging.
+    """
+
+    def __init__(
+        self,
+        db_url: str,
+        pool_size: int | None = None,
+        max_overflow: int | None = None,
+        pool_timeout: float | None = None,
+        pool_recycle: int | None = None,
+        pool_pre_ping: bool | None = None,
+    ) -> None:
+        self.engine = create_async_engine(
+            to_async_url(db_url),
+            echo=False,
+            **_pool_options(
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                pool_timeout=pool_timeout,
+                pool_recycle=pool_recycle,
+                pool_pre_ping=pool_pre_ping,
+            ),
+        )
+        self.search_paths = SearchPathTracker(self.engine.sync_engine)
+        # objects stay readable after commit without an implicit (awaitable) refresh
+        self.session_factory = async_sessionmaker(
+            bind=self.engine,
+            autoflush=False,
+            expire_on_commit=False,
+        )
+        self._provision_lock = asyncio.Lock()
+
+    def is_provisioned(self, schema_name: str) -> bool:
+        return (
+            _registry_key(self.engine.url, sanitize_schema_name(schema_name))
+            in _provisioned_schemas
+        )
+
+    async def create_database(self, schema_name: str = "public") -> None:
+        sanitized_schema = sanitize_schema_name(schema_name)
+        async with self.engine.begin() as conn:
+            conn.info.pop(SEARCH_PATH_KEY, None)
+            await conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {sanitized_schema}"))
+            await conn.execute(text(f"SET search_path TO {sanitized_schema}"))
+            await conn.run_sync(Base.metadata.create_all)
+            conn.info[SEARCH_PATH_KEY] = sanitized_schema
+
+    async def provision_schema(self, schema_name: str = "public") -> None:
+        key = _registry_key(self.engine.url, sanitize_schema_name(schema_name))
+        if key in _provisioned_schemas:
+            return
+        async with self._provision_lock:
+            if key in _provisioned_schemas:
+                return
+            await self.create_database(schema_name=schema_name)
+            with _provisioned_schemas_lock:
+                _provisioned_schemas.add(key)
+
+    @asynccontextmanager
+    async def session(self, schema_name: str = "public"):
+        sanitized_schema = sanitize_schema_name(schema_name)
+        await self.provision_schema(schema_name=sanitized_schema)
+        with self.search_paths.bind(sanitized_schema):
+            session: AsyncSession = self.session_factory()
+            try:
+                await self.search_paths.acquire_async(session)
+                yield session
+            except Exception:
+                logger.exception("Session rollback because of exception")
+                await session.rollback()
+                raise
+            finally:
+                await session.close()
+
+    async def dispose(self) -> None:
+        await self.engine.dispose()
+
+    def pool_metrics(self) -> dict:
+        return self.search_paths.metrics()
@@ -26,9 +26,9 @@ from app.interface.api.agents.schema import (
     AgentSettingUpdateRequest,
     AgentUpdateRequest,
 )
-from app.services.agent_settings import AgentSettingService
+from app.services.agent_settings import AsyncAgentSettingService
 from app.services.agent_types.registry import AgentRegistry
-from app.services.agents import AgentService
+from app.services.agents import AsyncAgentService
 from app.services.tasks import TaskNotificationService
 
 from app.interface.api.agents.schema import valid_agent_types
@@ -36,6 +36,10 @@ from app.interface.api.agents.schema import valid_agent_types
 router = APIRouter()
 bearer_scheme = HTTPBearer()
 
+# how long the task updates socket waits for an update before giving up, or in
+# stream mode before sending a keep-alive frame
+TASK_UPDATES_KEEPALIVE_SECONDS = 30
+
 
 @router.get(
     path="/list",
@@ -82,11 +86,13 @@ bearer_scheme = HTTPBearer()
 )
 @inject
 async def get_list(
-    agent_service: Annotated[AgentService, Depends(Provide[Container.agent_service])],
+    agent_service: Annotated[
+        AsyncAgentService, Depends(Provide[Container.async_agent_service])
+    ],
     user: Annotated[User, Depends(get_user)],
 ):
     schema = get_schema(user.id if user is not None else None)
-    agents = agent_service.get_agents(schema)
+    agents = await agent_service.get_agents(schema)
     return [Agent.model_validate(agent) for agent in agents]
 
 
@@ -142,15 +148,18 @@ async def get_list(
 @inject
 async def get_by_id(
     agent_id: str,
-    agent_service: Annotated[AgentService, Depends(Provide[Container.agent_service])],
+    agent_service: Annotated[
+        AsyncAgentService, Depends(Provide[Container.async_agent_service])
+    ],
     agent_setting_service: Annotated[
-        AgentSettingService, Depends(Provide[Container.agent_setting_service])
+        AsyncAgentSettingService,
+        Depends(Provide[Container.async_agent_setting_service]),
     ],
     user: Annotated[User, Depends(get_user)],
 ):
     schema = get_schema(user.id if user is not None else None)
-    agent = agent_service.get_agent_by_id(agent_id, schema)
-    return _format_expanded_response(agent, agent_setting_service, schema)
+    agent = await agent_service.get_agent_by_id(agent_id, schema)
+    return await _format_expanded_response(agent, agent_setting_service, schema)
 
 
 @router.post(
@@ -221,21 +230,25 @@ async def get_by_id(
 @inject
 async def add(
     agent_data: Annotated[AgentCreateRequest, Body(...)],
-    agent_service: Annotated[AgentService, Depends(Provide[Container.agent_service])],
+    agent_service: Annotated[
+        AsyncAgentService, Depends(Provide[Container.async_agent_service])
+    ],
     agent_registry: Annotated[
         AgentRegistry, Depends(Provide[Container.agent_registry])
     ],
     user: Annotated[User, Depends(get_user)],
 ):
     schema = get_schema(user.id if user is not None else None)
-    agent = agent_service.create_agent(
+    agent = await agent_service.create_agent(
         language_model_id=agent_data.language_model_id,
         agent_name=agent_data.agent_name,
         agent_type=agent_data.agent_type,
         schema=schema,
     )
-    agent_registry.get_agent(agent_data.agent_type).create_default_settings(
-        agent.id, schema
+    await asyncio.to_thread(
+        agent_registry.get_agent(agent_data.agent_type).create_default_settings,
+        agent.id,
+        schema,
     )
     return Agent.model_validate(agent)
 
@@ -267,11 +280,13 @@ async def add(
 @inject
 async def remove(
     agent_id: str,
-    agent_service: Annotated[AgentService, Depends(Provide[Container.agent_service])],
+    agent_service: Annotated[
+        AsyncAgentService, Depends(Provide[Container.async_agent_service])
+    ],
     user: Annotated[User, Depends(get_user)],
 ):
     schema = get_schema(user.id if user is not None else None)
-    agent_service.delete_agent_by_id(agent_id, schema)
+    await agent_service.delete_agent_by_id(agent_id, schema)
 
 
 @router.post(
@@ -330,11 +345,13 @@ async def remove(
 @inject
 async def update(
     agent_data: Annotated[AgentUpdateRequest, Body(...)],
-    agent_service: Annotated[AgentService, Depends(Provide[Container.agent_service])],
+    agent_service: Annotated[
+        AsyncAgentService, Depends(Provide[Container.async_agent_service])
+    ],
     user: Annotated[User, Depends(get_user)],
 ):
     schema = get_schema(user.id if user is not None else None)
-    agent = agent_service.update_agent(
+    agent = await agent_service.update_agent(
         agent_id=agent_data.agent_id,
         agent_name=agent_data.agent_name,
         language_model_id=agent_data.language_model_id,
@@ -410,22 +427,25 @@ async def update(
 @inject
 async def update_setting(
     agent_data: Annotated[AgentSettingUpdateRequest, Body(...)],
-    agent_service: Annotated[AgentService, Depends(Provide[Container.agent_service])],
+    agent_service: Annotated[
+        AsyncAgentService, Depends(Provide[Container.async_agent_service])
+    ],
     agent_setting_service: Annotated[
-        AgentSettingService, Depends(Provide[Container.agent_setting_service])
+        AsyncAgentSettingService,
+        Depends(Provide[Container.async_agent_setting_service]),
     ],
     user: Annotated[User, Depends(get_user)],
 ):
     schema = get_schema(user.id if user is not None else None)
-    agent_setting_service.update_by_key(
+    await agent_setting_service.update_by_key(
         agent_id=agent_data.agent_id,
         setting_key=agent_data.setting_key,
         setting_value=agent_data.setting_value,
         schema=schema,
     )
 
-    agent = agent_service.get_agent_by_id(agent_data.agent_id, schema)
-    return _format_expanded_response(agent, agent_setting_service, schema)
+    agent = await agent_service.get_agent_by_id(agent_data.agent_id, schema)
+    return await _format_expanded_response(agent, agent_setting_service, schema)
 
 
 @router.post(
@@ -456,9 +476,12 @@ async def update_setting(
 @inject
 async def reset_settings(
     agent_id: str,
-    agent_service: Annotated[AgentService, Depends(Provide[Container.agent_service])],
+    agent_service: Annotated[
+        AsyncAgentService, Depends(Provide[Container.async_agent_service])
+    ],
     agent_setting_service: Annotated[
-        AgentSettingService, Depends(Provide[Container.agent_setting_service])
+        AsyncAgentSettingService,
+        Depends(Provide[Container.async_agent_setting_service]),
     ],
     agent_registry: Annotated[
         AgentRegistry, Depends(Provide[Container.agent_registry])
@@ -466,10 +489,14 @@ async def reset_settings(
     user: Annotated[User, Depends(get_user)],
 ):
     schema = get_schema(user.id if user is not None else None)
-    agent = agent_service.get_agent_by_id(agent_id, schema)
-    agent_setting_service.delete_by_agent_id(agent.id, schema)
-    agent_registry.get_agent(agent.agent_type).create_default_settings(agent.id, schema)
-    return _format_expanded_response(agent, agent_setting_service, schema)
+    agent = await agent_service.get_agent_by_id(agent_id, schema)
+    await agent_setting_service.delete_by_agent_id(agent.id, schema)
+    await asyncio.to_thread(
+        agent_registry.get_agent(agent.agent_type).create_default_settings,
+        agent.id,
+        schema,
+    )
+    return await _format_expanded_response(agent, agent_setting_service, schema)
 
 
 @router.websocket("/ws/task_updates/{agent_id}")
@@ -480,27 +507,42 @@ async def task_updates_endpoint(
     task_notification_service: Annotated[
         TaskNotificationService, Depends(Provide[Container.task_notification_service])
     ],
+    stream: bool = False,
 ):
+    """
+    Sends the next task update for the agent and closes. With `stream=true` every
+    update is forwarded, including the node and token events of runs posted with
+    `stream=true`, until a task result (completed or failed, with a task id) arrives
+    or the client disconnects; a `{"type": "keepalive"}` frame is sent whenever no
+    update arrives for TASK_UPDATES_KEEPALIVE_SECONDS.
+    """
     await websocket.accept()
     task_notification_service.subscribe()
-    loop = asyncio.get_event_loop()
-
-    def get_next_message():
-        return next(task_notification_service.listen())
+    loop = asyncio.get_running_loop()
+    # one blocking iterator, advanced by one worker call at a time; a pending call
+    # is kept across keep-alive timeouts instead of starting another
+    messages = task_notification_service.listen()
+    pending = None
 
     try:
         while True:
-            try:
-                message = await asyncio.wait_for(
-                    loop.run_in_executor(None, get_next_message), timeout=30
-                )
-            except asyncio.TimeoutError:
-                break
-
+            if pending is None:
+                pending = loop.run_in_executor(None, next, messages)
+            done, _ = await asyncio.wait(
+                {pending}, timeout=TASK_UPDATES_KEEPALIVE_SECONDS
+            )
+            if not done:
+                if not stream:
+                    break
+                await websocket.send_json({"type": "keepalive"})
+                continue
+
+            message, pending = pending.result(), None
             data = _parse_agent_task_message(message, agent_id)
             if data is not None:
                 await websocket.send_json(data)
-                break
+                if not stream or _is_task_result(data):
+                    break
     except WebSocketDisconnect:
         pass
     finally:
@@ -519,10 +561,17 @@ def _parse_agent_task_message(message: dict, agent_id: str) -> dict | None:
     return data
 
 
-def _format_expanded_response(
-    agent: DomainAgent, agent_setting_service: AgentSettingService, schema: str
+def _is_task_result(data: dict) -> bool:
+    return (
+        data.get("status") in ("completed", "failed")
+        and data.get("task_id") is not None
+    )
+
+
+async def _format_expanded_response(
+    agent: DomainAgent, agent_setting_service: AsyncAgentSettingService, schema: str
 ) -> AgentExpanded:
-    settings = agent_setting_service.get_agent_settings(agent.id, schema)
+    settings = await agent_setting_service.get_agent_settings(agent.id, schema)
     response = AgentExpanded.model_validate(agent)
     response.ag_settings = [
         AgentSetting.model_validate(setting) for setting in settings
@@ -13,7 +13,7 @@ from app.domain.exceptions.base import FileToLargeError
 from app.infrastructure.auth.schema import User
 from app.infrastructure.auth.user import get_schema
 from app.interface.api.attachments.schema import Attachment, EmbeddingsRequest
-from app.services.attachments import AttachmentService
+from app.services.attachments import AsyncAttachmentService, AttachmentService
 
 router = APIRouter()
 bearer_scheme = HTTPBearer()
@@ -69,12 +69,13 @@ bearer_scheme = HTTPBearer()
 @inject
 async def get_list(
     attachment_service: Annotated[
-        AttachmentService, Depends(Provide[Container.attachment_service])
+        AsyncAttachmentService,
+        Depends(Provide[Container.async_attachment_service]),
     ],
     user: Annotated[User, Depends(get_user)],
 ):
     schema = get_schema(user.id if user is not None else None)
-    attachments = attachment_service.get_attachments(schema)
+    attachments = await attachment_service.get_attachments(schema)
     return [Attachment.model_validate(attachment) for attachment in attachments]
 
 
@@ -211,12 +212,13 @@ async def download_attachment(
         ),
     ],
     attachment_service: Annotated[
-        AttachmentService, Depends(Provide[Container.attachment_service])
+        AsyncAttachmentService,
+        Depends(Provide[Container.async_attachment_service]),
     ],
     user: Annotated[User, Depends(get_user)],
 ):
     schema = get_schema(user.id if user is not None else None)
-    attachment = attachment_service.get_attachment_by_id(attachment_id, schema)
+    attachment = await attachment_service.get_attachment_by_id(attachment_id, schema)
     response = StreamingResponse(
         BytesIO(attachment.raw_content),
         media_type="application/octet-stream",
@@ -1,12 +1,178 @@
-from typing_extensions import Callable
-from fastapi import Depends, Response
+import hashlib
+import json
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
 
+from dependency_injector.wiring import inject, Provide
+from typing_extensions import Callable, Optional
+from fastapi import Depends, Request, Response
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-def cache_control(max_age: int = 86400) -> Callable:
+from app.core.container import Container
+from app.domain.exceptions.base import NotModifiedError
+from app.infrastructure.cache.result_cache import ResultCache
+
+_CONDITIONAL_GET = "conditional_get"
+
+
+def cache_control(
+    max_age: int = 86400,
+    data_generation: bool = False,
+    etag: bool = False,
+    last_modified: Optional[str] = None,
+) -> Callable:
     """
     Returns a FastAPI dependency that sets Cache-Control headers on the Response.
     Use in endpoints as: cache: None = cache_control(86400)
+
+    With `data_generation=True` the response also carries an ETag for the current
+    markets data generation, and a matching If-None-Match is answered with 304
+    before the endpoint runs.
+
+    With `etag=True` a strong ETag is computed from the serialized payload, and
+    `last_modified` names the date field of the listed items whose newest value
+    becomes Last-Modified; `ConditionalGetMiddleware` then answers requests whose
+    If-None-Match / If-Modified-Since still match with 304.
     """
-    def _set_cache_header(response: Response):
+    def _set_cache_header(request: Request, response: Response):
         response.headers["Cache-Control"] = f"public, max-age={max_age}, s-maxage={max_age}"
-    return Depends(_set_cache_header)
+        if etag or last_modified:
+            setattr(request.state, _CONDITIONAL_GET, {"etag": etag, "last_modified": last_modified})
+
+    async def _set_generation_headers(request: Request, response: Response):
+        _set_cache_header(request, response)
+        await check_generation_etag(request, response)
+
+    return Depends(_set_generation_headers if data_generation else _set_cache_header)
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against `etag`, as RFC 9110 requires."""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag.removeprefix("W/") in (tag.removeprefix("W/") for tag in candidates)
+
+
+@inject
+async def check_generation_etag(
+    request: Request,
+    response: Response,
+    markets_result_cache: ResultCache = Provide[Container.markets_result_cache],
+) -> None:
+    etag = f'"markets-{await markets_result_cache.generation()}"'
+    if etag_matches(request.headers.get("If-None-Match"), etag):
+        raise NotModifiedError(
+            headers={"ETag": etag, "Cache-Control": response.headers["Cache-Control"]}
+        )
+    response.headers["ETag"] = etag
+
+
+def payload_etag(body: bytes) -> str:
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def newest_date(body: bytes, field: str) -> datetime | None:
+    """Newest `field` value across the lists of objects in a JSON payload."""
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        return None
+    if not isinstance(payload, dict):
+        return None
+
+    newest = None
+    for value in payload.values():
+        if not isinstance(value, list):
+            continue
+        for item in value:
+            if not isinstance(item, dict) or not item.get(field):
+                continue
+            try:
+                date = datetime.fromisoformat(str(item[field]))
+            except ValueError:
+                continue
+            if date.tzinfo is None:
+                date = date.replace(tzinfo=timezone.utc)
+            if newest is None or date > newest:
+                newest = date
+    return newest
+
+
+def is_not_modified(request_headers: Headers, response_headers: Headers) -> bool:
+    # If-None-Match takes precedence; If-Modified-Since is only evaluated without it
+    if "if-none-match" in request_headers:
+        etag = response_headers.get("etag")
+        return etag is not None and etag_matches(request_headers["if-none-match"], etag)
+
+    if_modified_since = request_headers.get("if-modified-since")
+    last_modified = response_headers.get("last-modified")
+    if not if_modified_since or not last_modified:
+        return False
+    try:
+        return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+
+
+class ConditionalGetMiddleware:
+    """
+    Adds validators to the GET responses of endpoints that opted in through
+    `cache_control(etag=..., last_modified=...)` and replaces the body with a
+    304 when the request's preconditions still match.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        # created here so the endpoint's request.state is visible once it responds
+        state = scope.setdefault("state", {})
+        response_start: Message | None = None
+        options: dict | None = None
+        chunks: list[bytes] = []
+
+        async def send_validated(message: Message) -> None:
+            nonlocal response_start, options
+            if message["type"] == "http.response.start":
+                options = state.get(_CONDITIONAL_GET)
+                if options is None or message["status"] != 200:
+                    await send(message)
+                else:
+                    response_start = message
+                return
+
+            if response_start is None:
+                await send(message)
+                return
+
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                await self._send(scope, response_start, b"".join(chunks), options, send)
+
+        await self.app(scope, receive, send_validated)
+
+    @staticmethod
+    async def _send(scope: Scope, start: Message, body: bytes, options: dict, send: Send) -> None:
+        headers = MutableHeaders(raw=start["headers"])
+        if options["etag"] and "etag" not in headers:
+            headers["ETag"] = payload_etag(body)
+        if options["last_modified"]:
+            newest = newest_date(body, options["last_modified"])
+            if newest is not None:
+                headers["Last-Modified"] = format_datetime(newest.astimezone(timezone.utc), usegmt=True)
+
+        if is_not_modified(Headers(scope=scope), headers):
+            del headers["content-length"]
+            del headers["content-type"]
+            await send({"type": "http.response.start", "status": 304, "headers": headers.raw})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        await send(start)
+        await send({"type": "http.response.body", "body": body})
@@ -12,7 +12,7 @@ from app.interface.api.integrations.schema import (
     Integration,
     integration_valid_types,
 )
-from app.services.integrations import IntegrationService
+from app.services.integrations import AsyncIntegrationService
 
 router = APIRouter()
 bearer_scheme = HTTPBearer()
@@ -57,12 +57,13 @@ bearer_scheme = HTTPBearer()
 @inject
 async def get_list(
     integration_service: Annotated[
-        IntegrationService, Depends(Provide[Container.integration_service])
+        AsyncIntegrationService,
+        Depends(Provide[Container.async_integration_service]),
     ],
     user: Annotated[User, Depends(get_user)],
 ):
     schema = get_schema(user.id if user is not None else None)
-    integrations = integration_service.get_integrations(schema)
+    integrations = await integration_service.get_integrations(schema)
     return [Integration.model_validate(integration) for integration in integrations]
 
 
@@ -108,12 +109,15 @@ async def get_list(
 async def get_by_id(
     integration_id: str,
     integration_service: Annotated[
-        IntegrationService, Depends(Provide[Container.integration_service])
+        AsyncIntegrationService,
+        Depends(Provide[Container.async_integration_service]),
     ],
     user: Annotated[User, Depends(get_user)],
 ):
     schema = get_schema(user.id if user is not None else None)
-    integration = integration_service.get_integration_by_id(integration_id, schema)
+    integration = await integration_service.get_integration_by_id(
+        integration_id, schema
+    )
     return Integration.model_validate(integration)
 
 
@@ -186,12 +190,13 @@ async def add(
         ),
     ],
     integration_service: Annotated[
-        IntegrationService, Depends(Provide[Container.integration_service])
+        AsyncIntegrationService,
+        Depends(Provide[Container.async_integration_service]),
     ],
     user: Annotated[User, Depends(get_user)],
 ):
     schema = get_schema(user.id if user is not None else None)
-    integration = integration_service.create_integration(
+    integration = await integration_service.create_integration(
         integration_type=integration_data.integration_type,
         api_endpoint=integration_data.api_endpoint,
         api_key=integration_data.api_key,
@@ -232,10 +237,11 @@ async def add(
 async def remove(
     integration_id: str,
     integration_service: Annotated[
-        IntegrationService, Depends(Provide[Container.integration_service])
+        AsyncIntegrationService,
+        Depends(Provide[Container.async_integration_service]),
     ],
     user: Annotated[User, Depends(get_user)],
 ):
     schema = get_schema(user.id if user is not None else None)
-    integration_service.delete_integration_by_id(integration_id, schema)
+    await integration_service.delete_integration_by_id(integration_id, schema)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -16,8 +16,8 @@ from app.interface.api.language_models.schema import (
     LanguageModelSettingUpdateRequest,
     LanguageModelUpdateRequest,
 )
-from app.services.language_model_settings import LanguageModelSettingService
-from app.services.language_models import LanguageModelService
+from app.services.language_model_settings import AsyncLanguageModelSettingService
+from app.services.language_models import AsyncLanguageModelService
 
 router = APIRouter()
 bearer_scheme = HTTPBearer()
@@ -64,12 +64,13 @@ bearer_scheme = HTTPBearer()
 @inject
 async def get_list(
     language_model_service: Annotated[
-        LanguageModelService, Depends(Provide[Container.language_model_service])
+        AsyncLanguageModelService,
+        Depends(Provide[Container.async_language_model_service]),
     ],
     user: Annotated[User, Depends(get_user)],
 ):
     schema = get_schema(user.id if user is not None else None)
-    language_models = language_model_service.get_language_models(schema)
+    language_models = await language_model_service.get_language_models(schema)
     return [LanguageModel.model_validate(lm) for lm in language_models]
 
 
@@ -142,12 +143,13 @@ async def add(
         ),
     ],
     language_model_service: Annotated[
-        LanguageModelService, Depends(Provide[Container.language_model_service])
+        AsyncLanguageModelService,
+        Depends(Provide[Container.async_language_model_service]),
     ],
     user: Annotated[User, Depends(get_user)],
 ):
     schema = get_schema(user.id if user is not None else None)
-    language_model = language_model_service.create_language_model(
+    language_model = await language_model_service.create_language_model(
         integration_id=language_model_data.integration_id,
         language_model_tag=language_model_data.language_model_tag,
         schema=schema,
@@ -207,19 +209,20 @@ async def add(
 async def get_by_id(
     language_model_id: str,
     language_model_service: Annotated[
-        LanguageModelService, Depends(Provide[Container.language_model_service])
+        AsyncLanguageModelService,
+        Depends(Provide[Container.async_language_model_service]),
     ],
     language_model_setting_service: Annotated[
-        LanguageModelSettingService,
-        Depends(Provide[Container.language_model_setting_service]),
+        AsyncLanguageModelSettingService,
+        Depends(Provide[Container.async_language_model_setting_service]),
     ],
     user: Annotated[User, Depends(get_user)],
 ):
     schema = get_schema(user.id if user is not None else None)
-    language_model = language_model_service.get_language_model_by_id(
+    language_model = await language_model_service.get_language_model_by_id(
         language_model_id, schema
     )
-    return _format_expanded_response(
+    return await _format_expanded_response(
         language_model, language_model_setting_service, schema
     )
 
@@ -255,12 +258,13 @@ async def get_by_id(
 async def remove(
     language_model_id: str,
     language_model_service: Annotated[
-        LanguageModelService, Depends(Provide[Container.language_model_service])
+        AsyncLanguageModelService,
+        Depends(Provide[Container.async_language_model_service]),
     ],
     user: Annotated[User, Depends(get_user)],
 ):
     schema = get_schema(user.id if user is not None else None)
-    language_model_service.delete_language_model_by_id(language_model_id, schema)
+    await language_model_service.delete_language_model_by_id(language_model_id, schema)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
@@ -333,12 +337,13 @@ async def update(
         ),
     ],
     language_model_service: Annotated[
-        LanguageModelService, Depends(Provide[Container.language_model_service])
+        AsyncLanguageModelService,
+        Depends(Provide[Container.async_language_model_service]),
     ],
     user: Annotated[User, Depends(get_user)],
 ):
     schema = get_schema(user.id if user is not None else None)
-    language_model = language_model_service.update_language_model(
+    language_model = await language_model_service.update_language_model(
         language_model_id=language_model_data.language_model_id,
         language_model_tag=language_model_data.language_model_tag,
         integration_id=language_model_data.integration_id,
@@ -423,38 +428,39 @@ async def update_setting(
         ),
     ],
     language_model_service: Annotated[
-        LanguageModelService, Depends(Provide[Container.language_model_service])
+        AsyncLanguageModelService,
+        Depends(Provide[Container.async_language_model_service]),
     ],
     language_model_setting_service: Annotated[
-        LanguageModelSettingService,
-        Depends(Provide[Container.language_model_setting_service]),
+        AsyncLanguageModelSettingService,
+        Depends(Provide[Container.async_language_model_setting_service]),
     ],
     user: Annotated[User, Depends(get_user)],
 ):
     schema = get_schema(user.id if user is not None else None)
-    language_model_setting_service.update_by_key(
+    await language_model_setting_service.update_by_key(
         language_model_id=language_model_data.language_model_id,
         setting_key=language_model_data.setting_key,
         setting_value=language_model_data.setting_value,
         schema=schema,
     )
 
-    language_model = language_model_service.get_language_model_by_id(
+    language_model = await language_model_service.get_language_model_by_id(
         language_model_id=language_model_data.language_model_id,
         schema=schema,
     )
 
-    return _format_expanded_response(
+    return await _format_expanded_response(
         language_model, language_model_setting_service, schema
     )
 
 
-def _format_expanded_response(
+async def _format_expanded_response(
     language_model: DomainLanguageModel,
-    language_model_setting_service: LanguageModelSettingService,
+    language_model_setting_service: AsyncLanguageModelSettingService,
     schema: str,
 ) -> LanguageModelExpanded:
-    settings = language_model_setting_service.get_language_model_settings(
+    settings = await language_model_setting_service.get_language_model_settings(
         language_model.id, schema
     )
     response = LanguageModelExpanded.model_validate(language_model)
@@ -15,6 +15,8 @@ from app.interface.api.markets.schema import (
     CompanyProfile,
     IndicatorRequest,
     IndicatorResponse,
+    IndicatorsBulkResponse,
+    IndicatorsByTickerResponse,
     InsightsNewsItem,
     InsightsNewsList,
     InsightsNewsListRequest,
@@ -28,9 +30,9 @@ from app.interface.api.markets.schema import (
     StatsCloseBulkResponse,
     StatsCloseRequest,
 )
-from app.services.markets_insights import MarketsInsightsService
-from app.services.markets_news import MarketsNewsService
-from app.services.markets_stats import MarketsStatsService
+from app.services.markets_insights import AsyncMarketsInsightsService
+from app.services.markets_news import AsyncMarketsNewsService
+from app.services.markets_stats import AsyncMarketsStatsService
 from app.services.published_content import PublishedContentService
 
 router = APIRouter()
@@ -95,14 +97,14 @@ def _validate_index_name(index_name: str):
             },
         },
     },
-    dependencies=[cache_control(3600)],
+    dependencies=[cache_control(3600, data_generation=True)],
 )
 @inject
 async def get_stats_close(
     index_name: str,
     key_ticker: str,
     markets_stats_service: Annotated[
-        MarketsStatsService, Depends(Provide[Container.markets_stats_service])
+        AsyncMarketsStatsService, Depends(Provide[Container.async_markets_stats_service])
     ],
     request: Annotated[StatsCloseRequest, Depends()],
 ):
@@ -110,7 +112,7 @@ async def get_stats_close(
     today = datetime.now()
     end_date = request.end_date or today.strftime("%Y-%m-%d")
     start_date = request.start_date or (today - timedelta(days=90)).strftime("%Y-%m-%d")
-    result = markets_stats_service.get_stats_close(
+    result = await markets_stats_service.get_stats_close(
         index_name=index_name,
         key_ticker=key_ticker,
         start_date=start_date,
@@ -143,18 +145,18 @@ async def get_stats_close(
     - `key_ticker` (path): The ticker symbol (e.g. `AAPL`, `MSFT`).
     """,
     response_description="Company profile metadata",
-    dependencies=[cache_control(3600)],
+    dependencies=[cache_control(3600, data_generation=True)],
 )
 @inject
 async def get_company_profile(
     index_name: str,
     key_ticker: str,
     markets_stats_service: Annotated[
-        MarketsStatsService, Depends(Provide[Container.markets_stats_service])
+        AsyncMarketsStatsService, Depends(Provide[Container.async_markets_stats_service])
     ],
 ):
     _validate_index_name(index_name)
-    result = markets_stats_service.get_company_profile(
+    result = await markets_stats_service.get_company_profile(
         index_name=index_name,
         key_ticker=key_ticker,
     )
@@ -179,14 +181,14 @@ async def get_company_profile(
     - `end_date` (query, optional): End of the date range in `yyyy-mm-dd` format. Defaults to today.
     """,
     response_description="Bulk close price statistics",
-    dependencies=[cache_control(3600)],
+    dependencies=[cache_control(3600, data_generation=True)],
 )
 @inject
 async def get_stats_close_bulk(
     index_name: str,
     key_tickers: str,
     markets_stats_service: Annotated[
-        MarketsStatsService, Depends(Provide[Container.markets_stats_service])
+        AsyncMarketsStatsService, Depends(Provide[Container.async_markets_stats_service])
     ],
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
@@ -196,7 +198,7 @@ async def get_stats_close_bulk(
     today = datetime.now()
     end_date = end_date or today.strftime("%Y-%m-%d")
     start_date = start_date or (today - timedelta(days=7)).strftime("%Y-%m-%d")
-    results = markets_stats_service.get_stats_close_bulk(
+    results = await markets_stats_service.get_stats_close_bulk(
         index_name=index_name,
         key_tickers=tickers,
         start_date=start_date,
@@ -232,19 +234,19 @@ async def get_stats_close_bulk(
     - `key_tickers` (query): Comma-separated list of ticker symbols (e.g. `AAPL,MSFT`).
     """,
     response_description="Bulk market capitalization data",
-    dependencies=[cache_control(3600)],
+    dependencies=[cache_control(3600, data_generation=True)],
 )
 @inject
 async def get_market_caps_bulk(
     index_name: str,
     key_tickers: str,
     markets_stats_service: Annotated[
-        MarketsStatsService, Depends(Provide[Container.markets_stats_service])
+        AsyncMarketsStatsService, Depends(Provide[Container.async_markets_stats_service])
     ],
 ):
     _validate_index_name(index_name)
     tickers = [t.strip() for t in key_tickers.split(",") if t.strip()]
-    results = markets_stats_service.get_market_caps_bulk(
+    results = await markets_stats_service.get_market_caps_bulk(
         index_name=index_name,
         key_tickers=tickers,
     )
@@ -318,18 +320,18 @@ async def get_market_caps_bulk(
             },
         },
     },
-    dependencies=[cache_control(3600)],
+    dependencies=[cache_control(3600, etag=True, last_modified="date")],
 )
 @inject
 async def get_news(
     index_name: str,
     markets_news_service: Annotated[
-        MarketsNewsService, Depends(Provide[Container.markets_news_service])
+        AsyncMarketsNewsService, Depends(Provide[Container.async_markets_news_service])
     ],
     request: Annotated[NewsListRequest, Depends()],
 ):
     _validate_index_name(index_name)
-    results, sort = markets_news_service.get_news(
+    results, sort = await markets_news_service.get_news(
         index_name=index_name,
         id=request.id,
         key_ticker=request.key_ticker,
@@ -383,18 +385,18 @@ async def get_news(
     - `include_report_html` (query, optional): Include the full HTML report content.
     """,
     response_description="Paginated list of investor briefings with cursor for next page",
-    dependencies=[cache_control(3600)],
+    dependencies=[cache_control(3600, etag=True, last_modified="date")],
 )
 @inject
 async def get_insights_news(
     index_name: str,
     markets_insights_service: Annotated[
-        MarketsInsightsService, Depends(Provide[Container.markets_insights_service])
+        AsyncMarketsInsightsService, Depends(Provide[Container.async_markets_insights_service])
     ],
     request: Annotated[InsightsNewsListRequest, Depends()],
 ):
     _validate_index_name(index_name)
-    results, sort = markets_insights_service.get_insights_news(
+    results, sort = await markets_insights_service.get_insights_news(
         index_name=index_name,
         id=request.id,
         date_from=request.date_from,
@@ -499,6 +501,46 @@ INDICATOR_CONFIG = {
 SUPPORTED_INDICATORS = ", ".join(sorted(INDICATOR_CONFIG.keys()))
 
 
+def _validate_indicator_name(indicator_name: str):
+    if indicator_name not in INDICATOR_CONFIG:
+        raise InvalidFieldError(
+            "indicator_name",
+            f"Unknown indicator '{indicator_name}'. "
+            f"Supported: {SUPPORTED_INDICATORS}",
+        )
+
+
+def _resolve_indicator_dates(request: IndicatorRequest) -> tuple[str, str]:
+    today = datetime.now()
+    end_date = request.end_date or today.strftime("%Y-%m-%d")
+    start_date = request.start_date or (today - timedelta(days=90)).strftime("%Y-%m-%d")
+    return start_date, end_date
+
+
+def _resolve_indicator_params(indicator_name: str, request: IndicatorRequest) -> dict:
+    params = {}
+    for param, default in INDICATOR_CONFIG[indicator_name].items():
+        value = getattr(request, param)
+        if value is None:
+            value = default
+        elif value <= 0:
+            raise InvalidFieldError(param, f"{param} must be greater than 0")
+        params[param] = value
+    return params
+
+
+def _resolve_indicator_specs(indicators: str, request: IndicatorRequest) -> list[dict]:
+    indicator_names = list(dict.fromkeys(i.strip() for i in indicators.split(",") if i.strip()))
+    if not indicator_names:
+        raise InvalidFieldError("indicators", "At least one indicator is required")
+    for indicator_name in indicator_names:
+        _validate_indicator_name(indicator_name)
+    return [
+        {"indicator": name, **_resolve_indicator_params(name, request)}
+        for name in indicator_names
+    ]
+
+
 @router.get(
     path="/indicator/{indicator_name}/{index_name}/{key_ticker}",
     response_model=IndicatorResponse,
@@ -560,7 +602,7 @@ SUPPORTED_INDICATORS = ", ".join(sorted(INDICATOR_CONFIG.keys()))
             },
         },
     },
-    dependencies=[cache_control(3600)],
+    dependencies=[cache_control(3600, data_generation=True)],
 )
 @inject
 async def get_indicator(
@@ -568,36 +610,141 @@ async def get_indicator(
     index_name: str,
     key_ticker: str,
     markets_stats_service: Annotated[
-        MarketsStatsService, Depends(Provide[Container.markets_stats_service])
+        AsyncMarketsStatsService, Depends(Provide[Container.async_markets_stats_service])
     ],
     request: Annotated[IndicatorRequest, Depends()],
 ):
     _validate_index_name(index_name)
+    _validate_indicator_name(indicator_name)
 
-    if indicator_name not in INDICATOR_CONFIG:
-        raise InvalidFieldError(
-            "indicator_name",
-            f"Unknown indicator '{indicator_name}'. "
-            f"Supported: {SUPPORTED_INDICATORS}",
-        )
-
-    today = datetime.now()
-    end_date = request.end_date or today.strftime("%Y-%m-%d")
-    start_date = request.start_date or (today - timedelta(days=90)).strftime("%Y-%m-%d")
-
-    extra_params = INDICATOR_CONFIG[indicator_name]
-    kwargs = {
-        "index_name": index_name,
-        "key_ticker": key_ticker,
-        "start_date": start_date,
-        "end_date": end_date,
+    start_date, end_date = _resolve_indicator_dates(request)
+    spec = {
+        "indicator": indicator_name,
+        **_resolve_indicator_params(indicator_name, request),
     }
-    for param, default in extra_params.items():
-        kwargs[param] = getattr(request, param) or default
-
-    method = getattr(markets_stats_service, f"get_indicator_{indicator_name}")
-    data = method(**kwargs)
+    indicators = await markets_stats_service.get_indicators_bulk(
+        index_name=index_name,
+        key_ticker=key_ticker,
+        start_date=start_date,
+        end_date=end_date,
+        specs=[spec],
+    )
+    data = indicators[indicator_name]
 
     return IndicatorResponse(
         key_ticker=key_ticker, indicator=indicator_name, data=data
     )
+
+
+@router.get(
+    path="/indicators/{index_name}/{key_ticker}",
+    response_model=IndicatorsBulkResponse,
+    operation_id="get_indicators_bulk",
+    summary="Get several technical indicators for a ticker",
+    description="""
+    Returns several technical indicators for a ticker, computed from a single
+    read of its OHLCV series. Results are keyed by indicator name.
+
+    Accepts the same query parameters as `/indicator/{indicator_name}/...`;
+    each extra parameter is applied to every requested indicator that
+    supports it, with the same defaults.
+
+    **Path parameters:**
+    - `index_name`: The Elasticsearch index (e.g. `stocks-eod`).
+    - `key_ticker`: The ticker symbol (e.g. `AAPL`).
+
+    **Query parameters:**
+    - `indicators`: Comma-separated indicator names (e.g. `rsi,macd,ema,adx`).
+    - `start_date` (optional): Start of date range in `yyyy-mm-dd` format. Defaults to 90 days ago.
+    - `end_date` (optional): End of date range in `yyyy-mm-dd` format. Defaults to today.
+    """,
+    response_description="Indicator time series data keyed by indicator name",
+    responses={
+        200: {
+            "description": "Successfully retrieved indicator data",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "key_ticker": "AAPL",
+                        "indicators": {
+                            "rsi": [{"date": "2025-01-10", "rsi": 62.35, "position": 1}],
+                            "obv": [{"date": "2025-01-10", "obv": 1250000.0, "obv_change": 54132987.0, "position": 1}],
+                        },
+                    }
+                }
+            },
+        },
+    },
+    dependencies=[cache_control(3600, data_generation=True)],
+)
+@inject
+async def get_indicators_bulk(
+    index_name: str,
+    key_ticker: str,
+    indicators: str,
+    markets_stats_service: Annotated[
+        AsyncMarketsStatsService, Depends(Provide[Container.async_markets_stats_service])
+    ],
+    request: Annotated[IndicatorRequest, Depends()],
+):
+    _validate_index_name(index_name)
+    specs = _resolve_indicator_specs(indicators, request)
+    start_date, end_date = _resolve_indicator_dates(request)
+    data = await markets_stats_service.get_indicators_bulk(
+        index_name=index_name,
+        key_ticker=key_ticker,
+        start_date=start_date,
+        end_date=end_date,
+        specs=specs,
+    )
+
+    return IndicatorsBulkResponse(key_ticker=key_ticker, indicators=data)
+
+
+@router.get(
+    path="/indicators_bulk/{index_name}",
+    response_model=IndicatorsByTickerResponse,
+    operation_id="get_indicators_by_ticker",
+    summary="Get several technical indicators for multiple tickers",
+    description="""
+    Returns several technical indicators for multiple tickers, computed from a
+    single terms-filtered read of their OHLCV series. Results are keyed by
+    ticker, then by indicator name. Tickers without data map to empty series.
+
+    Accepts the same indicator query parameters as `/indicators/{index_name}/{key_ticker}`.
+
+    Parameters:
+    - `index_name` (path): The Elasticsearch index to query (e.g. `stocks-eod`).
+    - `key_tickers` (query): Comma-separated list of ticker symbols (e.g. `AAPL,MSFT`).
+    - `indicators` (query): Comma-separated indicator names (e.g. `rsi,macd,ema,adx`).
+    - `start_date` (query, optional): Start of the date range in `yyyy-mm-dd` format. Defaults to 90 days ago.
+    - `end_date` (query, optional): End of the date range in `yyyy-mm-dd` format. Defaults to today.
+    """,
+    response_description="Indicator time series data keyed by ticker and indicator name",
+    dependencies=[cache_control(3600, data_generation=True)],
+)
+@inject
+async def get_indicators_by_ticker(
+    index_name: str,
+    key_tickers: str,
+    indicators: str,
+    markets_stats_service: Annotated[
+        AsyncMarketsStatsService, Depends(Provide[Container.async_markets_stats_service])
+    ],
+    request: Annotated[IndicatorRequest, Depends()],
+):
+    _validate_index_name(index_name)
+    tickers = list(dict.fromkeys(t.strip() for t in key_tickers.split(",") if t.strip()))
+    if not tickers:
+        raise InvalidFieldError("key_tickers", "At least one ticker is required")
+    specs = _resolve_indicator_specs(indicators, request)
+    start_date, end_date = _resolve_indicator_dates(request)
+    data = await markets_stats_service.get_indicators_by_ticker(
+        index_name=index_name,
+        key_tickers=tickers,
+        start_date=start_date,
+        end_date=end_date,
+        specs=specs,
+    )
+
+    return IndicatorsByTickerResponse(items=data)
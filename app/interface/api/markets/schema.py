@@ -1,6 +1,13 @@
 from datetime import datetime
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    Field,
+    PositiveFloat,
+    PositiveInt,
+    field_validator,
+    model_validator,
+)
 from typing_extensions import Any, Optional
 
 from app.domain.exceptions.base import InvalidFieldError
@@ -251,14 +258,14 @@ class _DateRangeRequest(BaseModel):
 class IndicatorRequest(BaseModel):
     start_date: Optional[str] = None
     end_date: Optional[str] = None
-    period: Optional[int] = None
-    constant: Optional[float] = None
-    short_window: Optional[int] = None
-    long_window: Optional[int] = None
-    signal_window: Optional[int] = None
-    lookback: Optional[int] = None
-    smooth_k: Optional[int] = None
-    smooth_d: Optional[int] = None
+    period: Optional[PositiveInt] = None
+    constant: Optional[PositiveFloat] = None
+    short_window: Optional[PositiveInt] = None
+    long_window: Optional[PositiveInt] = None
+    signal_window: Optional[PositiveInt] = None
+    lookback: Optional[PositiveInt] = None
+    smooth_k: Optional[PositiveInt] = None
+    smooth_d: Optional[PositiveInt] = None
 
     @field_validator("start_date", "end_date")
     @classmethod
@@ -277,6 +284,15 @@ class IndicatorResponse(BaseModel):
     data: list[Any]
 
 
+class IndicatorsBulkResponse(BaseModel):
+    key_ticker: str
+    indicators: dict[str, list[Any]]
+
+
+class IndicatorsByTickerResponse(BaseModel):
+    items: dict[str, dict[str, list[Any]]]
+
+
 class PublishedContentPreview(BaseModel):
     doc_id: str
     status: str
@@ -1,8 +1,14 @@
+import asyncio
+import json
+import logging
+from uuid import uuid4
+
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, Body, Response, status
+from fastapi import APIRouter, Depends, Body, Query, Response, status
+from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPBearer
 from fastapi_keycloak_middleware import get_user
-from typing_extensions import Annotated, List
+from typing_extensions import Annotated, AsyncIterator, Awaitable, Callable, List, Union
 
 from app.core.container import Container
 from app.domain.exceptions.base import NotFoundError
@@ -15,15 +21,27 @@ from app.interface.api.messages.schema import (
     MessageExpanded,
     Message,
     MessageRequest,
+    MessageTask,
+)
+from app.services.agent_execution import (
+    TASK_FAILED_MESSAGE,
+    AgentExecutionService,
+    Reservation,
 )
+from app.services.agent_types.base import AgentBase
 from app.services.agent_types.registry import AgentRegistry
-from app.services.agents import AgentService
-from app.services.attachments import AttachmentService
-from app.services.messages import MessageService
+from app.services.agents import AsyncAgentService
+from app.services.attachments import AsyncAttachmentService
+from app.services.messages import AsyncMessageService, MessageService
+from app.services.tasks import TaskNotificationService, TaskProgress, TaskUpdateStream
 
+logger = logging.getLogger(__name__)
 router = APIRouter()
 bearer_scheme = HTTPBearer()
 
+# comment lines sent while an agent is quiet, so proxies keep the stream open
+SSE_KEEPALIVE_SECONDS = 15
+
 
 @router.post(
     "/list",
@@ -92,37 +110,59 @@ async def get_list(
         ),
     ],
     message_service: Annotated[
-        MessageService, Depends(Provide[Container.message_service])
+        AsyncMessageService, Depends(Provide[Container.async_message_service])
     ],
     user: Annotated[User, Depends(get_user)],
 ):
     schema = get_schema(user.id if user is not None else None)
-    messages = message_service.get_messages(message_data.agent_id, schema)
+    messages = await message_service.get_messages(message_data.agent_id, schema)
     return [Message.model_validate(message) for message in messages]
 
 
 @router.post(
     "/post",
     dependencies=[Depends(bearer_scheme)],
-    response_model=Message,
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model=Union[MessageTask, Message],
     operation_id="post_message",
     summary="Send a message to an agent",
     description="""
-    Sends a human message to an agent and returns the assistant's response.
+    Sends a human message to an agent and queues it for processing.
 
-    The message is routed to the appropriate agent processor based on agent type.
-    Both the human message and the generated response are stored in the conversation history.
+    The message is routed to the appropriate agent processor based on agent type and
+    runs on the agent worker pool. The call returns immediately with a task id; the
+    assistant's response is stored in the conversation history and announced on the
+    task updates channel (`/agents/ws/task_updates/{agent_id}`) with that task id.
+    When the worker pool is saturated the request is rejected with 429.
 
     Parameters (JSON body):
     - `agent_id`: The unique identifier of the target agent.
     - `message_role`: Must be "human".
     - `message_content`: The text content of the message.
     - `attachment_id` (optional): ID of a previously uploaded attachment to include.
+
+    Parameters (query):
+    - `sync` (optional): Wait for the agent and return the assistant's response (200).
+    - `stream` (optional): Also publish node transitions and LLM tokens on the task
+      updates channel while the agent runs (`?stream=true` on the websocket).
     """,
-    response_description="The assistant's response message",
+    response_description="The queued task, or the assistant's response when `sync=true`",
     responses={
+        202: {
+            "description": "Message accepted and queued for processing",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "task_id": "3f6c1f0e-8d1b-4a51-9a57-0c2d5f7a8e11",
+                        "agent_id": "agent_456",
+                        "status": "queued",
+                        "replies_to": "msg_123",
+                    }
+                }
+            },
+        },
         200: {
-            "description": "Message processed and response generated",
+            "description": "Message processed and response generated (`sync=true`)",
             "content": {
                 "application/json": {
                     "example": {
@@ -157,6 +197,16 @@ async def get_list(
             },
         },
         422: {"description": "Validation error"},
+        429: {
+            "description": "Agent worker pool is saturated",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Too many requests: agent execution queue is full"
+                    }
+                }
+            },
+        },
     },
 )
 @inject
@@ -174,42 +224,200 @@ async def post_message(
             },
         ),
     ],
-    agent_service: Annotated[AgentService, Depends(Provide[Container.agent_service])],
+    response: Response,
+    agent_service: Annotated[
+        AsyncAgentService, Depends(Provide[Container.async_agent_service])
+    ],
     agent_registry: Annotated[
         AgentRegistry, Depends(Provide[Container.agent_registry])
     ],
+    async_message_service: Annotated[
+        AsyncMessageService, Depends(Provide[Container.async_message_service])
+    ],
     message_service: Annotated[
         MessageService, Depends(Provide[Container.message_service])
     ],
+    agent_execution_service: Annotated[
+        AgentExecutionService, Depends(Provide[Container.agent_execution_service])
+    ],
+    task_notification_service: Annotated[
+        TaskNotificationService, Depends(Provide[Container.task_notification_service])
+    ],
     user: Annotated[User, Depends(get_user)],
+    sync: Annotated[
+        bool, Query(description="Wait for the assistant's response")
+    ] = False,
+    stream: Annotated[
+        bool, Query(description="Publish tokens on the task updates channel")
+    ] = False,
 ):
     schema = get_schema(user.id if user is not None else None)
-    agent = agent_service.get_agent_by_id(message_data.agent_id, schema)
+    agent = await agent_service.get_agent_by_id(message_data.agent_id, schema)
     matching_agent = agent_registry.get_agent(agent.agent_type)
 
-    # Store human message
-    human_message = message_service.create_message(
-        message_role=message_data.message_role,
-        message_content=message_data.message_content,
+    # Admit the job first, so a rejected request leaves no orphan human message
+    reservation = agent_execution_service.reserve(
+        schema, asynchronous=stream or agent_execution_service.async_mode
+    )
+    human_message = await _store_human_message(
+        async_message_service, message_data, schema, reservation
+    )
+
+    task_id = str(uuid4())
+
+    if stream:
+
+        async def reply() -> DomainMessage:
+            async with TaskUpdateStream(task_notification_service, task_id) as updates:
+                return await _aprocess_and_store_reply(
+                    matching_agent,
+                    async_message_service,
+                    message_data,
+                    human_message,
+                    schema,
+                    on_event=updates.send,
+                )
+
+    elif agent_execution_service.async_mode:
+
+        async def reply() -> DomainMessage:
+            return await _aprocess_and_store_reply(
+                matching_agent,
+                async_message_service,
+                message_data,
+                human_message,
+                schema,
+            )
+
+    else:
+
+        def reply() -> DomainMessage:
+            return _process_and_store_reply(
+                matching_agent, message_service, message_data, human_message, schema
+            )
+
+    if sync:
+        assistant_message = await agent_execution_service.run(
+            schema, reply, reservation=reservation
+        )
+        response.status_code = status.HTTP_200_OK
+        return Message.model_validate(assistant_message)
+
+    agent_execution_service.submit(
+        schema, message_data.agent_id, reply, task_id=task_id, reservation=reservation
+    )
+    return MessageTask(
+        task_id=task_id,
         agent_id=message_data.agent_id,
-        attachment_id=message_data.attachment_id,
-        schema=schema,
+        replies_to=human_message.id,
     )
 
-    # Process human message
-    processed_message = matching_agent.process_message(message_data, schema)
 
-    # Store assistant message
-    assistant_message = message_service.create_message(
-        message_role="assistant",
-        message_content=processed_message.message_content,
-        response_data=processed_message.response_data,
-        agent_id=processed_message.agent_id,
-        replies_to=human_message,
-        schema=schema,
+@router.post(
+    "/stream",
+    dependencies=[Depends(bearer_scheme)],
+    operation_id="stream_message",
+    summary="Send a message to an agent and stream its response",
+    description="""
+    Sends a human message to an agent and streams the run back as Server-Sent Events.
+
+    The agent runs on the agent worker pool like `/messages/post`, but progress is
+    pushed as it is produced instead of only when the run ends:
+    - `started`: the stored human message id, sent right away
+    - `node`: a graph step started (`node` holds its name)
+    - `token`: LLM output from a graph step (`message_content` holds the text)
+    - `message`: the stored assistant message, once the run has finished
+    - `error`: the run failed (`detail` holds the reason)
+
+    The assistant's response is stored even if the client disconnects before the end.
+    When the worker pool is saturated the request is rejected with 429.
+
+    Parameters (JSON body):
+    - `agent_id`: The unique identifier of the target agent.
+    - `message_role`: Must be "human".
+    - `message_content`: The text content of the message.
+    - `attachment_id` (optional): ID of a previously uploaded attachment to include.
+    """,
+    response_description="Server-Sent Events stream of the agent run",
+    responses={
+        200: {
+            "description": "Event stream of the agent run",
+            "content": {
+                "text/event-stream": {
+                    "example": (
+                        'event: node\ndata: {"agent_id": "agent_456", "status": "in_progress", '
+                        '"event": "node", "node": "reporter"}\n\n'
+                        'event: token\ndata: {"agent_id": "agent_456", "status": "in_progress", '
+                        '"event": "token", "node": "reporter", "message_content": "Markets"}\n\n'
+                    )
+                }
+            },
+        },
+        404: {
+            "description": "Agent not found",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Agent with ID 'agent_456' not found"}
+                }
+            },
+        },
+        429: {"description": "Agent worker pool is saturated"},
+    },
+)
+@inject
+async def stream_message(
+    message_data: Annotated[
+        MessageRequest,
+        Body(..., description="The message to send to the agent"),
+    ],
+    agent_service: Annotated[
+        AsyncAgentService, Depends(Provide[Container.async_agent_service])
+    ],
+    agent_registry: Annotated[
+        AgentRegistry, Depends(Provide[Container.agent_registry])
+    ],
+    async_message_service: Annotated[
+        AsyncMessageService, Depends(Provide[Container.async_message_service])
+    ],
+    agent_execution_service: Annotated[
+        AgentExecutionService, Depends(Provide[Container.agent_execution_service])
+    ],
+    user: Annotated[User, Depends(get_user)],
+):
+    schema = get_schema(user.id if user is not None else None)
+    agent = await agent_service.get_agent_by_id(message_data.agent_id, schema)
+    matching_agent = agent_registry.get_agent(agent.agent_type)
+
+    reservation = agent_execution_service.reserve(schema, asynchronous=True)
+    human_message = await _store_human_message(
+        async_message_service, message_data, schema, reservation
     )
 
-    return Message.model_validate(assistant_message)
+    events: asyncio.Queue = asyncio.Queue()
+
+    async def reply() -> DomainMessage:
+        return await _aprocess_and_store_reply(
+            matching_agent,
+            async_message_service,
+            message_data,
+            human_message,
+            schema,
+            on_event=events.put,
+        )
+
+    task = agent_execution_service.start(schema, reply, reservation=reservation)
+    # None marks the end of the run, whatever its outcome
+    task.add_done_callback(lambda _: events.put_nowait(None))
+
+    return StreamingResponse(
+        _sse_events(
+            task,
+            events,
+            {"agent_id": message_data.agent_id, "replies_to": human_message.id},
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.get(
@@ -274,20 +482,21 @@ async def post_message(
 async def get_by_id(
     message_id: str,
     message_service: Annotated[
-        MessageService, Depends(Provide[Container.message_service])
+        AsyncMessageService, Depends(Provide[Container.async_message_service])
     ],
     attachment_service: Annotated[
-        AttachmentService, Depends(Provide[Container.attachment_service])
+        AsyncAttachmentService,
+        Depends(Provide[Container.async_attachment_service]),
     ],
     user: Annotated[User, Depends(get_user)],
 ):
     schema = get_schema(user.id if user is not None else None)
-    assistant_message = message_service.get_message_by_id(message_id, schema)
-    human_message = message_service.get_message_by_id(
+    assistant_message = await message_service.get_message_by_id(message_id, schema)
+    human_message = await message_service.get_message_by_id(
         assistant_message.replies_to, schema
     )
 
-    return _format_expanded_response(
+    return await _format_expanded_response(
         assistant_message, human_message, attachment_service, schema
     )
 
@@ -323,26 +532,124 @@ async def get_by_id(
 async def remove(
     message_id: str,
     message_service: Annotated[
-        MessageService, Depends(Provide[Container.message_service])
+        AsyncMessageService, Depends(Provide[Container.async_message_service])
     ],
     user: Annotated[User, Depends(get_user)],
 ):
     schema = get_schema(user.id if user is not None else None)
-    message_service.delete_message_by_id(message_id, schema)
+    await message_service.delete_message_by_id(message_id, schema)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
-def _format_expanded_response(
+async def _store_human_message(
+    message_service: AsyncMessageService,
+    message_data: MessageRequest,
+    schema: str,
+    reservation: Reservation,
+) -> DomainMessage:
+    try:
+        return await message_service.create_message(
+            message_role=message_data.message_role,
+            message_content=message_data.message_content,
+            agent_id=message_data.agent_id,
+            attachment_id=message_data.attachment_id,
+            schema=schema,
+        )
+    except BaseException:
+        reservation.release()
+        raise
+
+
+def _process_and_store_reply(
+    matching_agent: AgentBase,
+    message_service: MessageService,
+    message_data: MessageRequest,
+    human_message: DomainMessage,
+    schema: str,
+) -> DomainMessage:
+    # Process human message
+    processed_message = matching_agent.process_message(message_data, schema)
+
+    # Store assistant message
+    return message_service.create_message(
+        message_role="assistant",
+        message_content=processed_message.message_content,
+        response_data=processed_message.response_data,
+        agent_id=processed_message.agent_id,
+        replies_to=human_message,
+        schema=schema,
+    )
+
+
+async def _aprocess_and_store_reply(
+    matching_agent: AgentBase,
+    message_service: AsyncMessageService,
+    message_data: MessageRequest,
+    human_message: DomainMessage,
+    schema: str,
+    on_event: Callable[[TaskProgress], Awaitable[None]] | None = None,
+) -> DomainMessage:
+    if on_event is None:
+        processed_message = await matching_agent.aprocess_message(message_data, schema)
+    else:
+        processed_message = await matching_agent.astream_message(
+            message_data, schema, on_event
+        )
+    return await message_service.create_message(
+        message_role="assistant",
+        message_content=processed_message.message_content,
+        response_data=processed_message.response_data,
+        agent_id=processed_message.agent_id,
+        replies_to=human_message,
+        schema=schema,
+    )
+
+
+async def _sse_events(
+    task: asyncio.Task, events: asyncio.Queue, started: dict
+) -> AsyncIterator[str]:
+    yield _sse("started", json.dumps(started))
+    while True:
+        try:
+            progress = await asyncio.wait_for(
+                events.get(), timeout=SSE_KEEPALIVE_SECONDS
+            )
+        except asyncio.TimeoutError:
+            yield ": keep-alive\n\n"
+            continue
+        if progress is None:
+            break
+        yield _sse(
+            progress.event or "progress", progress.model_dump_json(exclude_none=True)
+        )
+
+    if task.cancelled():
+        yield _sse("error", json.dumps({"detail": "agent run was cancelled"}))
+    elif task.exception() is not None:
+        logger.exception(
+            f"Agent[{started['agent_id']}] -> Streamed run failed",
+            exc_info=task.exception(),
+        )
+        yield _sse("error", json.dumps({"detail": TASK_FAILED_MESSAGE}))
+    else:
+        yield _sse("message", Message.model_validate(task.result()).model_dump_json())
+
+
+def _sse(event: str, data: str) -> str:
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+async def _format_expanded_response(
     agent_message: DomainMessage,
     human_message: DomainMessage,
-    attachment_service: AttachmentService,
+    attachment_service: AsyncAttachmentService,
     schema: str,
 ) -> MessageExpanded:
     attachment_response = None
 
     if human_message.attachment_id is not None:
         try:
-            attachment = attachment_service.get_attachment_by_id(
+            attachment = await attachment_service.get_attachment_by_id(
                 human_message.attachment_id, schema
             )
             attachment_response = Attachment.model_validate(attachment)
@@ -39,6 +39,13 @@ class Message(MessageBase):
         from_attributes = True
 
 
+class MessageTask(BaseModel):
+    task_id: str
+    agent_id: str
+    status: str = "queued"
+    replies_to: Optional[str] = None
+
+
 class MessageExpanded(Message):
     replies_to: Optional[Message]
     attachment: Optional[Attachment]
@@ -2,7 +2,14 @@ import threading
 import time
 
 import psutil
-from fastapi import APIRouter
+from dependency_injector.wiring import inject, Provide
+from fastapi import APIRouter, Depends
+from typing_extensions import Annotated
+
+from app.core.container import Container
+from app.infrastructure.cache.llm_cache import LLMResponseCache
+from app.infrastructure.database.checkpoints import CheckpointRetention
+from app.infrastructure.database.sql import Database
 
 startup_time = time.time()
 
@@ -28,9 +35,20 @@ def readiness():
 
 
 @router.get("/metrics", include_in_schema=False)
-def metrics():
+@inject
+def metrics(
+    db: Annotated[Database, Depends(Provide[Container.db])],
+    checkpoint_retention: Annotated[
+        CheckpointRetention, Depends(Provide[Container.checkpoint_retention])
+    ],
+    llm_response_cache: Annotated[
+        LLMResponseCache, Depends(Provide[Container.llm_response_cache])
+    ],
+):
     """
-    Returns application metrics.
+    Returns application metrics, including database pool checkouts, wait time,
+    search_path hit rate, checkpoint retention with the largest threads and
+    LLM response cache hits with the tokens they saved.
     """
     return {
         "application": {
@@ -53,4 +71,7 @@ def metrics():
             },
         },
         "threads": {"active_count": threading.active_count()},
+        "database": db.pool_metrics(),
+        "checkpoints": checkpoint_retention.metrics(),
+        "llm_cache": llm_response_cache.metrics(),
     }
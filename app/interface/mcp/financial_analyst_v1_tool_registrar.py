@@ -9,8 +9,11 @@ from pydantic import Field
 
 from app.interface.mcp.registrar import McpRegistrar
 from app.interface.mcp.user_prompt_resolver import UserPromptResolver
+from app.services.agent_types.quaks.insights.financial_analyst.v1 import (
+    FINANCIAL_ANALYST_V1_INDICATOR_SPECS,
+)
 from app.services.agent_types.quaks.insights.financial_analyst.v1.portfolio_xray import (
-    compute_xray_data,
+    compute_xray_data_async,
     format_xray_text,
 )
 from app.services.agent_types.quaks.insights.financial_analyst.v1.prompts import (
@@ -105,8 +108,8 @@ class FinancialAnalystV1ToolRegistrar(McpRegistrar):
                 Field(description="Stock ticker symbol (e.g. 'AAPL', 'MSFT', 'NVDA')"),
             ],
         ) -> dict:
-            svc = container.markets_stats_service()
-            return svc.get_company_profile(
+            svc = container.async_markets_stats_service()
+            return await svc.get_company_profile(
                 index_name="quaks_stocks-metadata_latest",
                 key_ticker=ticker.upper(),
             )
@@ -134,12 +137,12 @@ class FinancialAnalystV1ToolRegistrar(McpRegistrar):
                 Field(description="End date in yyyy-mm-dd format. Defaults to today."),
             ] = None,
         ) -> dict:
-            svc = container.markets_stats_service()
+            svc = container.async_markets_stats_service()
             resolved_end = end_date or datetime.now().strftime("%Y-%m-%d")
             resolved_start = start_date or (
                 datetime.now() - timedelta(days=365)
             ).strftime("%Y-%m-%d")
-            return svc.get_stats_close(
+            return await svc.get_stats_close(
                 index_name="quaks_stocks-eod_latest",
                 key_ticker=ticker.upper(),
                 start_date=resolved_start,
@@ -170,46 +173,18 @@ class FinancialAnalystV1ToolRegistrar(McpRegistrar):
                 Field(description="End date in yyyy-mm-dd format. Defaults to today."),
             ] = None,
         ) -> dict:
-            svc = container.markets_stats_service()
+            svc = container.async_markets_stats_service()
             resolved_end = end_date or datetime.now().strftime("%Y-%m-%d")
             resolved_start = start_date or (
                 datetime.now() - timedelta(days=365)
             ).strftime("%Y-%m-%d")
-            index_name = "quaks_stocks-eod_latest"
-            key = ticker.upper()
-            return {
-                "rsi": svc.get_indicator_rsi(
-                    index_name=index_name,
-                    key_ticker=key,
-                    start_date=resolved_start,
-                    end_date=resolved_end,
-                    period=14,
-                ),
-                "macd": svc.get_indicator_macd(
-                    index_name=index_name,
-                    key_ticker=key,
-                    start_date=resolved_start,
-                    end_date=resolved_end,
-                    short_window=12,
-                    long_window=26,
-                    signal_window=9,
-                ),
-                "ema": svc.get_indicator_ema(
-                    index_name=index_name,
-                    key_ticker=key,
-                    start_date=resolved_start,
-                    end_date=resolved_end,
-                    short_window=10,
-                    long_window=20,
-                ),
-                "adx": svc.get_indicator_adx(
-                    index_name=index_name,
-                    key_ticker=key,
-                    start_date=resolved_start,
-                    end_date=resolved_end,
-                    period=14,
-                ),
-            }
+            return await svc.get_indicators_bulk(
+                index_name="quaks_stocks-eod_latest",
+                key_ticker=ticker.upper(),
+                start_date=resolved_start,
+                end_date=resolved_end,
+                specs=FINANCIAL_ANALYST_V1_INDICATOR_SPECS,
+            )
 
         @mcp.tool(
             name="fetch_portfolio_xray_mcp",
@@ -228,9 +203,9 @@ class FinancialAnalystV1ToolRegistrar(McpRegistrar):
                 ),
             ],
         ) -> str:
-            svc = container.markets_stats_service()
+            svc = container.async_markets_stats_service()
             ticker_list = [t.strip().upper() for t in tickers.split(",") if t.strip()]
-            data = compute_xray_data(svc, ticker_list)
+            data = await compute_xray_data_async(svc, ticker_list)
             return format_xray_text(data)
 
     def register_prompts(self, mcp: FastMCP) -> None:
@@ -135,7 +135,7 @@ class NewsToolRegistrar(McpRegistrar):
                 ),
             ] = False,
         ) -> NewsList:
-            svc = container.markets_news_service()
+            svc = container.async_markets_news_service()
             resolved_from = (
                 None
                 if id
@@ -144,7 +144,7 @@ class NewsToolRegistrar(McpRegistrar):
             )
             content_requested = include_content or id is not None
 
-            results, sort = svc.get_news(
+            results, sort = await svc.get_news(
                 index_name="quaks_markets-news_latest",
                 id=id,
                 search_term=search_term,
@@ -217,9 +217,9 @@ class NewsToolRegistrar(McpRegistrar):
                 ),
             ] = False,
         ) -> InsightsNewsList:
-            svc = container.markets_insights_service()
+            svc = container.async_markets_insights_service()
 
-            results, sort = svc.get_insights_news(
+            results, sort = await svc.get_insights_news(
                 index_name="quaks_insights-news_latest",
                 id=id,
                 date_from=date_from,
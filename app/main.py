@@ -1,11 +1,13 @@
+import inspect
 import logging
 import os
 import re
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi_keycloak_middleware import KeycloakConfiguration, setup_keycloak_middleware
 from starlette.middleware.cors import CORSMiddleware
-from starlette.responses import JSONResponse, FileResponse
+from starlette.responses import FileResponse, JSONResponse, Response
 from starlette.staticfiles import StaticFiles
 
 from app.core.container import Container
@@ -15,6 +17,7 @@ from app.infrastructure.metrics.logging_middleware import LoggingMiddleware
 from app.interface.api.agents.endpoints import router as agents_router
 from app.interface.api.attachments.endpoints import router as attachments_router
 from app.interface.api.auth.endpoints import router as auth_router
+from app.interface.api.cache_control import ConditionalGetMiddleware
 from app.interface.api.integrations.endpoints import router as integrations_router
 from app.interface.api.language_models.endpoints import router as language_models_router
 from app.interface.api.markets.endpoints import router as markets_router
@@ -37,7 +40,7 @@ def create_app():
         title=os.getenv("SERVICE_NAME", "Quaks"),
         version=os.getenv("SERVICE_VERSION", "snapshot"),
         dependencies=[],
-        lifespan=mcp_app.lifespan,
+        lifespan=build_lifespan(container, mcp_app.lifespan),
     )
     application.container = container
 
@@ -54,6 +57,52 @@ def create_app():
     return application
 
 
+def build_lifespan(container, mcp_lifespan):
+    @asynccontextmanager
+    async def lifespan(application):
+        container.checkpoint_retention().start()
+        try:
+            async with mcp_lifespan(application):
+                yield
+        finally:
+            # agent jobs go first, while the clients they use are still open
+            await _shutdown(
+                (
+                    "agent executor",
+                    lambda: container.agent_execution_service().shutdown(),
+                ),
+                (
+                    "checkpoint retention",
+                    lambda: container.checkpoint_retention().close(),
+                ),
+                (
+                    "checkpoint pool",
+                    lambda: container.graph_persistence_factory().aclose(),
+                ),
+                ("elasticsearch", lambda: container.async_es().close()),
+                ("database", lambda: container.async_db().dispose()),
+                (
+                    "markets result cache",
+                    lambda: container.markets_result_cache().aclose(),
+                ),
+                ("secret cache", lambda: container.secret_cache().close()),
+                ("llm response cache", lambda: container.llm_response_cache().close()),
+            )
+
+    return lifespan
+
+
+async def _shutdown(*steps):
+    """Runs every shutdown step, logging failures instead of skipping the steps after them."""
+    for name, step in steps:
+        try:
+            result = step()
+            if inspect.isawaitable(result):
+                await result
+        except Exception:
+            logger.exception(f"Shutdown -> {name} failed")
+
+
 def setup_auth(container, application):
     config = container.config()
     if config["auth"]["enabled"]:
@@ -170,6 +219,9 @@ def setup_routers(container: Container, application: FastAPI):
 def setup_exception_handlers(application: FastAPI):
     @application.exception_handler(HTTPException)
     async def http_exception_handler(request: Request, exc: HTTPException):
+        if exc.status_code == 304:
+            return Response(status_code=304, headers=exc.headers)
+
         match = re.match(r"^(\d+):", exc.detail)
         if match:
             status_code = int(match.group(1))
@@ -181,6 +233,7 @@ def setup_exception_handlers(application: FastAPI):
         return JSONResponse(
             status_code=status_code,
             content={"detail": detail},
+            headers=exc.headers,
         )
 
 
@@ -190,6 +243,9 @@ def setup_tracing(container: Container, application: FastAPI):
 
 
 def setup_middleware(application: FastAPI):
+    application.add_middleware(
+        ConditionalGetMiddleware,
+    )
     application.add_middleware(
         LoggingMiddleware,
     )
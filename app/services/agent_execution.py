@@ -0,0 +1,315 @@
+import asyncio
+import inspect
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from uuid import uuid4
+
+from typing_extensions import Awaitable, Callable, TypeVar, Union
+
+from app.domain.exceptions.base import TooManyRequestsError
+from app.domain.models import Message
+from app.services.tasks import TaskNotificationService, TaskProgress
+
+T = TypeVar("T")
+
+Job = Union[Callable[[], T], Callable[[], Awaitable[T]]]
+
+TASK_FAILED_MESSAGE = "The agent could not complete this task."
+
+
+class AgentExecutionService:
+    """
+    Runs agent workflows on a bounded worker pool so they never block the event loop.
+
+    Admission is capped at `max_workers + queue_size` jobs in flight overall and at
+    `per_tenant_limit` per schema; anything beyond that is rejected with a 429 instead
+    of piling up. Detached jobs report their outcome on the task notification channel.
+
+    Coroutine jobs (`async_mode`) run on the event loop instead of the pool and are
+    capped separately by `max_async_tasks`, since they mostly wait on LLM I/O.
+    """
+
+    def __init__(
+        self,
+        task_notification_service: TaskNotificationService,
+        max_workers: int | None = None,
+        queue_size: int | None = None,
+        per_tenant_limit: int | None = None,
+        async_mode: bool | None = None,
+        max_async_tasks: int | None = None,
+    ) -> None:
+        self.task_notification_service = task_notification_service
+        self.max_workers = max_workers or 4
+        self.capacity = self.max_workers + (
+            queue_size if queue_size is not None else 16
+        )
+        self.per_tenant_limit = per_tenant_limit or self.max_workers
+        self.async_mode = bool(async_mode)
+        self.async_capacity = max_async_tasks or 256
+        self.logger = logging.getLogger(__name__)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="agent-worker"
+        )
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._in_flight_async = 0
+        self._in_flight_by_tenant: dict[str, int] = {}
+        self._tasks: set[asyncio.Task] = set()
+        # detached jobs not finished yet, to report those dropped on shutdown
+        self._detached: dict[Future | asyncio.Task, tuple[str, str, Reservation]] = {}
+
+    def reserve(self, schema: str, asynchronous: bool = False) -> "Reservation":
+        """
+        Admit a job before it is built, so callers persist its inputs only once it
+        is known to run. Hand the reservation to `submit`, `run` or `start`, or
+        `release()` it if the job is abandoned. Raises `TooManyRequestsError` when
+        the pool is saturated.
+        """
+        self._admit(schema, asynchronous)
+        return Reservation(schema, asynchronous, self._release)
+
+    def submit(
+        self,
+        schema: str,
+        agent_id: str,
+        job: Job[Message],
+        task_id: str | None = None,
+        reservation: "Reservation | None" = None,
+    ) -> str:
+        """Queue `job` and return a task id; the result is published when it finishes."""
+        task_id = task_id or str(uuid4())
+        reservation = self._claim(schema, job, reservation)
+        if reservation.asynchronous:
+            detached = self._spawn(
+                self._run_detached_async(task_id, reservation, agent_id, job),
+                reservation,
+            )
+        else:
+            detached = self._queue(
+                reservation, self._run_detached, task_id, reservation, agent_id, job
+            )
+        self._detached[detached] = (task_id, agent_id, reservation)
+        detached.add_done_callback(self._forget_detached)
+        return task_id
+
+    async def run(
+        self, schema: str, job: Job[T], reservation: "Reservation | None" = None
+    ) -> T:
+        """Run `job` and wait for its result."""
+        reservation = self._claim(schema, job, reservation)
+        if reservation.asynchronous:
+            try:
+                return await job()
+            finally:
+                reservation.release()
+
+        future = self._queue(reservation, self._run_attached, reservation, job)
+        return await asyncio.wrap_future(future)
+
+    def start(
+        self,
+        schema: str,
+        job: Callable[[], Awaitable[T]],
+        reservation: "Reservation | None" = None,
+    ) -> asyncio.Task:
+        """
+        Admit a coroutine job and run it as a task, for callers that consume its
+        progress while it runs. The task outlives the caller, so a client that goes
+        away does not lose the result.
+        """
+        reservation = self._claim(schema, job, reservation)
+
+        async def run() -> T:
+            try:
+                return await job()
+            except Exception:
+                self.logger.exception(f"Agent task for {schema} failed")
+                raise
+            finally:
+                reservation.release()
+
+        return self._spawn(run(), reservation)
+
+    def shutdown(self) -> None:
+        """
+        Stop running jobs. Running pool jobs finish on their own; queued ones and
+        coroutine jobs are cancelled, and detached ones among them are published as
+        failed so their subscribers are not left waiting.
+        """
+        # cancelled futures drop out of `_detached` right away, so take a snapshot first
+        detached_jobs = list(self._detached.items())
+        cancelled = {task for task in list(self._tasks) if task.cancel()}
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        for detached, (task_id, agent_id, reservation) in detached_jobs:
+            if detached in cancelled or detached.cancelled():
+                self.logger.warning(
+                    f"Agent[{agent_id}] -> Task {task_id} dropped on shutdown"
+                )
+                reservation.release()
+                self._publish(self._task_failure(task_id, agent_id))
+
+    def metrics(self) -> dict:
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "capacity": self.capacity,
+                "in_flight": self._in_flight,
+                "async_capacity": self.async_capacity,
+                "async_in_flight": self._in_flight_async,
+                "tenants": len(self._in_flight_by_tenant),
+            }
+
+    def _spawn(
+        self, coroutine: Awaitable[T], reservation: "Reservation"
+    ) -> asyncio.Task:
+        try:
+            task = asyncio.get_running_loop().create_task(coroutine)
+        except BaseException:
+            coroutine.close()
+            reservation.release()
+            raise
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def _queue(self, reservation: "Reservation", fn: Callable[..., T], *args) -> Future:
+        try:
+            return self._executor.submit(fn, *args)
+        except BaseException:
+            # e.g. submitted after shutdown
+            reservation.release()
+            raise
+
+    def _forget_detached(self, detached: Future | asyncio.Task) -> None:
+        self._detached.pop(detached, None)
+
+    def _claim(
+        self, schema: str, job: Job, reservation: "Reservation | None"
+    ) -> "Reservation":
+        asynchronous = inspect.iscoroutinefunction(job)
+        if reservation is None:
+            return self.reserve(schema, asynchronous)
+        if reservation.asynchronous != asynchronous:
+            raise ValueError("reservation was made for a different kind of job")
+        return reservation
+
+    def _admit(self, schema: str, asynchronous: bool = False) -> None:
+        with self._lock:
+            if asynchronous:
+                saturated = self._in_flight_async >= self.async_capacity
+            else:
+                saturated = self._in_flight >= self.capacity
+            if saturated:
+                raise TooManyRequestsError("agent execution queue is full")
+            if self._in_flight_by_tenant.get(schema, 0) >= self.per_tenant_limit:
+                raise TooManyRequestsError(
+                    "too many agent tasks running for this account"
+                )
+            if asynchronous:
+                self._in_flight_async += 1
+            else:
+                self._in_flight += 1
+            self._in_flight_by_tenant[schema] = (
+                self._in_flight_by_tenant.get(schema, 0) + 1
+            )
+
+    def _release(self, schema: str, asynchronous: bool = False) -> None:
+        with self._lock:
+            if asynchronous:
+                self._in_flight_async -= 1
+            else:
+                self._in_flight -= 1
+            remaining = self._in_flight_by_tenant.get(schema, 0) - 1
+            if remaining > 0:
+                self._in_flight_by_tenant[schema] = remaining
+            else:
+                self._in_flight_by_tenant.pop(schema, None)
+
+    @staticmethod
+    def _run_attached(reservation: "Reservation", job: Callable[[], T]) -> T:
+        try:
+            return job()
+        finally:
+            reservation.release()
+
+    def _run_detached(
+        self,
+        task_id: str,
+        reservation: "Reservation",
+        agent_id: str,
+        job: Callable[[], Message],
+    ) -> None:
+        try:
+            progress = self._task_result(task_id, agent_id, job())
+        except Exception:
+            self.logger.exception(f"Agent[{agent_id}] -> Task {task_id} failed")
+            progress = self._task_failure(task_id, agent_id)
+        finally:
+            reservation.release()
+        self._publish(progress)
+
+    async def _run_detached_async(
+        self,
+        task_id: str,
+        reservation: "Reservation",
+        agent_id: str,
+        job: Callable[[], Awaitable[Message]],
+    ) -> None:
+        try:
+            progress = self._task_result(task_id, agent_id, await job())
+        except Exception:
+            self.logger.exception(f"Agent[{agent_id}] -> Task {task_id} failed")
+            progress = self._task_failure(task_id, agent_id)
+        finally:
+            reservation.release()
+        await asyncio.to_thread(self._publish, progress)
+
+    @staticmethod
+    def _task_result(task_id: str, agent_id: str, message: Message) -> TaskProgress:
+        return TaskProgress(
+            task_id=task_id,
+            agent_id=agent_id,
+            status="completed",
+            message_id=message.id,
+            message_content=message.message_content,
+            response_data=message.response_data,
+        )
+
+    @staticmethod
+    def _task_failure(task_id: str, agent_id: str) -> TaskProgress:
+        # the channel is shared by every subscriber, so error details stay in the logs
+        return TaskProgress(
+            task_id=task_id,
+            agent_id=agent_id,
+            status="failed",
+            message_content=TASK_FAILED_MESSAGE,
+        )
+
+    def _publish(self, progress: TaskProgress) -> None:
+        try:
+            self.task_notification_service.publish_update(task_progress=progress)
+        except Exception:
+            self.logger.exception(
+                f"Agent[{progress.agent_id}] -> Task {progress.task_id} result not published"
+            )
+
+
+class Reservation:
+    """An admitted slot in `AgentExecutionService`; `release()` frees it exactly once."""
+
+    def __init__(
+        self, schema: str, asynchronous: bool, release: Callable[[str, bool], None]
+    ) -> None:
+        self.schema = schema
+        self.asynchronous = asynchronous
+        self._release = release
+        self._released = False
+        self._lock = threading.Lock()
+
+    def release(self) -> None:
+        with self._lock:
+            if self._released:
+                return
+            self._released = True
+        self._release(self.schema, self.asynchronous)
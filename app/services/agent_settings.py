@@ -1,7 +1,10 @@
 from typing_extensions import Iterator
 
 from app.domain.models import AgentSetting
-from app.domain.repositories.agents import AgentSettingRepository
+from app.domain.repositories.agents import (
+    AgentSettingRepository,
+    AsyncAgentSettingRepository,
+)
 
 
 class AgentSettingService:
@@ -33,3 +36,38 @@ class AgentSettingService:
 
     def delete_by_agent_id(self, agent_id: str, schema: str) -> None:
         return self.repository.delete_by_agent_id(agent_id=agent_id, schema=schema)
+
+
+class AsyncAgentSettingService:
+    def __init__(self, agent_setting_repository: AsyncAgentSettingRepository) -> None:
+        self.repository: AsyncAgentSettingRepository = agent_setting_repository
+
+    async def get_agent_settings(
+        self, agent_id: str, schema: str
+    ) -> list[AgentSetting]:
+        return await self.repository.get_all(agent_id, schema)
+
+    async def create_agent_setting(
+        self, agent_id: str, setting_key: str, setting_value: str, schema: str
+    ) -> AgentSetting:
+        return await self.repository.add(
+            agent_id=agent_id,
+            setting_key=setting_key,
+            setting_value=setting_value,
+            schema=schema,
+        )
+
+    async def update_by_key(
+        self, agent_id: str, setting_key: str, setting_value: str, schema: str
+    ) -> AgentSetting:
+        return await self.repository.update_by_key(
+            agent_id=agent_id,
+            setting_key=setting_key,
+            setting_value=setting_value,
+            schema=schema,
+        )
+
+    async def delete_by_agent_id(self, agent_id: str, schema: str) -> None:
+        return await self.repository.delete_by_agent_id(
+            agent_id=agent_id, schema=schema
+        )
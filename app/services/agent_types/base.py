@@ -5,6 +5,7 @@ import os
 import shlex
 import uuid
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from datetime import timedelta, datetime, timezone
 
 import hvac
@@ -23,21 +24,31 @@ from jinja2 import Environment, DictLoader, select_autoescape
 from langchain_anthropic import ChatAnthropic
 from langchain_core.embeddings import Embeddings
 from langchain_core.language_models import BaseChatModel
-from langchain_core.messages import HumanMessage
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.tools import tool, BaseTool
 from langchain_xai import ChatXAI
 from langchain_ollama import ChatOllama, OllamaEmbeddings
 from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 from langchain_tavily import TavilySearch, TavilyExtract
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph import MessagesState
+from langgraph.graph.state import CompiledStateGraph
+from langgraph.prebuilt import create_react_agent
+from langgraph.runtime import Runtime, get_runtime
 from langgraph.types import Command
 from openai import OpenAI
-from typing_extensions import List, Annotated, Literal
+from typing_extensions import Awaitable, Callable, Hashable, List, Annotated, Literal
 
 from app.domain.exceptions.base import ResourceNotFoundError
 from app.domain.models import Agent, Integration, LanguageModel
-from app.infrastructure.database.checkpoints import GraphPersistenceFactory
+from app.infrastructure.cache.llm_cache import LLMResponseCache
+from app.infrastructure.cache.model_clients import ModelBinding, ModelClientCache
+from app.infrastructure.cache.secret_cache import SecretCache
+from app.infrastructure.database.checkpoints import (
+    CheckpointThreads,
+    GraphPersistenceFactory,
+)
 from app.infrastructure.database.vectors import DocumentRepository
 from app.interface.api.messages.schema import MessageRequest, Message
 from app.services.agent_settings import AgentSettingService
@@ -48,6 +59,26 @@ from app.services.language_model_settings import LanguageModelSettingService
 from app.services.language_models import LanguageModelService
 from app.services.tasks import TaskNotificationService, TaskProgress
 
+# agent setting that opts the agent's chat models in to the LLM response cache
+LLM_RESPONSE_CACHE_SETTING = "llm_response_cache"
+
+
+def _message_key(msg) -> Hashable:
+    # equal messages always share a key, so only messages under the same key are compared
+    if isinstance(msg, BaseMessage):
+        return (
+            type(msg),
+            msg.id,
+            msg.content if isinstance(msg.content, str) else None,
+            getattr(msg, "tool_call_id", None),
+            tuple(call.get("id") for call in getattr(msg, "tool_calls", None) or ()),
+        )
+    try:
+        hash(msg)
+        return msg
+    except TypeError:
+        return type(msg)
+
 
 def join_messages(left: List, right: List) -> List:
     if not isinstance(left, list):
@@ -55,16 +86,63 @@ def join_messages(left: List, right: List) -> List:
     if not isinstance(right, list):
         right = [right]
 
-    combined = left + right
-
     unique_messages = []
-    for msg in combined:
-        if msg not in unique_messages:
-            unique_messages.append(msg)
+    seen: dict[Hashable, list] = {}
+    for msg in left + right:
+        candidates = seen.setdefault(_message_key(msg), [])
+        if any(other is msg or other == msg for other in candidates):
+            continue
+        candidates.append(msg)
+        unique_messages.append(msg)
 
     return unique_messages
 
 
+def _stream_progress(agent_id: str, event: dict) -> TaskProgress | None:
+    """The update a client sees for a `astream_events` event, if any."""
+    node = event.get("metadata", {}).get("langgraph_node")
+    # parent_ids holds just the graph run for its own nodes; sub-agent nodes sit deeper
+    if (
+        event["event"] == "on_chain_start"
+        and event["name"] == node
+        and len(event["parent_ids"]) == 1
+    ):
+        return TaskProgress(
+            agent_id=agent_id, status="in_progress", event="node", node=node
+        )
+    if event["event"] == "on_chat_model_stream":
+        text = event["data"]["chunk"].text
+        if text:
+            return TaskProgress(
+                agent_id=agent_id,
+                status="in_progress",
+                event="token",
+                node=node,
+                message_content=text,
+            )
+    return None
+
+
+@dataclass
+class ReactAgentContext:
+    """Per-run values of a ReAct sub-agent built by `WorkflowAgentBase.get_react_agent`."""
+
+    chat_model: BaseChatModel
+    system_prompt: str
+
+
+def _react_agent_model(tools: list) -> Callable:
+    def select_model(state, runtime: Runtime[ReactAgentContext]):
+        return runtime.context.chat_model.bind_tools(tools)
+
+    return select_model
+
+
+def _react_agent_prompt(state) -> list:
+    system_prompt = get_runtime(ReactAgentContext).context.system_prompt
+    return [SystemMessage(content=system_prompt), *state["messages"]]
+
+
 class AgentUtils:
     def __init__(
         self,
@@ -79,6 +157,10 @@ class AgentUtils:
         document_repository: DocumentRepository,
         task_notification_service: TaskNotificationService,
         config: Configuration,
+        model_client_cache: ModelClientCache | None = None,
+        secret_cache: SecretCache | None = None,
+        checkpoint_threads: CheckpointThreads | None = None,
+        llm_response_cache: LLMResponseCache | None = None,
     ):
         self.config = config
         self.agent_service = agent_service
@@ -91,6 +173,10 @@ class AgentUtils:
         self.graph_persistence_factory = graph_persistence_factory
         self.document_repository = document_repository
         self.task_notification_service = task_notification_service
+        self.model_client_cache = model_client_cache or ModelClientCache()
+        self.secret_cache = secret_cache or SecretCache(vault_client)
+        self.checkpoint_threads = checkpoint_threads or CheckpointThreads()
+        self.llm_response_cache = llm_response_cache or LLMResponseCache()
 
 
 class AgentBase(ABC):
@@ -105,6 +191,10 @@ class AgentBase(ABC):
         self.integration_service = agent_utils.integration_service
         self.task_notification_service = agent_utils.task_notification_service
         self.vault_client = agent_utils.vault_client
+        self.model_client_cache = agent_utils.model_client_cache
+        self.secret_cache = agent_utils.secret_cache
+        self.checkpoint_threads = agent_utils.checkpoint_threads
+        self.llm_response_cache = agent_utils.llm_response_cache
         self.logger = logging.getLogger(__name__)
 
     @abstractmethod
@@ -119,6 +209,23 @@ class AgentBase(ABC):
     def process_message(self, message_request: MessageRequest, schema: str) -> Message:
         pass
 
+    async def aprocess_message(
+        self, message_request: MessageRequest, schema: str
+    ) -> Message:
+        return await asyncio.to_thread(self.process_message, message_request, schema)
+
+    async def astream_message(
+        self,
+        message_request: MessageRequest,
+        schema: str,
+        on_event: Callable[[TaskProgress], Awaitable[None]],
+    ) -> Message:
+        """
+        Like `aprocess_message`, reporting node transitions and LLM tokens to
+        `on_event` while the agent runs. Agents without a graph only return the result.
+        """
+        return await self.aprocess_message(message_request, schema)
+
     def format_response(self, workflow_state: MessagesState) -> (str, dict):
         response_data = {
             "messages": [
@@ -139,66 +246,142 @@ class AgentBase(ABC):
         )
         return language_model, integration
 
+    def get_model_binding(self, agent_id: str, schema: str) -> ModelBinding:
+        def load() -> ModelBinding:
+            agent = self.agent_service.get_agent_by_id(agent_id, schema)
+            language_model, integration = self.get_language_model_integration(
+                agent, schema
+            )
+            return ModelBinding(
+                language_model_id=language_model.id,
+                language_model_tag=language_model.language_model_tag,
+                integration_id=integration.id,
+                integration_type=integration.integration_type,
+            )
+
+        return self.model_client_cache.binding(schema, agent_id, load)
+
     def get_integration_credentials(self, integration: Integration) -> (str, str):
-        secrets = self.vault_client.secrets.kv.read_secret_version(
-            path=f"integration_{integration.id}", raise_on_deleted_version=False
-        )
-        api_endpoint = secrets["data"]["data"]["api_endpoint"]
-        api_key = secrets["data"]["data"]["api_key"]
-        return api_endpoint, api_key
+        return self._get_integration_credentials(integration.id)
+
+    def _get_integration_credentials(self, integration_id: str) -> (str, str):
+        secret = self.secret_cache.read(f"integration_{integration_id}")
+        return secret["api_endpoint"], secret["api_key"]
 
     def get_embeddings_model(self, agent_id, schema: str) -> Embeddings:
-        agent = self.agent_service.get_agent_by_id(agent_id, schema)
-        language_model, integration = self.get_language_model_integration(agent, schema)
-        api_endpoint, api_key = self.get_integration_credentials(integration)
+        binding = self.get_model_binding(agent_id, schema)
+        credentials = self._get_integration_credentials(binding.integration_id)
 
-        lm_settings = self.language_model_setting_service.get_language_model_settings(
-            language_model.id, schema
-        )
+        def load_model_name() -> str:
+            lm_settings = (
+                self.language_model_setting_service.get_language_model_settings(
+                    binding.language_model_id, schema
+                )
+            )
+            lm_settings_dict = {
+                setting.setting_key: setting.setting_value for setting in lm_settings
+            }
+            return lm_settings_dict["embeddings"]
 
-        lm_settings_dict = {
-            setting.setting_key: setting.setting_value for setting in lm_settings
-        }
+        model_name = self.model_client_cache.embeddings_model_name(
+            schema, binding.language_model_id, load_model_name
+        )
+        return self.model_client_cache.client(
+            binding.integration_id,
+            "embeddings",
+            model_name,
+            credentials,
+            lambda: self._build_embeddings_model(
+                binding.integration_type, model_name, *credentials
+            ),
+        )
 
-        if integration.integration_type == "openai_api_v1":
+    @staticmethod
+    def _build_embeddings_model(
+        integration_type: str, model_name: str, api_endpoint: str, api_key: str
+    ) -> Embeddings:
+        if integration_type == "openai_api_v1":
             return OpenAIEmbeddings(
-                model=lm_settings_dict["embeddings"],
+                model=model_name,
                 openai_api_base=api_endpoint,
                 openai_api_key=api_key,
             )
-        elif integration.integration_type == "ollama_api_v1":
-            return OllamaEmbeddings(
-                model=lm_settings_dict["embeddings"], base_url=api_endpoint
-            )
+        elif integration_type == "ollama_api_v1":
+            return OllamaEmbeddings(model=model_name, base_url=api_endpoint)
         else:
             return OllamaEmbeddings(
-                model=lm_settings_dict["embeddings"],
+                model=model_name,
                 base_url=f"{os.getenv('OLLAMA_ENDPOINT')}",
             )
 
     def get_chat_model(
         self, agent_id, schema: str, language_model_tag: str = None
     ) -> BaseChatModel:
-        agent = self.agent_service.get_agent_by_id(agent_id, schema)
-        language_model, integration = self.get_language_model_integration(agent, schema)
-        api_endpoint, api_key = self.get_integration_credentials(integration)
+        binding = self.get_model_binding(agent_id, schema)
+        credentials = self._get_integration_credentials(binding.integration_id)
 
         if language_model_tag is None:
-            language_model_tag = language_model.language_model_tag
+            language_model_tag = binding.language_model_tag
+
+        if self.is_response_cache_enabled(agent_id, schema):
+            # cached responses are per tenant, so each schema gets its own client
+            response_cache = self.llm_response_cache.scoped(
+                f"{schema}:{binding.integration_id}"
+            )
+            return self.model_client_cache.client(
+                binding.integration_id,
+                f"chat-cached:{schema}",
+                language_model_tag,
+                credentials,
+                lambda: self._build_chat_model(
+                    binding.integration_type, language_model_tag, *credentials
+                ).model_copy(update={"cache": response_cache}),
+            )
 
-        if integration.integration_type == "openai_api_v1":
+        return self.model_client_cache.client(
+            binding.integration_id,
+            "chat",
+            language_model_tag,
+            credentials,
+            lambda: self._build_chat_model(
+                binding.integration_type, language_model_tag, *credentials
+            ),
+        )
+
+    def is_response_cache_enabled(self, agent_id: str, schema: str) -> bool:
+        """Whether the agent opted in to `LLMResponseCache` with its `llm_response_cache` setting."""
+
+        def load() -> bool:
+            settings = self.agent_setting_service.get_agent_settings(agent_id, schema)
+            value = next(
+                (
+                    setting.setting_value
+                    for setting in settings
+                    if setting.setting_key == LLM_RESPONSE_CACHE_SETTING
+                ),
+                "",
+            )
+            return str(value).strip().lower() in ("true", "1", "yes", "enabled")
+
+        return self.model_client_cache.response_cache_enabled(schema, agent_id, load)
+
+    @staticmethod
+    def _build_chat_model(
+        integration_type: str, language_model_tag: str, api_endpoint: str, api_key: str
+    ) -> BaseChatModel:
+        if integration_type == "openai_api_v1":
             return ChatOpenAI(
                 model_name=language_model_tag,
                 openai_api_base=api_endpoint,
                 openai_api_key=api_key,
             )
-        elif integration.integration_type == "xai_api_v1":
+        elif integration_type == "xai_api_v1":
             return ChatXAI(
                 model=language_model_tag,
                 xai_api_base=api_endpoint,
                 xai_api_key=api_key,
             )
-        elif integration.integration_type == "anthropic_api_v1":
+        elif integration_type == "anthropic_api_v1":
             return ChatAnthropic(
                 model=language_model_tag,
                 anthropic_api_url=api_endpoint,
@@ -210,14 +393,29 @@ class AgentBase(ABC):
                 base_url=api_endpoint,
             )
 
+    async def aget_chat_model(
+        self, agent_id, schema: str, language_model_tag: str = None
+    ) -> BaseChatModel:
+        # settings, integration and vault lookups block on a cache miss
+        return await asyncio.to_thread(
+            self.get_chat_model, agent_id, schema, language_model_tag
+        )
+
     def get_openai_client(self, agent_id: str, schema: str) -> OpenAI:
-        agent = self.agent_service.get_agent_by_id(agent_id, schema)
-        _, integration = self.get_language_model_integration(agent, schema)
-        api_endpoint, api_key = self.get_integration_credentials(integration)
+        binding = self.get_model_binding(agent_id, schema)
+        api_endpoint, api_key = credentials = self._get_integration_credentials(
+            binding.integration_id
+        )
 
-        return OpenAI(
-            api_key=api_key,
-            base_url=api_endpoint,
+        return self.model_client_cache.client(
+            binding.integration_id,
+            "openai",
+            None,
+            credentials,
+            lambda: OpenAI(
+                api_key=api_key,
+                base_url=api_endpoint,
+            ),
         )
 
     def read_file_content(self, file_path: str) -> str:
@@ -246,15 +444,64 @@ class WorkflowAgentBase(AgentBase, ABC):
     def __init__(self, agent_utils: AgentUtils):
         super().__init__(agent_utils)
         self.graph_persistence_factory = agent_utils.graph_persistence_factory
+        self._compiled_workflows: dict[bool, CompiledStateGraph] = {}
+        self._react_agents: dict[str, CompiledStateGraph] = {}
 
     @abstractmethod
     def get_workflow_builder(self, agent_id: str):
         pass
 
+    def get_async_workflow_builder(self, agent_id: str):
+        """Graph used by `aprocess_message`; sync nodes run on LangGraph's executor."""
+        return self.get_workflow_builder(agent_id)
+
+    def get_compiled_workflow(
+        self,
+        agent_id: str,
+        checkpointer: BaseCheckpointSaver,
+        asynchronous: bool = False,
+    ) -> CompiledStateGraph:
+        """
+        Compile the agent's graph once and bind a copy of it to this run's checkpointer.
+
+        The graph shape must not depend on the agent id or its settings; per-agent
+        values (prompts, tickers, ids) reach the nodes through the input state.
+        """
+        workflow = self._compiled_workflows.get(asynchronous)
+        if workflow is None:
+            if asynchronous:
+                builder = self.get_async_workflow_builder(agent_id)
+            else:
+                builder = self.get_workflow_builder(agent_id)
+            workflow = builder.compile()
+            self._compiled_workflows[asynchronous] = workflow
+        # savers serialize their queries behind a lock, so each run gets its own
+        return workflow.copy(update={"checkpointer": checkpointer})
+
+    def get_react_agent(
+        self, name: str, build_tools: Callable[[], list]
+    ) -> CompiledStateGraph:
+        """
+        Return the named ReAct sub-agent, building it and its tools only once.
+        Invoke it with `context=ReactAgentContext(...)` to supply the chat model and
+        system prompt for that run.
+        """
+        agent = self._react_agents.get(name)
+        if agent is None:
+            tools = build_tools()
+            agent = create_react_agent(
+                model=_react_agent_model(tools),
+                tools=tools,
+                prompt=_react_agent_prompt,
+                context_schema=ReactAgentContext,
+            )
+            self._react_agents[name] = agent
+        return agent
+
     def get_config(self, agent_id: str) -> dict:
         return {
             "configurable": {
-                "thread_id": agent_id,
+                "thread_id": self.checkpoint_threads.thread_id(agent_id),
             },
             "recursion_limit": 30,
         }
@@ -291,16 +538,80 @@ class WorkflowAgentBase(AgentBase, ABC):
     def process_message(self, message_request: MessageRequest, schema: str) -> Message:
         agent_id = message_request.agent_id
         checkpointer = self.graph_persistence_factory.build_checkpoint_saver()
-        workflow = self.get_workflow_builder(agent_id).compile(
-            checkpointer=checkpointer
-        )
+        workflow = self.get_compiled_workflow(agent_id, checkpointer)
 
         config = self.get_config(agent_id)
         self.logger.info(f"Agent[{agent_id}] -> Config -> {config}")
 
         inputs = self.get_input_params(message_request, schema)
         self.logger.info(f"Agent[{agent_id}] -> Input -> {inputs}")
+        self._publish_started(agent_id)
+
+        workflow_result = workflow.invoke(inputs, config)
+        return self._complete_message(message_request, schema, workflow_result)
+
+    @langwatch.trace()
+    async def aprocess_message(
+        self, message_request: MessageRequest, schema: str
+    ) -> Message:
+        agent_id = message_request.agent_id
+        checkpointer = (
+            await self.graph_persistence_factory.build_async_checkpoint_saver()
+        )
+        workflow = self.get_compiled_workflow(agent_id, checkpointer, asynchronous=True)
 
+        config = self.get_config(agent_id)
+        self.logger.info(f"Agent[{agent_id}] -> Config -> {config}")
+
+        inputs = await asyncio.to_thread(self.get_input_params, message_request, schema)
+        self.logger.info(f"Agent[{agent_id}] -> Input -> {inputs}")
+        await asyncio.to_thread(self._publish_started, agent_id)
+
+        workflow_result = await workflow.ainvoke(inputs, config)
+        return await asyncio.to_thread(
+            self._complete_message, message_request, schema, workflow_result
+        )
+
+    @langwatch.trace()
+    async def astream_message(
+        self,
+        message_request: MessageRequest,
+        schema: str,
+        on_event: Callable[[TaskProgress], Awaitable[None]],
+    ) -> Message:
+        agent_id = message_request.agent_id
+        checkpointer = (
+            await self.graph_persistence_factory.build_async_checkpoint_saver()
+        )
+        workflow = self.get_compiled_workflow(agent_id, checkpointer, asynchronous=True)
+
+        config = self.get_config(agent_id)
+        self.logger.info(f"Agent[{agent_id}] -> Config -> {config}")
+
+        inputs = await asyncio.to_thread(self.get_input_params, message_request, schema)
+        self.logger.info(f"Agent[{agent_id}] -> Input -> {inputs}")
+        await asyncio.to_thread(self._publish_started, agent_id)
+
+        workflow_result = None
+        async for event in workflow.astream_events(inputs, config, version="v2"):
+            progress = _stream_progress(agent_id, event)
+            if progress is not None:
+                await on_event(progress)
+            elif event["event"] == "on_chain_end" and not event["parent_ids"]:
+                workflow_result = event["data"]["output"]
+        if workflow_result is None:
+            # the root end event is missing when the run is interrupted or a custom
+            # node swallows it; the checkpointed state holds the same final values
+            workflow_result = (await workflow.aget_state(config)).values
+        if not workflow_result:
+            raise RuntimeError(
+                f"Agent[{agent_id}] -> workflow finished without a result"
+            )
+        return await asyncio.to_thread(
+            self._complete_message, message_request, schema, workflow_result
+        )
+
+    def _publish_started(self, agent_id: str) -> None:
         self.task_notification_service.publish_update(
             task_progress=TaskProgress(
                 agent_id=agent_id,
@@ -309,7 +620,10 @@ class WorkflowAgentBase(AgentBase, ABC):
             )
         )
 
-        workflow_result = workflow.invoke(inputs, config)
+    def _complete_message(
+        self, message_request: MessageRequest, schema: str, workflow_result: dict
+    ) -> Message:
+        agent_id = message_request.agent_id
         self.logger.info(f"Agent[{agent_id}] -> Result -> {workflow_result}")
         response_content, response_data = self.format_response(workflow_result)
 
@@ -570,14 +884,27 @@ class WebAgentBase(WorkflowAgentBase, ABC):
     def get_browser_chat_model(
         self, agent_id, schema: str, language_model_tag: str = None
     ) -> browser_use_llm.base.BaseChatModel:
-        agent = self.agent_service.get_agent_by_id(agent_id, schema)
-        language_model, integration = self.get_language_model_integration(agent, schema)
-        api_endpoint, api_key = self.get_integration_credentials(integration)
+        binding = self.get_model_binding(agent_id, schema)
+        credentials = self._get_integration_credentials(binding.integration_id)
 
         if language_model_tag is None:
-            language_model_tag = language_model.language_model_tag
+            language_model_tag = binding.language_model_tag
+
+        return self.model_client_cache.client(
+            binding.integration_id,
+            "browser",
+            language_model_tag,
+            credentials,
+            lambda: self._build_browser_chat_model(
+                binding.integration_type, language_model_tag, *credentials
+            ),
+        )
 
-        if integration.integration_type == "openai_api_v1":
+    @staticmethod
+    def _build_browser_chat_model(
+        integration_type: str, language_model_tag: str, api_endpoint: str, api_key: str
+    ) -> browser_use_llm.base.BaseChatModel:
+        if integration_type == "openai_api_v1":
             return BrowserChatOpenAI(
                 model=language_model_tag,
                 base_url=api_endpoint,
@@ -586,7 +913,7 @@ class WebAgentBase(WorkflowAgentBase, ABC):
                 reasoning_effort="medium",
                 frequency_penalty=None,
             )
-        elif integration.integration_type == "anthropic_api_v1":
+        elif integration_type == "anthropic_api_v1":
             return BrowserChatAnthropic(
                 model=language_model_tag,
                 base_url=api_endpoint,
@@ -3,7 +3,7 @@ FINANCIAL_ANALYST_V1_AGENT_CONFIGURATION = {
         "name": "data_collector",
         "desc": "Fetches company profiles, technical indicators, price stats, and news from Elasticsearch",
         "desc_for_llm": (
-            "Collects all financial data for the requested ticker(s) using tools: "
+            "Collects all financial data for the requested ticker(s) in one concurrent pre-fetch: "
             "company profile (metadata, multiples, analyst ratings), "
             "price stats (latest close, variance), "
             "technical indicators (RSI, MACD, EMA, ADX), "
@@ -60,3 +60,16 @@ FINANCIAL_ANALYST_V1_AGENT_CONFIGURATION = {
 }
 
 FINANCIAL_ANALYST_V1_AGENTS = list(FINANCIAL_ANALYST_V1_AGENT_CONFIGURATION.keys())
+
+FINANCIAL_ANALYST_V1_INDICATOR_SPECS = [
+    {"indicator": "rsi", "period": 14},
+    {"indicator": "macd", "short_window": 12, "long_window": 26, "signal_window": 9},
+    {"indicator": "ema", "short_window": 10, "long_window": 20},
+    {"indicator": "adx", "period": 14},
+]
+
+# Upper bound on concurrent Elasticsearch fetches while pre-collecting ticker data
+FINANCIAL_ANALYST_V1_PREFETCH_CONCURRENCY = 8
+
+FINANCIAL_ANALYST_V1_NEWS_DAYS = 7
+FINANCIAL_ANALYST_V1_NEWS_SIZE = 10
@@ -1,18 +1,19 @@
+import asyncio
 import json
 import re
-from datetime import datetime, timedelta
+from datetime import datetime
 
 from langchain_core.messages import AIMessage, HumanMessage
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.tools import tool
 from langgraph.constants import START, END
 from langgraph.graph import MessagesState, StateGraph
-from langgraph.prebuilt import create_react_agent
 from langgraph.types import Command
 from typing_extensions import Literal
 
 from app.interface.api.messages.schema import MessageRequest
 from app.services.agent_types.base import (
+    ReactAgentContext,
     SupervisedWorkflowAgentBase,
     AgentUtils,
 )
@@ -20,6 +21,11 @@ from app.services.agent_types.quaks.insights.financial_analyst.v1 import (
     FINANCIAL_ANALYST_V1_AGENTS,
     FINANCIAL_ANALYST_V1_AGENT_CONFIGURATION,
 )
+from app.services.agent_types.quaks.insights.financial_analyst.v1.market_data import (
+    collect_market_data,
+    collect_market_data_async,
+    format_market_data,
+)
 from app.services.agent_types.quaks.insights.financial_analyst.v1.prompts import (
     CONSENSUS_REPORTER_SYSTEM_PROMPT,
     COORDINATOR_SYSTEM_PROMPT,
@@ -32,13 +38,13 @@ from app.services.agent_types.quaks.insights.financial_analyst.v1.state import (
     FinancialAnalystState,
 )
 from app.services.agent_types.quaks.insights.financial_analyst.v1.portfolio_xray import (
+    build_xray_data,
     compute_xray_data,
     format_xray_html,
     format_xray_text,
 )
-from app.services.agent_types.quaks.insights.tools import build_get_markets_news_tool
-from app.services.markets_news import MarketsNewsService
-from app.services.markets_stats import MarketsStatsService
+from app.services.markets_news import AsyncMarketsNewsService, MarketsNewsService
+from app.services.markets_stats import AsyncMarketsStatsService, MarketsStatsService
 from app.services.tasks import TaskProgress
 
 
@@ -48,10 +54,14 @@ class QuaksFinancialAnalystV1Agent(SupervisedWorkflowAgentBase):
         agent_utils: AgentUtils,
         markets_stats_service: MarketsStatsService,
         markets_news_service: MarketsNewsService,
+        async_markets_stats_service: AsyncMarketsStatsService | None = None,
+        async_markets_news_service: AsyncMarketsNewsService | None = None,
     ):
         super().__init__(agent_utils)
         self.markets_stats_service = markets_stats_service
         self.markets_news_service = markets_news_service
+        self.async_markets_stats_service = async_markets_stats_service
+        self.async_markets_news_service = async_markets_news_service
 
     def create_default_settings(self, agent_id: str, schema: str):
         prompts = {
@@ -70,14 +80,44 @@ class QuaksFinancialAnalystV1Agent(SupervisedWorkflowAgentBase):
             )
 
     def get_workflow_builder(self, agent_id: str):
+        return self._build_workflow(
+            coordinator=self.get_coordinator,
+            data_prefetch=self.get_data_prefetch,
+            data_collector=self.get_data_collector,
+            fundamental_analyst=self.get_fundamental_analyst,
+            technical_analyst=self.get_technical_analyst,
+            consensus_reporter=self.get_consensus_reporter,
+        )
+
+    def get_async_workflow_builder(self, agent_id: str):
+        return self._build_workflow(
+            coordinator=self.aget_coordinator,
+            data_prefetch=self.aget_data_prefetch,
+            data_collector=self.aget_data_collector,
+            fundamental_analyst=self.aget_fundamental_analyst,
+            technical_analyst=self.aget_technical_analyst,
+            consensus_reporter=self.aget_consensus_reporter,
+        )
+
+    def _build_workflow(
+        self,
+        coordinator,
+        data_prefetch,
+        data_collector,
+        fundamental_analyst,
+        technical_analyst,
+        consensus_reporter,
+    ):
         workflow_builder = StateGraph(FinancialAnalystState)
         workflow_builder.add_edge(START, "coordinator")
-        workflow_builder.add_node("coordinator", self.get_coordinator)
-        workflow_builder.add_node("data_collector", self.get_data_collector)
-        workflow_builder.add_node("fundamental_analyst", self.get_fundamental_analyst)
-        workflow_builder.add_node("technical_analyst", self.get_technical_analyst)
-        workflow_builder.add_node("consensus_reporter", self.get_consensus_reporter)
+        workflow_builder.add_node("coordinator", coordinator)
+        workflow_builder.add_node("data_prefetch", data_prefetch)
+        workflow_builder.add_node("data_collector", data_collector)
+        workflow_builder.add_node("fundamental_analyst", fundamental_analyst)
+        workflow_builder.add_node("technical_analyst", technical_analyst)
+        workflow_builder.add_node("consensus_reporter", consensus_reporter)
         workflow_builder.add_node("portfolio_xray", self.get_portfolio_xray)
+        workflow_builder.add_edge("data_prefetch", "data_collector")
         workflow_builder.add_edge("data_collector", "portfolio_xray")
         workflow_builder.add_edge("portfolio_xray", "fundamental_analyst")
         workflow_builder.add_edge("fundamental_analyst", "technical_analyst")
@@ -131,6 +171,8 @@ class QuaksFinancialAnalystV1Agent(SupervisedWorkflowAgentBase):
             "consensus_verdict": "",
             "allocation_weights": "",
             "portfolio_xray_html": "",
+            "market_data": "",
+            "company_profiles": {},
             "messages": [HumanMessage(content=message_request.message_content)],
         }
 
@@ -149,101 +191,6 @@ class QuaksFinancialAnalystV1Agent(SupervisedWorkflowAgentBase):
         tickers = [t.upper() for t in tokens if re.match(r"^[A-Z]{1,5}$", t.upper())]
         return tickers
 
-    def _build_tools(self):
-        markets_stats_service = self.markets_stats_service
-        markets_news_service = self.markets_news_service
-
-        @tool("fetch_company_profile")
-        def fetch_company_profile(ticker: str) -> str:
-            """Fetch company metadata, valuation multiples, analyst ratings, and ownership data.
-
-            Args:
-                ticker: Stock ticker symbol (e.g. AAPL, MSFT, NVDA).
-
-            Returns:
-                JSON string with company profile data.
-            """
-            result = markets_stats_service.get_company_profile(
-                index_name="quaks_stocks-metadata_latest",
-                key_ticker=ticker,
-            )
-            return json.dumps(result, ensure_ascii=False, default=str)
-
-        @tool("fetch_stats_close")
-        def fetch_stats_close(ticker: str) -> str:
-            """Fetch latest price stats including OHLCV and percent variance for a ticker.
-
-            Args:
-                ticker: Stock ticker symbol (e.g. AAPL, MSFT, NVDA).
-
-            Returns:
-                JSON string with price stats.
-            """
-            end_date = datetime.now().strftime("%Y-%m-%d")
-            start_date = (datetime.now() - timedelta(days=365)).strftime("%Y-%m-%d")
-            result = markets_stats_service.get_stats_close(
-                index_name="quaks_stocks-eod_latest",
-                key_ticker=ticker,
-                start_date=start_date,
-                end_date=end_date,
-            )
-            return json.dumps(result, ensure_ascii=False, default=str)
-
-        @tool("fetch_technical_indicators")
-        def fetch_technical_indicators(ticker: str) -> str:
-            """Fetch technical indicators (RSI, MACD, EMA, ADX) for a ticker.
-
-            Args:
-                ticker: Stock ticker symbol (e.g. AAPL, MSFT, NVDA).
-
-            Returns:
-                JSON string with technical indicator values.
-            """
-            end_date = datetime.now().strftime("%Y-%m-%d")
-            start_date = (datetime.now() - timedelta(days=365)).strftime("%Y-%m-%d")
-            indicators = {
-                "rsi": markets_stats_service.get_indicator_rsi(
-                    index_name="quaks_stocks-eod_latest",
-                    key_ticker=ticker,
-                    start_date=start_date,
-                    end_date=end_date,
-                    period=14,
-                ),
-                "macd": markets_stats_service.get_indicator_macd(
-                    index_name="quaks_stocks-eod_latest",
-                    key_ticker=ticker,
-                    start_date=start_date,
-                    end_date=end_date,
-                    short_window=12,
-                    long_window=26,
-                    signal_window=9,
-                ),
-                "ema": markets_stats_service.get_indicator_ema(
-                    index_name="quaks_stocks-eod_latest",
-                    key_ticker=ticker,
-                    start_date=start_date,
-                    end_date=end_date,
-                    short_window=10,
-                    long_window=20,
-                ),
-                "adx": markets_stats_service.get_indicator_adx(
-                    index_name="quaks_stocks-eod_latest",
-                    key_ticker=ticker,
-                    start_date=start_date,
-                    end_date=end_date,
-                    period=14,
-                ),
-            }
-            return json.dumps(indicators, ensure_ascii=False, default=str)
-
-        return [
-            fetch_company_profile,
-            fetch_stats_close,
-            fetch_technical_indicators,
-            build_get_markets_news_tool(markets_news_service),
-            self._build_xray_tool(),
-        ]
-
     def _build_xray_tool(self):
         markets_stats_service = self.markets_stats_service
 
@@ -267,19 +214,27 @@ class QuaksFinancialAnalystV1Agent(SupervisedWorkflowAgentBase):
 
         return fetch_portfolio_xray
 
-    def _invoke_chain(self, agent_id, schema, system_prompt, messages):
-        """Invoke a simple system+messages chain and return a single AIMessage."""
-        chat_model = self.get_chat_model(agent_id, schema)
+    def _build_chain(self, chat_model, system_prompt):
         prompt = ChatPromptTemplate.from_messages(
             [
                 ("system", system_prompt),
                 ("placeholder", "{messages}"),
             ]
         )
-        chain = prompt | chat_model
+        return prompt | chat_model
+
+    def _invoke_chain(self, agent_id, schema, system_prompt, messages):
+        """Invoke a simple system+messages chain and return a single AIMessage."""
+        chat_model = self.get_chat_model(agent_id, schema)
+        chain = self._build_chain(chat_model, system_prompt)
         response = chain.invoke({"messages": messages})
         return response
 
+    async def _ainvoke_chain(self, agent_id, schema, system_prompt, messages):
+        chat_model = await self.aget_chat_model(agent_id, schema)
+        chain = self._build_chain(chat_model, system_prompt)
+        return await chain.ainvoke({"messages": messages})
+
     @staticmethod
     def _strip_markdown_fences(text: str) -> str:
         """Remove markdown code fences and inline formatting from LLM output."""
@@ -301,9 +256,45 @@ class QuaksFinancialAnalystV1Agent(SupervisedWorkflowAgentBase):
 
     def get_coordinator(
         self, state: FinancialAnalystState
-    ) -> Command[Literal["data_collector", "__end__"]]:
+    ) -> Command[Literal["data_prefetch", "__end__"]]:
+        command = self._route_query(state)
+        if command is not None:
+            return command
+
+        chat_model = self.get_chat_model(state["agent_id"], state["schema"])
+        response = self._coordinator_agent().invoke(
+            state,
+            context=ReactAgentContext(
+                chat_model=chat_model, system_prompt=state["coordinator_system_prompt"]
+            ),
+        )
+        return Command(
+            goto=END,
+            update={"messages": response["messages"]},
+        )
+
+    async def aget_coordinator(
+        self, state: FinancialAnalystState
+    ) -> Command[Literal["data_prefetch", "__end__"]]:
+        command = self._route_query(state)
+        if command is not None:
+            return command
+
+        chat_model = await self.aget_chat_model(state["agent_id"], state["schema"])
+        response = await self._coordinator_agent().ainvoke(
+            state,
+            context=ReactAgentContext(
+                chat_model=chat_model, system_prompt=state["coordinator_system_prompt"]
+            ),
+        )
+        return Command(
+            goto=END,
+            update={"messages": response["messages"]},
+        )
+
+    def _route_query(self, state: FinancialAnalystState) -> Command | None:
+        """Route BATCH_ETL requests without an LLM call; None means QA mode."""
         agent_id = state["agent_id"]
-        schema = state["schema"]
         query = state["query"]
         tickers = state["tickers"]
 
@@ -320,10 +311,10 @@ class QuaksFinancialAnalystV1Agent(SupervisedWorkflowAgentBase):
 
         if tickers:
             self.logger.info(
-                f"Agent[{agent_id}] -> Coordinator -> Tickers: {tickers} -> data_collector"
+                f"Agent[{agent_id}] -> Coordinator -> Tickers: {tickers} -> data_prefetch"
             )
             return Command(
-                goto="data_collector",
+                goto="data_prefetch",
                 update={
                     "messages": [
                         AIMessage(
@@ -352,24 +343,48 @@ class QuaksFinancialAnalystV1Agent(SupervisedWorkflowAgentBase):
 
         # QA mode: answer directly, with portfolio X-ray tool available
         self.logger.info(f"Agent[{agent_id}] -> Coordinator -> QA mode")
-        chat_model = self.get_chat_model(agent_id, schema)
-        coordinator = create_react_agent(
-            model=chat_model,
-            tools=[self._build_xray_tool()],
-            prompt=state["coordinator_system_prompt"],
-        )
-        response = coordinator.invoke(state)
-        return Command(
-            goto=END,
-            update={"messages": response["messages"]},
+        return None
+
+    def _coordinator_agent(self):
+        return self.get_react_agent("coordinator", lambda: [self._build_xray_tool()])
+
+    def get_data_prefetch(self, state: FinancialAnalystState) -> dict:
+        self._start_data_collection(state)
+        market_data = collect_market_data(
+            self.markets_stats_service, self.markets_news_service, state["tickers"]
         )
+        return self._data_prefetched(market_data)
+
+    async def aget_data_prefetch(self, state: FinancialAnalystState) -> dict:
+        self._start_data_collection(state)
+        if self.async_markets_stats_service and self.async_markets_news_service:
+            market_data = await collect_market_data_async(
+                self.async_markets_stats_service,
+                self.async_markets_news_service,
+                state["tickers"],
+            )
+        else:
+            market_data = await asyncio.to_thread(
+                collect_market_data,
+                self.markets_stats_service,
+                self.markets_news_service,
+                state["tickers"],
+            )
+        return self._data_prefetched(market_data)
 
-    def get_data_collector(
-        self, state: FinancialAnalystState
-    ) -> Command[Literal["fundamental_analyst"]]:
-        agent_id = state["agent_id"]
-        schema = state["schema"]
+    @staticmethod
+    def _data_prefetched(market_data: dict) -> dict:
+        return {
+            "market_data": format_market_data(market_data),
+            "company_profiles": {
+                ticker: data["profile"]
+                for ticker, data in market_data.items()
+                if data["profile"]
+            },
+        }
 
+    def _start_data_collection(self, state: FinancialAnalystState) -> None:
+        agent_id = state["agent_id"]
         tickers_str = ", ".join(state["tickers"])
         self.logger.info(f"Agent[{agent_id}] -> Data Collector -> {tickers_str}")
         self.task_notification_service.publish_update(
@@ -380,18 +395,31 @@ class QuaksFinancialAnalystV1Agent(SupervisedWorkflowAgentBase):
             )
         )
 
-        chat_model = self.get_chat_model(agent_id, schema)
-        data_collector = create_react_agent(
-            model=chat_model,
-            tools=self._build_tools(),
-            prompt=state["data_collector_system_prompt"],
+    def get_data_collector(
+        self, state: FinancialAnalystState
+    ) -> Command[Literal["fundamental_analyst"]]:
+        response = self._invoke_chain(
+            state["agent_id"],
+            state["schema"],
+            state["data_collector_system_prompt"],
+            [HumanMessage(content=state["market_data"])],
         )
-        response = data_collector.invoke(state)
+        return self._data_collected(state, response)
 
-        # Extract the final summary (last AI message) from the react agent
-        collected_data = (
-            response["messages"][-1].content if response["messages"] else ""
+    async def aget_data_collector(
+        self, state: FinancialAnalystState
+    ) -> Command[Literal["fundamental_analyst"]]:
+        response = await self._ainvoke_chain(
+            state["agent_id"],
+            state["schema"],
+            state["data_collector_system_prompt"],
+            [HumanMessage(content=state["market_data"])],
         )
+        return self._data_collected(state, response)
+
+    def _data_collected(self, state: FinancialAnalystState, response) -> Command:
+        agent_id = state["agent_id"]
+        collected_data = response.content
 
         self.logger.info(f"Agent[{agent_id}] -> Data Collector -> Complete")
         self.task_notification_service.publish_update(
@@ -411,31 +439,35 @@ class QuaksFinancialAnalystV1Agent(SupervisedWorkflowAgentBase):
     def get_fundamental_analyst(
         self, state: FinancialAnalystState
     ) -> Command[Literal["technical_analyst"]]:
-        agent_id = state["agent_id"]
-        schema = state["schema"]
-
-        self.logger.info(f"Agent[{agent_id}] -> Fundamental Analyst")
-        self.task_notification_service.publish_update(
-            task_progress=TaskProgress(
-                agent_id=agent_id,
-                status="in_progress",
-                message_content="Running fundamental analysis...",
-            )
+        messages = self._start_analyst(
+            state, "Fundamental Analyst", "Running fundamental analysis..."
         )
-
-        # Pass collected data + X-Ray text context
-        data_msg = self._get_last_named_message(state["messages"], "data_collector")
-        xray_msg = self._get_last_named_message(state["messages"], "portfolio_xray")
-        data_content = data_msg.content if data_msg else ""
-        if xray_msg:
-            data_content += f"\n\n{xray_msg.content}"
-        messages = [HumanMessage(content=data_content)]
-
         response = self._invoke_chain(
-            agent_id, schema, state["fundamental_analyst_system_prompt"], messages
+            state["agent_id"],
+            state["schema"],
+            state["fundamental_analyst_system_prompt"],
+            messages,
+        )
+        return self._fundamental_analyst_result(state, response)
+
+    async def aget_fundamental_analyst(
+        self, state: FinancialAnalystState
+    ) -> Command[Literal["technical_analyst"]]:
+        messages = self._start_analyst(
+            state, "Fundamental Analyst", "Running fundamental analysis..."
         )
+        response = await self._ainvoke_chain(
+            state["agent_id"],
+            state["schema"],
+            state["fundamental_analyst_system_prompt"],
+            messages,
+        )
+        return self._fundamental_analyst_result(state, response)
 
-        self.logger.info(f"Agent[{agent_id}] -> Fundamental Analyst -> Complete")
+    def _fundamental_analyst_result(self, state, response) -> Command:
+        self.logger.info(
+            f"Agent[{state['agent_id']}] -> Fundamental Analyst -> Complete"
+        )
         return Command(
             update={
                 "messages": [
@@ -449,15 +481,53 @@ class QuaksFinancialAnalystV1Agent(SupervisedWorkflowAgentBase):
     def get_technical_analyst(
         self, state: FinancialAnalystState
     ) -> Command[Literal["consensus_reporter"]]:
-        agent_id = state["agent_id"]
-        schema = state["schema"]
+        messages = self._start_analyst(
+            state, "Technical Analyst", "Running technical analysis..."
+        )
+        response = self._invoke_chain(
+            state["agent_id"],
+            state["schema"],
+            state["technical_analyst_system_prompt"],
+            messages,
+        )
+        return self._technical_analyst_result(state, response)
 
-        self.logger.info(f"Agent[{agent_id}] -> Technical Analyst")
+    async def aget_technical_analyst(
+        self, state: FinancialAnalystState
+    ) -> Command[Literal["consensus_reporter"]]:
+        messages = self._start_analyst(
+            state, "Technical Analyst", "Running technical analysis..."
+        )
+        response = await self._ainvoke_chain(
+            state["agent_id"],
+            state["schema"],
+            state["technical_analyst_system_prompt"],
+            messages,
+        )
+        return self._technical_analyst_result(state, response)
+
+    def _technical_analyst_result(self, state, response) -> Command:
+        self.logger.info(f"Agent[{state['agent_id']}] -> Technical Analyst -> Complete")
+        return Command(
+            update={
+                "messages": [
+                    AIMessage(content=response.content, name="technical_analyst")
+                ],
+                "technical_recommendation": response.content,
+            },
+            goto="consensus_reporter",
+        )
+
+    def _start_analyst(
+        self, state: FinancialAnalystState, title: str, progress: str
+    ) -> list:
+        agent_id = state["agent_id"]
+        self.logger.info(f"Agent[{agent_id}] -> {title}")
         self.task_notification_service.publish_update(
             task_progress=TaskProgress(
                 agent_id=agent_id,
                 status="in_progress",
-                message_content="Running technical analysis...",
+                message_content=progress,
             )
         )
 
@@ -467,22 +537,7 @@ class QuaksFinancialAnalystV1Agent(SupervisedWorkflowAgentBase):
         data_content = data_msg.content if data_msg else ""
         if xray_msg:
             data_content += f"\n\n{xray_msg.content}"
-        messages = [HumanMessage(content=data_content)]
-
-        response = self._invoke_chain(
-            agent_id, schema, state["technical_analyst_system_prompt"], messages
-        )
-
-        self.logger.info(f"Agent[{agent_id}] -> Technical Analyst -> Complete")
-        return Command(
-            update={
-                "messages": [
-                    AIMessage(content=response.content, name="technical_analyst")
-                ],
-                "technical_recommendation": response.content,
-            },
-            goto="consensus_reporter",
-        )
+        return [HumanMessage(content=data_content)]
 
     @staticmethod
     def _extract_executive_summary(html: str) -> str:
@@ -509,9 +564,27 @@ class QuaksFinancialAnalystV1Agent(SupervisedWorkflowAgentBase):
         return weights
 
     def get_consensus_reporter(self, state: FinancialAnalystState):
-        agent_id = state["agent_id"]
-        schema = state["schema"]
+        messages = self._start_consensus(state)
+        response = self._invoke_chain(
+            state["agent_id"],
+            state["schema"],
+            state["consensus_reporter_system_prompt"],
+            messages,
+        )
+        return self._consensus_result(state, response)
+
+    async def aget_consensus_reporter(self, state: FinancialAnalystState):
+        messages = self._start_consensus(state)
+        response = await self._ainvoke_chain(
+            state["agent_id"],
+            state["schema"],
+            state["consensus_reporter_system_prompt"],
+            messages,
+        )
+        return self._consensus_result(state, response)
 
+    def _start_consensus(self, state: FinancialAnalystState) -> list:
+        agent_id = state["agent_id"]
         self.logger.info(f"Agent[{agent_id}] -> Consensus Reporter")
         self.task_notification_service.publish_update(
             task_progress=TaskProgress(
@@ -531,12 +604,10 @@ class QuaksFinancialAnalystV1Agent(SupervisedWorkflowAgentBase):
         ]
         if xray_msg:
             input_parts.append(xray_msg.content)
-        messages = [HumanMessage(content="\n\n".join(input_parts))]
-
-        response = self._invoke_chain(
-            agent_id, schema, state["consensus_reporter_system_prompt"], messages
-        )
+        return [HumanMessage(content="\n\n".join(input_parts))]
 
+    def _consensus_result(self, state: FinancialAnalystState, response) -> dict:
+        agent_id = state["agent_id"]
         report_html = self._strip_markdown_fences(response.content)
         executive_summary = self._extract_executive_summary(report_html)
         allocation = self._extract_allocation(report_html)
@@ -574,8 +645,13 @@ class QuaksFinancialAnalystV1Agent(SupervisedWorkflowAgentBase):
             )
         )
 
-        # Runs before analysts — always equal-weight at this stage
-        xray_data = compute_xray_data(self.markets_stats_service, tickers)
+        # Runs before analysts — always equal-weight at this stage; profiles were
+        # already fetched by data_prefetch
+        profiles = state.get("company_profiles")
+        if profiles:
+            xray_data = build_xray_data(profiles)
+        else:
+            xray_data = compute_xray_data(self.markets_stats_service, tickers)
         xray_html = format_xray_html(xray_data)
         xray_text = format_xray_text(xray_data)
 
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from app.services.agent_types.quaks.insights.financial_analyst.v1 import (
+    FINANCIAL_ANALYST_V1_INDICATOR_SPECS,
+    FINANCIAL_ANALYST_V1_NEWS_DAYS,
+    FINANCIAL_ANALYST_V1_NEWS_SIZE,
+    FINANCIAL_ANALYST_V1_PREFETCH_CONCURRENCY,
+)
+from app.services.markets_news import AsyncMarketsNewsService, MarketsNewsService
+from app.services.markets_stats import AsyncMarketsStatsService, MarketsStatsService
+
+_METADATA_INDEX = "quaks_stocks-metadata_latest"
+_EOD_INDEX = "quaks_stocks-eod_latest"
+_NEWS_INDEX = "quaks_markets-news_latest"
+
+logger = logging.getLogger(__name__)
+
+
+def _date_range() -> tuple[str, str]:
+    now = datetime.now()
+    return (now - timedelta(days=365)).strftime("%Y-%m-%d"), now.strftime("%Y-%m-%d")
+
+
+def _news_params(ticker: str) -> dict:
+    date_from = (
+        datetime.now() - timedelta(days=FINANCIAL_ANALYST_V1_NEWS_DAYS)
+    ).strftime("%Y-%m-%d")
+    return {
+        "index_name": _NEWS_INDEX,
+        "key_ticker": ticker,
+        "date_from": date_from,
+        "size": FINANCIAL_ANALYST_V1_NEWS_SIZE,
+    }
+
+
+def _parse_news(hits: list[dict]) -> list[dict]:
+    return [
+        {
+            "headline": hit["_source"].get("text_headline", ""),
+            "summary": hit["_source"].get("text_summary", ""),
+            "source": hit["_source"].get("key_source", ""),
+            "date": hit["_source"].get("date_reference", ""),
+        }
+        for hit in hits
+    ]
+
+
+def _fetch_failed(name: str, error: Exception) -> None:
+    logger.warning(f"Market data prefetch -> {name} failed: {error}")
+
+
+def collect_market_data(
+    markets_stats_service: MarketsStatsService,
+    markets_news_service: MarketsNewsService,
+    tickers: list[str],
+    max_concurrency: int = FINANCIAL_ANALYST_V1_PREFETCH_CONCURRENCY,
+) -> dict:
+    """
+    Fetch profiles, price stats, indicators and news for all tickers at once.
+    Per-ticker lookups run on at most `max_concurrency` threads; price stats and
+    indicators are single bulk queries. A failed lookup is recorded as missing.
+    """
+    if not tickers:
+        return {}
+
+    start_date, end_date = _date_range()
+
+    def guarded(name, fetch, *args, **kwargs):
+        try:
+            return fetch(*args, **kwargs)
+        except Exception as e:
+            _fetch_failed(name, e)
+            return None
+
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(max_concurrency, 2 * len(tickers) + 2))
+    ) as pool:
+        stats_future = pool.submit(
+            guarded,
+            "stats_close",
+            markets_stats_service.get_stats_close_bulk,
+            index_name=_EOD_INDEX,
+            key_tickers=tickers,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        indicators_future = pool.submit(
+            guarded,
+            "indicators",
+            markets_stats_service.get_indicators_by_ticker,
+            index_name=_EOD_INDEX,
+            key_tickers=tickers,
+            start_date=start_date,
+            end_date=end_date,
+            specs=FINANCIAL_ANALYST_V1_INDICATOR_SPECS,
+        )
+        profile_futures = [
+            pool.submit(
+                guarded,
+                f"profile {ticker}",
+                markets_stats_service.get_company_profile,
+                index_name=_METADATA_INDEX,
+                key_ticker=ticker,
+            )
+            for ticker in tickers
+        ]
+        news_futures = [
+            pool.submit(
+                guarded,
+                f"news {ticker}",
+                markets_news_service.get_news,
+                **_news_params(ticker),
+            )
+            for ticker in tickers
+        ]
+
+        return build_market_data(
+            tickers,
+            profiles=[future.result() for future in profile_futures],
+            stats_close=stats_future.result(),
+            indicators=indicators_future.result(),
+            news=[future.result() for future in news_futures],
+        )
+
+
+async def collect_market_data_async(
+    markets_stats_service: AsyncMarketsStatsService,
+    markets_news_service: AsyncMarketsNewsService,
+    tickers: list[str],
+    max_concurrency: int = FINANCIAL_ANALYST_V1_PREFETCH_CONCURRENCY,
+) -> dict:
+    """Same as `collect_market_data`, with the lookups gathered on the event loop."""
+    if not tickers:
+        return {}
+
+    start_date, end_date = _date_range()
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def guarded(name, fetch):
+        async with semaphore:
+            try:
+                return await fetch
+            except Exception as e:
+                _fetch_failed(name, e)
+                return None
+
+    stats_close, indicators, *per_ticker = await asyncio.gather(
+        guarded(
+            "stats_close",
+            markets_stats_service.get_stats_close_bulk(
+                index_name=_EOD_INDEX,
+                key_tickers=tickers,
+                start_date=start_date,
+                end_date=end_date,
+            ),
+        ),
+        guarded(
+            "indicators",
+            markets_stats_service.get_indicators_by_ticker(
+                index_name=_EOD_INDEX,
+                key_tickers=tickers,
+                start_date=start_date,
+                end_date=end_date,
+                specs=FINANCIAL_ANALYST_V1_INDICATOR_SPECS,
+            ),
+        ),
+        *(
+            guarded(
+                f"profile {ticker}",
+                markets_stats_service.get_company_profile(
+                    index_name=_METADATA_INDEX,
+                    key_ticker=ticker,
+                ),
+            )
+            for ticker in tickers
+        ),
+        *(
+            guarded(
+                f"news {ticker}", markets_news_service.get_news(**_news_params(ticker))
+            )
+            for ticker in tickers
+        ),
+    )
+
+    return build_market_data(
+        tickers,
+        profiles=per_ticker[: len(tickers)],
+        stats_close=stats_close,
+        indicators=indicators,
+        news=per_ticker[len(tickers) :],
+    )
+
+
+def build_market_data(
+    tickers: list[str],
+    profiles: list,
+    stats_close: list[dict] | None,
+    indicators: dict | None,
+    news: list,
+) -> dict:
+    """Assemble fetched results into one entry per ticker, in request order."""
+    stats_by_ticker = {stats.get("key_ticker"): stats for stats in stats_close or []}
+    indicators = indicators or {}
+    return {
+        ticker: {
+            "profile": profile or None,
+            "stats_close": stats_by_ticker.get(ticker),
+            "indicators": indicators.get(ticker),
+            "news": _parse_news(ticker_news[0]) if ticker_news else [],
+        }
+        for ticker, profile, ticker_news in zip(tickers, profiles, news)
+    }
+
+
+def format_market_data(data: dict) -> str:
+    """Compact JSON rendering of the collected data, keyed by ticker."""
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=str)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from app.services.markets_stats import MarketsStatsService
+import asyncio
+
+from app.services.markets_stats import AsyncMarketsStatsService, MarketsStatsService
 
 _TABLE_OPEN = "<table>"
 _TABLE_CLOSE = "</table>"
@@ -414,6 +416,31 @@ def compute_xray_data(
         if profile:
             profiles[ticker] = profile
 
+    return build_xray_data(profiles, allocation)
+
+
+async def compute_xray_data_async(
+    markets_stats_service: AsyncMarketsStatsService,
+    tickers: list[str],
+    allocation: dict = None,
+) -> dict:
+    """Same as `compute_xray_data`, fetching the ticker profiles concurrently."""
+    fetched = await asyncio.gather(
+        *(
+            markets_stats_service.get_company_profile(
+                index_name="quaks_stocks-metadata_latest",
+                key_ticker=ticker,
+            )
+            for ticker in tickers
+        )
+    )
+    profiles = {ticker: profile for ticker, profile in zip(tickers, fetched) if profile}
+
+    return build_xray_data(profiles, allocation)
+
+
+def build_xray_data(profiles: dict, allocation: dict = None) -> dict:
+    """Compute X-Ray structured data from already fetched profiles keyed by ticker."""
     if not profiles:
         return {}
 
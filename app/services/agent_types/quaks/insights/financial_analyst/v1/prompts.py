@@ -1,7 +1,7 @@
 EXECUTION_PLAN = (
     "Financial analysis plan:\n"
     "1. coordinator: Parse ticker(s) and decide whether to proceed\n"
-    "2. data_collector: Fetch company profile, price stats, technical indicators, and news for each ticker\n"
+    "2. data_collector: Present the company profile, price stats, technical indicators, and news for each ticker\n"
     "3. portfolio_xray: Generate Morningstar-style portfolio breakdown (sectors, regions, style, stats)\n"
     "4. fundamental_analyst: Evaluate valuation, profitability, and financial health → BUY/HOLD/SELL\n"
     "5. technical_analyst: Evaluate price action, momentum, and trend signals → BUY/HOLD/SELL\n"
@@ -43,25 +43,26 @@ Current time: {{ CURRENT_TIME }}
 {{ EXECUTION_PLAN }}
 
 ## Current Step
-Step 2 of 6: Data Collector — Gather all financial data for the requested ticker(s).
+Step 2 of 6: Data Collector — Present the financial data gathered for the requested ticker(s).
 
 ## Tickers to Analyze
 {{ TICKERS }}
 
-## Instructions
-For EACH ticker in the list above, collect data using the available tools:
-
-1. Use fetch_company_profile to get metadata, valuation multiples, analyst ratings, and ownership data.
-2. Use fetch_stats_close to get latest price stats, OHLCV, and percent variance.
-3. Use fetch_technical_indicators to get RSI, MACD, EMA crossover, and ADX signals.
-4. Use get_markets_news to get recent news headlines for context.
+## Input
+The data has already been fetched and is provided in the last message as a JSON object keyed by ticker. \
+Each ticker holds:
+- profile: metadata, valuation multiples, analyst ratings, and ownership data.
+- stats_close: latest price stats, OHLCV, and percent variance.
+- indicators: RSI, MACD, EMA crossover, and ADX signals.
+- news: recent headlines with summary, source, and date.
 
-Call tools for ALL tickers. Present all collected data structured by ticker symbol.
+## Instructions
+Present the data for EACH ticker in the list above, structured by ticker symbol.
 
 IMPORTANT:
-- Do NOT analyze the data — just collect and present it.
-- Include ALL fields returned by each tool.
-- If a tool returns empty results for a ticker, note it explicitly.
+- Do NOT analyze the data — just present it.
+- Include ALL fields provided for each ticker.
+- If a section is null or empty for a ticker, note it explicitly as missing.
 """
 
 FUNDAMENTAL_ANALYST_SYSTEM_PROMPT = """\
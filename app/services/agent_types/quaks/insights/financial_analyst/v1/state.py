@@ -23,5 +23,7 @@ class FinancialAnalystState(MessagesState):
     executive_summary: str
     allocation_weights: str
     portfolio_xray_html: str
+    market_data: str
+    company_profiles: dict
     messages: Annotated[List, join_messages]
     remaining_steps: RemainingSteps
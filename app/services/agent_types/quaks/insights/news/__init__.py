@@ -3,8 +3,8 @@ NEWS_AGENT_CONFIGURATION = {
         "name": "aggregator",
         "desc": "Collects the latest news articles from the last 24 hours via Elasticsearch",
         "desc_for_llm": (
-            "Fetches market news from the Elasticsearch datasource using the get_markets_news tool."
-            "Retrieves articles from the last 24 hours across all exchanges. "
+            "Works from the market news of the last 24 hours across all exchanges, fetched once from "
+            "Elasticsearch, de-duplicated and ranked by ticker coverage within a token budget. "
             "Outputs the raw collected articles as structured data for downstream processing."
         ),
         "is_optional": False,
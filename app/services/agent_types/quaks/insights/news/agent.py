@@ -1,3 +1,4 @@
+import asyncio
 import json
 import re
 from datetime import datetime
@@ -6,12 +7,12 @@ from langchain_core.messages import AIMessage, HumanMessage
 from langchain_core.prompts import ChatPromptTemplate
 from langgraph.constants import START, END
 from langgraph.graph import MessagesState, StateGraph
-from langgraph.prebuilt import create_react_agent
 from langgraph.types import Command
 from typing_extensions import Literal
 
 from app.interface.api.messages.schema import MessageRequest
 from app.services.agent_types.base import (
+    ReactAgentContext,
     SupervisedWorkflowAgentBase,
     AgentUtils,
 )
@@ -19,6 +20,10 @@ from app.services.agent_types.quaks.insights.news import (
     NEWS_AGENTS,
     NEWS_AGENT_CONFIGURATION,
 )
+from app.services.agent_types.quaks.insights.news.curation import (
+    NewsCurator,
+    NewsDigest,
+)
 from app.services.agent_types.quaks.insights.news.prompts import (
     AGGREGATOR_SYSTEM_PROMPT,
     COORDINATOR_SYSTEM_PROMPT,
@@ -28,7 +33,7 @@ from app.services.agent_types.quaks.insights.news.prompts import (
 from app.services.agent_types.quaks.insights.news.state import NewsAnalystState
 from app.services.agent_types.quaks.insights.tools import (
     build_get_insights_news_tool,
-    build_get_markets_news_tool,
+    fetch_markets_news,
 )
 from app.services.markets_insights import MarketsInsightsService
 from app.services.markets_news import MarketsNewsService
@@ -41,10 +46,12 @@ class QuaksNewsAnalystAgent(SupervisedWorkflowAgentBase):
         agent_utils: AgentUtils,
         markets_news_service: MarketsNewsService,
         markets_insights_service: MarketsInsightsService,
+        news_curator: NewsCurator | None = None,
     ):
         super().__init__(agent_utils)
         self.markets_news_service = markets_news_service
         self.markets_insights_service = markets_insights_service
+        self.news_curator = news_curator or NewsCurator()
 
     def create_default_settings(self, agent_id: str, schema: str):
         prompts = {
@@ -61,11 +68,25 @@ class QuaksNewsAnalystAgent(SupervisedWorkflowAgentBase):
             )
 
     def get_workflow_builder(self, agent_id: str):
+        return self._build_workflow(
+            coordinator=self.get_coordinator,
+            aggregator=self.get_aggregator,
+            reporter=self.get_reporter,
+        )
+
+    def get_async_workflow_builder(self, agent_id: str):
+        return self._build_workflow(
+            coordinator=self.aget_coordinator,
+            aggregator=self.aget_aggregator,
+            reporter=self.aget_reporter,
+        )
+
+    def _build_workflow(self, coordinator, aggregator, reporter):
         workflow_builder = StateGraph(NewsAnalystState)
         workflow_builder.add_edge(START, "coordinator")
-        workflow_builder.add_node("coordinator", self.get_coordinator)
-        workflow_builder.add_node("aggregator", self.get_aggregator)
-        workflow_builder.add_node("reporter", self.get_reporter)
+        workflow_builder.add_node("coordinator", coordinator)
+        workflow_builder.add_node("aggregator", aggregator)
+        workflow_builder.add_node("reporter", reporter)
         # Deterministic sequential edges — no supervisor LLM calls needed
         workflow_builder.add_edge("aggregator", "reporter")
         workflow_builder.add_edge("reporter", END)
@@ -100,22 +121,32 @@ class QuaksNewsAnalystAgent(SupervisedWorkflowAgentBase):
             "reporter_system_prompt": self.parse_prompt_template(
                 settings_dict, "reporter_system_prompt", template_vars
             ),
+            "executive_summary": "",
+            "news_tokens": {},
             "messages": [HumanMessage(content=message_request.message_content)],
         }
 
-    def _invoke_chain(self, agent_id, schema, system_prompt, state):
-        """Invoke a simple system+messages chain and return a single AIMessage."""
-        chat_model = self.get_chat_model(agent_id, schema)
+    def _build_chain(self, chat_model, system_prompt):
         prompt = ChatPromptTemplate.from_messages(
             [
                 ("system", system_prompt),
                 ("placeholder", "{messages}"),
             ]
         )
-        chain = prompt | chat_model
+        return prompt | chat_model
+
+    def _invoke_chain(self, agent_id, schema, system_prompt, state):
+        """Invoke a simple system+messages chain and return a single AIMessage."""
+        chat_model = self.get_chat_model(agent_id, schema)
+        chain = self._build_chain(chat_model, system_prompt)
         response = chain.invoke({"messages": state["messages"]})
         return response
 
+    async def _ainvoke_chain(self, agent_id, schema, system_prompt, state):
+        chat_model = await self.aget_chat_model(agent_id, schema)
+        chain = self._build_chain(chat_model, system_prompt)
+        return await chain.ainvoke({"messages": state["messages"]})
+
     _BRIEFING_KEYWORDS = {
         "briefing",
         "brief",
@@ -136,8 +167,44 @@ class QuaksNewsAnalystAgent(SupervisedWorkflowAgentBase):
     def get_coordinator(
         self, state: NewsAnalystState
     ) -> Command[Literal["aggregator", "__end__"]]:
+        command = self._route_query(state)
+        if command is not None:
+            return command
+
+        chat_model = self.get_chat_model(state["agent_id"], state["schema"])
+        response = self._coordinator_agent().invoke(
+            state,
+            context=ReactAgentContext(
+                chat_model=chat_model, system_prompt=state["coordinator_system_prompt"]
+            ),
+        )
+        return Command(
+            goto=END,
+            update={"messages": response["messages"]},
+        )
+
+    async def aget_coordinator(
+        self, state: NewsAnalystState
+    ) -> Command[Literal["aggregator", "__end__"]]:
+        command = self._route_query(state)
+        if command is not None:
+            return command
+
+        chat_model = await self.aget_chat_model(state["agent_id"], state["schema"])
+        response = await self._coordinator_agent().ainvoke(
+            state,
+            context=ReactAgentContext(
+                chat_model=chat_model, system_prompt=state["coordinator_system_prompt"]
+            ),
+        )
+        return Command(
+            goto=END,
+            update={"messages": response["messages"]},
+        )
+
+    def _route_query(self, state: NewsAnalystState) -> Command | None:
+        """Route full briefings to the aggregator; None means QA mode."""
         agent_id = state["agent_id"]
-        schema = state["schema"]
         query = state["query"]
 
         self.logger.info(f"Agent[{agent_id}] -> Coordinator -> Query -> {query}")
@@ -157,23 +224,40 @@ class QuaksNewsAnalystAgent(SupervisedWorkflowAgentBase):
 
         # QA mode: answer the user's question using insights news tool
         self.logger.info(f"Agent[{agent_id}] -> Coordinator -> QA mode")
-        chat_model = self.get_chat_model(agent_id, schema)
-        coordinator = create_react_agent(
-            model=chat_model,
-            tools=[build_get_insights_news_tool(self.markets_insights_service)],
-            prompt=state["coordinator_system_prompt"],
-        )
-        response = coordinator.invoke(state)
-        return Command(
-            goto=END,
-            update={"messages": response["messages"]},
+        return None
+
+    def _coordinator_agent(self):
+        return self.get_react_agent(
+            "coordinator",
+            lambda: [build_get_insights_news_tool(self.markets_insights_service)],
         )
 
     def get_aggregator(self, state: NewsAnalystState) -> Command[Literal["reporter"]]:
-        agent_id = state["agent_id"]
-        schema = state["schema"]
-        aggregator_system_prompt = state["aggregator_system_prompt"]
+        self._start_aggregation(state)
+        digest = self._collect_news()
+        response = self._invoke_chain(
+            state["agent_id"],
+            state["schema"],
+            state["aggregator_system_prompt"],
+            self._with_articles(state, digest),
+        )
+        return self._aggregated(state, digest, response)
 
+    async def aget_aggregator(
+        self, state: NewsAnalystState
+    ) -> Command[Literal["reporter"]]:
+        self._start_aggregation(state)
+        digest = await asyncio.to_thread(self._collect_news)
+        response = await self._ainvoke_chain(
+            state["agent_id"],
+            state["schema"],
+            state["aggregator_system_prompt"],
+            self._with_articles(state, digest),
+        )
+        return self._aggregated(state, digest, response)
+
+    def _start_aggregation(self, state: NewsAnalystState) -> None:
+        agent_id = state["agent_id"]
         self.logger.info(f"Agent[{agent_id}] -> Aggregator")
         self.task_notification_service.publish_update(
             task_progress=TaskProgress(
@@ -183,15 +267,41 @@ class QuaksNewsAnalystAgent(SupervisedWorkflowAgentBase):
             )
         )
 
-        chat_model = self.get_chat_model(agent_id, schema)
-        aggregator = create_react_agent(
-            model=chat_model,
-            tools=[build_get_markets_news_tool(self.markets_news_service)],
-            prompt=aggregator_system_prompt,
+    def _collect_news(self) -> NewsDigest:
+        """Fetch the day's articles once and pre-rank them into the aggregator's token budget."""
+        articles = fetch_markets_news(
+            self.markets_news_service, size=self.news_curator.fetch_size
         )
-        response = aggregator.invoke(state)
+        return self.news_curator.curate(articles)
 
-        self.logger.info(f"Agent[{agent_id}] -> Aggregator -> Response complete")
+    @staticmethod
+    def _with_articles(state: NewsAnalystState, digest: NewsDigest) -> dict:
+        articles = json.dumps(digest.articles, ensure_ascii=False)
+        return {
+            "messages": [
+                *state["messages"],
+                HumanMessage(
+                    content=f"Articles from the last 24 hours, highest ranked first:\n{articles}"
+                ),
+            ]
+        }
+
+    @staticmethod
+    def _token_usage(response) -> dict:
+        usage = getattr(response, "usage_metadata", None) or {}
+        return {
+            "input_tokens": usage.get("input_tokens", 0),
+            "output_tokens": usage.get("output_tokens", 0),
+        }
+
+    def _aggregated(
+        self, state: NewsAnalystState, digest: NewsDigest, response
+    ) -> Command:
+        agent_id = state["agent_id"]
+        self.logger.info(
+            f"Agent[{agent_id}] -> Aggregator -> Response complete -> "
+            f"{len(digest.articles)}/{digest.fetched} articles, {digest.tokens} article tokens"
+        )
         self.task_notification_service.publish_update(
             task_progress=TaskProgress(
                 agent_id=agent_id,
@@ -200,7 +310,13 @@ class QuaksNewsAnalystAgent(SupervisedWorkflowAgentBase):
             )
         )
         return Command(
-            update={"messages": response["messages"]},
+            update={
+                "messages": [response],
+                "news_tokens": {
+                    **digest.stats(),
+                    "aggregator": self._token_usage(response),
+                },
+            },
             goto="reporter",
         )
 
@@ -210,9 +326,21 @@ class QuaksNewsAnalystAgent(SupervisedWorkflowAgentBase):
         return match.group(1).strip() if match else ""
 
     def get_reporter(self, state: NewsAnalystState):
-        agent_id = state["agent_id"]
-        schema = state["schema"]
+        self._start_report(state)
+        response = self._invoke_chain(
+            state["agent_id"], state["schema"], state["reporter_system_prompt"], state
+        )
+        return self._report_result(state, response)
 
+    async def aget_reporter(self, state: NewsAnalystState):
+        self._start_report(state)
+        response = await self._ainvoke_chain(
+            state["agent_id"], state["schema"], state["reporter_system_prompt"], state
+        )
+        return self._report_result(state, response)
+
+    def _start_report(self, state: NewsAnalystState) -> None:
+        agent_id = state["agent_id"]
         self.logger.info(f"Agent[{agent_id}] -> Reporter")
         self.task_notification_service.publish_update(
             task_progress=TaskProgress(
@@ -222,10 +350,8 @@ class QuaksNewsAnalystAgent(SupervisedWorkflowAgentBase):
             )
         )
 
-        response = self._invoke_chain(
-            agent_id, schema, state["reporter_system_prompt"], state
-        )
-
+    def _report_result(self, state: NewsAnalystState, response) -> dict:
+        agent_id = state["agent_id"]
         report_html = response.content
         executive_summary = self._extract_executive_summary(report_html)
 
@@ -239,10 +365,20 @@ class QuaksNewsAnalystAgent(SupervisedWorkflowAgentBase):
                 else report_html[:200],
             )
         )
-        return {
+        result = {
             "messages": [AIMessage(content=report_html, name="reporter")],
             "executive_summary": executive_summary,
         }
+        if state.get("news_tokens"):
+            news_tokens = {
+                **state["news_tokens"],
+                "reporter": self._token_usage(response),
+            }
+            news_tokens["total_tokens"] = sum(
+                sum(news_tokens[step].values()) for step in ("aggregator", "reporter")
+            )
+            result["news_tokens"] = news_tokens
+        return result
 
     def format_response(self, workflow_state: MessagesState) -> (str, dict):
         report_html = workflow_state["messages"][-1].content
@@ -250,6 +386,7 @@ class QuaksNewsAnalystAgent(SupervisedWorkflowAgentBase):
         response_data = {
             "executive_summary": executive_summary,
             "report_html": report_html,
+            "news_tokens": workflow_state.get("news_tokens", {}),
             "messages": [
                 json.loads(message.model_dump_json())
                 for message in workflow_state["messages"]
@@ -0,0 +1,186 @@
+import hashlib
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+
+# rough chars-per-token ratio of English news copy for the BPE tokenizers we run
+CHARS_PER_TOKEN = 4
+
+_WORD = re.compile(r"[a-z0-9]+")
+_TRUNCATED = " …"
+
+
+def estimate_tokens(text: str) -> int:
+    return math.ceil(len(text) / CHARS_PER_TOKEN) if text else 0
+
+
+def simhash(text: str) -> int:
+    """64-bit SimHash of the character 4-grams in `text`; near-identical headlines land a few bits apart."""
+    normalized = " ".join(_WORD.findall(text.lower()))
+    features = [normalized[i : i + 4] for i in range(max(len(normalized) - 3, 1))]
+    weights = [0] * 64
+    for feature in features:
+        value = int.from_bytes(
+            hashlib.blake2b(feature.encode(), digest_size=8).digest(), "big"
+        )
+        for bit in range(64):
+            weights[bit] += 1 if value >> bit & 1 else -1
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+@dataclass
+class NewsDigest:
+    articles: list[dict] = field(default_factory=list)
+    fetched: int = 0
+    duplicates_removed: int = 0
+    dropped_over_budget: int = 0
+    tokens: int = 0
+
+    def stats(self) -> dict:
+        return {
+            "fetched": self.fetched,
+            "articles": len(self.articles),
+            "duplicates_removed": self.duplicates_removed,
+            "dropped_over_budget": self.dropped_over_budget,
+            "article_tokens": self.tokens,
+        }
+
+
+class NewsCurator:
+    """
+    Pre-ranks the day's articles before they reach the aggregator LLM.
+
+    Headlines whose SimHash is within `duplicate_distance` bits of an earlier one
+    about the same tickers are dropped as syndicated copies, their tickers folded
+    into the article kept.
+    The rest are ranked by how widely their tickers are covered that day, scaled
+    by a per-source weight, and bodies are cut to `article_max_tokens` and then
+    to whatever is left of `token_budget`, so the prompt size is bounded no
+    matter how busy the news day was.
+    """
+
+    def __init__(
+        self,
+        fetch_size: int | None = None,
+        token_budget: int | None = None,
+        article_max_tokens: int | None = None,
+        duplicate_distance: int | None = None,
+        source_weights: dict[str, float] | None = None,
+    ) -> None:
+        self.fetch_size = fetch_size or 100
+        self.token_budget = token_budget or 24000
+        self.article_max_tokens = article_max_tokens or 600
+        self.duplicate_distance = (
+            duplicate_distance if duplicate_distance is not None else 10
+        )
+        self.source_weights = {
+            key.lower(): value for key, value in (source_weights or {}).items()
+        }
+
+    def curate(self, articles: list[dict]) -> NewsDigest:
+        digest = NewsDigest(fetched=len(articles))
+        unique = self._deduplicate(articles)
+        digest.duplicates_removed = len(articles) - len(unique)
+
+        remaining = self.token_budget
+        for article in self._rank(unique):
+            overhead = self._article_tokens({**article, "content": ""})
+            article = self._fit(
+                article, overhead, min(remaining, overhead + self.article_max_tokens)
+            )
+            if article is None:
+                digest.dropped_over_budget += 1
+                continue
+            tokens = self._article_tokens(article)
+            remaining -= tokens
+            digest.tokens += tokens
+            digest.articles.append(article)
+        return digest
+
+    def _deduplicate(self, articles: list[dict]) -> list[dict]:
+        # pigeonhole: hashes within d bits agree exactly on at least one of d + 1 bands,
+        # so only articles sharing a band are compared
+        bands = self.duplicate_distance + 1
+        width = -(-64 // bands)
+        buckets: dict[tuple[int, int], list[int]] = {}
+        kept: list[tuple[int, dict]] = []
+        for article in articles:
+            headline = article.get("headline") or ""
+            fingerprint = simhash(headline)
+            # articles without a headline have nothing to compare, so they are all kept
+            keys = (
+                [
+                    (band, fingerprint >> (band * width) & ((1 << width) - 1))
+                    for band in range(bands)
+                ]
+                if headline
+                else []
+            )
+            original = next(
+                (
+                    index
+                    for key in keys
+                    for index in buckets.get(key, ())
+                    if bin(kept[index][0] ^ fingerprint).count("1")
+                    <= self.duplicate_distance
+                    and self._same_subject(kept[index][1], article)
+                ),
+                None,
+            )
+            if original is not None:
+                kept_article = kept[original][1]
+                tickers = kept_article["tickers"]
+                kept_article["tickers"] = tickers + [
+                    t for t in article.get("tickers") or [] if t not in tickers
+                ]
+                continue
+            for key in keys:
+                buckets.setdefault(key, []).append(len(kept))
+            kept.append(
+                (
+                    fingerprint,
+                    {**article, "tickers": list(article.get("tickers") or [])},
+                )
+            )
+        return [article for _, article in kept]
+
+    @staticmethod
+    def _same_subject(kept: dict, article: dict) -> bool:
+        # templated headlines ("X shares rise after earnings") hash close together across companies
+        tickers = set(article.get("tickers") or [])
+        if not tickers or not kept["tickers"]:
+            return not tickers and not kept["tickers"]
+        return bool(tickers & set(kept["tickers"]))
+
+    def _rank(self, articles: list[dict]) -> list[dict]:
+        coverage = Counter(
+            ticker for article in articles for ticker in article["tickers"]
+        )
+
+        def score(article: dict) -> float:
+            weight = self.source_weights.get((article.get("source") or "").lower(), 1.0)
+            return weight * (
+                1 + sum(math.log1p(coverage[ticker]) for ticker in article["tickers"])
+            )
+
+        # sorted() is stable, so equal scores keep the index's newest-first order
+        return sorted(articles, key=score, reverse=True)
+
+    @staticmethod
+    def _article_tokens(article: dict) -> int:
+        return sum(estimate_tokens(str(value)) for value in article.values())
+
+    @staticmethod
+    def _fit(article: dict, overhead: int, tokens: int) -> dict | None:
+        """The article with its body cut to fit `tokens`, or None when even the headline and summary don't."""
+        if overhead > tokens:
+            return None
+        content = article.get("content") or ""
+        max_chars = (tokens - overhead) * CHARS_PER_TOKEN
+        if len(content) <= max_chars:
+            return article
+        cut = content[: max(max_chars - len(_TRUNCATED), 0)]
+        if " " in cut:
+            cut = cut.rsplit(" ", 1)[0]
+        return {**article, "content": cut + _TRUNCATED if cut else ""}
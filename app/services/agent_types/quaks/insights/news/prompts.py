@@ -48,8 +48,8 @@ A comprehensive collection of ALL news articles from the last 24 hours, sorted b
 preceded by a 2-3 paragraph market mood briefing. Every article must appear in full.
 
 ## Instructions
-1. Use the get_markets_news tool to collect the latest market news articles.
-   Call the tool multiple times with different search terms if needed to ensure comprehensive coverage.
+1. The latest market news articles are provided in the last message as a JSON list, already \
+de-duplicated and ranked by ticker coverage. Long article bodies may have been cut short, marked with "…".
 2. Sort the collected articles by priority of economic impact — highest impact first.
    Priority order: macroeconomic policy & central bank decisions > earnings & guidance from mega-caps > \
 M&A and major deals > regulatory and geopolitical shifts > sector-wide trends > individual stock moves.
@@ -60,8 +60,8 @@ Every recovered article must appear with its full headline, full summary, full c
 and tickers. The downstream reporter relies on this complete data to produce a 5-to-8-minute read.
 
 IMPORTANT:
-- Do NOT compress or shorten article content. Include every detail from the tool results.
-- If the tool returns 50 articles, all 50 must appear in your output.
+- Do NOT compress or shorten article content. Include every detail from the provided articles.
+- If 50 articles are provided, all 50 must appear in your output.
 - The final report targets a 5-to-8-minute reading time, so completeness is essential.
 """
 
@@ -15,5 +15,6 @@ class NewsAnalystState(MessagesState):
     aggregator_system_prompt: str
     reporter_system_prompt: str
     executive_summary: str
+    news_tokens: dict
     messages: Annotated[List, join_messages]
     remaining_steps: RemainingSteps
@@ -7,6 +7,38 @@ from app.services.markets_insights import MarketsInsightsService
 from app.services.markets_news import MarketsNewsService
 
 
+def fetch_markets_news(
+    markets_news_service: MarketsNewsService,
+    search_term: str = "",
+    ticker: str = "",
+    days: int = 1,
+    size: int = 50,
+) -> list[dict]:
+    """Recent articles from the latest news index, flattened to the fields the agents read."""
+    date_from = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+    results, _ = markets_news_service.get_news(
+        index_name="quaks_markets-news_latest",
+        search_term=search_term if search_term else None,
+        key_ticker=ticker if ticker else None,
+        date_from=date_from,
+        size=size,
+        include_text_content=True,
+        include_key_ticker=True,
+    )
+    articles = []
+    for hit in results:
+        source = hit["_source"]
+        articles.append({
+            "headline": source.get("text_headline", ""),
+            "summary": source.get("text_summary", ""),
+            "content": source.get("text_content", ""),
+            "source": source.get("key_source", ""),
+            "date": source.get("date_reference", ""),
+            "tickers": source.get("key_ticker", []),
+        })
+    return articles
+
+
 def build_get_markets_news_tool(markets_news_service: MarketsNewsService):
     @tool("get_markets_news")
     def get_markets_news(
@@ -26,28 +58,13 @@ def build_get_markets_news_tool(markets_news_service: MarketsNewsService):
         Returns:
             JSON string with the list of news articles.
         """
-        actual_size = min(size, 50)
-        date_from = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
-        results, _ = markets_news_service.get_news(
-            index_name="quaks_markets-news_latest",
-            search_term=search_term if search_term else None,
-            key_ticker=ticker if ticker else None,
-            date_from=date_from,
-            size=actual_size,
-            include_text_content=True,
-            include_key_ticker=True,
+        articles = fetch_markets_news(
+            markets_news_service,
+            search_term=search_term,
+            ticker=ticker,
+            days=days,
+            size=min(size, 50),
         )
-        articles = []
-        for hit in results:
-            source = hit["_source"]
-            articles.append({
-                "headline": source.get("text_headline", ""),
-                "summary": source.get("text_summary", ""),
-                "content": source.get("text_content", ""),
-                "source": source.get("key_source", ""),
-                "date": source.get("date_reference", ""),
-                "tickers": source.get("key_ticker", []),
-            })
         return json.dumps(articles, ensure_ascii=False)
 
     return get_markets_news
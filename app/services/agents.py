@@ -1,9 +1,9 @@
 from typing_extensions import Iterator, Optional
 
 from app.domain.models import Agent
-from app.domain.repositories.agents import AgentRepository
-from app.services.agent_settings import AgentSettingService
-from app.services.language_models import LanguageModelService
+from app.domain.repositories.agents import AgentRepository, AsyncAgentRepository
+from app.services.agent_settings import AgentSettingService, AsyncAgentSettingService
+from app.services.language_models import AsyncLanguageModelService, LanguageModelService
 
 
 class AgentService:
@@ -74,3 +74,71 @@ class AgentService:
             language_model_id, schema
         )
         return language_model.id
+
+
+class AsyncAgentService:
+    def __init__(
+        self,
+        agent_repository: AsyncAgentRepository,
+        agent_setting_service: AsyncAgentSettingService,
+        language_model_service: AsyncLanguageModelService,
+    ) -> None:
+        self.agent_repository: AsyncAgentRepository = agent_repository
+        self.agent_setting_service: AsyncAgentSettingService = agent_setting_service
+        self.language_model_service: AsyncLanguageModelService = language_model_service
+
+    async def get_agents(self, schema: str) -> list[Agent]:
+        return await self.agent_repository.get_all(schema)
+
+    async def get_agent_by_id(self, agent_id: str, schema: str) -> Agent:
+        return await self.agent_repository.get_by_id(agent_id, schema)
+
+    async def create_agent(
+        self,
+        agent_name: str,
+        agent_type: str,
+        schema: str,
+        language_model_id: Optional[str] = None,
+    ) -> Agent:
+        resolved_language_model_id = await self._resolve_language_model_id(
+            language_model_id, schema
+        )
+
+        return await self.agent_repository.add(
+            agent_name=agent_name,
+            agent_type=agent_type,
+            language_model_id=resolved_language_model_id,
+            schema=schema,
+        )
+
+    async def delete_agent_by_id(self, agent_id: str, schema: str) -> None:
+        return await self.agent_repository.delete_by_id(agent_id, schema)
+
+    async def update_agent(
+        self,
+        agent_id: str,
+        agent_name: str,
+        schema: str,
+        language_model_id: Optional[str] = None,
+        agent_summary: str = None,
+    ) -> Agent:
+        resolved_language_model_id = await self._resolve_language_model_id(
+            language_model_id, schema
+        )
+        return await self.agent_repository.update_agent(
+            agent_id=agent_id,
+            agent_name=agent_name,
+            language_model_id=resolved_language_model_id,
+            agent_summary=agent_summary,
+            schema=schema,
+        )
+
+    async def _resolve_language_model_id(
+        self, language_model_id: Optional[str], schema: str
+    ) -> Optional[str]:
+        if language_model_id is None:
+            return None
+        language_model = await self.language_model_service.get_language_model_by_id(
+            language_model_id, schema
+        )
+        return language_model.id
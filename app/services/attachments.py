@@ -13,7 +13,11 @@ from markitdown import MarkItDown
 
 from app.domain.exceptions.base import AudioOptimizationError, FileProcessingError
 from app.domain.models import Attachment
-from app.domain.repositories.attachments import AttachmentRepository
+from app.domain.repositories.attachments import (
+    AsyncAttachmentRepository,
+    AttachmentRepository,
+)
+from app.infrastructure.cache.secret_cache import SecretCache
 from app.infrastructure.database.vectors import DocumentRepository
 from app.services.integrations import IntegrationService
 from app.services.language_model_settings import LanguageModelSettingService
@@ -29,6 +33,7 @@ class AttachmentService:
         language_model_setting_service: LanguageModelSettingService,
         integration_service: IntegrationService,
         vault_client: hvac.Client,
+        secret_cache: SecretCache | None = None,
     ) -> None:
         self.attachment_repository = attachment_repository
         self.document_repository = document_repository
@@ -36,6 +41,7 @@ class AttachmentService:
         self.language_model_setting_service = language_model_setting_service
         self.integration_service = integration_service
         self.vault_client = vault_client
+        self.secret_cache = secret_cache or SecretCache(vault_client)
 
     def get_attachments(self, schema: str) -> list[Attachment]:
         return self.attachment_repository.get_all(schema)
@@ -112,12 +118,10 @@ class AttachmentService:
         integration = self.integration_service.get_integration_by_id(
             language_model.integration_id, schema
         )
-        secrets = self.vault_client.secrets.kv.read_secret_version(
-            path=f"integration_{integration.id}", raise_on_deleted_version=False
-        )
+        secret = self.secret_cache.read(f"integration_{integration.id}")
 
-        api_endpoint = secrets["data"]["data"]["api_endpoint"]
-        api_key = secrets["data"]["data"]["api_key"]
+        api_endpoint = secret["api_endpoint"]
+        api_key = secret["api_key"]
 
         if integration.integration_type == "openai_api_v1":
             embeddings_model = OpenAIEmbeddings(
@@ -181,3 +185,19 @@ class AttachmentService:
             return optimized_audio
         except subprocess.CalledProcessError as e:
             raise AudioOptimizationError(e)
+
+
+class AsyncAttachmentService:
+    """
+    Non-blocking attachment reads for the API. File parsing and embeddings stay on
+    `AttachmentService`, which agents also use.
+    """
+
+    def __init__(self, attachment_repository: AsyncAttachmentRepository) -> None:
+        self.attachment_repository = attachment_repository
+
+    async def get_attachments(self, schema: str) -> list[Attachment]:
+        return await self.attachment_repository.get_all(schema)
+
+    async def get_attachment_by_id(self, attachment_id: str, schema: str) -> Attachment:
+        return await self.attachment_repository.get_by_id(attachment_id, schema)
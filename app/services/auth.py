@@ -1,12 +1,29 @@
+import base64
+import json
+import logging
+
 import requests
 
 from app.domain.exceptions.base import AuthenticationError
+from app.infrastructure.auth.user import get_schema
+from app.infrastructure.database.sql import Database
 from app.interface.api.auth.schema import AuthResponse, UserProfileResponse
 
+logger = logging.getLogger(__name__)
 
 _TOKEN_NOT_FOUND = "Access token or refresh token not found in response"
 
 
+def _token_subject(access_token: str) -> str | None:
+    """Read the `sub` claim of a token just issued by Keycloak (no signature check)."""
+    try:
+        payload = access_token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return json.loads(base64.urlsafe_b64decode(payload)).get("sub")
+    except (IndexError, ValueError, AttributeError):
+        return None
+
+
 class AuthService:
     def __init__(
         self,
@@ -15,6 +32,7 @@ class AuthService:
         realm: str,
         client_id: str,
         client_secret: str,
+        db: Database | None = None,
     ):
         self.enabled = enabled
         self.url = url
@@ -23,6 +41,20 @@ class AuthService:
         self.client_secret = client_secret
         self.token_url = f"{self.url}/realms/{self.realm}/protocol/openid-connect/token"
         self.admin_users_url = f"{self.url}/admin/realms/{self.realm}/users"
+        self.db = db
+
+    def _provision_tenant(self, access_token: str) -> None:
+        """Create the user's schema up front so their first API call skips the DDL."""
+        if self.db is None:
+            return
+        subject = _token_subject(access_token)
+        if subject is None:
+            return
+        try:
+            self.db.provision_schema(get_schema(f"id_{subject}"))
+        except Exception:
+            # sessions provision lazily as well, so a failure here must not block the login
+            logger.exception("Failed to provision schema for user %s", subject)
 
     def login(self, username: str, password: str) -> AuthResponse:
         try:
@@ -43,6 +75,7 @@ class AuthService:
             refresh_token = token_data.get("refresh_token")
             if not access_token or not refresh_token:
                 raise AuthenticationError(_TOKEN_NOT_FOUND)
+            self._provision_tenant(access_token)
             return AuthResponse(access_token=access_token, refresh_token=refresh_token)
         except requests.exceptions.RequestException as exc:
             raise AuthenticationError(str(exc))
@@ -68,6 +101,7 @@ class AuthService:
             refresh_token = token_data.get("refresh_token")
             if not access_token or not refresh_token:
                 raise AuthenticationError(_TOKEN_NOT_FOUND)
+            self._provision_tenant(access_token)
             return AuthResponse(
                 access_token=access_token, refresh_token=refresh_token
             )
@@ -1,12 +1,21 @@
 from typing_extensions import Iterator
 
 from app.domain.models import Integration
-from app.domain.repositories.integrations import IntegrationRepository
+from app.domain.repositories.integrations import (
+    AsyncIntegrationRepository,
+    IntegrationRepository,
+)
+from app.infrastructure.cache.model_clients import ModelClientCache
 
 
 class IntegrationService:
-    def __init__(self, integration_repository: IntegrationRepository) -> None:
+    def __init__(
+        self,
+        integration_repository: IntegrationRepository,
+        model_client_cache: ModelClientCache | None = None,
+    ) -> None:
         self.repository: IntegrationRepository = integration_repository
+        self.model_client_cache = model_client_cache
 
     def get_integrations(self, schema: str) -> Iterator[Integration]:
         return self.repository.get_all(schema)
@@ -25,4 +34,39 @@ class IntegrationService:
         )
 
     def delete_integration_by_id(self, integration_id: str, schema: str) -> None:
-        return self.repository.delete_by_id(integration_id, schema)
+        self.repository.delete_by_id(integration_id, schema)
+        if self.model_client_cache is not None:
+            self.model_client_cache.invalidate_integration(integration_id)
+
+
+class AsyncIntegrationService:
+    def __init__(
+        self,
+        integration_repository: AsyncIntegrationRepository,
+        model_client_cache: ModelClientCache | None = None,
+    ) -> None:
+        self.repository: AsyncIntegrationRepository = integration_repository
+        self.model_client_cache = model_client_cache
+
+    async def get_integrations(self, schema: str) -> list[Integration]:
+        return await self.repository.get_all(schema)
+
+    async def get_integration_by_id(
+        self, integration_id: str, schema: str
+    ) -> Integration:
+        return await self.repository.get_by_id(integration_id, schema)
+
+    async def create_integration(
+        self, integration_type: str, api_endpoint: str, api_key: str, schema: str
+    ) -> Integration:
+        return await self.repository.add(
+            integration_type=integration_type,
+            api_endpoint=api_endpoint,
+            api_key=api_key,
+            schema=schema,
+        )
+
+    async def delete_integration_by_id(self, integration_id: str, schema: str) -> None:
+        await self.repository.delete_by_id(integration_id, schema)
+        if self.model_client_cache is not None:
+            self.model_client_cache.invalidate_integration(integration_id)
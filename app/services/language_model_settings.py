@@ -1,7 +1,10 @@
 from typing_extensions import Iterator
 
 from app.domain.models import LanguageModelSetting
-from app.domain.repositories.language_models import LanguageModelSettingRepository
+from app.domain.repositories.language_models import (
+    AsyncLanguageModelSettingRepository,
+    LanguageModelSettingRepository,
+)
 
 
 class LanguageModelSettingService:
@@ -36,3 +39,37 @@ class LanguageModelSettingService:
             setting_value=setting_value,
             schema=schema,
         )
+
+
+class AsyncLanguageModelSettingService:
+    def __init__(
+        self, language_model_setting_repository: AsyncLanguageModelSettingRepository
+    ) -> None:
+        self.repository: AsyncLanguageModelSettingRepository = (
+            language_model_setting_repository
+        )
+
+    async def get_language_model_settings(
+        self, language_model_id: str, schema: str
+    ) -> list[LanguageModelSetting]:
+        return await self.repository.get_all(language_model_id, schema)
+
+    async def create_language_model_setting(
+        self, language_model_id: str, setting_key: str, setting_value: str, schema: str
+    ) -> LanguageModelSetting:
+        return await self.repository.add(
+            language_model_id=language_model_id,
+            setting_key=setting_key,
+            setting_value=setting_value,
+            schema=schema,
+        )
+
+    async def update_by_key(
+        self, language_model_id: str, setting_key: str, setting_value: str, schema: str
+    ) -> LanguageModelSetting:
+        return await self.repository.update_by_key(
+            language_model_id=language_model_id,
+            setting_key=setting_key,
+            setting_value=setting_value,
+            schema=schema,
+        )
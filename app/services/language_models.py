@@ -1,9 +1,19 @@
 from typing_extensions import Iterator
 
 from app.domain.models import LanguageModel
-from app.domain.repositories.language_models import LanguageModelRepository
-from app.services.integrations import IntegrationService
-from app.services.language_model_settings import LanguageModelSettingService
+from app.domain.repositories.language_models import (
+    AsyncLanguageModelRepository,
+    LanguageModelRepository,
+)
+from app.services.integrations import AsyncIntegrationService, IntegrationService
+from app.services.language_model_settings import (
+    AsyncLanguageModelSettingService,
+    LanguageModelSettingService,
+)
+
+
+def _default_embeddings_model(integration_type: str) -> str:
+    return "text-embedding-3-large" if integration_type == "openai_api_v1" else "bge-m3"
 
 
 class LanguageModelService:
@@ -41,20 +51,12 @@ class LanguageModelService:
         )
 
         # default embeddings model setting
-        if integration.integration_type == "openai_api_v1":
-            self.setting_service.create_language_model_setting(
-                language_model_id=language_model.id,
-                setting_key="embeddings",
-                setting_value="text-embedding-3-large",
-                schema=schema,
-            )
-        else:
-            self.setting_service.create_language_model_setting(
-                language_model_id=language_model.id,
-                setting_key="embeddings",
-                setting_value="bge-m3",
-                schema=schema,
-            )
+        self.setting_service.create_language_model_setting(
+            language_model_id=language_model.id,
+            setting_key="embeddings",
+            setting_value=_default_embeddings_model(integration.integration_type),
+            schema=schema,
+        )
 
         return language_model
 
@@ -77,3 +79,67 @@ class LanguageModelService:
             integration_id=integration.id,
             schema=schema,
         )
+
+
+class AsyncLanguageModelService:
+    def __init__(
+        self,
+        language_model_repository: AsyncLanguageModelRepository,
+        language_model_setting_service: AsyncLanguageModelSettingService,
+        integration_service: AsyncIntegrationService,
+    ) -> None:
+        self.repository: AsyncLanguageModelRepository = language_model_repository
+        self.setting_service = language_model_setting_service
+        self.integration_service = integration_service
+
+    async def get_language_models(self, schema: str) -> list[LanguageModel]:
+        return await self.repository.get_all(schema)
+
+    async def get_language_model_by_id(
+        self, language_model_id: str, schema: str
+    ) -> LanguageModel:
+        return await self.repository.get_by_id(language_model_id, schema)
+
+    async def create_language_model(
+        self, integration_id: str, language_model_tag: str, schema: str
+    ) -> LanguageModel:
+        integration = await self.integration_service.get_integration_by_id(
+            integration_id, schema
+        )
+
+        language_model = await self.repository.add(
+            integration_id=integration.id,
+            language_model_tag=language_model_tag,
+            schema=schema,
+        )
+
+        await self.setting_service.create_language_model_setting(
+            language_model_id=language_model.id,
+            setting_key="embeddings",
+            setting_value=_default_embeddings_model(integration.integration_type),
+            schema=schema,
+        )
+
+        return language_model
+
+    async def delete_language_model_by_id(
+        self, language_model_id: str, schema: str
+    ) -> None:
+        return await self.repository.delete_by_id(language_model_id, schema)
+
+    async def update_language_model(
+        self,
+        language_model_id: str,
+        language_model_tag: str,
+        integration_id: str,
+        schema: str,
+    ) -> LanguageModel:
+        integration = await self.integration_service.get_integration_by_id(
+            integration_id, schema
+        )
+        return await self.repository.update_language_model(
+            language_model_id=language_model_id,
+            language_model_tag=language_model_tag,
+            integration_id=integration.id,
+            schema=schema,
+        )
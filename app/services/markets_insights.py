@@ -1,7 +1,42 @@
 import base64
 import json
 
-from elasticsearch import Elasticsearch
+from elasticsearch import AsyncElasticsearch, Elasticsearch
+
+
+def _insights_search_params(
+        id: str = None,
+        date_from: str = None,
+        date_to: str = None,
+        size=10,
+        cursor: str = None,
+        include_report_html=False) -> dict:
+    params = {
+        "size": size,
+        "include_report_html": include_report_html,
+    }
+    if id:
+        params["id"] = id
+    if date_from:
+        params["date_from"] = date_from
+    if date_to:
+        params["date_to"] = date_to
+    if cursor:
+        params["search_after"] = json.loads(base64.urlsafe_b64decode(cursor).decode())
+    return {
+        "id": "get_insights_news_template",
+        "params": params,
+    }
+
+
+def _parse_insights_hits(response) -> tuple[list[dict], str]:
+    results = []
+    last_sort = None
+    for hit in response['hits']['hits']:
+        results.append(hit)
+        last_sort = base64.urlsafe_b64encode(json.dumps(hit['sort']).encode()).decode()
+
+    return results, last_sort
 
 
 class MarketsInsightsService:
@@ -18,28 +53,40 @@ class MarketsInsightsService:
             size=10,
             cursor: str = None,
             include_report_html=False):
-        params = {
-            "size": size,
-            "include_report_html": include_report_html,
-        }
-        if id:
-            params["id"] = id
-        if date_from:
-            params["date_from"] = date_from
-        if date_to:
-            params["date_to"] = date_to
-        if cursor:
-            params["search_after"] = json.loads(base64.urlsafe_b64decode(cursor).decode())
-        search_params = {
-            "id": "get_insights_news_template",
-            "params": params,
-        }
-
+        search_params = _insights_search_params(
+            id=id,
+            date_from=date_from,
+            date_to=date_to,
+            size=size,
+            cursor=cursor,
+            include_report_html=include_report_html,
+        )
         response = self.es.search_template(index=index_name, body=search_params)
-        results = []
-        last_sort = None
-        for hit in response['hits']['hits']:
-            results.append(hit)
-            last_sort = base64.urlsafe_b64encode(json.dumps(hit['sort']).encode()).decode()
+        return _parse_insights_hits(response)
+
+
+class AsyncMarketsInsightsService:
+    """Non-blocking counterpart of `MarketsInsightsService` for the API and MCP handlers."""
+
+    def __init__(self, es: AsyncElasticsearch) -> None:
+        self.es = es
 
-        return results, last_sort
+    async def get_insights_news(
+            self,
+            index_name: str,
+            id: str = None,
+            date_from: str = None,
+            date_to: str = None,
+            size=10,
+            cursor: str = None,
+            include_report_html=False):
+        search_params = _insights_search_params(
+            id=id,
+            date_from=date_from,
+            date_to=date_to,
+            size=size,
+            cursor=cursor,
+            include_report_html=include_report_html,
+        )
+        response = await self.es.search_template(index=index_name, body=search_params)
+        return _parse_insights_hits(response)
@@ -1,7 +1,52 @@
 import base64
 import json
 
-from elasticsearch import Elasticsearch
+from elasticsearch import AsyncElasticsearch, Elasticsearch
+
+
+def _news_search_params(
+        id: str = None,
+        key_ticker: str = None,
+        search_term: str = None,
+        date_from: str = None,
+        date_to: str = None,
+        size=10,
+        cursor: str = None,
+        include_text_content=False,
+        include_key_ticker=False,
+        include_obj_images=False) -> dict:
+    params = {
+        "size": size,
+        "include_text_content": include_text_content,
+        "include_key_ticker": include_key_ticker,
+        "include_obj_images": include_obj_images,
+    }
+    if id:
+        params["id"] = id
+    if key_ticker:
+        params["key_ticker"] = key_ticker
+    elif search_term:
+        params["search_term"] = search_term
+    if date_from:
+        params["date_from"] = date_from
+    if date_to:
+        params["date_to"] = date_to
+    if cursor:
+        params["search_after"] = json.loads(base64.urlsafe_b64decode(cursor).decode())
+    return {
+        "id": "get_markets_news_template",
+        "params": params,
+    }
+
+
+def _parse_news_hits(response) -> tuple[list[dict], str]:
+    results = []
+    last_sort = None
+    for hit in response['hits']['hits']:
+        results.append(hit)
+        last_sort = base64.urlsafe_b64encode(json.dumps(hit['sort']).encode()).decode()
+
+    return results, last_sort
 
 
 class MarketsNewsService:
@@ -22,34 +67,52 @@ class MarketsNewsService:
             include_text_content=False,
             include_key_ticker=False,
             include_obj_images=False):
-        params = {
-            "size": size,
-            "include_text_content": include_text_content,
-            "include_key_ticker": include_key_ticker,
-            "include_obj_images": include_obj_images,
-        }
-        if id:
-            params["id"] = id
-        if key_ticker:
-            params["key_ticker"] = key_ticker
-        elif search_term:
-            params["search_term"] = search_term
-        if date_from:
-            params["date_from"] = date_from
-        if date_to:
-            params["date_to"] = date_to
-        if cursor:
-            params["search_after"] = json.loads(base64.urlsafe_b64decode(cursor).decode())
-        search_params = {
-            "id": "get_markets_news_template",
-            "params": params,
-        }
-
+        search_params = _news_search_params(
+            id=id,
+            key_ticker=key_ticker,
+            search_term=search_term,
+            date_from=date_from,
+            date_to=date_to,
+            size=size,
+            cursor=cursor,
+            include_text_content=include_text_content,
+            include_key_ticker=include_key_ticker,
+            include_obj_images=include_obj_images,
+        )
         response = self.es.search_template(index=index_name, body=search_params)
-        results = []
-        last_sort = None
-        for hit in response['hits']['hits']:
-            results.append(hit)
-            last_sort = base64.urlsafe_b64encode(json.dumps(hit['sort']).encode()).decode()
+        return _parse_news_hits(response)
 
-        return results, last_sort
+
+class AsyncMarketsNewsService:
+    """Non-blocking counterpart of `MarketsNewsService` for the API and MCP handlers."""
+
+    def __init__(self, es: AsyncElasticsearch) -> None:
+        self.es = es
+
+    async def get_news(
+            self,
+            index_name: str,
+            id: str = None,
+            key_ticker: str = None,
+            search_term: str = None,
+            date_from: str = None,
+            date_to: str = None,
+            size=10,
+            cursor: str = None,
+            include_text_content=False,
+            include_key_ticker=False,
+            include_obj_images=False):
+        search_params = _news_search_params(
+            id=id,
+            key_ticker=key_ticker,
+            search_term=search_term,
+            date_from=date_from,
+            date_to=date_to,
+            size=size,
+            cursor=cursor,
+            include_text_content=include_text_content,
+            include_key_ticker=include_key_ticker,
+            include_obj_images=include_obj_images,
+        )
+        response = await self.es.search_template(index=index_name, body=search_params)
+        return _parse_news_hits(response)
@@ -1,5 +1,117 @@
+import numpy as np
 from typing_extensions import Optional
-from elasticsearch import Elasticsearch
+from elasticsearch import AsyncElasticsearch, Elasticsearch
+
+from app.infrastructure.cache.result_cache import ResultCache
+from app.utils import indicator_utils
+
+OHLCV_PAGE_SIZE = 10000
+
+
+def _company_profile_params(key_ticker: str) -> dict:
+    return {
+        "id": "get_metadata_profile_template",
+        "params": {
+            "key_ticker": key_ticker,
+        }
+    }
+
+
+def _parse_company_profile(response) -> dict:
+    hits = response['hits']['hits']
+    if not hits:
+        return {}
+    return hits[0]['_source']
+
+
+def _market_caps_bulk_params(key_tickers: list[str]) -> dict:
+    return {
+        "id": "get_metadata_market_caps_template",
+        "params": {
+            "key_tickers": key_tickers,
+            "size": len(key_tickers),
+        }
+    }
+
+
+def _parse_market_caps_bulk(response) -> list[dict]:
+    buckets = response['aggregations']['by_ticker']['buckets']
+    results = []
+    for bucket in buckets:
+        hits = bucket['latest']['hits']['hits']
+        if hits:
+            market_cap = hits[0]['_source'].get('market_capitalization')
+            results.append({
+                'key_ticker': bucket['key'],
+                'market_capitalization': market_cap,
+            })
+    return results
+
+
+def _stats_close_bulk_params(key_tickers: list[str], start_date: str, end_date: str) -> dict:
+    return {
+        "id": "get_stats_close_bulk_template",
+        "params": {
+            "key_tickers": key_tickers,
+            "date_gte": start_date,
+            "date_lte": end_date,
+            "size": len(key_tickers),
+        }
+    }
+
+
+def _parse_stats_close_bulk(response) -> list[dict]:
+    buckets = response['aggregations']['by_ticker']['buckets']
+    results = []
+    for bucket in buckets:
+        stats = bucket['recent_stats']['value']
+        if stats is not None:
+            stats['key_ticker'] = bucket['key']
+            results.append(stats)
+    return results
+
+
+def _stats_close_params(key_ticker: str, start_date: str, end_date: Optional[str]) -> dict:
+    return {
+        "id": "get_stats_close_template",
+        "params": {
+            "key_ticker": key_ticker,
+            "date_gte": start_date,
+            "date_lte": end_date,
+        }
+    }
+
+
+def _ohlcv_page_params(key_tickers: list[str], start_date: str, end_date: str, search_after) -> dict:
+    params = {
+        "key_tickers": key_tickers,
+        "date_gte": start_date,
+        "date_lte": end_date,
+        "size": OHLCV_PAGE_SIZE,
+    }
+    if search_after is not None:
+        params["has_search_after"] = True
+        params["search_after"] = search_after
+    return {
+        "id": "get_eod_ohlcv_series_template",
+        "params": params,
+    }
+
+
+def _split_ohlcv_series(hits: list[dict], key_tickers: list[str]) -> dict[str, dict[str, np.ndarray]]:
+    grouped = indicator_utils.group_ohlcv_series(hits)
+    empty = indicator_utils.build_ohlcv_series([])
+    return {ticker: grouped.get(ticker, empty) for ticker in key_tickers}
+
+
+def _compute_indicators_by_ticker(
+        series_by_ticker: dict[str, dict[str, np.ndarray]],
+        specs: list[dict],
+) -> dict[str, dict[str, list[dict]]]:
+    return {
+        ticker: indicator_utils.compute_indicators(series, specs)
+        for ticker, series in series_by_ticker.items()
+    }
 
 
 class MarketsStatsService:
@@ -12,44 +124,18 @@ class MarketsStatsService:
             index_name: str,
             key_ticker: str,
     ) -> dict:
-        search_params = {
-            "id": "get_metadata_profile_template",
-            "params": {
-                "key_ticker": key_ticker,
-            }
-        }
-
+        search_params = _company_profile_params(key_ticker)
         response = self.es.search_template(index=index_name, body=search_params)
-        hits = response['hits']['hits']
-        if not hits:
-            return {}
-        return hits[0]['_source']
+        return _parse_company_profile(response)
 
     def get_market_caps_bulk(
             self,
             index_name: str,
             key_tickers: list[str],
     ) -> list[dict]:
-        search_params = {
-            "id": "get_metadata_market_caps_template",
-            "params": {
-                "key_tickers": key_tickers,
-                "size": len(key_tickers),
-            }
-        }
-
+        search_params = _market_caps_bulk_params(key_tickers)
         response = self.es.search_template(index=index_name, body=search_params)
-        buckets = response['aggregations']['by_ticker']['buckets']
-        results = []
-        for bucket in buckets:
-            hits = bucket['latest']['hits']['hits']
-            if hits:
-                market_cap = hits[0]['_source'].get('market_capitalization')
-                results.append({
-                    'key_ticker': bucket['key'],
-                    'market_capitalization': market_cap,
-                })
-        return results
+        return _parse_market_caps_bulk(response)
 
     def get_stats_close_bulk(
             self,
@@ -58,25 +144,9 @@ class MarketsStatsService:
             start_date: str,
             end_date: str,
     ) -> list[dict]:
-        search_params = {
-            "id": "get_stats_close_bulk_template",
-            "params": {
-                "key_tickers": key_tickers,
-                "date_gte": start_date,
-                "date_lte": end_date,
-                "size": len(key_tickers),
-            }
-        }
-
+        search_params = _stats_close_bulk_params(key_tickers, start_date, end_date)
         response = self.es.search_template(index=index_name, body=search_params)
-        buckets = response['aggregations']['by_ticker']['buckets']
-        results = []
-        for bucket in buckets:
-            stats = bucket['recent_stats']['value']
-            if stats is not None:
-                stats['key_ticker'] = bucket['key']
-                results.append(stats)
-        return results
+        return _parse_stats_close_bulk(response)
 
     def get_stats_close(
             self,
@@ -85,29 +155,91 @@ class MarketsStatsService:
             start_date: str,
             end_date: Optional[str]
     ) -> dict:
-        search_params = {
-            "id": "get_stats_close_template",
-            "params": {
-                "key_ticker": key_ticker,
-                "date_gte": start_date,
-                "date_lte": end_date,
-            }
-        }
-
+        search_params = _stats_close_params(key_ticker, start_date, end_date)
         response = self.es.search_template(index=index_name, body=search_params)
         return response['aggregations']['recent_stats']['value']
 
+    def _search_ohlcv_hits(
+            self,
+            index_name: str,
+            key_tickers: list[str],
+            start_date: str,
+            end_date: str,
+    ) -> list[dict]:
+        hits = []
+        search_after = None
+        while True:
+            search_params = _ohlcv_page_params(key_tickers, start_date, end_date, search_after)
+            response = self.es.search_template(index=index_name, body=search_params)
+            page = response['hits']['hits']
+            hits.extend(page)
+            if len(page) < OHLCV_PAGE_SIZE:
+                return hits
+            # (key_ticker, date_reference, _index) is unique, since document ids are
+            # ticker_date within an index, so no page boundary skips or repeats a bar
+            search_after = page[-1]['sort']
+
+    def get_ohlcv_series(
+            self,
+            index_name: str,
+            key_ticker: str,
+            start_date: str,
+            end_date: str,
+    ) -> dict[str, np.ndarray]:
+        """
+        Fetches the raw daily OHLCV columns for a ticker, sorted by date.
+        Uses docvalue_fields only; indicators are computed in-process.
+        """
+        hits = self._search_ohlcv_hits(index_name, [key_ticker], start_date, end_date)
+        return indicator_utils.build_ohlcv_series(hits)
+
+    def get_ohlcv_series_bulk(
+            self,
+            index_name: str,
+            key_tickers: list[str],
+            start_date: str,
+            end_date: str,
+    ) -> dict[str, dict[str, np.ndarray]]:
+        """
+        Fetches the OHLCV columns of several tickers with one terms-filtered query.
+        Tickers without data map to an empty series.
+        """
+        hits = self._search_ohlcv_hits(index_name, key_tickers, start_date, end_date)
+        return _split_ohlcv_series(hits, key_tickers)
+
+    def get_indicators_bulk(
+            self,
+            index_name: str,
+            key_ticker: str,
+            start_date: str,
+            end_date: str,
+            specs: list[dict],
+    ) -> dict[str, list[dict]]:
+        """
+        Computes every requested indicator from a single OHLCV fetch.
+        Specs follow `indicator_utils.compute_indicators`, e.g. {"indicator": "rsi", "period": 14}.
+        """
+        series = self.get_ohlcv_series(index_name, key_ticker, start_date, end_date)
+        return indicator_utils.compute_indicators(series, specs)
+
+    def get_indicators_by_ticker(
+            self,
+            index_name: str,
+            key_tickers: list[str],
+            start_date: str,
+            end_date: str,
+            specs: list[dict],
+    ) -> dict[str, dict[str, list[dict]]]:
+        """
+        Computes the requested indicator specs for several tickers from a single OHLCV fetch.
+        Results are keyed by ticker, then by spec name.
+        """
+        series_by_ticker = self.get_ohlcv_series_bulk(index_name, key_tickers, start_date, end_date)
+        return _compute_indicators_by_ticker(series_by_ticker, specs)
+
     def get_indicator_ad(self, index_name: str, key_ticker: str, start_date: str, end_date: str) -> list[dict]:
-        search_params = {
-            "id": "get_eod_indicator_ad_template",
-            "params": {
-                "key_ticker": key_ticker,
-                "date_gte": start_date,
-                "date_lte": end_date,
-            }
-        }
-        response = self.es.search_template(index=index_name, body=search_params)
-        return response['aggregations']['ad_stats']['value']
+        series = self.get_ohlcv_series(index_name, key_ticker, start_date, end_date)
+        return indicator_utils.compute_ad(series)
 
     def get_indicator_adx(
             self,
@@ -117,17 +249,8 @@ class MarketsStatsService:
             end_date: str,
             period: int
     ) -> list[dict]:
-        search_params = {
-            "id": "get_eod_indicator_adx_template",
-            "params": {
-                "key_ticker": key_ticker,
-                "date_gte": start_date,
-                "date_lte": end_date,
-                "period": period,
-            }
-        }
-        response = self.es.search_template(index=index_name, body=search_params)
-        return response['aggregations']['adx_stats']['value']
+        series = self.get_ohlcv_series(index_name, key_ticker, start_date, end_date)
+        return indicator_utils.compute_adx(series, period=period)
 
     def get_indicator_cci(
             self,
@@ -138,18 +261,8 @@ class MarketsStatsService:
             period: int,
             constant: float
     ) -> list[dict]:
-        search_params = {
-            "id": "get_eod_indicator_cci_template",
-            "params": {
-                "key_ticker": key_ticker,
-                "date_gte": start_date,
-                "date_lte": end_date,
-                "period": period,
-                "constant": constant,
-            }
-        }
-        response = self.es.search_template(index=index_name, body=search_params)
-        return response['aggregations']['cci_stats']['value']
+        series = self.get_ohlcv_series(index_name, key_ticker, start_date, end_date)
+        return indicator_utils.compute_cci(series, period=period, constant=constant)
 
     def get_indicator_ema(
             self,
@@ -160,18 +273,8 @@ class MarketsStatsService:
             short_window: int,
             long_window: int
     ) -> list[dict]:
-        search_params = {
-            "id": "get_eod_indicator_ema_template",
-            "params": {
-                "key_ticker": key_ticker,
-                "date_gte": start_date,
-                "date_lte": end_date,
-                "short_window": short_window,
-                "long_window": long_window,
-            }
-        }
-        response = self.es.search_template(index=index_name, body=search_params)
-        return response['aggregations']['ema_stats']['value']
+        series = self.get_ohlcv_series(index_name, key_ticker, start_date, end_date)
+        return indicator_utils.compute_ema(series, short_window=short_window, long_window=long_window)
 
     def get_indicator_macd(
             self,
@@ -183,31 +286,17 @@ class MarketsStatsService:
             long_window: int,
             signal_window: int
     ) -> list[dict]:
-        search_params = {
-            "id": "get_eod_indicator_macd_template",
-            "params": {
-                "key_ticker": key_ticker,
-                "date_gte": start_date,
-                "date_lte": end_date,
-                "short_window": short_window,
-                "long_window": long_window,
-                "signal_window": signal_window,
-            }
-        }
-        response = self.es.search_template(index=index_name, body=search_params)
-        return response['aggregations']['macd_stats']['value']
+        series = self.get_ohlcv_series(index_name, key_ticker, start_date, end_date)
+        return indicator_utils.compute_macd(
+            series,
+            short_window=short_window,
+            long_window=long_window,
+            signal_window=signal_window,
+        )
 
     def get_indicator_obv(self, index_name: str, key_ticker: str, start_date: str, end_date: str) -> list[dict]:
-        search_params = {
-            "id": "get_eod_indicator_obv_template",
-            "params": {
-                "key_ticker": key_ticker,
-                "date_gte": start_date,
-                "date_lte": end_date,
-            }
-        }
-        response = self.es.search_template(index=index_name, body=search_params)
-        return response['aggregations']['obv_stats']['value']
+        series = self.get_ohlcv_series(index_name, key_ticker, start_date, end_date)
+        return indicator_utils.compute_obv(series)
 
     def get_indicator_rsi(
             self,
@@ -217,17 +306,8 @@ class MarketsStatsService:
             end_date: str,
             period: int
     ) -> list[dict]:
-        search_params = {
-            "id": "get_eod_indicator_rsi_template",
-            "params": {
-                "key_ticker": key_ticker,
-                "date_gte": start_date,
-                "date_lte": end_date,
-                "period": period,
-            }
-        }
-        response = self.es.search_template(index=index_name, body=search_params)
-        return response['aggregations']['rsi_stats']['value']
+        series = self.get_ohlcv_series(index_name, key_ticker, start_date, end_date)
+        return indicator_utils.compute_rsi(series, period=period)
 
     def get_indicator_stoch(
             self,
@@ -239,16 +319,213 @@ class MarketsStatsService:
             smooth_k: int,
             smooth_d: int
     ) -> list[dict]:
-        search_params = {
-            "id": "get_eod_indicator_stoch_template",
-            "params": {
-                "key_ticker": key_ticker,
-                "date_gte": start_date,
-                "date_lte": end_date,
-                "lookback": lookback,
-                "smooth_k": smooth_k,
-                "smooth_d": smooth_d,
-            }
-        }
-        response = self.es.search_template(index=index_name, body=search_params)
-        return response['aggregations']['stoch_stats']['value']
+        series = self.get_ohlcv_series(index_name, key_ticker, start_date, end_date)
+        return indicator_utils.compute_stoch(series, lookback=lookback, smooth_k=smooth_k, smooth_d=smooth_d)
+
+
+class AsyncMarketsStatsService:
+    """
+    Non-blocking counterpart of `MarketsStatsService` for the API and MCP handlers.
+    Shares query building and response parsing with the sync service.
+    """
+
+    def __init__(self, es: AsyncElasticsearch) -> None:
+        self.es = es
+
+    async def get_company_profile(
+            self,
+            index_name: str,
+            key_ticker: str,
+    ) -> dict:
+        search_params = _company_profile_params(key_ticker)
+        response = await self.es.search_template(index=index_name, body=search_params)
+        return _parse_company_profile(response)
+
+    async def get_market_caps_bulk(
+            self,
+            index_name: str,
+            key_tickers: list[str],
+    ) -> list[dict]:
+        search_params = _market_caps_bulk_params(key_tickers)
+        response = await self.es.search_template(index=index_name, body=search_params)
+        return _parse_market_caps_bulk(response)
+
+    async def get_stats_close_bulk(
+            self,
+            index_name: str,
+            key_tickers: list[str],
+            start_date: str,
+            end_date: str,
+    ) -> list[dict]:
+        search_params = _stats_close_bulk_params(key_tickers, start_date, end_date)
+        response = await self.es.search_template(index=index_name, body=search_params)
+        return _parse_stats_close_bulk(response)
+
+    async def get_stats_close(
+            self,
+            index_name: str,
+            key_ticker: str,
+            start_date: str,
+            end_date: Optional[str]
+    ) -> dict:
+        search_params = _stats_close_params(key_ticker, start_date, end_date)
+        response = await self.es.search_template(index=index_name, body=search_params)
+        return response['aggregations']['recent_stats']['value']
+
+    async def _search_ohlcv_hits(
+            self,
+            index_name: str,
+            key_tickers: list[str],
+            start_date: str,
+            end_date: str,
+    ) -> list[dict]:
+        hits = []
+        search_after = None
+        while True:
+            search_params = _ohlcv_page_params(key_tickers, start_date, end_date, search_after)
+            response = await self.es.search_template(index=index_name, body=search_params)
+            page = response['hits']['hits']
+            hits.extend(page)
+            if len(page) < OHLCV_PAGE_SIZE:
+                return hits
+            # (key_ticker, date_reference, _index) is unique, since document ids are
+            # ticker_date within an index, so no page boundary skips or repeats a bar
+            search_after = page[-1]['sort']
+
+    async def get_ohlcv_series(
+            self,
+            index_name: str,
+            key_ticker: str,
+            start_date: str,
+            end_date: str,
+    ) -> dict[str, np.ndarray]:
+        hits = await self._search_ohlcv_hits(index_name, [key_ticker], start_date, end_date)
+        return indicator_utils.build_ohlcv_series(hits)
+
+    async def get_ohlcv_series_bulk(
+            self,
+            index_name: str,
+            key_tickers: list[str],
+            start_date: str,
+            end_date: str,
+    ) -> dict[str, dict[str, np.ndarray]]:
+        hits = await self._search_ohlcv_hits(index_name, key_tickers, start_date, end_date)
+        return _split_ohlcv_series(hits, key_tickers)
+
+    async def get_indicators_bulk(
+            self,
+            index_name: str,
+            key_ticker: str,
+            start_date: str,
+            end_date: str,
+            specs: list[dict],
+    ) -> dict[str, list[dict]]:
+        series = await self.get_ohlcv_series(index_name, key_ticker, start_date, end_date)
+        return indicator_utils.compute_indicators(series, specs)
+
+    async def get_indicators_by_ticker(
+            self,
+            index_name: str,
+            key_tickers: list[str],
+            start_date: str,
+            end_date: str,
+            specs: list[dict],
+    ) -> dict[str, dict[str, list[dict]]]:
+        series_by_ticker = await self.get_ohlcv_series_bulk(index_name, key_tickers, start_date, end_date)
+        return _compute_indicators_by_ticker(series_by_ticker, specs)
+
+
+class CachedAsyncMarketsStatsService(AsyncMarketsStatsService):
+    """
+    `AsyncMarketsStatsService` whose read queries are served from a `ResultCache`.
+    EOD data only changes when the ingestion DAGs run, so identical requests in
+    between are answered without touching Elasticsearch.
+    """
+
+    def __init__(self, es: AsyncElasticsearch, result_cache: ResultCache) -> None:
+        super().__init__(es)
+        self.result_cache = result_cache
+
+    async def get_company_profile(self, index_name: str, key_ticker: str) -> dict:
+        return await self.result_cache.get_or_load(
+            "get_company_profile",
+            super().get_company_profile,
+            index_name=index_name,
+            key_ticker=key_ticker,
+        )
+
+    async def get_market_caps_bulk(self, index_name: str, key_tickers: list[str]) -> list[dict]:
+        return await self.result_cache.get_or_load(
+            "get_market_caps_bulk",
+            super().get_market_caps_bulk,
+            index_name=index_name,
+            key_tickers=key_tickers,
+        )
+
+    async def get_stats_close_bulk(
+            self,
+            index_name: str,
+            key_tickers: list[str],
+            start_date: str,
+            end_date: str,
+    ) -> list[dict]:
+        return await self.result_cache.get_or_load(
+            "get_stats_close_bulk",
+            super().get_stats_close_bulk,
+            index_name=index_name,
+            key_tickers=key_tickers,
+            start_date=start_date,
+            end_date=end_date,
+        )
+
+    async def get_stats_close(
+            self,
+            index_name: str,
+            key_ticker: str,
+            start_date: str,
+            end_date: Optional[str]
+    ) -> dict:
+        return await self.result_cache.get_or_load(
+            "get_stats_close",
+            super().get_stats_close,
+            index_name=index_name,
+            key_ticker=key_ticker,
+            start_date=start_date,
+            end_date=end_date,
+        )
+
+    async def get_indicators_bulk(
+            self,
+            index_name: str,
+            key_ticker: str,
+            start_date: str,
+            end_date: str,
+            specs: list[dict],
+    ) -> dict[str, list[dict]]:
+        return await self.result_cache.get_or_load(
+            "get_indicators_bulk",
+            super().get_indicators_bulk,
+            index_name=index_name,
+            key_ticker=key_ticker,
+            start_date=start_date,
+            end_date=end_date,
+            specs=specs,
+        )
+
+    async def get_indicators_by_ticker(
+            self,
+            index_name: str,
+            key_tickers: list[str],
+            start_date: str,
+            end_date: str,
+            specs: list[dict],
+    ) -> dict[str, dict[str, list[dict]]]:
+        return await self.result_cache.get_or_load(
+            "get_indicators_by_ticker",
+            super().get_indicators_by_ticker,
+            index_name=index_name,
+            key_tickers=key_tickers,
+            start_date=start_date,
+            end_date=end_date,
+            specs=specs,
+        )
@@ -3,8 +3,8 @@ from typing_extensions import Iterator
 from app.domain.exceptions.base import InvalidFieldError
 from app.domain.models import Message
 from app.domain.repositories.agents import AgentNotFoundError
-from app.domain.repositories.messages import MessageRepository
-from app.services.agents import AgentService
+from app.domain.repositories.messages import AsyncMessageRepository, MessageRepository
+from app.services.agents import AgentService, AsyncAgentService
 from app.services.attachments import AttachmentService
 
 
@@ -57,3 +57,52 @@ class MessageService:
         if message.replies_to is not None:
             self.repository.delete_by_id(message.replies_to, schema)
         return self.repository.delete_by_id(message_id, schema)
+
+
+class AsyncMessageService:
+    def __init__(
+        self,
+        message_repository: AsyncMessageRepository,
+        agent_service: AsyncAgentService,
+    ) -> None:
+        self.repository: AsyncMessageRepository = message_repository
+        self.agent_service: AsyncAgentService = agent_service
+
+    async def get_messages(self, agent_id: str, schema: str) -> list[Message]:
+        agent = await self.agent_service.get_agent_by_id(agent_id, schema)
+        return await self.repository.get_all(agent.id, schema)
+
+    async def get_message_by_id(self, message_id: str, schema: str) -> Message:
+        return await self.repository.get_by_id(message_id, schema)
+
+    async def create_message(
+        self,
+        message_role: str,
+        message_content: str,
+        agent_id: str,
+        schema: str,
+        response_data: dict = None,
+        attachment_id: str = None,
+        replies_to: Message = None,
+    ) -> Message:
+        # verify agent
+        try:
+            await self.agent_service.get_agent_by_id(agent_id, schema)
+        except AgentNotFoundError:
+            raise InvalidFieldError(field_name="agent_id", reason="agent not found")
+
+        return await self.repository.add(
+            message_role=message_role,
+            message_content=message_content,
+            agent_id=agent_id,
+            schema=schema,
+            response_data=response_data,
+            attachment_id=attachment_id,
+            replies_to=replies_to,
+        )
+
+    async def delete_message_by_id(self, message_id: str, schema: str) -> None:
+        message = await self.get_message_by_id(message_id, schema)
+        if message.replies_to is not None:
+            await self.repository.delete_by_id(message.replies_to, schema)
+        return await self.repository.delete_by_id(message_id, schema)
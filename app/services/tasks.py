@@ -1,4 +1,6 @@
+import asyncio
 import logging
+import time
 
 import redis
 from pydantic import BaseModel
@@ -10,6 +12,11 @@ class TaskProgress(BaseModel):
 
     agent_id: str
     status: Literal["in_progress", "completed", "failed"]
+    task_id: Optional[str] = None
+    # set on streamed updates: a graph node starting, or LLM tokens it produced
+    event: Optional[Literal["node", "token"]] = None
+    node: Optional[str] = None
+    message_id: Optional[str] = None
     message_content: Optional[str] = None
     response_data: Optional[Dict[str, Any]] = None
 
@@ -44,3 +51,59 @@ class TaskNotificationService:
         self.pubsub.close()
         self.redis_client.close()
         self.logger.info("Redis connections closed")
+
+
+class TaskUpdateStream:
+    """
+    Publishes the streamed progress of one task on the task updates channel.
+
+    Consecutive tokens from the same node are merged and published at most once
+    per `interval` seconds, so a long answer costs a few publishes per second
+    rather than one per token. Use as an async context manager to publish the
+    last merged tokens when the task ends.
+    """
+
+    def __init__(
+        self,
+        task_notification_service: TaskNotificationService,
+        task_id: str | None = None,
+        interval: float | None = None,
+    ) -> None:
+        self.task_notification_service = task_notification_service
+        self.task_id = task_id
+        self.interval = interval or 0.25
+        self._pending: TaskProgress | None = None
+        self._pending_since = 0.0
+
+    async def __aenter__(self) -> "TaskUpdateStream":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.flush()
+
+    async def send(self, progress: TaskProgress) -> None:
+        progress = progress.model_copy(update={"task_id": self.task_id})
+        if progress.event != "token":
+            await self.flush()
+            await self._publish(progress)
+            return
+
+        pending = self._pending
+        if pending is not None and pending.node == progress.node:
+            pending.message_content += progress.message_content
+        else:
+            await self.flush()
+            self._pending = progress
+            self._pending_since = time.monotonic()
+        if time.monotonic() - self._pending_since >= self.interval:
+            await self.flush()
+
+    async def flush(self) -> None:
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            await self._publish(pending)
+
+    async def _publish(self, progress: TaskProgress) -> None:
+        await asyncio.to_thread(
+            self.task_notification_service.publish_update, task_progress=progress
+        )
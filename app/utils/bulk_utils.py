@@ -0,0 +1,241 @@
+import json
+import os
+import threading
+import time
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass
+
+import requests
+from requests.adapters import HTTPAdapter
+
+BULK_MAX_BYTES = 5 * 1024 * 1024
+BULK_MAX_DOCS = 5000
+BULK_MAX_RETRIES = 3
+BULK_BACKOFF_SECONDS = 0.5
+BULK_MAX_BACKOFF_SECONDS = 30.0
+BULK_TIMEOUT_SECONDS = 60
+
+# statuses worth resending: the cluster is shedding load or a proxy hiccuped
+RETRYABLE_STATUSES = frozenset({429, 502, 503, 504})
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def shared_session() -> requests.Session:
+    """The process-wide session every `BulkWriter` posts through, so connections are reused."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            _session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+            _session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+        return _session
+
+
+@dataclass
+class _BulkItem:
+    action: bytes
+    source: bytes | None
+    key: Hashable
+    error: str | None = None
+
+    def __len__(self) -> int:
+        return (
+            len(self.action)
+            + 1
+            + (len(self.source) + 1 if self.source is not None else 0)
+        )
+
+
+class BulkWriter:
+    """
+    Writes NDJSON to the Elasticsearch `_bulk` API in requests capped by bytes and
+    documents.
+
+    Every item result is checked. Items rejected with a retryable status (429 and
+    gateway errors) are resent on their own with exponential backoff, up to
+    `max_retries` times; other rejections are counted as failed with their error.
+    A request that fails as a whole is treated the same way for all of its items.
+    Items written with a `key` (a ticker, say) are also tallied per key.
+
+    Use as a context manager, or call `close()`, to flush the last request.
+    """
+
+    def __init__(
+        self,
+        es_url: str | None = None,
+        api_key: str | None = None,
+        session: requests.Session | None = None,
+        max_bytes: int = BULK_MAX_BYTES,
+        max_docs: int = BULK_MAX_DOCS,
+        max_retries: int = BULK_MAX_RETRIES,
+        backoff: float = BULK_BACKOFF_SECONDS,
+        max_backoff: float = BULK_MAX_BACKOFF_SECONDS,
+        timeout: float = BULK_TIMEOUT_SECONDS,
+    ) -> None:
+        self.url = f"{es_url or os.environ.get('ELASTICSEARCH_URL')}/_bulk"
+        self.headers = {
+            "Authorization": f"ApiKey {api_key or os.environ.get('ELASTICSEARCH_API_KEY')}",
+            "Content-Type": "application/x-ndjson",
+        }
+        self.session = session or shared_session()
+        self.max_bytes = max_bytes
+        self.max_docs = max_docs
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+        self.keys: dict = {}
+        self._pending: list[_BulkItem] = []
+        self._pending_bytes = 0
+        self._indexed = 0
+        self._failed = 0
+        self._retried = 0
+        self._requests = 0
+        self._bytes = 0
+        self._errors: list[str] = []
+        self._started_at = None
+        self._finished_at = None
+
+    def __enter__(self) -> "BulkWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def write(self, body: bytes | Iterable[bytes], key: Hashable = None) -> int:
+        """Queue every action in an NDJSON body, or in an iterable of NDJSON chunks. Returns the item count."""
+        chunks = [body] if isinstance(body, (bytes, bytearray)) else body
+        count = 0
+        for chunk in chunks:
+            lines = iter(chunk.splitlines())
+            for action in lines:
+                if not action.strip():
+                    continue
+                source = (
+                    None
+                    if action.lstrip().startswith(b'{"delete"')
+                    else next(lines, None)
+                )
+                self.add(action, source, key)
+                count += 1
+        return count
+
+    def add(
+        self, action: bytes, source: bytes | None = None, key: Hashable = None
+    ) -> None:
+        """Queue one action line and its source line (none for deletes)."""
+        if self._started_at is None:
+            self._started_at = time.monotonic()
+        if key is not None:
+            self.keys.setdefault(key, {"indexed": 0, "failed": 0, "error": None})
+        item = _BulkItem(action, source, key)
+        size = len(item)
+        if self._pending and (
+            self._pending_bytes + size > self.max_bytes
+            or len(self._pending) >= self.max_docs
+        ):
+            self.flush()
+        self._pending.append(item)
+        self._pending_bytes += size
+
+    def flush(self) -> None:
+        items, self._pending, self._pending_bytes = self._pending, [], 0
+        attempt = 0
+        while items:
+            retry = self._send(items)
+            if not retry:
+                break
+            attempt += 1
+            if attempt > self.max_retries:
+                for item in retry:
+                    self._fail(item, item.error)
+                break
+            self._retried += len(retry)
+            time.sleep(min(self.max_backoff, self.backoff * 2 ** (attempt - 1)))
+            items = retry
+        if self._started_at is not None:
+            self._finished_at = time.monotonic()
+
+    def close(self) -> None:
+        self.flush()
+
+    def report(self) -> dict:
+        seconds = (self._finished_at or self._started_at or 0) - (self._started_at or 0)
+        return {
+            "indexed": self._indexed,
+            "failed": self._failed,
+            "retried": self._retried,
+            "requests": self._requests,
+            "bytes": self._bytes,
+            "seconds": round(seconds, 3),
+            "docs_per_second": round(self._indexed / seconds, 1)
+            if seconds > 0
+            else None,
+            "errors": self._errors,
+        }
+
+    def _send(self, items: list[_BulkItem]) -> list[_BulkItem]:
+        """Post one request and settle its items. Returns the items to retry."""
+        body = bytearray()
+        for item in items:
+            body += item.action + b"\n"
+            if item.source is not None:
+                body += item.source + b"\n"
+        self._requests += 1
+        self._bytes += len(body)
+
+        try:
+            response = self.session.post(
+                self.url, headers=self.headers, data=bytes(body), timeout=self.timeout
+            )
+        except requests.RequestException as e:
+            return self._retry_all(items, f"bulk request failed: {e}")
+        if response.status_code in RETRYABLE_STATUSES:
+            return self._retry_all(
+                items, f"bulk request returned {response.status_code}"
+            )
+        if response.status_code != 200:
+            for item in items:
+                self._fail(item, f"bulk request returned {response.status_code}")
+            return []
+
+        results = response.json().get("items")
+        if results is None or len(results) != len(items):
+            for item in items:
+                self._fail(item, "bulk response does not match the request")
+            return []
+
+        retry = []
+        for item, result in zip(items, results):
+            result = next(iter(result.values()))
+            status = result.get("status", 200)
+            if status < 300 and not result.get("error"):
+                self._succeed(item)
+            elif status in RETRYABLE_STATUSES:
+                item.error = json.dumps(result.get("error"))
+                retry.append(item)
+            else:
+                self._fail(item, json.dumps(result.get("error")))
+        return retry
+
+    @staticmethod
+    def _retry_all(items: list[_BulkItem], error: str) -> list[_BulkItem]:
+        for item in items:
+            item.error = error
+        return items
+
+    def _succeed(self, item: _BulkItem) -> None:
+        self._indexed += 1
+        if item.key is not None:
+            self.keys[item.key]["indexed"] += 1
+
+    def _fail(self, item: _BulkItem, error: str) -> None:
+        self._failed += 1
+        # keep the report small; the distinct errors are what matter
+        if error not in self._errors and len(self._errors) < 10:
+            self._errors.append(error)
+        if item.key is not None:
+            self.keys[item.key]["failed"] += 1
+            self.keys[item.key]["error"] = error
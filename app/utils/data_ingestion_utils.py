@@ -1,14 +1,24 @@
 import hashlib
 import math
 import os
+import queue
+import threading
 import time
 import requests
 import json
 import pandas as pd
-from datetime import datetime
-from requests import Response
+import redis
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from requests_oauthlib import OAuth1Session
 
+from app.utils.bulk_utils import BULK_MAX_BYTES, BULK_MAX_DOCS, RETRYABLE_STATUSES, BulkWriter
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - the stdlib encoder is the fallback
+    orjson = None
+
 
 def _safe_float(val):
     if val is None or (hasattr(val, '__class__') and val.__class__.__name__ == 'NaTType'):
@@ -45,7 +55,32 @@ def _epoch_to_month_name(epoch_val):
 
 _FINNHUB_FINANCIALS_REPORTED_PATH = '/stock/financials-reported'
 
-_finnhub_request_times = []
+
+class TokenBucket:
+    """Thread-safe token bucket allowing `rate` requests per `per` seconds, in bursts of up to `capacity`."""
+
+    def __init__(self, rate: float, per: float = 60.0, capacity: float = None):
+        self.fill_rate = rate / per
+        self.capacity = capacity or rate
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.fill_rate)
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.fill_rate
+            time.sleep(wait)
+
+
+_FINNHUB_LIMITER = TokenBucket(int(os.environ.get('FINNHUB_REQUESTS_PER_MINUTE', 60)))
+_ALPACA_LIMITER = TokenBucket(int(os.environ.get('ALPACA_REQUESTS_PER_MINUTE', 200)))
 
 
 def _finnhub_get(path: str, params: dict = None) -> dict:
@@ -54,13 +89,7 @@ def _finnhub_get(path: str, params: dict = None) -> dict:
     if params is None:
         params = {}
     params['token'] = finnhub_api_key
-    now = time.time()
-    _finnhub_request_times[:] = [t for t in _finnhub_request_times if now - t < 60]
-    if len(_finnhub_request_times) >= 60:
-        wait = 60 - (now - _finnhub_request_times[0])
-        if wait > 0:
-            time.sleep(wait)
-    _finnhub_request_times.append(time.time())
+    _FINNHUB_LIMITER.acquire()
     response = requests.get(f"{base_url}{path}", params=params)
     return response.json()
 
@@ -73,13 +102,70 @@ def _es_headers():
     }
 
 
-def _es_bulk_post(data: bytes) -> Response:
-    es_url = os.environ.get('ELASTICSEARCH_URL')
-    return requests.post(
-        url=f"{es_url}/_bulk",
-        headers=_es_headers(),
-        data=data
-    )
+def _bulk_write(body) -> dict:
+    with BulkWriter() as writer:
+        writer.write(body)
+    return writer.report()
+
+
+MARKETS_GENERATION_KEY = "quaks:markets:generation"
+
+
+def bump_markets_generation() -> int | None:
+    """Invalidate the API's markets result cache after a successful bulk load."""
+    broker_url = os.environ.get('BROKER_URL')
+    if not broker_url:
+        return None
+    return redis.Redis.from_url(broker_url).incr(MARKETS_GENERATION_KEY)
+
+
+# ---------------------------------------------------------------------------
+# NDJSON bulk encoding
+# ---------------------------------------------------------------------------
+
+BULK_CHUNK_BYTES = 1024 * 1024
+
+
+def _json_bytes(value) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(',', ':')).encode('utf-8')
+
+
+def _values(series: pd.Series) -> list:
+    """The series as native Python values, with NaN/NaT as None."""
+    return series.astype(object).where(series.notna(), None).tolist()
+
+
+def _column(df: pd.DataFrame, name: str) -> list:
+    if name not in df.columns:
+        return [None] * len(df)
+    return _values(df[name])
+
+
+def iter_bulk_ndjson(index_name: str, ids: list, docs, chunk_bytes: int = BULK_CHUNK_BYTES):
+    """
+    Encode `index` actions for `ids` and `docs` into NDJSON, yielding chunks of about
+    `chunk_bytes` that always end on a document boundary.
+    """
+    meta_prefix = b'{"index":{"_index":' + _json_bytes(index_name) + b',"_id":'
+    buffer = bytearray()
+    for id_, doc in zip(ids, docs):
+        buffer += meta_prefix
+        buffer += _json_bytes(id_)
+        buffer += b'}}\n'
+        buffer += _json_bytes(doc)
+        buffer += b'\n'
+        if len(buffer) >= chunk_bytes:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+def _join_bulk(chunks) -> bytes:
+    # an empty body is sent as a lone newline, which `_bulk` accepts
+    return b"".join(chunks) or b"\n"
 
 
 # ---------------------------------------------------------------------------
@@ -113,51 +199,101 @@ def _find_financial_value_multi(items: list, concepts: list) -> float | None:
 # Stocks EOD (Alpaca with Finnhub fallback)
 # ---------------------------------------------------------------------------
 
-def format_bulk_stocks_eod(ticker: str, df: pd.DataFrame, index_suffix: str) -> bytes:
+def iter_bulk_stocks_eod(ticker: str, df: pd.DataFrame, index_suffix: str, chunk_bytes: int = BULK_CHUNK_BYTES):
     index_name = f"quaks_stocks-eod_{index_suffix}"
-    lines = []
-
-    for _, row in df.iterrows():
-        date_reference = row.get('t').split('T')[0] if 'T' in str(row.get('t', '')) else str(row.get('t'))
-        open_ = row.get('o')
-        close = row.get('c')
-        high = row.get('h')
-        low = row.get('l')
-        volume = row.get('v')
-
-        if open_ is None or close is None:
-            continue
-        id_str = f"{ticker}_{str(date_reference)}"
-
-        meta = {"index": {"_index": index_name, "_id": id_str}}
-        doc = {
+    if df.empty or 'o' not in df.columns or 'c' not in df.columns:
+        return
+    df = df[df['o'].notna() & df['c'].notna()]
+    if df.empty:
+        return
+
+    dates = _values(df['t'].astype(str).str.split('T', n=1).str[0])
+    docs = (
+        {
             "key_ticker": ticker,
             "date_reference": date_reference,
             "val_open": float(open_),
-            "val_close": float(close) if close is not None else None,
+            "val_close": float(close),
             "val_high": float(high) if high is not None else None,
             "val_low": float(low) if low is not None else None,
             "val_volume": int(volume) if volume is not None else None,
         }
+        for date_reference, open_, close, high, low, volume in zip(
+            dates, _column(df, 'o'), _column(df, 'c'), _column(df, 'h'), _column(df, 'l'), _column(df, 'v')
+        )
+    )
+    ids = [f"{ticker}_{date_reference}" for date_reference in dates]
+    yield from iter_bulk_ndjson(index_name, ids, docs, chunk_bytes)
 
-        lines.append(json.dumps(meta))
-        lines.append(json.dumps(doc))
 
-    return (("\n".join(lines)) + "\n").encode("utf-8")
+def format_bulk_stocks_eod(ticker: str, df: pd.DataFrame, index_suffix: str) -> bytes:
+    return _join_bulk(iter_bulk_stocks_eod(ticker, df, index_suffix))
+
+
+_ALPACA_BARS_URL = "https://data.alpaca.markets/v2/stocks/bars"
+_ALPACA_BARS_PAGE_LIMIT = 10000
+_ALPACA_MAX_RETRIES = 3
+_ALPACA_BACKOFF_SECONDS = 0.5
+_ALPACA_MAX_BACKOFF_SECONDS = 30.0
+
+
+def _alpaca_bars_page(params: dict, headers: dict) -> dict:
+    # 429 and gateway errors are retried with backoff; any other non-200 raises
+    for attempt in range(_ALPACA_MAX_RETRIES + 1):
+        _ALPACA_LIMITER.acquire()
+        response = requests.get(_ALPACA_BARS_URL, params=params, headers=headers)
+        if response.status_code not in RETRYABLE_STATUSES or attempt == _ALPACA_MAX_RETRIES:
+            break
+        time.sleep(min(_ALPACA_MAX_BACKOFF_SECONDS, _ALPACA_BACKOFF_SECONDS * 2 ** attempt))
+    if response.status_code != 200:
+        raise requests.HTTPError(f"Alpaca bars request failed with {response.status_code}", response=response)
+    return response.json()
 
 
-def _fetch_eod_alpaca(ticker: str, start_date: str, end_date: str) -> pd.DataFrame:
-    alpaca_api_key = os.environ.get('APCA-API-KEY-ID')
-    alpaca_api_secret = os.environ.get('APCA-API-SECRET-KEY')
-    url = f"https://data.alpaca.markets/v2/stocks/{ticker}/bars?timeframe=1D&start={start_date}&end={end_date}&adjustment=all"
-    response = requests.get(url, headers={
+def _iter_eod_alpaca(tickers: list, start_date: str, end_date: str):
+    """
+    Yield (ticker, bars DataFrame) for `tickers` from Alpaca's multi-symbol bars
+    endpoint, following `next_page_token`. Pages are ordered by symbol, so every
+    symbol before the last one of a page is complete and is yielded right away.
+    Symbols without bars are not yielded. A page that still fails after the
+    retries raises `requests.HTTPError`, so the symbol it was continuing is
+    never yielded with truncated bars.
+    """
+    headers = {
         "accept": "application/json",
-        "APCA-API-KEY-ID": alpaca_api_key,
-        "APCA-API-SECRET-KEY": alpaca_api_secret
-    })
-    if response.status_code != 200 or not response.json().get('bars'):
+        "APCA-API-KEY-ID": os.environ.get('APCA-API-KEY-ID'),
+        "APCA-API-SECRET-KEY": os.environ.get('APCA-API-SECRET-KEY'),
+    }
+    params = {
+        'symbols': ",".join(tickers),
+        'timeframe': '1D',
+        'start': start_date,
+        'end': end_date,
+        'adjustment': 'all',
+        'limit': _ALPACA_BARS_PAGE_LIMIT,
+    }
+    pending = {}
+    while True:
+        page = _alpaca_bars_page(params, headers)
+        for ticker, bars in (page.get('bars') or {}).items():
+            for completed in [t for t in pending if t != ticker]:
+                yield completed, pd.json_normalize(pending.pop(completed))
+            pending.setdefault(ticker, []).extend(bars)
+        if not page.get('next_page_token'):
+            break
+        params['page_token'] = page['next_page_token']
+
+    for ticker, bars in pending.items():
+        yield ticker, pd.json_normalize(bars)
+
+
+def _fetch_eod_alpaca(ticker: str, start_date: str, end_date: str) -> pd.DataFrame:
+    try:
+        for _, bars in _iter_eod_alpaca([ticker], start_date, end_date):
+            return bars
+    except requests.HTTPError:
         return None
-    return pd.json_normalize(response.json().get('bars'))
+    return None
 
 
 def _fetch_eod_finnhub(ticker: str, start_date: str, end_date: str) -> pd.DataFrame:
@@ -182,23 +318,182 @@ def _fetch_eod_finnhub(ticker: str, start_date: str, end_date: str) -> pd.DataFr
     return df
 
 
-def ingest_stocks_eod(ticker: str, index_suffix="latest") -> Response:
+def _eod_date_range() -> tuple[str, str]:
     now = datetime.now()
-    yesterday = now.replace(day=now.day - 1)
-    back_one_year = now.replace(year=now.year - 1)
-    start_date = back_one_year.strftime('%Y-%m-%d')
-    end_date = yesterday.strftime('%Y-%m-%d')
+    back_one_year = now - timedelta(days=365)
+    yesterday = now - timedelta(days=1)
+    return back_one_year.strftime('%Y-%m-%d'), yesterday.strftime('%Y-%m-%d')
+
+
+def ingest_stocks_eod(ticker: str, index_suffix="latest") -> dict:
+    start_date, end_date = _eod_date_range()
 
     ticker_daily_time_series = _fetch_eod_alpaca(ticker, start_date, end_date)
     if ticker_daily_time_series is None:
         ticker_daily_time_series = _fetch_eod_finnhub(ticker, start_date, end_date)
 
     if ticker_daily_time_series is None:
-        return _es_bulk_post(b"\n")
+        return _bulk_write(b"")
+
+    return _bulk_write(iter_bulk_stocks_eod(ticker, ticker_daily_time_series, index_suffix))
+
+
+EOD_FETCH_WORKERS = 8
+EOD_ALPACA_SYMBOLS_PER_REQUEST = 100
+EOD_BULK_MAX_BYTES = BULK_MAX_BYTES
+EOD_BULK_MAX_DOCS = BULK_MAX_DOCS
+
+
+def _fetch_eod_chunk(
+    companies: list, start_date: str, end_date: str, fallback: bool, results: queue.Queue
+) -> None:
+    """
+    Fetch one chunk of tickers with multi-symbol Alpaca requests. With `fallback`,
+    the symbols Alpaca did not return are tried on Finnhub; without it they are
+    left out, as they simply have no new bars. If the Alpaca request fails, every
+    symbol it did not deliver goes to Finnhub, and the ones Finnhub has nothing
+    for are reported with the Alpaca error. Each ticker is put on `results` as
+    (company, source, bars, error) as soon as it is complete, followed by a None
+    once the chunk is done.
+    """
+    missing = {company['key_ticker']: company for company in companies}
+    alpaca_error = None
+    try:
+        for ticker, bars in _iter_eod_alpaca(list(missing), start_date, end_date):
+            company = missing.pop(ticker, None)
+            if company is not None:
+                results.put((company, 'alpaca', bars, None))
+    except Exception as e:
+        alpaca_error = f"fetch failed: {e}"
 
-    return _es_bulk_post(
-        format_bulk_stocks_eod(ticker, ticker_daily_time_series, index_suffix)
+    try:
+        for company in missing.values() if fallback or alpaca_error else []:
+            try:
+                bars = _fetch_eod_finnhub(company['key_ticker'], start_date, end_date)
+            except Exception as e:
+                results.put((company, None, None, f"fetch failed: {e}"))
+                continue
+            if bars is None:
+                results.put((company, None, None, alpaca_error))
+            else:
+                results.put((company, 'finnhub', bars, None))
+    finally:
+        results.put(None)
+
+
+def _eod_high_water_marks(tickers: list) -> dict:
+    """Latest indexed `date_reference` per ticker, from one terms + max aggregation."""
+    if not tickers:
+        return {}
+    es_url = os.environ.get('ELASTICSEARCH_URL')
+    response = requests.post(
+        url=f"{es_url}/quaks_stocks-eod_*/_search",
+        headers={**_es_headers(), 'Content-Type': 'application/json'},
+        data=json.dumps({
+            "size": 0,
+            "query": {"terms": {"key_ticker": tickers}},
+            "aggs": {
+                "by_ticker": {
+                    "terms": {"field": "key_ticker", "size": len(tickers)},
+                    "aggs": {"latest": {"max": {"field": "date_reference", "format": "yyyy-MM-dd"}}},
+                }
+            },
+        }),
     )
+    response.raise_for_status()
+    buckets = response.json()['aggregations']['by_ticker']['buckets']
+    return {
+        bucket['key']: bucket['latest']['value_as_string']
+        for bucket in buckets
+        if bucket['latest'].get('value_as_string')
+    }
+
+
+def _eod_fetch_plan(companies: list, incremental: bool) -> list:
+    """
+    Group `companies` into (start_date, end_date, fallback, companies) fetches.
+    Incremental mode starts each ticker the day after its high-water mark and
+    skips tickers that are already up to date; tickers never indexed before, and
+    every ticker in full mode, get the whole year with the Finnhub fallback.
+    """
+    start_date, end_date = _eod_date_range()
+    if not incremental:
+        return [(start_date, end_date, True, companies)]
+
+    high_water_marks = _eod_high_water_marks([company['key_ticker'] for company in companies])
+    groups = {}
+    for company in companies:
+        latest = high_water_marks.get(company['key_ticker'])
+        if latest is None:
+            groups.setdefault((start_date, True), []).append(company)
+            continue
+        next_date = (datetime.strptime(latest, '%Y-%m-%d') + timedelta(days=1)).strftime('%Y-%m-%d')
+        if next_date <= end_date:
+            groups.setdefault((next_date, False), []).append(company)
+
+    return [(start, end_date, fallback, group) for (start, fallback), group in groups.items()]
+
+
+def ingest_stocks_eod_batch(
+    companies: list,
+    incremental: bool = True,
+    max_workers: int = EOD_FETCH_WORKERS,
+    max_bytes: int = EOD_BULK_MAX_BYTES,
+    max_docs: int = EOD_BULK_MAX_DOCS,
+    symbols_per_request: int = EOD_ALPACA_SYMBOLS_PER_REQUEST,
+) -> dict:
+    """
+    Ingest EOD bars for `companies` ({"key_ticker", "index"} entries, as in
+    indexed_key_ticker_list.json). Chunks of tickers are fetched concurrently
+    under the per-provider rate limits while completed tickers are indexed in
+    shared `_bulk` requests.
+
+    Incremental runs only fetch the bars after each ticker's latest indexed date;
+    `incremental=False` re-fetches the full year, which picks up corporate-action
+    adjustments. Returns {ticker: {"source", "indexed", "failed", "error"}}.
+    """
+    companies = list({company['key_ticker']: company for company in companies}.values())
+    report = {
+        company['key_ticker']: {'source': None, 'indexed': 0, 'failed': 0, 'error': None}
+        for company in companies
+    }
+    writer = BulkWriter(max_bytes=max_bytes, max_docs=max_docs)
+    results = queue.Queue()
+    chunks = [
+        (start_date, end_date, fallback, group[i:i + symbols_per_request])
+        for start_date, end_date, fallback, group in _eod_fetch_plan(companies, incremental)
+        for i in range(0, len(group), symbols_per_request)
+    ]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for start_date, end_date, fallback, chunk in chunks:
+            executor.submit(_fetch_eod_chunk, chunk, start_date, end_date, fallback, results)
+
+        pending = len(chunks)
+        while pending:
+            result = results.get()
+            if result is None:
+                pending -= 1
+                continue
+            company, source, ticker_daily_time_series, error = result
+            ticker = company['key_ticker']
+            if error is not None:
+                report[ticker]['error'] = error
+                continue
+            if ticker_daily_time_series is None:
+                report[ticker]['error'] = "no data"
+                continue
+
+            docs = writer.write(iter_bulk_stocks_eod(ticker, ticker_daily_time_series, company['index']), key=ticker)
+            if not docs:
+                report[ticker]['error'] = "no data"
+                continue
+            report[ticker]['source'] = source
+
+    writer.close()
+    for ticker, counts in writer.keys.items():
+        report[ticker].update(counts)
+    return report
 
 
 # ---------------------------------------------------------------------------
@@ -246,7 +541,7 @@ def format_bulk_stocks_insider_trades(ticker: str, data: list, index_suffix: str
     return (("\n".join(lines)) + "\n").encode("utf-8") if lines else b""
 
 
-def ingest_stocks_insider_trades(ticker: str, cutoff_days=365, index_suffix="latest") -> Response:
+def ingest_stocks_insider_trades(ticker: str, cutoff_days=365, index_suffix="latest") -> dict:
     now = datetime.now()
     from_date = (now - pd.Timedelta(days=cutoff_days)).strftime('%Y-%m-%d')
     to_date = now.strftime('%Y-%m-%d')
@@ -259,9 +554,9 @@ def ingest_stocks_insider_trades(ticker: str, cutoff_days=365, index_suffix="lat
     data = result.get('data', [])
 
     if not data:
-        return _es_bulk_post(b"\n")
+        return _bulk_write(b"")
 
-    return _es_bulk_post(
+    return _bulk_write(
         format_bulk_stocks_insider_trades(ticker, data, index_suffix)
     )
 
@@ -385,11 +680,11 @@ def _enrich_metadata_with_metrics(ticker: str, doc: dict) -> dict:
     return doc
 
 
-def ingest_stocks_metadata(ticker: str, index_suffix="latest") -> Response:
+def ingest_stocks_metadata(ticker: str, index_suffix="latest") -> dict:
     profile = _finnhub_get('/stock/profile2', {'symbol': ticker})
 
     if not profile or not profile.get('ticker'):
-        return _es_bulk_post(b"\n")
+        return _bulk_write(b"")
 
     data = format_bulk_stocks_metadata(ticker, profile, index_suffix)
 
@@ -401,7 +696,7 @@ def ingest_stocks_metadata(ticker: str, index_suffix="latest") -> Response:
         lines[1] = json.dumps(doc)
         data = (("\n".join(lines)) + "\n").encode("utf-8")
 
-    return _es_bulk_post(data)
+    return _bulk_write(data)
 
 
 # ---------------------------------------------------------------------------
@@ -509,7 +804,7 @@ def format_bulk_stocks_fundamental_income_statement(ticker: str, reports: list,
     return (("\n".join(lines)) + "\n").encode("utf-8") if lines else b""
 
 
-def ingest_stocks_fundamental_income_statement(ticker: str, cutoff_days=3650, index_suffix="latest", reports=None) -> Response:
+def ingest_stocks_fundamental_income_statement(ticker: str, cutoff_days=3650, index_suffix="latest", reports=None) -> dict:
     if reports is None:
         result = _finnhub_get(_FINNHUB_FINANCIALS_REPORTED_PATH, {
             'symbol': ticker,
@@ -518,13 +813,13 @@ def ingest_stocks_fundamental_income_statement(ticker: str, cutoff_days=3650, in
         reports = result.get('data', [])
 
     if not reports:
-        return _es_bulk_post(b"\n")
+        return _bulk_write(b"")
 
     # Filter by cutoff
     cutoff_date = (datetime.now() - pd.Timedelta(days=cutoff_days)).strftime('%Y-%m-%d')
     reports = [r for r in reports if (r.get('endDate', '') or '') >= cutoff_date]
 
-    return _es_bulk_post(
+    return _bulk_write(
         format_bulk_stocks_fundamental_income_statement(ticker, reports, index_suffix)
     )
 
@@ -669,7 +964,7 @@ def format_bulk_stocks_fundamental_balance_sheet(ticker: str, reports: list, ind
     return (("\n".join(lines)) + "\n").encode("utf-8") if lines else b""
 
 
-def ingest_stocks_fundamental_balance_sheet(ticker: str, cutoff_days=3650, index_suffix="latest", reports=None) -> Response:
+def ingest_stocks_fundamental_balance_sheet(ticker: str, cutoff_days=3650, index_suffix="latest", reports=None) -> dict:
     if reports is None:
         result = _finnhub_get(_FINNHUB_FINANCIALS_REPORTED_PATH, {
             'symbol': ticker,
@@ -678,12 +973,12 @@ def ingest_stocks_fundamental_balance_sheet(ticker: str, cutoff_days=3650, index
         reports = result.get('data', [])
 
     if not reports:
-        return _es_bulk_post(b"\n")
+        return _bulk_write(b"")
 
     cutoff_date = (datetime.now() - pd.Timedelta(days=cutoff_days)).strftime('%Y-%m-%d')
     reports = [r for r in reports if (r.get('endDate', '') or '') >= cutoff_date]
 
-    return _es_bulk_post(
+    return _bulk_write(
         format_bulk_stocks_fundamental_balance_sheet(ticker, reports, index_suffix)
     )
 
@@ -801,7 +1096,7 @@ def format_bulk_stocks_fundamental_cash_flow(ticker: str, reports: list, index_s
     return (("\n".join(lines)) + "\n").encode("utf-8") if lines else b""
 
 
-def ingest_stocks_fundamental_cash_flow(ticker: str, cutoff_days=3650, index_suffix="latest", reports=None) -> Response:
+def ingest_stocks_fundamental_cash_flow(ticker: str, cutoff_days=3650, index_suffix="latest", reports=None) -> dict:
     if reports is None:
         result = _finnhub_get(_FINNHUB_FINANCIALS_REPORTED_PATH, {
             'symbol': ticker,
@@ -810,12 +1105,12 @@ def ingest_stocks_fundamental_cash_flow(ticker: str, cutoff_days=3650, index_suf
         reports = result.get('data', [])
 
     if not reports:
-        return _es_bulk_post(b"\n")
+        return _bulk_write(b"")
 
     cutoff_date = (datetime.now() - pd.Timedelta(days=cutoff_days)).strftime('%Y-%m-%d')
     reports = [r for r in reports if (r.get('endDate', '') or '') >= cutoff_date]
 
-    return _es_bulk_post(
+    return _bulk_write(
         format_bulk_stocks_fundamental_cash_flow(ticker, reports, index_suffix)
     )
 
@@ -829,8 +1124,7 @@ def ingest_stocks_fundamentals(ticker: str, cutoff_days=3650, index_suffix="late
     reports = result.get('data', [])
 
     if not reports:
-        empty = _es_bulk_post(b"\n")
-        return [empty, empty, empty]
+        return [_bulk_write(b"") for _ in range(3)]
 
     return [
         ingest_stocks_fundamental_income_statement(ticker, cutoff_days, index_suffix, reports=reports),
@@ -898,14 +1192,14 @@ def format_bulk_stocks_fundamental_earnings_estimates(ticker: str, eps_data: lis
     return (("\n".join(lines)) + "\n").encode("utf-8") if lines else b""
 
 
-def ingest_stocks_fundamental_earnings_estimates(ticker: str, index_suffix="latest") -> Response:
+def ingest_stocks_fundamental_earnings_estimates(ticker: str, index_suffix="latest") -> dict:
     eps_data = _finnhub_get('/stock/eps-estimate', {'symbol': ticker}).get('data', [])
     revenue_data = _finnhub_get('/stock/revenue-estimate', {'symbol': ticker}).get('data', [])
 
     if not eps_data and not revenue_data:
-        return _es_bulk_post(b"\n")
+        return _bulk_write(b"")
 
-    return _es_bulk_post(
+    return _bulk_write(
         format_bulk_stocks_fundamental_earnings_estimates(ticker, eps_data, revenue_data, index_suffix)
     )
 
@@ -914,46 +1208,39 @@ def ingest_stocks_fundamental_earnings_estimates(ticker: str, index_suffix="late
 # Markets News (Alpaca — unchanged)
 # ---------------------------------------------------------------------------
 
-def format_bulk_markets_news(df: pd.DataFrame, index_suffix: str) -> bytes:
+def iter_bulk_markets_news(df: pd.DataFrame, index_suffix: str, chunk_bytes: int = BULK_CHUNK_BYTES):
     index_name = f"quaks_markets-news_{index_suffix}"
-    lines = []
+    if df.empty:
+        return
 
-    for _, row in df.iterrows():
-        url = row.get('url')
-        created_at = row.get('created_at').split('T')[0]
-        images = row.get('images')
-        headline = row.get('headline')
-        author = row.get('author')
-        summary = row.get('summary')
-        content = row.get('content')
-        symbols = row.get('symbols')
-        source = row.get('source')
-
-        id_str = f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}"
-        meta = {"index": {"_index": index_name, "_id": id_str}}
-
-        doc = {
+    urls = _column(df, 'url')
+    docs = (
+        {
             "key_ticker": symbols,
             "key_url": url,
             "key_source": source,
-            "date_reference": created_at,
+            "date_reference": date_reference,
             "obj_images": images,
             "text_headline": headline,
             "text_author": author,
             "text_summary": summary,
             "text_content": content
         }
+        for url, symbols, source, date_reference, images, headline, author, summary, content in zip(
+            urls, _column(df, 'symbols'), _column(df, 'source'), _values(df['created_at'].str.split('T', n=1).str[0]),
+            _column(df, 'images'), _column(df, 'headline'), _column(df, 'author'),
+            _column(df, 'summary'), _column(df, 'content')
+        )
+    )
+    ids = [hashlib.sha256(url.encode('utf-8')).hexdigest() for url in urls]
+    yield from iter_bulk_ndjson(index_name, ids, docs, chunk_bytes)
 
-        lines.append(json.dumps(meta))
-        lines.append(json.dumps(doc))
 
-    return (("\n".join(lines)) + "\n").encode("utf-8")
+def format_bulk_markets_news(df: pd.DataFrame, index_suffix: str) -> bytes:
+    return _join_bulk(iter_bulk_markets_news(df, index_suffix))
 
 
-def ingest_markets_news(ticker: str, limit=20, index_suffix="latest") -> Response:
-    es_url = os.environ.get('ELASTICSEARCH_URL')
-    es_api_key = os.environ.get('ELASTICSEARCH_API_KEY')
-
+def ingest_markets_news(ticker: str, limit=20, index_suffix="latest") -> dict:
     now = datetime.now()
     yesterday = now.replace(day=now.day - 1)
     alpaca_api_key = os.environ.get('APCA-API-KEY-ID')
@@ -966,14 +1253,7 @@ def ingest_markets_news(ticker: str, limit=20, index_suffix="latest") -> Respons
     })
     ticker_news_series = pd.json_normalize(response.json().get('news'))
 
-    return requests.post(
-        url=f"{es_url}/_bulk",
-        headers={
-            'Authorization': f'ApiKey {es_api_key}',
-            'Content-Type': 'application/x-ndjson'
-        },
-        data=format_bulk_markets_news(ticker_news_series, index_suffix)
-    )
+    return _bulk_write(iter_bulk_markets_news(ticker_news_series, index_suffix))
 
 
 def post_to_x(
@@ -0,0 +1,359 @@
+import numpy as np
+import pandas as pd
+from typing_extensions import Optional
+
+OHLCV_FIELDS = ("open", "high", "low", "close", "volume")
+
+
+def build_ohlcv_series(hits: list[dict]) -> dict[str, np.ndarray]:
+    """
+    Builds column arrays from `get_eod_ohlcv_series_template` hits.
+    Hits are expected sorted by date; missing values become NaN.
+    """
+    series = {
+        "date": np.array(
+            [hit["fields"]["date_reference"][0] for hit in hits], dtype=object
+        )
+    }
+    for field in OHLCV_FIELDS:
+        series[field] = np.array(
+            [hit["fields"].get(f"val_{field}", [np.nan])[0] for hit in hits],
+            dtype=float,
+        )
+    return series
+
+
+def group_ohlcv_series(hits: list[dict]) -> dict[str, dict[str, np.ndarray]]:
+    """
+    Splits multi-ticker hits, sorted by ticker then date, into one series per ticker.
+    """
+    series = build_ohlcv_series(hits)
+    tickers = np.array([hit["fields"]["key_ticker"][0] for hit in hits], dtype=object)
+    if len(tickers) == 0:
+        return {}
+    _, starts = np.unique(tickers, return_index=True)
+    bounds = np.append(np.sort(starts), len(tickers))
+    return {
+        tickers[start]: {column: values[start:end] for column, values in series.items()}
+        for start, end in zip(bounds[:-1], bounds[1:])
+    }
+
+
+def _select(
+    series: dict[str, np.ndarray], fields: tuple[str, ...]
+) -> dict[str, np.ndarray]:
+    mask = np.ones(len(series["date"]), dtype=bool)
+    for field in fields:
+        mask &= ~np.isnan(series[field])
+    return {key: series[key][mask] for key in ("date",) + fields}
+
+
+def _round(values: np.ndarray) -> np.ndarray:
+    # Half-up rounding to two decimals, as Math.round in the former Painless scripts
+    return np.floor(values * 100.0 + 0.5) / 100.0
+
+
+def _ewm(values: np.ndarray, alpha: float) -> np.ndarray:
+    # Recursive smoothing seeded with the first value: y[0] = x[0], y[i] = a * x[i] + (1 - a) * y[i-1]
+    return pd.Series(values).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+
+
+def _sign(values: np.ndarray) -> np.ndarray:
+    return np.sign(values).astype(int)
+
+
+def _nullable(values: np.ndarray) -> list[Optional[float]]:
+    return [None if np.isnan(v) else v for v in values.tolist()]
+
+
+def _rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    # Trailing mean over up to `window` values; NaN if any value in the window is NaN
+    nan_mask = np.isnan(values)
+    sums = np.cumsum(np.where(nan_mask, 0.0, values))
+    nans = np.cumsum(nan_mask)
+    idx = np.arange(len(values))
+    start = idx - window
+    window_sums = sums - np.where(start >= 0, sums[np.maximum(start, 0)], 0.0)
+    window_nans = nans - np.where(start >= 0, nans[np.maximum(start, 0)], 0)
+    counts = np.minimum(idx + 1, window)
+    return np.where(window_nans > 0, np.nan, window_sums / counts)
+
+
+def _rolling_extreme(values: np.ndarray, window: int, func) -> np.ndarray:
+    # Trailing min/max over up to `window` values
+    padded = np.concatenate([np.full(window - 1, values[0]), values])
+    return func(np.lib.stride_tricks.sliding_window_view(padded, window), axis=1)
+
+
+def compute_ad(series: dict[str, np.ndarray]) -> list[dict]:
+    data = _select(series, ("high", "low", "close", "volume"))
+    if len(data["date"]) == 0:
+        return []
+    high, low, close = data["high"], data["low"], data["close"]
+    denom = high - low
+    with np.errstate(divide="ignore", invalid="ignore"):
+        clv = np.where(denom != 0, ((close - low) - (high - close)) / denom, 0.0)
+    ad_line = np.cumsum(clv * data["volume"])
+    ad_change = np.diff(ad_line)
+
+    ad_lines = _round(ad_line).tolist()
+    ad_changes = [None] + _round(ad_change).tolist()
+    positions = [None] + _sign(ad_change).tolist()
+    return [
+        {
+            "date": date,
+            "ad_line": ad_lines[i],
+            "ad_change": ad_changes[i],
+            "position": positions[i],
+        }
+        for i, date in enumerate(data["date"])
+    ]
+
+
+def compute_adx(series: dict[str, np.ndarray], period: int) -> list[dict]:
+    data = _select(series, ("high", "low", "close"))
+    dates = data["date"]
+    if len(dates) == 0:
+        return []
+    empty = {"adx": None, "plus_di": None, "minus_di": None, "position": None}
+    if len(dates) < 2:
+        return [{"date": date, **empty} for date in dates]
+
+    high, low, close = data["high"], data["low"], data["close"]
+    up_move = high[1:] - high[:-1]
+    down_move = low[:-1] - low[1:]
+    plus_dm = np.where((up_move > down_move) & (up_move > 0), up_move, 0.0)
+    minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0.0)
+    tr = np.maximum(
+        high[1:] - low[1:],
+        np.maximum(np.abs(high[1:] - close[:-1]), np.abs(low[1:] - close[:-1])),
+    )
+
+    alpha = 1.0 / period
+    plus_dm_smooth = _ewm(plus_dm, alpha)
+    minus_dm_smooth = _ewm(minus_dm, alpha)
+    tr_smooth = _ewm(tr, alpha)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        plus_di = np.where(tr_smooth != 0, 100.0 * plus_dm_smooth / tr_smooth, 0.0)
+        minus_di = np.where(tr_smooth != 0, 100.0 * minus_dm_smooth / tr_smooth, 0.0)
+        di_sum = plus_di + minus_di
+        dx = np.where(di_sum != 0, 100.0 * np.abs(plus_di - minus_di) / di_sum, 0.0)
+    adx = _ewm(dx, alpha)
+    position = np.where((adx > 25) & (minus_di > plus_di), -1, 1)
+
+    adxs = _round(adx).tolist()
+    plus_dis = _round(plus_di).tolist()
+    minus_dis = _round(minus_di).tolist()
+    positions = position.tolist()
+    return [{"date": dates[0], **empty}] + [
+        {
+            "date": date,
+            "adx": adxs[k],
+            "plus_di": plus_dis[k],
+            "minus_di": minus_dis[k],
+            "position": positions[k],
+        }
+        for k, date in enumerate(dates[1:])
+    ]
+
+
+def compute_cci(
+    series: dict[str, np.ndarray], period: int, constant: float
+) -> list[dict]:
+    data = _select(series, ("high", "low", "close"))
+    dates = data["date"]
+    n = len(dates)
+    if n == 0:
+        return []
+    cci = np.full(n, np.nan)
+    if n >= period:
+        tp = (data["high"] + data["low"] + data["close"]) / 3.0
+        windows = np.lib.stride_tricks.sliding_window_view(tp, period)
+        atp = windows.sum(axis=1) / period
+        md = np.abs(windows - atp[:, None]).sum(axis=1) / period
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cci[period - 1 :] = np.where(
+                md != 0, (tp[period - 1 :] - atp) / (constant * md), np.nan
+            )
+
+    ccis = _nullable(_round(cci))
+    positions = [
+        None if value is None else (-1 if value > 100 else 1)
+        for value in _nullable(cci)
+    ]
+    return [
+        {"date": date, "cci": ccis[i], "position": positions[i]}
+        for i, date in enumerate(dates)
+    ]
+
+
+def compute_ema(
+    series: dict[str, np.ndarray], short_window: int, long_window: int
+) -> list[dict]:
+    data = _select(series, ("close",))
+    if len(data["date"]) == 0:
+        return []
+    close = data["close"]
+    ema_short = _ewm(close, 2.0 / (short_window + 1.0))
+    ema_long = _ewm(close, 2.0 / (long_window + 1.0))
+    position = np.where(ema_short > ema_long, 1, -1)
+
+    shorts = _round(ema_short).tolist()
+    longs = _round(ema_long).tolist()
+    positions = position.tolist()
+    return [
+        {
+            "date": date,
+            "ema_short": shorts[i],
+            "ema_long": longs[i],
+            "position": positions[i],
+        }
+        for i, date in enumerate(data["date"])
+    ]
+
+
+def compute_macd(
+    series: dict[str, np.ndarray],
+    short_window: int,
+    long_window: int,
+    signal_window: int,
+) -> list[dict]:
+    data = _select(series, ("close",))
+    if len(data["date"]) < 2:
+        return []
+    close = data["close"]
+    short_ema = _ewm(close, 2.0 / (short_window + 1.0))
+    long_ema = _ewm(close, 2.0 / (long_window + 1.0))
+    macd = short_ema - long_ema
+    signal = _ewm(macd, 2.0 / (signal_window + 1.0))
+    histogram = macd - signal
+    crossed_down = (macd[:-1] > signal[:-1]) & (macd[1:] < signal[1:])
+    position = np.where(crossed_down, -1, 1)
+
+    columns = {
+        "short_ema": _round(short_ema[1:]).tolist(),
+        "long_ema": _round(long_ema[1:]).tolist(),
+        "macd": _round(macd[1:]).tolist(),
+        "signal": _round(signal[1:]).tolist(),
+        "histogram": _round(histogram[1:]).tolist(),
+        "position": position.tolist(),
+    }
+    return [
+        {"date": date, **{key: values[k] for key, values in columns.items()}}
+        for k, date in enumerate(data["date"][1:])
+    ]
+
+
+def compute_obv(series: dict[str, np.ndarray]) -> list[dict]:
+    data = _select(series, ("close", "volume"))
+    if len(data["date"]) < 2:
+        return []
+    close_change = np.diff(data["close"])
+    signed_volume = np.where(
+        close_change > 0,
+        data["volume"][1:],
+        np.where(close_change < 0, -data["volume"][1:], 0.0),
+    )
+    obv = np.cumsum(signed_volume)
+    obv_change = np.diff(obv, prepend=0.0)
+
+    obvs = _round(obv).tolist()
+    changes = _round(obv_change).tolist()
+    positions = _sign(obv_change).tolist()
+    return [
+        {
+            "date": date,
+            "obv": obvs[k],
+            "obv_change": changes[k],
+            "position": positions[k],
+        }
+        for k, date in enumerate(data["date"][1:])
+    ]
+
+
+def compute_rsi(series: dict[str, np.ndarray], period: int) -> list[dict]:
+    data = _select(series, ("close",))
+    dates = data["date"]
+    if len(dates) == 0:
+        return []
+    if len(dates) < 2:
+        return [{"date": date, "rsi": None, "position": None} for date in dates]
+
+    delta = np.diff(data["close"])
+    alpha = 1.0 / period
+    upavg = _ewm(np.maximum(delta, 0.0), alpha)
+    dnavg = _ewm(np.maximum(-delta, 0.0), alpha)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = np.where(dnavg == 0.0, 100.0, 100.0 - 100.0 / (1.0 + upavg / dnavg))
+    rsi = np.where((upavg == 0.0) & (dnavg == 0.0), np.nan, rsi)
+
+    rsis = _nullable(_round(rsi))
+    positions = [
+        None if value is None else (-1 if value > 70 else 1) for value in _nullable(rsi)
+    ]
+    return [{"date": dates[0], "rsi": None, "position": None}] + [
+        {"date": date, "rsi": rsis[k], "position": positions[k]}
+        for k, date in enumerate(dates[1:])
+    ]
+
+
+def compute_stoch(
+    series: dict[str, np.ndarray], lookback: int, smooth_k: int, smooth_d: int
+) -> list[dict]:
+    data = _select(series, ("high", "low", "close"))
+    if len(data["date"]) == 0:
+        return []
+    min_low = _rolling_extreme(data["low"], lookback, np.min)
+    max_high = _rolling_extreme(data["high"], lookback, np.max)
+    denom = max_high - min_low
+    with np.errstate(divide="ignore", invalid="ignore"):
+        raw_k = np.where(denom != 0, 100 * (data["close"] - min_low) / denom, np.nan)
+    slow_k = _rolling_mean(raw_k, smooth_k)
+    slow_d = _rolling_mean(slow_k, smooth_d)
+    valid = ~np.isnan(slow_k) & ~np.isnan(slow_d)
+
+    dates = data["date"][valid].tolist()
+    slow_ks = slow_k[valid].tolist()
+    slow_ds = slow_d[valid].tolist()
+    return [
+        {
+            "date": date,
+            "slow_k": slow_ks[i],
+            "slow_d": slow_ds[i],
+            "position": 1 if slow_ks[i] > slow_ds[i] else -1,
+        }
+        for i, date in enumerate(dates)
+    ]
+
+
+INDICATORS = {
+    "ad": compute_ad,
+    "adx": compute_adx,
+    "cci": compute_cci,
+    "ema": compute_ema,
+    "macd": compute_macd,
+    "obv": compute_obv,
+    "rsi": compute_rsi,
+    "stoch": compute_stoch,
+}
+
+
+def compute_indicators(
+    series: dict[str, np.ndarray], specs: list[dict]
+) -> dict[str, list[dict]]:
+    """
+    Computes several indicators over the same series.
+    Each spec holds an `indicator` name, an optional result `name` and the indicator parameters.
+    """
+    results = {}
+    for spec in specs:
+        params = dict(spec)
+        indicator = params.pop("indicator")
+        name = params.pop("name", indicator)
+        for param, value in params.items():
+            if value <= 0:
+                raise ValueError(
+                    f"{indicator} {param} must be greater than 0, got {value}"
+                )
+        results[name] = INDICATORS[indicator](series, **params)
+    return results
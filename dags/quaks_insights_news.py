@@ -107,6 +107,7 @@ def generate_insights_news():
     print("Sending BATCH_ETL message...")
     message_response = requests.post(
         f"{api_url}/messages/post",
+        params={"sync": "true"},
         json={
             "agent_id": agent_id,
             "message_role": "human",
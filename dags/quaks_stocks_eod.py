@@ -24,70 +24,130 @@ dag = DAG(
 )
 def load_stocks_eod():
     import os
+    import queue
+    import threading
     import time
     import requests
+    from requests.adapters import HTTPAdapter
     import json
     import pandas as pd
-    from datetime import datetime
+    from concurrent.futures import ThreadPoolExecutor
+    from datetime import datetime, timedelta
 
-    finnhub_request_times = []
+    fetch_workers = 8
+    symbols_per_request = 100
+    bulk_max_bytes = 5 * 1024 * 1024
+    bulk_max_docs = 5000
 
-    def format_bulk_stocks_eod(ticker: str, df: pd.DataFrame, index_suffix: str) -> bytes:
-        index_name = f"quaks_stocks-eod_{index_suffix}"
-        lines = []
+    class TokenBucket:
+        def __init__(self, rate: float, per: float = 60.0):
+            self.fill_rate = rate / per
+            self.capacity = rate
+            self.tokens = rate
+            self.updated_at = time.monotonic()
+            self.lock = threading.Lock()
 
-        for _, row in df.iterrows():
-            date_reference = row.get('t').split('T')[0] if 'T' in str(row.get('t', '')) else str(row.get('t'))
-            open_ = row.get('o')
-            close = row.get('c')
-            high = row.get('h')
-            low = row.get('l')
-            volume = row.get('v')
+        def acquire(self):
+            while True:
+                with self.lock:
+                    now = time.monotonic()
+                    self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.fill_rate)
+                    self.updated_at = now
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    wait = (1 - self.tokens) / self.fill_rate
+                time.sleep(wait)
 
-            if open_ is None or close is None:
-                continue
-            id_str = f"{ticker}_{str(date_reference)}"
+    alpaca_limiter = TokenBucket(int(os.environ.get('ALPACA_REQUESTS_PER_MINUTE', 200)))
+    finnhub_limiter = TokenBucket(int(os.environ.get('FINNHUB_REQUESTS_PER_MINUTE', 60)))
+
+    try:
+        import orjson
+
+        def json_bytes(value) -> bytes:
+            return orjson.dumps(value)
+    except ImportError:
+        def json_bytes(value) -> bytes:
+            return json.dumps(value, separators=(',', ':')).encode('utf-8')
+
+    def values(series: pd.Series) -> list:
+        return series.astype(object).where(series.notna(), None).tolist()
 
-            meta = {"index": {"_index": index_name, "_id": id_str}}
+    def column(df: pd.DataFrame, name: str) -> list:
+        return values(df[name]) if name in df.columns else [None] * len(df)
 
-            doc = {
+    def format_bulk_stocks_eod(ticker: str, df: pd.DataFrame, index_suffix: str) -> bytes:
+        index_name = f"quaks_stocks-eod_{index_suffix}"
+        if df.empty or 'o' not in df.columns or 'c' not in df.columns:
+            return b"\n"
+        df = df[df['o'].notna() & df['c'].notna()]
+        if df.empty:
+            return b"\n"
+
+        meta_prefix = b'{"index":{"_index":' + json_bytes(index_name) + b',"_id":'
+        buffer = bytearray()
+        dates = values(df['t'].astype(str).str.split('T', n=1).str[0])
+        for date_reference, open_, close, high, low, volume in zip(
+            dates, column(df, 'o'), column(df, 'c'), column(df, 'h'), column(df, 'l'), column(df, 'v')
+        ):
+            buffer += meta_prefix + json_bytes(f"{ticker}_{date_reference}") + b'}}\n'
+            buffer += json_bytes({
                 "key_ticker": ticker,
                 "date_reference": date_reference,
                 "val_open": float(open_),
-                "val_close": float(close) if close is not None else None,
+                "val_close": float(close),
                 "val_high": float(high) if high is not None else None,
                 "val_low": float(low) if low is not None else None,
                 "val_volume": int(volume) if volume is not None else None,
-            }
-
-            lines.append(json.dumps(meta))
-            lines.append(json.dumps(doc))
-
-        return (("\n".join(lines)) + "\n").encode("utf-8")
+            }) + b'\n'
+        return bytes(buffer)
 
-    def fetch_eod_alpaca(ticker: str, start_date: str, end_date: str):
-        url = f"https://data.alpaca.markets/v2/stocks/{ticker}/bars?timeframe=1D&start={start_date}&end={end_date}&adjustment=all"
-        response = requests.get(url, headers={
+    def iter_eod_alpaca(tickers: list, start_date: str, end_date: str):
+        # multi-symbol bars, paginated; pages are ordered by symbol, so every symbol
+        # before the last one of a page is complete
+        headers = {
             "accept": "application/json",
             "APCA-API-KEY-ID": os.environ.get('APCA-API-KEY-ID'),
             "APCA-API-SECRET-KEY": os.environ.get('APCA-API-SECRET-KEY')
-        })
-        if response.status_code != 200 or not response.json().get('bars'):
-            return None
-        return pd.json_normalize(response.json().get('bars'))
+        }
+        params = {
+            'symbols': ",".join(tickers),
+            'timeframe': '1D',
+            'start': start_date,
+            'end': end_date,
+            'adjustment': 'all',
+            'limit': 10000,
+        }
+        pending = {}
+        while True:
+            # 429 and gateway errors are retried with backoff; a page that still fails
+            # raises, so the symbol it was continuing is never yielded truncated
+            for attempt in range(4):
+                alpaca_limiter.acquire()
+                response = requests.get("https://data.alpaca.markets/v2/stocks/bars", params=params, headers=headers)
+                if response.status_code not in {429, 502, 503, 504} or attempt == 3:
+                    break
+                time.sleep(min(30.0, 0.5 * 2 ** attempt))
+            if response.status_code != 200:
+                raise requests.HTTPError(f"Alpaca bars request failed with {response.status_code}", response=response)
+            page = response.json()
+            for ticker, bars in (page.get('bars') or {}).items():
+                for completed in [t for t in pending if t != ticker]:
+                    yield completed, pd.json_normalize(pending.pop(completed))
+                pending.setdefault(ticker, []).extend(bars)
+            if not page.get('next_page_token'):
+                break
+            params['page_token'] = page['next_page_token']
+
+        for ticker, bars in pending.items():
+            yield ticker, pd.json_normalize(bars)
 
     def fetch_eod_finnhub(ticker: str, start_date: str, end_date: str):
         finnhub_api_key = os.environ.get('FINNHUB_API_KEY')
         from_ts = int(datetime.strptime(start_date, '%Y-%m-%d').timestamp())
         to_ts = int(datetime.strptime(end_date, '%Y-%m-%d').timestamp())
-        now = time.time()
-        finnhub_request_times[:] = [t for t in finnhub_request_times if now - t < 60]
-        if len(finnhub_request_times) >= 60:
-            wait = 60 - (now - finnhub_request_times[0])
-            if wait > 0:
-                print(f"  Finnhub rate limit reached, waiting {wait:.1f}s...")
-                time.sleep(wait)
-        finnhub_request_times.append(time.time())
+        finnhub_limiter.acquire()
         url = f"https://finnhub.io/api/v1/stock/candle?symbol={ticker}&resolution=D&from={from_ts}&to={to_ts}&token={finnhub_api_key}"
         response = requests.get(url)
         result = response.json()
@@ -102,47 +162,258 @@ def load_stocks_eod():
             't': [datetime.fromtimestamp(ts).strftime('%Y-%m-%d') for ts in result['t']],
         })
 
-    def ingest_stocks_eod(ticker: str, index_suffix="latest") -> requests.Response:
-        es_url = os.environ.get('ELASTICSEARCH_URL')
-        es_api_key = os.environ.get('ELASTICSEARCH_API_KEY')
+    def fetch_eod_chunk(companies: list, start_date: str, end_date: str, fallback: bool, results: queue.Queue):
+        missing = {company['key_ticker']: company for company in companies}
+        alpaca_error = None
+        try:
+            for ticker, bars in iter_eod_alpaca(list(missing), start_date, end_date):
+                company = missing.pop(ticker, None)
+                if company is not None:
+                    results.put((company, 'alpaca', bars, None))
+        except Exception as e:
+            print(f"Alpaca bars request failed: {e}")
+            alpaca_error = f"fetch failed: {e}"
 
-        now = datetime.now()
-        end = now.replace(day=now.day - 1)
-        start = now.replace(year=now.year - 1)
-        start_date = start.strftime('%Y-%m-%d')
-        end_date = end.strftime('%Y-%m-%d')
-
-        ticker_daily_time_series = fetch_eod_alpaca(ticker, start_date, end_date)
-        if ticker_daily_time_series is None:
-            print(f"Alpaca failed for {ticker}, trying Finnhub fallback...")
-            ticker_daily_time_series = fetch_eod_finnhub(ticker, start_date, end_date)
-
-        if ticker_daily_time_series is None:
-            print(f"No EOD data available for {ticker} from either source")
-            return requests.post(
-                url=f"{es_url}/_bulk",
-                headers={
-                    'Authorization': f'ApiKey {es_api_key}',
-                    'Content-Type': 'application/x-ndjson'
-                },
-                data=b"\n"
-            )
+        try:
+            # incremental fetches leave out symbols without new bars instead of asking
+            # Finnhub, unless Alpaca failed and could not tell which symbols those are
+            for company in missing.values() if fallback or alpaca_error else []:
+                print(f"Alpaca missing {company['key_ticker']}, trying Finnhub fallback...")
+                try:
+                    bars = fetch_eod_finnhub(company['key_ticker'], start_date, end_date)
+                except Exception as e:
+                    results.put((company, None, None, f"fetch failed: {e}"))
+                    continue
+                if bars is None:
+                    results.put((company, None, None, alpaca_error))
+                else:
+                    results.put((company, 'finnhub', bars, None))
+        finally:
+            results.put(None)
 
-        return requests.post(
-            url=f"{es_url}/_bulk",
+    def eod_high_water_marks(tickers: list) -> dict:
+        es_url = os.environ.get('ELASTICSEARCH_URL')
+        es_api_key = os.environ.get('ELASTICSEARCH_API_KEY')
+        response = requests.post(
+            url=f"{es_url}/quaks_stocks-eod_*/_search",
             headers={
                 'Authorization': f'ApiKey {es_api_key}',
-                'Content-Type': 'application/x-ndjson'
+                'Content-Type': 'application/json'
             },
-            data=format_bulk_stocks_eod(ticker, ticker_daily_time_series, index_suffix)
+            data=json.dumps({
+                "size": 0,
+                "query": {"terms": {"key_ticker": tickers}},
+                "aggs": {
+                    "by_ticker": {
+                        "terms": {"field": "key_ticker", "size": len(tickers)},
+                        "aggs": {"latest": {"max": {"field": "date_reference", "format": "yyyy-MM-dd"}}},
+                    }
+                },
+            })
         )
+        response.raise_for_status()
+        buckets = response.json()['aggregations']['by_ticker']['buckets']
+        return {
+            bucket['key']: bucket['latest']['value_as_string']
+            for bucket in buckets
+            if bucket['latest'].get('value_as_string')
+        }
+
+    def eod_fetch_plan(companies: list, incremental: bool) -> list:
+        now = datetime.now()
+        start_date = (now - timedelta(days=365)).strftime('%Y-%m-%d')
+        end_date = (now - timedelta(days=1)).strftime('%Y-%m-%d')
+        if not incremental:
+            return [(start_date, end_date, True, companies)]
+
+        high_water_marks = eod_high_water_marks([company['key_ticker'] for company in companies])
+        groups = {}
+        for company in companies:
+            latest = high_water_marks.get(company['key_ticker'])
+            if latest is None:
+                groups.setdefault((start_date, True), []).append(company)
+                continue
+            next_date = (datetime.strptime(latest, '%Y-%m-%d') + timedelta(days=1)).strftime('%Y-%m-%d')
+            if next_date <= end_date:
+                groups.setdefault((next_date, False), []).append(company)
+
+        return [(start, end_date, fallback, group) for (start, fallback), group in groups.items()]
+
+    class BulkWriter:
+        # mirrors app/utils/bulk_utils.py: size-capped _bulk requests over one pooled
+        # session, item-level results, and backoff retries of 429/5xx rejections only
+        retryable_statuses = {429, 502, 503, 504}
+
+        def __init__(self, max_bytes=5 * 1024 * 1024, max_docs=5000, max_retries=3, backoff=0.5, max_backoff=30.0):
+            self.url = f"{os.environ.get('ELASTICSEARCH_URL')}/_bulk"
+            self.headers = {
+                'Authorization': f"ApiKey {os.environ.get('ELASTICSEARCH_API_KEY')}",
+                'Content-Type': 'application/x-ndjson'
+            }
+            self.session = requests.Session()
+            self.session.mount("https://", HTTPAdapter(pool_maxsize=16))
+            self.session.mount("http://", HTTPAdapter(pool_maxsize=16))
+            self.max_bytes, self.max_docs = max_bytes, max_docs
+            self.max_retries, self.backoff, self.max_backoff = max_retries, backoff, max_backoff
+            self.keys = {}
+            self.totals = {'indexed': 0, 'failed': 0, 'retried': 0, 'requests': 0, 'bytes': 0}
+            self.pending, self.pending_bytes = [], 0
+            self.started_at = None
+
+        def write(self, body: bytes, key=None) -> int:
+            lines = iter(body.splitlines())
+            count = 0
+            for action in lines:
+                if not action.strip():
+                    continue
+                source = None if action.lstrip().startswith(b'{"delete"') else next(lines, None)
+                self.add(action, source, key)
+                count += 1
+            return count
+
+        def add(self, action: bytes, source, key=None):
+            self.started_at = self.started_at or time.monotonic()
+            if key is not None:
+                self.keys.setdefault(key, {'indexed': 0, 'failed': 0, 'error': None})
+            size = len(action) + 1 + (len(source) + 1 if source is not None else 0)
+            if self.pending and (self.pending_bytes + size > self.max_bytes or len(self.pending) >= self.max_docs):
+                self.flush()
+            self.pending.append([action, source, key, None])
+            self.pending_bytes += size
+
+        def flush(self):
+            items, self.pending, self.pending_bytes = self.pending, [], 0
+            attempt = 0
+            while items:
+                retry = self.send(items)
+                if not retry:
+                    break
+                attempt += 1
+                if attempt > self.max_retries:
+                    for item in retry:
+                        self.settle(item, item[3])
+                    break
+                self.totals['retried'] += len(retry)
+                time.sleep(min(self.max_backoff, self.backoff * 2 ** (attempt - 1)))
+                items = retry
+
+        def send(self, items: list) -> list:
+            body = b"".join(
+                action + b"\n" + (source + b"\n" if source is not None else b"") for action, source, _, _ in items
+            )
+            self.totals['requests'] += 1
+            self.totals['bytes'] += len(body)
+            try:
+                response = self.session.post(self.url, headers=self.headers, data=body, timeout=60)
+            except requests.RequestException as e:
+                return [item[:3] + [f"bulk request failed: {e}"] for item in items]
+            if response.status_code in self.retryable_statuses:
+                return [item[:3] + [f"bulk request returned {response.status_code}"] for item in items]
+            results = response.json().get('items') if response.status_code == 200 else None
+            if results is None or len(results) != len(items):
+                for item in items:
+                    self.settle(item, f"bulk request returned {response.status_code}")
+                return []
+
+            retry = []
+            for item, result in zip(items, results):
+                result = next(iter(result.values()))
+                status = result.get('status', 200)
+                if status < 300 and not result.get('error'):
+                    self.settle(item, None)
+                elif status in self.retryable_statuses:
+                    retry.append(item[:3] + [json.dumps(result.get('error'))])
+                else:
+                    self.settle(item, json.dumps(result.get('error')))
+            return retry
+
+        def settle(self, item: list, error):
+            outcome = 'failed' if error else 'indexed'
+            self.totals[outcome] += 1
+            if item[2] is not None:
+                self.keys[item[2]][outcome] += 1
+                if error:
+                    self.keys[item[2]]['error'] = error
+
+        def report(self) -> dict:
+            self.flush()
+            seconds = time.monotonic() - self.started_at if self.started_at else 0
+            return {
+                **self.totals,
+                'seconds': round(seconds, 3),
+                'docs_per_second': round(self.totals['indexed'] / seconds, 1) if seconds else None,
+            }
+
+    def ingest_stocks_eod_batch(companies: list, incremental: bool) -> dict:
+        companies = list({company['key_ticker']: company for company in companies}.values())
+        report = {
+            company['key_ticker']: {'source': None, 'indexed': 0, 'failed': 0, 'error': None}
+            for company in companies
+        }
+        writer = BulkWriter(max_bytes=bulk_max_bytes, max_docs=bulk_max_docs)
+        results = queue.Queue()
+        chunks = [
+            (start_date, end_date, fallback, group[i:i + symbols_per_request])
+            for start_date, end_date, fallback, group in eod_fetch_plan(companies, incremental)
+            for i in range(0, len(group), symbols_per_request)
+        ]
+
+        with ThreadPoolExecutor(max_workers=fetch_workers) as executor:
+            for start_date, end_date, fallback, chunk in chunks:
+                executor.submit(fetch_eod_chunk, chunk, start_date, end_date, fallback, results)
+
+            pending = len(chunks)
+            while pending:
+                result = results.get()
+                if result is None:
+                    pending -= 1
+                    continue
+                company, source, ticker_daily_time_series, error = result
+                ticker = company['key_ticker']
+                if error is not None:
+                    report[ticker]['error'] = error
+                    continue
+                if ticker_daily_time_series is None:
+                    report[ticker]['error'] = "no data"
+                    continue
+
+                docs = writer.write(format_bulk_stocks_eod(ticker, ticker_daily_time_series, company['index']), key=ticker)
+                if not docs:
+                    report[ticker]['error'] = "no data"
+                    continue
+                report[ticker]['source'] = source
+
+        print(f"Stocks EOD bulk: {writer.report()}")
+        for ticker, counts in writer.keys.items():
+            report[ticker].update(counts)
+        return report
+
+    def bump_markets_generation():
+        # Invalidates the API's markets result cache; see app/infrastructure/cache/result_cache.py
+        broker_url = os.environ.get('BROKER_URL')
+        if not broker_url:
+            return
+        import redis
+        generation = redis.Redis.from_url(broker_url).incr("quaks:markets:generation")
+        print(f"Markets data generation bumped to {generation}")
 
     api_endpoint = "https://quaks.ai"
     indexed_key_ticker_list = requests.get(f"{api_endpoint}/json/indexed_key_ticker_list.json").json()
 
-    for company in indexed_key_ticker_list:
-        stocks_eod_response = ingest_stocks_eod(company["key_ticker"], company["index"])
-        print(f"Ingestion complete stocks EOD for {company['key_ticker']}, index {company['index']}: {stocks_eod_response.json()}")
+    # weekly full backfill picks up corporate-action adjustments of past bars
+    full_backfill = datetime.now().weekday() == 5 or os.environ.get('EOD_FULL_BACKFILL', '').lower() == 'true'
+    print(f"Stocks EOD: {'full backfill' if full_backfill else 'incremental'} run")
+    report = ingest_stocks_eod_batch(indexed_key_ticker_list, incremental=not full_backfill)
+    for ticker, entry in report.items():
+        print(f"Ingestion complete stocks EOD for {ticker}: {entry}")
+
+    failed = [ticker for ticker, entry in report.items() if entry['error']]
+    loaded = any(entry['indexed'] for entry in report.values())
+    indexed = sum(entry['indexed'] for entry in report.values())
+    print(f"Stocks EOD: {indexed} bars indexed, {len(report) - len(failed)} tickers ok, {len(failed)} failed: {failed}")
+
+    if loaded:
+        bump_markets_generation()
 
 
 with dag:
@@ -27,6 +27,7 @@ def load_stocks_metadata():
     import time
     import math
     import requests
+    from requests.adapters import HTTPAdapter
     import json
     from datetime import datetime
 
@@ -136,9 +137,112 @@ def load_stocks_metadata():
         lines = [json.dumps(meta), json.dumps(doc)]
         return (("\n".join(lines)) + "\n").encode("utf-8")
 
-    def ingest_metadata(ticker, index_suffix="latest"):
-        es_url = os.environ.get('ELASTICSEARCH_URL')
-        es_api_key = os.environ.get('ELASTICSEARCH_API_KEY')
+    class BulkWriter:
+        # mirrors app/utils/bulk_utils.py: size-capped _bulk requests over one pooled
+        # session, item-level results, and backoff retries of 429/5xx rejections only
+        retryable_statuses = {429, 502, 503, 504}
+
+        def __init__(self, max_bytes=5 * 1024 * 1024, max_docs=5000, max_retries=3, backoff=0.5, max_backoff=30.0):
+            self.url = f"{os.environ.get('ELASTICSEARCH_URL')}/_bulk"
+            self.headers = {
+                'Authorization': f"ApiKey {os.environ.get('ELASTICSEARCH_API_KEY')}",
+                'Content-Type': 'application/x-ndjson'
+            }
+            self.session = requests.Session()
+            self.session.mount("https://", HTTPAdapter(pool_maxsize=16))
+            self.session.mount("http://", HTTPAdapter(pool_maxsize=16))
+            self.max_bytes, self.max_docs = max_bytes, max_docs
+            self.max_retries, self.backoff, self.max_backoff = max_retries, backoff, max_backoff
+            self.keys = {}
+            self.totals = {'indexed': 0, 'failed': 0, 'retried': 0, 'requests': 0, 'bytes': 0}
+            self.pending, self.pending_bytes = [], 0
+            self.started_at = None
+
+        def write(self, body: bytes, key=None) -> int:
+            lines = iter(body.splitlines())
+            count = 0
+            for action in lines:
+                if not action.strip():
+                    continue
+                source = None if action.lstrip().startswith(b'{"delete"') else next(lines, None)
+                self.add(action, source, key)
+                count += 1
+            return count
+
+        def add(self, action: bytes, source, key=None):
+            self.started_at = self.started_at or time.monotonic()
+            if key is not None:
+                self.keys.setdefault(key, {'indexed': 0, 'failed': 0, 'error': None})
+            size = len(action) + 1 + (len(source) + 1 if source is not None else 0)
+            if self.pending and (self.pending_bytes + size > self.max_bytes or len(self.pending) >= self.max_docs):
+                self.flush()
+            self.pending.append([action, source, key, None])
+            self.pending_bytes += size
+
+        def flush(self):
+            items, self.pending, self.pending_bytes = self.pending, [], 0
+            attempt = 0
+            while items:
+                retry = self.send(items)
+                if not retry:
+                    break
+                attempt += 1
+                if attempt > self.max_retries:
+                    for item in retry:
+                        self.settle(item, item[3])
+                    break
+                self.totals['retried'] += len(retry)
+                time.sleep(min(self.max_backoff, self.backoff * 2 ** (attempt - 1)))
+                items = retry
+
+        def send(self, items: list) -> list:
+            body = b"".join(
+                action + b"\n" + (source + b"\n" if source is not None else b"") for action, source, _, _ in items
+            )
+            self.totals['requests'] += 1
+            self.totals['bytes'] += len(body)
+            try:
+                response = self.session.post(self.url, headers=self.headers, data=body, timeout=60)
+            except requests.RequestException as e:
+                return [item[:3] + [f"bulk request failed: {e}"] for item in items]
+            if response.status_code in self.retryable_statuses:
+                return [item[:3] + [f"bulk request returned {response.status_code}"] for item in items]
+            results = response.json().get('items') if response.status_code == 200 else None
+            if results is None or len(results) != len(items):
+                for item in items:
+                    self.settle(item, f"bulk request returned {response.status_code}")
+                return []
+
+            retry = []
+            for item, result in zip(items, results):
+                result = next(iter(result.values()))
+                status = result.get('status', 200)
+                if status < 300 and not result.get('error'):
+                    self.settle(item, None)
+                elif status in self.retryable_statuses:
+                    retry.append(item[:3] + [json.dumps(result.get('error'))])
+                else:
+                    self.settle(item, json.dumps(result.get('error')))
+            return retry
+
+        def settle(self, item: list, error):
+            outcome = 'failed' if error else 'indexed'
+            self.totals[outcome] += 1
+            if item[2] is not None:
+                self.keys[item[2]][outcome] += 1
+                if error:
+                    self.keys[item[2]]['error'] = error
+
+        def report(self) -> dict:
+            self.flush()
+            seconds = time.monotonic() - self.started_at if self.started_at else 0
+            return {
+                **self.totals,
+                'seconds': round(seconds, 3),
+                'docs_per_second': round(self.totals['indexed'] / seconds, 1) if seconds else None,
+            }
+
+    def ingest_metadata(writer, ticker, index_suffix="latest"):
 
         profile = finnhub_get('/stock/profile2', {'symbol': ticker})
         if not profile or not profile.get('ticker'):
@@ -147,30 +251,42 @@ def load_stocks_metadata():
 
         metrics = finnhub_get('/stock/metric', {'symbol': ticker, 'metric': 'all'})
 
-        data = format_bulk_metadata(ticker, profile, metrics, index_suffix)
-        resp = requests.post(
-            url=f"{es_url}/_bulk",
-            headers={
-                'Authorization': f'ApiKey {es_api_key}',
-                'Content-Type': 'application/x-ndjson'
-            },
-            data=data
-        )
-        print(f"  Metadata for {ticker}: {resp.status_code}")
+        writer.write(format_bulk_metadata(ticker, profile, metrics, index_suffix), key=ticker)
+        print(f"  Metadata for {ticker}: queued")
+
+    def bump_markets_generation():
+        # Invalidates the API's markets result cache; see app/infrastructure/cache/result_cache.py
+        broker_url = os.environ.get('BROKER_URL')
+        if not broker_url:
+            return
+        import redis
+        generation = redis.Redis.from_url(broker_url).incr("quaks:markets:generation")
+        print(f"Markets data generation bumped to {generation}")
 
     api_endpoint = "https://quaks.ai"
     indexed_key_ticker_list = requests.get(f"{api_endpoint}/json/indexed_key_ticker_list.json").json()
 
+    writer = BulkWriter()
     for company in indexed_key_ticker_list:
         ticker = company["key_ticker"]
         index = company["index"]
         try:
             print(f"Processing metadata for {ticker}...")
-            ingest_metadata(ticker, index)
+            ingest_metadata(writer, ticker, index)
         except Exception as e:
             print(f"Error processing metadata for {ticker}: {e}")
         time.sleep(0.5)
 
+    bulk_report = writer.report()
+    print(f"Metadata bulk: {bulk_report}")
+    for ticker, counts in writer.keys.items():
+        if counts['failed']:
+            print(f"Ingestion of metadata for {ticker} had failures: {counts}")
+    loaded = bulk_report['indexed'] > 0
+
+    if loaded:
+        bump_markets_generation()
+
 
 with dag:
     load_stocks_metadata()
@@ -164,14 +164,7 @@ init_01_elasticsearch() {
   # Import search templates (for_each resources)
   local search_templates=(
     "get_eod_ohlcv_template"
-    "get_eod_indicator_ad_template"
-    "get_eod_indicator_adx_template"
-    "get_eod_indicator_cci_template"
-    "get_eod_indicator_ema_template"
-    "get_eod_indicator_macd_template"
-    "get_eod_indicator_obv_template"
-    "get_eod_indicator_rsi_template"
-    "get_eod_indicator_stoch_template"
+    "get_eod_ohlcv_series_template"
     "get_markets_news_template"
     "get_stats_close_template"
     "get_stats_close_bulk_template"
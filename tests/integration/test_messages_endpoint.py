@@ -83,6 +83,7 @@ class TestMessagesCRUD:
         assert TestMessagesCRUD.agent_id is not None
         response = client.post(
             "/messages/post",
+            params={"sync": "true"},
             headers=auth_headers(),
             json={
                 "agent_id": TestMessagesCRUD.agent_id,
@@ -98,6 +99,29 @@ class TestMessagesCRUD:
         assert "message_content" in data
         TestMessagesCRUD.assistant_message_id = data["id"]
 
+    def test_stream_message(self, client):
+        assert TestMessagesCRUD.agent_id is not None
+        with client.stream(
+            "POST",
+            "/messages/stream",
+            headers=auth_headers(),
+            json={
+                "agent_id": TestMessagesCRUD.agent_id,
+                "message_role": "human",
+                "message_content": "Hello, stream this!",
+                "attachment_id": None,
+            },
+        ) as response:
+            assert response.status_code == 200
+            assert response.headers["content-type"].startswith("text/event-stream")
+            events = [
+                line.removeprefix("event: ")
+                for line in response.iter_lines()
+                if line.startswith("event: ")
+            ]
+        assert events[0] == "started"
+        assert events[-1] == "message"
+
     def test_list_messages_has_entries(self, client):
         assert TestMessagesCRUD.agent_id is not None
         response = client.post(
@@ -39,3 +39,13 @@ def test_metrics(client):
 
     assert "threads" in data, "The response should contain the 'threads' key"
     assert "active_count" in data["threads"], "It should contain 'active_count'"
+
+    assert "database" in data, "The response should contain the 'database' key"
+    assert "checkouts" in data["database"], "It should contain pool 'checkouts'"
+    assert "hit_rate" in data["database"]["search_path"], "It should contain the search_path 'hit_rate'"
+
+    assert "checkpoints" in data, "The response should contain the 'checkpoints' key"
+    assert "largest_threads" in data["checkpoints"], "It should contain the 'largest_threads'"
+
+    assert "llm_cache" in data, "The response should contain the 'llm_cache' key"
+    assert "saved_tokens" in data["llm_cache"], "It should contain the 'saved_tokens'"
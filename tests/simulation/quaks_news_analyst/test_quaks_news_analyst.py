@@ -134,6 +134,7 @@ def news_analyst_agent(client, message_content) -> scenario.AgentReturnTypes:
 
     response = client.post(
         "/messages/post",
+        params={"sync": "true"},
         headers={"Authorization": f"Bearer {os.getenv('ACCESS_TOKEN')}"},
         json={
             "message_role": "human",
@@ -153,6 +154,7 @@ def news_analyst_agent_full_response(
 
     response = client.post(
         "/messages/post",
+        params={"sync": "true"},
         headers={"Authorization": f"Bearer {os.getenv('ACCESS_TOKEN')}"},
         json={
             "message_role": "human",
@@ -1,5 +1,9 @@
+import timeit
 from unittest.mock import MagicMock
 
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
 from app.services.agent_types.base import join_messages, AgentUtils
 
 
@@ -32,6 +36,103 @@ class TestJoinMessages:
         result = join_messages(["a", "a"], ["a"])
         assert result == ["a"]
 
+    def test_deduplicates_equal_messages(self):
+        left = [HumanMessage(content="hi"), AIMessage(content="hello")]
+        result = join_messages(
+            left, [HumanMessage(content="hi"), AIMessage(content="bye")]
+        )
+        assert result == [
+            HumanMessage(content="hi"),
+            AIMessage(content="hello"),
+            AIMessage(content="bye"),
+        ]
+
+    def test_keeps_messages_that_differ_beyond_content(self):
+        first = AIMessage(
+            content="", tool_calls=[{"name": "search", "args": {"q": "a"}, "id": "1"}]
+        )
+        second = AIMessage(
+            content="", tool_calls=[{"name": "search", "args": {"q": "b"}, "id": "2"}]
+        )
+        assert join_messages([first], [second, first]) == [first, second]
+
+    def test_deduplicates_unhashable_items(self):
+        result = join_messages([{"a": 1}, [1]], [{"a": 1}, [2]])
+        assert result == [{"a": 1}, [1], [2]]
+
+    def test_deduplicates_list_content(self):
+        content = [{"type": "text", "text": "chart"}]
+        result = join_messages(
+            [HumanMessage(content=content)], [HumanMessage(content=list(content))]
+        )
+        assert len(result) == 1
+
+
+def _join_messages_linear(left, right):
+    # the list-scan reducer join_messages replaced, kept as the benchmark baseline
+    unique_messages = []
+    for msg in left + right:
+        if msg not in unique_messages:
+            unique_messages.append(msg)
+    return unique_messages
+
+
+class TestJoinMessagesThroughput:
+    """One state update on a 1k-message ReAct history."""
+
+    SIZE = 1000
+
+    def _history(self):
+        article = "Shares rallied after earnings. " * 200
+        messages = []
+        for i in range(self.SIZE // 4):
+            messages += [
+                HumanMessage(content=f"question {i}"),
+                AIMessage(
+                    content="",
+                    tool_calls=[
+                        {"name": "news", "args": {"page": i}, "id": f"call-{i}"}
+                    ],
+                ),
+                ToolMessage(content=f"{i}: {article}", tool_call_id=f"call-{i}"),
+                AIMessage(content=f"answer {i}"),
+            ]
+        return messages
+
+    def test_indexed_reducer_matches_list_scan(self):
+        history = self._history()
+        update = [AIMessage(content="final answer")]
+
+        assert join_messages(history, update) == _join_messages_linear(history, update)
+
+    @pytest.mark.benchmark
+    def test_indexed_reducer_cost(self):
+        history = self._history()
+        update = [AIMessage(content="final answer")]
+
+        # best of several runs, to keep scheduler noise out of the figure
+        linear_ms = (
+            min(
+                timeit.repeat(
+                    lambda: _join_messages_linear(history, update), number=1, repeat=5
+                )
+            )
+            * 1000
+        )
+        indexed_ms = (
+            min(
+                timeit.repeat(
+                    lambda: join_messages(history, update), number=1, repeat=5
+                )
+            )
+            * 1000
+        )
+
+        print(
+            f"\njoin_messages on {self.SIZE} messages: {linear_ms:.1f} ms list scan, "
+            f"{indexed_ms:.2f} ms indexed ({linear_ms / indexed_ms:.0f}x)"
+        )
+
 
 class TestAgentUtils:
     def test_initialization(self):
@@ -1,13 +1,18 @@
 import os
 import tempfile
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
 from langchain_core.messages import AIMessage, HumanMessage
-from langgraph.graph import MessagesState
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.constants import END, START
+from langgraph.graph import MessagesState, StateGraph
 
 from app.domain.exceptions.base import ResourceNotFoundError
-from app.services.agent_types.base import AgentUtils, WorkflowAgentBase
+from app.infrastructure.database.checkpoints import CheckpointThreads
+from app.interface.api.messages.schema import MessageRequest
+from app.services.agent_types.base import AgentBase, AgentUtils, WorkflowAgentBase
 
 
 def _make_agent_utils(**overrides):
@@ -137,6 +142,43 @@ class TestAgentBaseGetChatModel:
         model = agent.get_chat_model("a1", "public", language_model_tag="custom-tag")
         assert model is not None
 
+    def test_client_and_lookups_are_cached(self):
+        agent = self._setup_agent("openai_api_v1")
+        first = agent.get_chat_model("a1", "public")
+        second = agent.get_chat_model("a1", "public")
+        assert first is second
+        agent.agent_service.get_agent_by_id.assert_called_once()
+        agent.vault_client.secrets.kv.read_secret_version.assert_called_once()
+
+    def test_response_cache_is_off_by_default(self):
+        agent = self._setup_agent("openai_api_v1")
+        agent.agent_setting_service.get_agent_settings.return_value = []
+        model = agent.get_chat_model("a1", "public")
+        assert model.cache is None
+
+    def test_response_cache_opt_in_setting(self):
+        agent = self._setup_agent("openai_api_v1")
+        setting = MagicMock(setting_key="llm_response_cache", setting_value="true")
+        agent.agent_setting_service.get_agent_settings.return_value = [setting]
+
+        first = agent.get_chat_model("a1", "public")
+        second = agent.get_chat_model("a1", "public")
+
+        assert first.cache is agent.llm_response_cache.scoped("public:int-1")
+        assert first is second
+        agent.agent_setting_service.get_agent_settings.assert_called_once_with("a1", "public")
+
+    def test_response_cache_is_scoped_per_tenant(self):
+        agent = self._setup_agent("openai_api_v1")
+        setting = MagicMock(setting_key="llm_response_cache", setting_value="true")
+        agent.agent_setting_service.get_agent_settings.return_value = [setting]
+
+        public = agent.get_chat_model("a1", "public")
+        tenant = agent.get_chat_model("a1", "tenant_a")
+
+        assert public is not tenant
+        assert tenant.cache.scope == "tenant_a:int-1"
+
 
 class TestAgentBaseGetEmbeddingsModel:
     def _setup_agent(self, integration_type):
@@ -240,6 +282,106 @@ class TestWorkflowAgentBaseGetConfig:
         assert config["configurable"]["thread_id"] == "agent-123"
         assert config["recursion_limit"] == 30
 
+    def test_thread_id_follows_checkpoint_thread_mode(self):
+        utils = _make_agent_utils(checkpoint_threads=CheckpointThreads(mode="run"))
+        agent = _StubWorkflowAgent(utils)
+
+        first = agent.get_config("agent-123")["configurable"]["thread_id"]
+        second = agent.get_config("agent-123")["configurable"]["thread_id"]
+
+        assert first.startswith("agent-123:")
+        assert first != second
+
+
+class _StreamingWorkflowAgent(_StubWorkflowAgent):
+    def __init__(self, agent_utils, chat_model):
+        super().__init__(agent_utils)
+        self.chat_model = chat_model
+
+    def get_input_params(self, message_request, schema):
+        return {"messages": [HumanMessage(content=message_request.message_content)]}
+
+    def get_workflow_builder(self, agent_id):
+        def writer(state):
+            return {"messages": [self.chat_model.invoke(state["messages"])]}
+
+        builder = StateGraph(MessagesState)
+        builder.add_node("writer", writer)
+        builder.add_edge(START, "writer")
+        builder.add_edge("writer", END)
+        return builder
+
+
+class TestWorkflowAgentBaseAstreamMessage:
+    @pytest.mark.asyncio
+    async def test_streams_nodes_and_tokens_then_returns_message(self):
+        utils = _make_agent_utils()
+        utils.graph_persistence_factory.build_async_checkpoint_saver = AsyncMock(
+            return_value=InMemorySaver()
+        )
+        chat_model = GenericFakeChatModel(messages=iter([AIMessage(content="Markets rallied today")]))
+        agent = _StreamingWorkflowAgent(utils, chat_model)
+        events = []
+
+        async def on_event(progress):
+            events.append(progress)
+
+        message = await agent.astream_message(
+            MessageRequest(agent_id="agent-1", message_role="human", message_content="brief me"),
+            "public",
+            on_event,
+        )
+
+        assert message.message_content == "Markets rallied today"
+        assert (events[0].event, events[0].node) == ("node", "writer")
+        tokens = [event for event in events if event.event == "token"]
+        assert {event.node for event in tokens} == {"writer"}
+        assert "".join(event.message_content for event in tokens) == "Markets rallied today"
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_checkpointed_state_without_root_end_event(self):
+        utils = _make_agent_utils()
+        utils.graph_persistence_factory.build_async_checkpoint_saver = AsyncMock(
+            return_value=InMemorySaver()
+        )
+        chat_model = GenericFakeChatModel(messages=iter([AIMessage(content="Markets rallied today")]))
+        agent = _StreamingWorkflowAgent(utils, chat_model)
+        compile_workflow = agent.get_compiled_workflow
+
+        def get_compiled_workflow(*args, **kwargs):
+            workflow = compile_workflow(*args, **kwargs)
+            astream_events = workflow.astream_events
+
+            async def without_root_end(*args, **kwargs):
+                async for event in astream_events(*args, **kwargs):
+                    if not (event["event"] == "on_chain_end" and not event["parent_ids"]):
+                        yield event
+
+            workflow.astream_events = without_root_end
+            return workflow
+
+        agent.get_compiled_workflow = get_compiled_workflow
+
+        message = await agent.astream_message(
+            MessageRequest(agent_id="agent-1", message_role="human", message_content="brief me"),
+            "public",
+            AsyncMock(),
+        )
+
+        assert message.message_content == "Markets rallied today"
+
+    @pytest.mark.asyncio
+    async def test_agents_without_graph_return_result_only(self):
+        agent = _StubWorkflowAgent(_make_agent_utils())
+        expected = MagicMock()
+        agent.aprocess_message = AsyncMock(return_value=expected)
+        on_event = AsyncMock()
+
+        result = await AgentBase.astream_message(agent, MagicMock(), "public", on_event)
+
+        assert result is expected
+        on_event.assert_not_awaited()
+
 
 class TestWorkflowAgentBaseCreateThoughtChain:
     def test_basic_thought_chain(self):
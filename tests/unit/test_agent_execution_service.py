@@ -0,0 +1,320 @@
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.domain.exceptions.base import TooManyRequestsError
+from app.domain.models import Message
+from app.services.agent_execution import TASK_FAILED_MESSAGE, AgentExecutionService
+
+
+@pytest.fixture
+def notifications():
+    return MagicMock()
+
+
+@pytest.fixture
+def service(notifications):
+    service = AgentExecutionService(
+        task_notification_service=notifications,
+        max_workers=1,
+        queue_size=1,
+        per_tenant_limit=2,
+    )
+    yield service
+    service.shutdown()
+
+
+def _blocking_job(release: threading.Event):
+    def job():
+        release.wait(timeout=5)
+        return Message(id="msg-1", message_content="done", response_data={"k": "v"})
+
+    return job
+
+
+def _wait_for_publish(notifications):
+    for _ in range(500):
+        if notifications.publish_update.called:
+            return notifications.publish_update.call_args.kwargs["task_progress"]
+        threading.Event().wait(0.01)
+    raise AssertionError("task progress was never published")
+
+
+class TestSubmit:
+    def test_publishes_completed_result(self, service, notifications):
+        release = threading.Event()
+        release.set()
+
+        task_id = service.submit("tenant_a", "agent-1", _blocking_job(release))
+
+        progress = _wait_for_publish(notifications)
+        assert progress.task_id == task_id
+        assert progress.agent_id == "agent-1"
+        assert progress.status == "completed"
+        assert progress.message_id == "msg-1"
+        assert progress.response_data == {"k": "v"}
+
+    def test_publishes_failure(self, service, notifications):
+        def job():
+            raise RuntimeError("llm unavailable")
+
+        task_id = service.submit("tenant_a", "agent-1", job)
+
+        progress = _wait_for_publish(notifications)
+        assert progress.task_id == task_id
+        assert progress.status == "failed"
+        assert progress.message_content == TASK_FAILED_MESSAGE
+        assert "llm unavailable" not in progress.model_dump_json()
+
+    def test_rejects_when_queue_is_full(self, notifications):
+        service = AgentExecutionService(
+            task_notification_service=notifications,
+            max_workers=1,
+            queue_size=1,
+            per_tenant_limit=5,
+        )
+        release = threading.Event()
+        try:
+            service.submit("tenant_a", "agent-1", _blocking_job(release))
+            service.submit("tenant_b", "agent-2", _blocking_job(release))
+
+            with pytest.raises(TooManyRequestsError) as exc_info:
+                service.submit("tenant_c", "agent-3", _blocking_job(release))
+
+            assert exc_info.value.status_code == 429
+            assert exc_info.value.headers["Retry-After"]
+        finally:
+            release.set()
+            service.shutdown()
+
+    def test_rejects_over_per_tenant_limit(self, notifications):
+        service = AgentExecutionService(
+            task_notification_service=notifications,
+            max_workers=2,
+            queue_size=4,
+            per_tenant_limit=1,
+        )
+        release = threading.Event()
+        try:
+            service.submit("tenant_a", "agent-1", _blocking_job(release))
+
+            with pytest.raises(TooManyRequestsError):
+                service.submit("tenant_a", "agent-1", _blocking_job(release))
+            service.submit("tenant_b", "agent-2", _blocking_job(release))
+        finally:
+            release.set()
+            service.shutdown()
+
+    def test_slot_is_released_after_completion(self, service, notifications):
+        release = threading.Event()
+        release.set()
+
+        service.submit("tenant_a", "agent-1", _blocking_job(release))
+        _wait_for_publish(notifications)
+
+        assert service.metrics()["in_flight"] == 0
+        assert service.metrics()["tenants"] == 0
+
+
+class TestRun:
+    @pytest.mark.asyncio
+    async def test_returns_job_result(self, service):
+        result = await service.run("tenant_a", lambda: threading.current_thread().name)
+
+        assert result.startswith("agent-worker")
+        assert service.metrics()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_propagates_errors_and_releases_slot(self, service):
+        def job():
+            raise ValueError("bad input")
+
+        with pytest.raises(ValueError):
+            await service.run("tenant_a", job)
+
+        assert service.metrics()["in_flight"] == 0
+
+
+class TestAsyncJobs:
+    @pytest.mark.asyncio
+    async def test_submit_runs_coroutine_on_event_loop(self, service, notifications):
+        async def job():
+            return Message(id="msg-2", message_content="async done")
+
+        task_id = service.submit("tenant_a", "agent-1", job)
+        await asyncio.gather(*service._tasks)
+
+        progress = await asyncio.to_thread(_wait_for_publish, notifications)
+        assert progress.task_id == task_id
+        assert progress.status == "completed"
+        assert progress.message_id == "msg-2"
+        assert service.metrics()["async_in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_async_jobs_do_not_use_worker_capacity(self, notifications):
+        service = AgentExecutionService(
+            task_notification_service=notifications,
+            max_workers=1,
+            queue_size=0,
+            per_tenant_limit=10,
+            max_async_tasks=2,
+        )
+        release = asyncio.Event()
+
+        async def job():
+            await release.wait()
+            return Message(id="msg-3", message_content="done")
+
+        try:
+            service.submit("tenant_a", "agent-1", job)
+            service.submit("tenant_b", "agent-2", job)
+            with pytest.raises(TooManyRequestsError):
+                service.submit("tenant_c", "agent-3", job)
+            assert service.metrics()["in_flight"] == 0
+        finally:
+            release.set()
+            await asyncio.gather(*service._tasks)
+            service.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_run_awaits_coroutine(self, service):
+        async def job():
+            return "result"
+
+        assert await service.run("tenant_a", job) == "result"
+        assert service.metrics()["async_in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_submit_uses_given_task_id(self, service, notifications):
+        async def job():
+            return Message(id="msg-4", message_content="done")
+
+        task_id = service.submit("tenant_a", "agent-1", job, task_id="task-1")
+
+        progress = await asyncio.to_thread(_wait_for_publish, notifications)
+        assert task_id == "task-1"
+        assert progress.task_id == "task-1"
+
+
+class TestStart:
+    @pytest.mark.asyncio
+    async def test_runs_job_as_task_and_releases_slot(self, service):
+        release = asyncio.Event()
+
+        async def job():
+            await release.wait()
+            return "result"
+
+        task = service.start("tenant_a", job)
+        await asyncio.sleep(0)
+        assert service.metrics()["async_in_flight"] == 1
+
+        release.set()
+        assert await task == "result"
+        assert service.metrics()["async_in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_rejects_before_starting(self, notifications):
+        service = AgentExecutionService(
+            task_notification_service=notifications, per_tenant_limit=1
+        )
+        release = asyncio.Event()
+
+        async def job():
+            await release.wait()
+
+        try:
+            task = service.start("tenant_a", job)
+            with pytest.raises(TooManyRequestsError):
+                service.start("tenant_a", job)
+        finally:
+            release.set()
+            await task
+            service.shutdown()
+
+
+class TestReserve:
+    def test_reservation_holds_slot_until_released(self, service):
+        reservation = service.reserve("tenant_a")
+        assert service.metrics()["in_flight"] == 1
+
+        reservation.release()
+        reservation.release()
+        assert service.metrics()["in_flight"] == 0
+
+    def test_rejects_when_saturated(self, service):
+        service.reserve("tenant_a")
+        service.reserve("tenant_b")
+
+        with pytest.raises(TooManyRequestsError):
+            service.reserve("tenant_c")
+
+    @pytest.mark.asyncio
+    async def test_run_consumes_reservation(self, service):
+        reservation = service.reserve("tenant_a")
+
+        assert (
+            await service.run("tenant_a", lambda: "result", reservation=reservation)
+            == "result"
+        )
+        assert service.metrics()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_rejects_reservation_for_other_kind_of_job(self, service):
+        reservation = service.reserve("tenant_a", asynchronous=True)
+
+        async def job():
+            return None
+
+        with pytest.raises(ValueError):
+            service.submit("tenant_a", "agent-1", lambda: None, reservation=reservation)
+        assert service.metrics()["async_in_flight"] == 1
+
+        await service.start("tenant_a", job, reservation=reservation)
+        assert service.metrics()["async_in_flight"] == 0
+
+
+class TestShutdown:
+    def test_releases_slot_when_pool_rejects_job(self, service):
+        service.shutdown()
+
+        with pytest.raises(RuntimeError):
+            service.submit("tenant_a", "agent-1", lambda: None)
+        assert service.metrics()["in_flight"] == 0
+
+    def test_reports_queued_jobs_as_failed(self, notifications):
+        service = AgentExecutionService(
+            task_notification_service=notifications, max_workers=1, queue_size=1
+        )
+        release = threading.Event()
+        service.submit("tenant_a", "agent-1", _blocking_job(release), task_id="running")
+        service.submit("tenant_b", "agent-1", _blocking_job(release), task_id="queued")
+
+        service.shutdown()
+        release.set()
+
+        published = {
+            call.kwargs["task_progress"].task_id: call.kwargs["task_progress"]
+            for call in notifications.publish_update.call_args_list
+        }
+        assert published["queued"].status == "failed"
+        assert service.metrics()["in_flight"] <= 1
+
+    @pytest.mark.asyncio
+    async def test_reports_cancelled_coroutine_jobs_as_failed(self, notifications):
+        service = AgentExecutionService(task_notification_service=notifications)
+
+        async def job():
+            await asyncio.Event().wait()
+
+        service.submit("tenant_a", "agent-1", job, task_id="task-1")
+        await asyncio.sleep(0)
+
+        service.shutdown()
+        await asyncio.sleep(0)
+
+        progress = notifications.publish_update.call_args.kwargs["task_progress"]
+        assert (progress.task_id, progress.status) == ("task-1", "failed")
+        assert service.metrics()["async_in_flight"] == 0
@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -8,6 +8,8 @@ from app.domain.repositories.agents import (
     AgentRepository,
     AgentSettingNotFoundError,
     AgentSettingRepository,
+    AsyncAgentRepository,
+    AsyncAgentSettingRepository,
 )
 
 
@@ -210,3 +212,99 @@ class TestAgentNotFoundError:
 class TestAgentSettingNotFoundError:
     def test_entity_name(self):
         assert AgentSettingNotFoundError.entity_name == "AgentSetting"
+
+
+@pytest.fixture
+def mock_async_db():
+    db = MagicMock()
+    session = MagicMock()
+    session.scalars = AsyncMock(return_value=MagicMock())
+    session.scalar = AsyncMock()
+    session.execute = AsyncMock()
+    session.commit = AsyncMock()
+    session.refresh = AsyncMock()
+    db.session.return_value.__aenter__ = AsyncMock(return_value=session)
+    db.session.return_value.__aexit__ = AsyncMock(return_value=False)
+    return db, session
+
+
+class TestAsyncAgentRepository:
+    @pytest.mark.asyncio
+    async def test_get_all(self, mock_async_db):
+        db, session = mock_async_db
+        repo = AsyncAgentRepository(db=db)
+        expected = [MagicMock(spec=Agent), MagicMock(spec=Agent)]
+        session.scalars.return_value.all.return_value = expected
+
+        result = await repo.get_all(schema="test_schema")
+
+        assert result == expected
+        db.session.assert_called_once_with(schema_name="test_schema")
+
+    @pytest.mark.asyncio
+    async def test_get_by_id_not_found(self, mock_async_db):
+        db, session = mock_async_db
+        repo = AsyncAgentRepository(db=db)
+        session.scalar.return_value = None
+
+        with pytest.raises(AgentNotFoundError):
+            await repo.get_by_id(agent_id="nonexistent", schema="test_schema")
+
+    @pytest.mark.asyncio
+    @patch("app.domain.repositories.agents.uuid4")
+    async def test_add(self, mock_uuid, mock_async_db):
+        db, session = mock_async_db
+        repo = AsyncAgentRepository(db=db)
+        mock_uuid.return_value = "generated-uuid"
+
+        result = await repo.add(
+            agent_name="Test Agent",
+            agent_type="test_echo",
+            language_model_id="lm-1",
+            schema="test_schema",
+        )
+
+        assert result.id == "generated-uuid"
+        assert result.agent_summary == ""
+        session.add.assert_called_once_with(result)
+        session.commit.assert_awaited_once()
+        session.refresh.assert_awaited_once_with(result)
+
+    @pytest.mark.asyncio
+    async def test_delete_by_id_soft_deletes(self, mock_async_db):
+        db, session = mock_async_db
+        repo = AsyncAgentRepository(db=db)
+        agent = MagicMock(spec=Agent)
+        agent.is_active = True
+        session.scalar.return_value = agent
+
+        await repo.delete_by_id(agent_id="agent-1", schema="test_schema")
+
+        assert agent.is_active is False
+        session.commit.assert_awaited_once()
+
+
+class TestAsyncAgentSettingRepository:
+    @pytest.mark.asyncio
+    async def test_update_by_key_not_found(self, mock_async_db):
+        db, session = mock_async_db
+        repo = AsyncAgentSettingRepository(db=db)
+        session.scalar.return_value = None
+
+        with pytest.raises(AgentSettingNotFoundError):
+            await repo.update_by_key(
+                agent_id="agent-1",
+                setting_key="temperature",
+                setting_value="0.5",
+                schema="test_schema",
+            )
+
+    @pytest.mark.asyncio
+    async def test_delete_by_agent_id(self, mock_async_db):
+        db, session = mock_async_db
+        repo = AsyncAgentSettingRepository(db=db)
+
+        await repo.delete_by_agent_id(agent_id="agent-1", schema="test_schema")
+
+        session.execute.assert_awaited_once()
+        session.commit.assert_awaited_once()
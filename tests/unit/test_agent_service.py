@@ -1,6 +1,6 @@
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 import pytest
-from app.services.agents import AgentService
+from app.services.agents import AgentService, AsyncAgentService
 from app.domain.models import Agent, LanguageModel
 
 @pytest.fixture
@@ -112,3 +112,50 @@ def test_update_agent(service, mock_agent_repository, mock_language_model_servic
         agent_summary=agent_summary,
         schema=schema,
     )
+
+@pytest.mark.asyncio
+async def test_async_create_agent_resolves_language_model():
+    agent_repository = MagicMock()
+    agent_repository.add = AsyncMock(return_value="agent")
+    language_model_service = MagicMock()
+    language_model_service.get_language_model_by_id = AsyncMock(
+        return_value=LanguageModel(id="lm-1")
+    )
+    service = AsyncAgentService(
+        agent_repository=agent_repository,
+        agent_setting_service=MagicMock(),
+        language_model_service=language_model_service,
+    )
+
+    result = await service.create_agent(
+        agent_name="Agent 1", agent_type="type", schema="schema-1", language_model_id="lm-1"
+    )
+
+    assert result == "agent"
+    language_model_service.get_language_model_by_id.assert_awaited_once_with("lm-1", "schema-1")
+    agent_repository.add.assert_awaited_once_with(
+        agent_name="Agent 1", agent_type="type", language_model_id="lm-1", schema="schema-1"
+    )
+
+@pytest.mark.asyncio
+async def test_async_update_agent_without_language_model():
+    agent_repository = MagicMock()
+    agent_repository.update_agent = AsyncMock(return_value="agent")
+    language_model_service = MagicMock()
+    language_model_service.get_language_model_by_id = AsyncMock()
+    service = AsyncAgentService(
+        agent_repository=agent_repository,
+        agent_setting_service=MagicMock(),
+        language_model_service=language_model_service,
+    )
+
+    await service.update_agent(agent_id="agent-1", agent_name="Renamed", schema="schema-1")
+
+    language_model_service.get_language_model_by_id.assert_not_awaited()
+    agent_repository.update_agent.assert_awaited_once_with(
+        agent_id="agent-1",
+        agent_name="Renamed",
+        language_model_id=None,
+        agent_summary=None,
+        schema="schema-1",
+    )
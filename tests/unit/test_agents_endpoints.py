@@ -0,0 +1,110 @@
+"""Tests for the task updates websocket."""
+
+import threading
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import WebSocketDisconnect
+
+from app.interface.api.agents import endpoints
+from app.services.tasks import TaskProgress
+
+_task_updates_endpoint = endpoints.task_updates_endpoint.__wrapped__
+
+
+def _message(**fields):
+    return {
+        "type": "message",
+        "data": TaskProgress(agent_id="agent-1", **fields).model_dump_json(),
+    }
+
+
+def _notifications(messages, gate=None):
+    def listen():
+        for message in messages:
+            if gate is not None:
+                gate.wait(timeout=5)
+            yield message
+
+    service = MagicMock()
+    service.listen.side_effect = listen
+    return service
+
+
+class TestTaskUpdatesEndpoint:
+    @pytest.fixture(autouse=True)
+    def short_keepalive(self, monkeypatch):
+        monkeypatch.setattr(endpoints, "TASK_UPDATES_KEEPALIVE_SECONDS", 0.05)
+
+    @pytest.mark.asyncio
+    async def test_sends_next_update_and_closes(self):
+        websocket = AsyncMock()
+        notifications = _notifications(
+            [
+                {"type": "subscribe", "data": 1},
+                _message(status="in_progress", message_content="Working..."),
+                _message(status="completed", task_id="task-1"),
+            ]
+        )
+
+        await _task_updates_endpoint(websocket, "agent-1", notifications)
+
+        assert websocket.send_json.await_count == 1
+        assert websocket.send_json.await_args.args[0]["status"] == "in_progress"
+        notifications.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_gives_up_on_timeout_without_stream(self):
+        websocket = AsyncMock()
+        gate = threading.Event()
+        notifications = _notifications([_message(status="in_progress")], gate)
+
+        await _task_updates_endpoint(websocket, "agent-1", notifications)
+        gate.set()
+
+        websocket.send_json.assert_not_awaited()
+        notifications.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_stream_keeps_alive_until_task_result(self):
+        websocket = AsyncMock()
+        gate = threading.Event()
+        notifications = _notifications(
+            [
+                _message(
+                    status="in_progress",
+                    event="token",
+                    node="reporter",
+                    message_content="Mar",
+                ),
+                _message(status="completed", task_id="task-1"),
+            ],
+            gate,
+        )
+
+        async def send_json(data):
+            # let the updates through once the idle socket has been kept alive
+            if data == {"type": "keepalive"}:
+                gate.set()
+
+        websocket.send_json.side_effect = send_json
+
+        await _task_updates_endpoint(websocket, "agent-1", notifications, stream=True)
+
+        sent = [call.args[0] for call in websocket.send_json.await_args_list]
+        assert sent[0] == {"type": "keepalive"}
+        updates = [data for data in sent if data != {"type": "keepalive"}]
+        assert [data["status"] for data in updates] == ["in_progress", "completed"]
+        notifications.listen.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_stream_stops_when_client_disconnects(self):
+        websocket = AsyncMock()
+        websocket.send_json.side_effect = WebSocketDisconnect()
+        gate = threading.Event()
+        notifications = _notifications([{"type": "subscribe", "data": 1}], gate)
+
+        await _task_updates_endpoint(websocket, "agent-1", notifications, stream=True)
+        gate.set()
+
+        notifications.close.assert_called_once()
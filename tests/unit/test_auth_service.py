@@ -217,3 +217,53 @@ def test_service_initialization(service):
     assert service.client_secret == "secret"
     assert "openid-connect/token" in service.token_url
     assert "admin/realms/realm/users" in service.admin_users_url
+
+def _jwt(payload: dict) -> str:
+    import base64
+    import json
+    body = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+    return f"header.{body}.signature"
+
+@patch("requests.post")
+def test_login_provisions_tenant_schema(mock_post):
+    db = MagicMock()
+    service = AuthService(
+        enabled=True, url="http://auth", realm="realm", client_id="client", client_secret="secret", db=db
+    )
+    mock_response = MagicMock()
+    mock_response.json.return_value = {"access_token": _jwt({"sub": "abc-123"}), "refresh_token": "rt"}
+    mock_post.return_value = mock_response
+
+    service.login("user", "pass")
+
+    db.provision_schema.assert_called_once_with("id_abc_123")
+
+@patch("requests.post")
+def test_exchange_provisioning_failure_does_not_block_login(mock_post):
+    db = MagicMock()
+    db.provision_schema.side_effect = RuntimeError("db down")
+    service = AuthService(
+        enabled=True, url="http://auth", realm="realm", client_id="client", client_secret="secret", db=db
+    )
+    mock_response = MagicMock()
+    mock_response.json.return_value = {"access_token": _jwt({"sub": "abc"}), "refresh_token": "rt"}
+    mock_post.return_value = mock_response
+
+    result = service.exchange("code", "verifier", "uri")
+
+    assert result.refresh_token == "rt"
+    db.provision_schema.assert_called_once_with("id_abc")
+
+@patch("requests.post")
+def test_login_skips_provisioning_for_opaque_token(mock_post):
+    db = MagicMock()
+    service = AuthService(
+        enabled=True, url="http://auth", realm="realm", client_id="client", client_secret="secret", db=db
+    )
+    mock_response = MagicMock()
+    mock_response.json.return_value = {"access_token": "at", "refresh_token": "rt"}
+    mock_post.return_value = mock_response
+
+    service.login("user", "pass")
+
+    db.provision_schema.assert_not_called()
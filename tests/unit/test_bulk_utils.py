@@ -0,0 +1,192 @@
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from app.utils.bulk_utils import BulkWriter
+
+
+def _body(count, start=0):
+    return b"".join(
+        b'{"index":{"_index":"idx","_id":"%d"}}\n{"n":%d}\n' % (i, i)
+        for i in range(start, start + count)
+    )
+
+
+def _response(statuses, status_code=200):
+    response = MagicMock(status_code=status_code)
+    response.json.return_value = {
+        "errors": any(status >= 300 for status in statuses),
+        "items": [
+            {
+                "index": {
+                    "status": status,
+                    **({"error": {"type": f"error_{status}"}} if status >= 300 else {}),
+                }
+            }
+            for status in statuses
+        ],
+    }
+    return response
+
+
+def _sent_ids(call):
+    lines = call.kwargs["data"].splitlines()
+    return [json.loads(line)["index"]["_id"] for line in lines[::2]]
+
+
+@pytest.fixture
+def session():
+    return MagicMock()
+
+
+@pytest.fixture(autouse=True)
+def no_sleep():
+    with patch("app.utils.bulk_utils.time.sleep") as sleep:
+        yield sleep
+
+
+def _writer(session, **kwargs):
+    return BulkWriter(es_url="http://es:9200", api_key="key", session=session, **kwargs)
+
+
+class TestChunking:
+    def test_splits_requests_by_doc_count(self, session):
+        session.post.side_effect = lambda url, data, **_: _response(
+            [201] * (data.count(b"\n") // 2)
+        )
+
+        with _writer(session, max_docs=2) as writer:
+            assert writer.write(_body(5)) == 5
+
+        assert [len(_sent_ids(call)) for call in session.post.call_args_list] == [
+            2,
+            2,
+            1,
+        ]
+        assert writer.report()["indexed"] == 5
+        assert writer.report()["requests"] == 3
+
+    def test_splits_requests_by_bytes(self, session):
+        session.post.side_effect = lambda url, data, **_: _response(
+            [201] * (data.count(b"\n") // 2)
+        )
+        item_bytes = len(_body(1))
+
+        with _writer(session, max_bytes=item_bytes * 2) as writer:
+            writer.write(iter([_body(2), _body(3, start=2)]))
+
+        assert [len(_sent_ids(call)) for call in session.post.call_args_list] == [
+            2,
+            2,
+            1,
+        ]
+
+    def test_posts_to_bulk_endpoint_with_api_key(self, session):
+        session.post.return_value = _response([201])
+
+        with _writer(session) as writer:
+            writer.write(_body(1))
+
+        assert session.post.call_args.args[0] == "http://es:9200/_bulk"
+        assert session.post.call_args.kwargs["headers"]["Authorization"] == "ApiKey key"
+
+    def test_delete_actions_have_no_source_line(self, session):
+        session.post.return_value = _response([200, 201])
+
+        with _writer(session) as writer:
+            assert (
+                writer.write(
+                    b'{"delete":{"_index":"idx","_id":"0"}}\n' + _body(1, start=1)
+                )
+                == 2
+            )
+
+        assert session.post.call_args.kwargs["data"].count(b"\n") == 3
+
+
+class TestRetries:
+    def test_retries_only_rejected_items(self, session, no_sleep):
+        session.post.side_effect = [
+            _response([201, 429, 201, 429]),
+            _response([201, 201]),
+        ]
+
+        with _writer(session) as writer:
+            writer.write(_body(4))
+
+        assert _sent_ids(session.post.call_args_list[1]) == ["1", "3"]
+        report = writer.report()
+        assert (report["indexed"], report["failed"], report["retried"]) == (4, 0, 2)
+        no_sleep.assert_called_once_with(0.5)
+
+    def test_backs_off_exponentially_then_gives_up(self, session, no_sleep):
+        session.post.return_value = _response([429])
+
+        with _writer(session, max_retries=3, backoff=1.0, max_backoff=3.0) as writer:
+            writer.write(_body(1))
+
+        assert session.post.call_count == 4
+        assert [call.args[0] for call in no_sleep.call_args_list] == [1.0, 2.0, 3.0]
+        assert writer.report()["failed"] == 1
+        assert writer.report()["errors"] == ['{"type": "error_429"}']
+
+    def test_does_not_retry_mapping_errors(self, session):
+        session.post.return_value = _response([201, 400])
+
+        with _writer(session) as writer:
+            writer.write(_body(2))
+
+        session.post.assert_called_once()
+        assert writer.report()["failed"] == 1
+
+    def test_retries_whole_request_on_connection_error(self, session):
+        session.post.side_effect = [
+            requests.ConnectionError("reset"),
+            _response([201, 201]),
+        ]
+
+        with _writer(session) as writer:
+            writer.write(_body(2))
+
+        assert writer.report()["indexed"] == 2
+        assert writer.report()["retried"] == 2
+
+    def test_fails_whole_request_on_client_error(self, session):
+        session.post.return_value = MagicMock(status_code=413)
+
+        with _writer(session) as writer:
+            writer.write(_body(2))
+
+        session.post.assert_called_once()
+        assert writer.report()["failed"] == 2
+        assert writer.report()["errors"] == ["bulk request returned 413"]
+
+
+class TestReport:
+    def test_tallies_per_key(self, session):
+        session.post.return_value = _response([201, 201, 201, 400])
+
+        with _writer(session) as writer:
+            writer.write(_body(2), key="AAPL")
+            writer.write(_body(2, start=2), key="MSFT")
+
+        assert writer.keys["AAPL"] == {"indexed": 2, "failed": 0, "error": None}
+        assert writer.keys["MSFT"] == {
+            "indexed": 1,
+            "failed": 1,
+            "error": '{"type": "error_400"}',
+        }
+
+    def test_reports_throughput(self, session):
+        session.post.return_value = _response([201, 201])
+
+        with patch("app.utils.bulk_utils.time.monotonic", side_effect=[10.0, 12.0]):
+            with _writer(session) as writer:
+                writer.write(_body(2))
+
+        report = writer.report()
+        assert report["seconds"] == 2.0
+        assert report["docs_per_second"] == 1.0
+        assert report["bytes"] == len(_body(2))
@@ -1,7 +1,18 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
-from app.interface.api.cache_control import cache_control
+from app.domain.exceptions.base import NotModifiedError
+from app.interface.api.cache_control import (
+    ConditionalGetMiddleware,
+    cache_control,
+    check_generation_etag,
+    etag_matches,
+    newest_date,
+    payload_etag,
+)
 
 
 def test_cache_control_default():
@@ -44,3 +55,153 @@ def test_cache_control_zero():
 
     assert response.status_code == 200
     assert response.headers["Cache-Control"] == "public, max-age=0, s-maxage=0"
+
+
+def test_etag_matches():
+    assert etag_matches('"a", "b"', '"b"')
+    assert etag_matches('W/"b"', '"b"')
+    assert etag_matches("*", '"b"')
+    assert not etag_matches('"a"', '"b"')
+    assert not etag_matches(None, '"b"')
+
+
+def _generation_cache(generation):
+    cache = MagicMock()
+    cache.generation = AsyncMock(return_value=generation)
+    return cache
+
+
+@pytest.mark.asyncio
+async def test_generation_etag_is_set():
+    request = MagicMock(headers={})
+    response = MagicMock(
+        headers={"Cache-Control": "public, max-age=3600, s-maxage=3600"}
+    )
+
+    await check_generation_etag(
+        request, response, markets_result_cache=_generation_cache("3.1")
+    )
+
+    assert response.headers["ETag"] == '"markets-3.1"'
+
+
+@pytest.mark.asyncio
+async def test_generation_etag_not_modified():
+    request = MagicMock(headers={"If-None-Match": '"markets-3.1"'})
+    response = MagicMock(
+        headers={"Cache-Control": "public, max-age=3600, s-maxage=3600"}
+    )
+
+    with pytest.raises(NotModifiedError) as exc_info:
+        await check_generation_etag(
+            request, response, markets_result_cache=_generation_cache("3.1")
+        )
+
+    assert exc_info.value.status_code == 304
+    assert exc_info.value.headers["ETag"] == '"markets-3.1"'
+
+
+@pytest.mark.asyncio
+async def test_generation_etag_changes_with_generation():
+    request = MagicMock(headers={"If-None-Match": '"markets-3.1"'})
+    response = MagicMock(
+        headers={"Cache-Control": "public, max-age=3600, s-maxage=3600"}
+    )
+
+    await check_generation_etag(
+        request, response, markets_result_cache=_generation_cache("4.1")
+    )
+
+    assert response.headers["ETag"] == '"markets-4.1"'
+
+
+def _conditional_app(payload):
+    app = FastAPI()
+    app.add_middleware(ConditionalGetMiddleware)
+
+    @app.get(
+        "/news", dependencies=[cache_control(3600, etag=True, last_modified="date")]
+    )
+    def endpoint():
+        return payload
+
+    @app.get("/plain", dependencies=[cache_control(3600)])
+    def plain():
+        return payload
+
+    return TestClient(app)
+
+
+_NEWS = {
+    "items": [{"date": "2026-03-04T10:00:00"}, {"date": "2026-03-05T08:30:00"}],
+    "cursor": None,
+}
+
+
+def test_payload_etag_and_last_modified():
+    client = _conditional_app(_NEWS)
+
+    response = client.get("/news")
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] == payload_etag(response.content)
+    assert response.headers["Last-Modified"] == "Thu, 05 Mar 2026 08:30:00 GMT"
+    assert response.json() == _NEWS
+
+
+def test_if_none_match_returns_not_modified():
+    client = _conditional_app(_NEWS)
+    etag = client.get("/news").headers["ETag"]
+
+    response = client.get("/news", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+    assert response.headers["Cache-Control"] == "public, max-age=3600, s-maxage=3600"
+
+
+def test_if_none_match_takes_precedence_over_if_modified_since():
+    client = _conditional_app(_NEWS)
+
+    response = client.get(
+        "/news",
+        headers={
+            "If-None-Match": '"stale"',
+            "If-Modified-Since": "Thu, 05 Mar 2026 09:00:00 GMT",
+        },
+    )
+
+    assert response.status_code == 200
+
+
+def test_if_modified_since():
+    client = _conditional_app(_NEWS)
+
+    fresh = client.get(
+        "/news", headers={"If-Modified-Since": "Thu, 05 Mar 2026 08:30:00 GMT"}
+    )
+    stale = client.get(
+        "/news", headers={"If-Modified-Since": "Wed, 04 Mar 2026 00:00:00 GMT"}
+    )
+
+    assert fresh.status_code == 304
+    assert stale.status_code == 200
+
+
+def test_endpoints_without_opt_in_are_untouched():
+    client = _conditional_app(_NEWS)
+
+    response = client.get("/plain")
+
+    assert "ETag" not in response.headers
+    assert "Last-Modified" not in response.headers
+
+
+def test_newest_date_ignores_unparseable_values():
+    body = (
+        b'{"items": [{"date": "not a date"}, {"date": "2026-01-02"}, {}], "total": 2}'
+    )
+
+    assert newest_date(body, "date").isoformat() == "2026-01-02T00:00:00+00:00"
+    assert newest_date(b"[]", "date") is None
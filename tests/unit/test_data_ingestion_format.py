@@ -1,8 +1,13 @@
 """Tests for format_bulk_* functions and post_to_x in data_ingestion_utils."""
 import json
+import timeit
+from datetime import datetime, timedelta
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pandas as pd
+import pytest
+import requests
 
 from app.utils.data_ingestion_utils import (
     format_bulk_stocks_insider_trades,
@@ -12,10 +17,20 @@ from app.utils.data_ingestion_utils import (
     format_bulk_stocks_fundamental_cash_flow,
     format_bulk_stocks_fundamental_earnings_estimates,
     format_bulk_markets_news,
+    format_bulk_stocks_eod,
+    iter_bulk_ndjson,
+    iter_bulk_stocks_eod,
     post_to_x,
     _enrich_metadata_with_metrics,
     _finnhub_get,
-    _es_bulk_post,
+    _bulk_write,
+    bump_markets_generation,
+    ingest_stocks_eod_batch,
+    TokenBucket,
+    _iter_eod_alpaca,
+    _fetch_eod_alpaca,
+    _eod_fetch_plan,
+    _eod_high_water_marks,
 )
 
 
@@ -324,6 +339,121 @@ class TestFormatBulkMarketsNews:
         assert "reuters" in decoded
 
 
+class TestIterBulkNdjson:
+    def test_action_and_document_lines(self):
+        body = b"".join(iter_bulk_ndjson("idx", ["a", "b"], [{"x": 1}, {"x": None}]))
+        lines = body.decode("utf-8").splitlines()
+        assert [json.loads(line) for line in lines] == [
+            {"index": {"_index": "idx", "_id": "a"}}, {"x": 1},
+            {"index": {"_index": "idx", "_id": "b"}}, {"x": None},
+        ]
+        assert body.endswith(b"\n")
+
+    def test_chunks_end_on_document_boundaries(self):
+        docs = [{"n": i} for i in range(100)]
+        chunks = list(iter_bulk_ndjson("idx", [str(i) for i in range(100)], docs, chunk_bytes=256))
+        assert len(chunks) > 1
+        assert all(chunk.count(b"\n") % 2 == 0 for chunk in chunks)
+        assert sum(chunk.count(b"\n") for chunk in chunks) == 200
+
+    def test_stdlib_fallback_matches_orjson(self):
+        docs = [{"text": "caf\u00e9 \"q\"\n", "v": 1.5, "l": [1, None]}]
+        with_orjson = b"".join(iter_bulk_ndjson("idx", ["a"], docs))
+        with patch("app.utils.data_ingestion_utils.orjson", None):
+            with_json = b"".join(iter_bulk_ndjson("idx", ["a"], docs))
+        assert [json.loads(line) for line in with_orjson.splitlines()] == \
+            [json.loads(line) for line in with_json.splitlines()]
+
+
+class TestColumnarEodFormatting:
+    def test_missing_values_become_null(self):
+        df = pd.DataFrame({
+            "t": ["2025-01-10T05:00:00Z", "2025-01-11T05:00:00Z"],
+            "o": [150.0, np.nan],
+            "c": [152.0, 151.0],
+            "h": [np.nan, 155.0],
+            "l": [149.0, 149.0],
+            "v": [1000.0, np.nan],
+        })
+        lines = format_bulk_stocks_eod("AAPL", df, "latest").splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[0])["index"]["_id"] == "AAPL_2025-01-10"
+        assert json.loads(lines[1]) == {
+            "key_ticker": "AAPL",
+            "date_reference": "2025-01-10",
+            "val_open": 150.0,
+            "val_close": 152.0,
+            "val_high": None,
+            "val_low": 149.0,
+            "val_volume": 1000,
+        }
+
+    def test_empty_frame(self):
+        assert format_bulk_stocks_eod("AAPL", pd.DataFrame(), "latest") == b"\n"
+        assert list(iter_bulk_stocks_eod("AAPL", pd.DataFrame(), "latest")) == []
+
+
+def _format_eod_iterrows(ticker, df, index_suffix):
+    # the row-at-a-time formatter the columnar one replaced, kept as the benchmark baseline
+    lines = []
+    for _, row in df.iterrows():
+        date_reference = str(row.get('t')).split('T')[0]
+        meta = {"index": {"_index": f"quaks_stocks-eod_{index_suffix}", "_id": f"{ticker}_{date_reference}"}}
+        doc = {
+            "key_ticker": ticker,
+            "date_reference": date_reference,
+            "val_open": float(row.get('o')),
+            "val_close": float(row.get('c')),
+            "val_high": float(row.get('h')),
+            "val_low": float(row.get('l')),
+            "val_volume": int(row.get('v')),
+        }
+        lines.append(json.dumps(meta))
+        lines.append(json.dumps(doc))
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def _ohlcv_frame(rows):
+    dates = pd.date_range("1990-01-01", periods=rows, freq="D")
+    prices = np.linspace(10.0, 500.0, rows)
+    return pd.DataFrame({
+        "t": dates.strftime("%Y-%m-%dT05:00:00Z"),
+        "o": prices, "c": prices + 1, "h": prices + 2, "l": prices - 1,
+        "v": np.arange(rows) * 100,
+    })
+
+
+class TestBulkFormattingEquivalence:
+    def test_columnar_matches_iterrows(self):
+        df = _ohlcv_frame(1_000)
+        expected = _format_eod_iterrows("AAPL", df, "latest")
+        result = format_bulk_stocks_eod("AAPL", df, "latest")
+        assert [json.loads(line) for line in result.splitlines()] == \
+            [json.loads(line) for line in expected.splitlines()]
+
+
+@pytest.mark.benchmark
+class TestBulkFormattingThroughput:
+    """Benchmark of the columnar formatter against the iterrows baseline on 10k rows."""
+
+    ROWS = 10_000
+    REPEATS = 5
+
+    def _elapsed_ms(self, format_fn, df) -> float:
+        # best of several runs, to keep scheduler noise out of the figure
+        return min(timeit.repeat(lambda: format_fn("AAPL", df, "latest"), number=1, repeat=self.REPEATS)) * 1000
+
+    def test_columnar_against_iterrows(self):
+        df = _ohlcv_frame(self.ROWS)
+        iterrows_ms = self._elapsed_ms(_format_eod_iterrows, df)
+        columnar_ms = self._elapsed_ms(format_bulk_stocks_eod, df)
+
+        print(
+            f"\nEOD bulk formatting, {self.ROWS} rows: {iterrows_ms:.1f} ms iterrows, "
+            f"{columnar_ms:.1f} ms columnar ({iterrows_ms / columnar_ms:.1f}x)"
+        )
+
+
 class TestPostToX:
     @patch("app.utils.data_ingestion_utils.OAuth1Session")
     def test_successful_post(self, mock_oauth_cls):
@@ -389,8 +519,8 @@ class TestPostToX:
 
 class TestFinnhubGet:
     @patch("app.utils.data_ingestion_utils.requests.get")
-    @patch("app.utils.data_ingestion_utils._finnhub_request_times", [])
-    def test_basic_request(self, mock_get):
+    @patch("app.utils.data_ingestion_utils._FINNHUB_LIMITER")
+    def test_basic_request(self, mock_limiter, mock_get):
         mock_response = MagicMock()
         mock_response.json.return_value = {"data": []}
         mock_get.return_value = mock_response
@@ -398,14 +528,324 @@ class TestFinnhubGet:
         with patch.dict("os.environ", {"FINNHUB_API_KEY": "test_key"}):
             result = _finnhub_get("/test/path", {"symbol": "AAPL"})
         assert result == {"data": []}
+        mock_limiter.acquire.assert_called_once()
+
+
+class TestBulkWrite:
+    @patch("app.utils.bulk_utils.shared_session")
+    def test_posts_data_and_reports(self, mock_session):
+        mock_session.return_value.post.return_value = _bulk_response([201])
+
+        with patch.dict("os.environ", {"ELASTICSEARCH_URL": "http://es:9200", "ELASTICSEARCH_API_KEY": "key"}):
+            report = _bulk_write(b'{"index":{"_index":"idx","_id":"1"}}\n{"a":1}\n')
+
+        assert report["indexed"] == 1
+        assert report["failed"] == 0
+        assert mock_session.return_value.post.call_args.args[0] == "http://es:9200/_bulk"
+
+    @patch("app.utils.bulk_utils.shared_session")
+    def test_empty_body_sends_nothing(self, mock_session):
+        report = _bulk_write(b"")
+
+        assert report["indexed"] == 0
+        assert report["requests"] == 0
+        mock_session.return_value.post.assert_not_called()
+
+
+class TestBumpMarketsGeneration:
+    @patch("app.utils.data_ingestion_utils.redis.Redis.from_url")
+    def test_increments_generation(self, mock_from_url):
+        mock_from_url.return_value.incr.return_value = 7
+
+        with patch.dict("os.environ", {"BROKER_URL": "redis://redis:6379/0"}):
+            assert bump_markets_generation() == 7
+        mock_from_url.return_value.incr.assert_called_once_with("quaks:markets:generation")
+
+    @patch("app.utils.data_ingestion_utils.redis.Redis.from_url")
+    def test_skips_without_broker(self, mock_from_url):
+        with patch.dict("os.environ", {}, clear=True):
+            assert bump_markets_generation() is None
+        mock_from_url.assert_not_called()
+
+
+class TestTokenBucket:
+    def test_allows_burst_up_to_capacity(self):
+        bucket = TokenBucket(rate=3, per=60)
+        with patch("app.utils.data_ingestion_utils.time.sleep") as mock_sleep:
+            for _ in range(3):
+                bucket.acquire()
+        mock_sleep.assert_not_called()
+
+    def test_waits_for_refill_when_empty(self):
+        bucket = TokenBucket(rate=60, per=60, capacity=1)
+        clock = [0.0]
+
+        def sleep(seconds):
+            clock[0] += seconds
 
+        with patch("app.utils.data_ingestion_utils.time.monotonic", side_effect=lambda: clock[0]), \
+                patch("app.utils.data_ingestion_utils.time.sleep", side_effect=sleep):
+            bucket._updated_at = 0.0
+            bucket.acquire()
+            bucket.acquire()
+
+        assert clock[0] == 1.0
+
+
+def _bars(closes):
+    return pd.DataFrame({
+        "t": [f"2025-01-0{i + 1}T05:00:00Z" for i in range(len(closes))],
+        "o": closes, "c": closes, "h": closes, "l": closes, "v": [100] * len(closes),
+    })
+
+
+def _bulk_response(statuses):
+    response = MagicMock(status_code=200)
+    response.json.return_value = {
+        "errors": any(status >= 300 for status in statuses),
+        "items": [
+            {"index": {"status": status, **({"error": {"type": "mapper_parsing_exception"}} if status >= 300 else {})}}
+            for status in statuses
+        ],
+    }
+    return response
+
+
+def _alpaca_bars(bars_by_ticker):
+    def iter_bars(tickers, start_date, end_date):
+        for ticker in tickers:
+            if ticker in bars_by_ticker:
+                yield ticker, bars_by_ticker[ticker]
+    return iter_bars
+
+
+def _alpaca_page(bars, next_page_token=None):
+    response = MagicMock(status_code=200)
+    response.json.return_value = {"bars": bars, "next_page_token": next_page_token}
+    return response
+
+
+class TestIterEodAlpaca:
+    @patch("app.utils.data_ingestion_utils._ALPACA_LIMITER", MagicMock())
+    @patch("app.utils.data_ingestion_utils.requests.get")
+    def test_follows_pages_and_yields_completed_symbols(self, mock_get):
+        bar = {"t": "2025-01-02T05:00:00Z", "o": 1.0, "c": 1.0, "h": 1.0, "l": 1.0, "v": 1}
+        mock_get.side_effect = [
+            _alpaca_page({"AAPL": [bar, bar], "MSFT": [bar]}, next_page_token="p2"),
+            _alpaca_page({"MSFT": [bar, bar]}),
+        ]
+
+        bars = {ticker: len(df) for ticker, df in _iter_eod_alpaca(["AAPL", "MSFT", "NVDA"], "2025-01-01", "2025-01-31")}
+
+        assert bars == {"AAPL": 2, "MSFT": 3}
+        assert mock_get.call_count == 2
+        assert mock_get.call_args_list[0].kwargs["params"]["symbols"] == "AAPL,MSFT,NVDA"
+        assert mock_get.call_args_list[1].kwargs["params"]["page_token"] == "p2"
+
+    @patch("app.utils.data_ingestion_utils.time.sleep")
+    @patch("app.utils.data_ingestion_utils._ALPACA_LIMITER", MagicMock())
+    @patch("app.utils.data_ingestion_utils.requests.get")
+    def test_retries_throttled_pages(self, mock_get, mock_sleep):
+        bar = {"t": "2025-01-02T05:00:00Z", "o": 1.0, "c": 1.0, "h": 1.0, "l": 1.0, "v": 1}
+        mock_get.side_effect = [MagicMock(status_code=429), MagicMock(status_code=503), _alpaca_page({"AAPL": [bar]})]
+
+        bars = {ticker: len(df) for ticker, df in _iter_eod_alpaca(["AAPL"], "2025-01-01", "2025-01-31")}
+
+        assert bars == {"AAPL": 1}
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.5, 1.0]
+
+    @patch("app.utils.data_ingestion_utils.time.sleep")
+    @patch("app.utils.data_ingestion_utils._ALPACA_LIMITER", MagicMock())
+    @patch("app.utils.data_ingestion_utils.requests.get")
+    def test_failed_page_raises_without_truncated_symbol(self, mock_get, mock_sleep):
+        bar = {"t": "2025-01-02T05:00:00Z", "o": 1.0, "c": 1.0, "h": 1.0, "l": 1.0, "v": 1}
+        mock_get.side_effect = [
+            _alpaca_page({"AAPL": [bar], "MSFT": [bar]}, next_page_token="p2"),
+        ] + [MagicMock(status_code=429)] * 4
+
+        yielded = []
+        with pytest.raises(requests.HTTPError):
+            for ticker, _ in _iter_eod_alpaca(["AAPL", "MSFT"], "2025-01-01", "2025-01-31"):
+                yielded.append(ticker)
+
+        # MSFT may continue on the failed page, so only AAPL is complete
+        assert yielded == ["AAPL"]
+        assert mock_get.call_count == 5
+
+    @patch("app.utils.data_ingestion_utils._ALPACA_LIMITER", MagicMock())
+    @patch("app.utils.data_ingestion_utils.requests.get")
+    def test_client_errors_are_not_retried(self, mock_get):
+        mock_get.return_value = MagicMock(status_code=403)
+
+        with pytest.raises(requests.HTTPError):
+            list(_iter_eod_alpaca(["AAPL"], "2025-01-01", "2025-01-31"))
+        mock_get.assert_called_once()
+
+    @patch("app.utils.data_ingestion_utils._ALPACA_LIMITER", MagicMock())
+    @patch("app.utils.data_ingestion_utils.requests.get")
+    def test_single_ticker_fetch_leaves_failures_to_the_fallback(self, mock_get):
+        mock_get.return_value = MagicMock(status_code=403)
+
+        assert _fetch_eod_alpaca("AAPL", "2025-01-01", "2025-01-31") is None
+
+
+class TestIngestStocksEodBatch:
+    COMPANIES = [
+        {"key_ticker": "AAPL", "index": "latest"},
+        {"key_ticker": "MSFT", "index": "latest"},
+        {"key_ticker": "XXXX", "index": "latest"},
+    ]
+
+    @patch("app.utils.bulk_utils.shared_session")
+    @patch("app.utils.data_ingestion_utils._fetch_eod_finnhub")
+    @patch("app.utils.data_ingestion_utils._iter_eod_alpaca")
+    def test_reports_each_ticker(self, mock_alpaca, mock_finnhub, mock_session):
+        mock_post = mock_session.return_value.post
+        mock_alpaca.side_effect = _alpaca_bars({"AAPL": _bars([1.0, 2.0])})
+        mock_finnhub.side_effect = lambda ticker, *_: _bars([3.0]) if ticker == "MSFT" else None
+        mock_post.side_effect = lambda url, data, **_: _bulk_response([201] * (data.count(b"\n") // 2))
+
+        report = ingest_stocks_eod_batch(self.COMPANIES, incremental=False)
+
+        assert report["AAPL"] == {"source": "alpaca", "indexed": 2, "failed": 0, "error": None}
+        assert report["MSFT"] == {"source": "finnhub", "indexed": 1, "failed": 0, "error": None}
+        assert report["XXXX"]["error"] == "no data"
+        # one Alpaca request for the chunk, Finnhub only for the symbols it missed
+        mock_alpaca.assert_called_once()
+        assert [c.args[0] for c in mock_finnhub.call_args_list] == ["MSFT", "XXXX"]
+        # both tickers share a single _bulk request
+        mock_post.assert_called_once()
+
+    @patch("app.utils.bulk_utils.shared_session")
+    @patch("app.utils.data_ingestion_utils._fetch_eod_finnhub", return_value=None)
+    @patch("app.utils.data_ingestion_utils._iter_eod_alpaca")
+    def test_requests_symbols_in_chunks(self, mock_alpaca, mock_finnhub, mock_session):
+        mock_post = mock_session.return_value.post
+        mock_alpaca.side_effect = _alpaca_bars({t["key_ticker"]: _bars([1.0]) for t in self.COMPANIES})
+        mock_post.side_effect = lambda url, data, **_: _bulk_response([201] * (data.count(b"\n") // 2))
+
+        report = ingest_stocks_eod_batch(self.COMPANIES, incremental=False, symbols_per_request=2)
+
+        assert sorted(len(c.args[0]) for c in mock_alpaca.call_args_list) == [1, 2]
+        assert all(entry["indexed"] == 1 for entry in report.values())
+        mock_finnhub.assert_not_called()
+
+    @patch("app.utils.bulk_utils.shared_session")
+    @patch("app.utils.data_ingestion_utils._fetch_eod_finnhub", return_value=None)
+    @patch("app.utils.data_ingestion_utils._iter_eod_alpaca")
+    def test_splits_batches_by_doc_count(self, mock_alpaca, mock_finnhub, mock_session):
+        mock_post = mock_session.return_value.post
+        mock_alpaca.side_effect = _alpaca_bars({t["key_ticker"]: _bars([1.0, 2.0]) for t in self.COMPANIES})
+        mock_post.side_effect = lambda url, data, **_: _bulk_response([201] * (data.count(b"\n") // 2))
+
+        report = ingest_stocks_eod_batch(self.COMPANIES, incremental=False, max_docs=2)
+
+        assert mock_post.call_count == 3
+        assert all(entry["indexed"] == 2 for entry in report.values())
+
+    @patch("app.utils.bulk_utils.shared_session")
+    @patch("app.utils.data_ingestion_utils._fetch_eod_finnhub", return_value=None)
+    @patch("app.utils.data_ingestion_utils._iter_eod_alpaca")
+    def test_attributes_item_failures_to_tickers(self, mock_alpaca, mock_finnhub, mock_session):
+        mock_post = mock_session.return_value.post
+        mock_alpaca.side_effect = _alpaca_bars({"AAPL": _bars([1.0, 2.0]), "MSFT": _bars([1.0, 2.0])})
+        mock_post.return_value = _bulk_response([201, 201, 201, 400])
+
+        report = ingest_stocks_eod_batch(self.COMPANIES[:2], incremental=False)
+
+        assert report["AAPL"]["indexed"] == 2
+        assert report["MSFT"]["indexed"] == 1
+        assert report["MSFT"]["failed"] == 1
+        assert "mapper_parsing_exception" in report["MSFT"]["error"]
+
+    @patch("app.utils.bulk_utils.shared_session")
+    @patch("app.utils.data_ingestion_utils._fetch_eod_finnhub", side_effect=ConnectionError("finnhub down"))
+    @patch("app.utils.data_ingestion_utils._iter_eod_alpaca", side_effect=ConnectionError("alpaca down"))
+    def test_fetch_errors_do_not_stop_the_run(self, mock_alpaca, mock_finnhub, mock_session):
+        mock_post = mock_session.return_value.post
+        report = ingest_stocks_eod_batch(self.COMPANIES[:1], incremental=False)
+
+        assert report["AAPL"]["error"] == "fetch failed: finnhub down"
+        mock_post.assert_not_called()
+
+
+class TestIncrementalStocksEod:
+    COMPANIES = TestIngestStocksEodBatch.COMPANIES
 
-class TestEsBulkPost:
     @patch("app.utils.data_ingestion_utils.requests.post")
-    def test_posts_data(self, mock_post):
-        mock_response = MagicMock()
-        mock_post.return_value = mock_response
+    def test_high_water_marks_use_one_aggregation(self, mock_post):
+        mock_post.return_value.json.return_value = {
+            "aggregations": {"by_ticker": {"buckets": [
+                {"key": "AAPL", "latest": {"value": 1.7e12, "value_as_string": "2025-01-02"}},
+                {"key": "MSFT", "latest": {"value": None}},
+            ]}}
+        }
 
         with patch.dict("os.environ", {"ELASTICSEARCH_URL": "http://es:9200", "ELASTICSEARCH_API_KEY": "key"}):
-            result = _es_bulk_post(b"test data")
-        assert result is mock_response
+            marks = _eod_high_water_marks(["AAPL", "MSFT"])
+
+        assert marks == {"AAPL": "2025-01-02"}
+        mock_post.assert_called_once()
+        assert mock_post.call_args.kwargs["url"] == "http://es:9200/quaks_stocks-eod_*/_search"
+        body = json.loads(mock_post.call_args.kwargs["data"])
+        assert body["aggs"]["by_ticker"]["aggs"]["latest"]["max"]["field"] == "date_reference"
+
+    @patch("app.utils.data_ingestion_utils._eod_date_range", return_value=("2024-01-10", "2025-01-10"))
+    @patch("app.utils.data_ingestion_utils._eod_high_water_marks")
+    def test_plan_fetches_only_missing_ranges(self, mock_marks, mock_range):
+        mock_marks.return_value = {"AAPL": "2025-01-08", "MSFT": "2025-01-10"}
+
+        plan = _eod_fetch_plan(self.COMPANIES, incremental=True)
+
+        assert [(start, end, fallback, [c["key_ticker"] for c in group]) for start, end, fallback, group in plan] == [
+            ("2025-01-09", "2025-01-10", False, ["AAPL"]),
+            ("2024-01-10", "2025-01-10", True, ["XXXX"]),
+        ]
+
+    @patch("app.utils.data_ingestion_utils._eod_date_range", return_value=("2024-01-10", "2025-01-10"))
+    @patch("app.utils.data_ingestion_utils._eod_high_water_marks")
+    def test_full_mode_skips_high_water_marks(self, mock_marks, mock_range):
+        plan = _eod_fetch_plan(self.COMPANIES, incremental=False)
+
+        assert plan == [("2024-01-10", "2025-01-10", True, self.COMPANIES)]
+        mock_marks.assert_not_called()
+
+    @patch("app.utils.bulk_utils.shared_session")
+    @patch("app.utils.data_ingestion_utils._fetch_eod_finnhub")
+    @patch("app.utils.data_ingestion_utils._iter_eod_alpaca")
+    @patch("app.utils.data_ingestion_utils._eod_high_water_marks")
+    def test_indexes_only_new_bars(self, mock_marks, mock_alpaca, mock_finnhub, mock_session):
+        mock_post = mock_session.return_value.post
+        yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+        two_days_ago = (datetime.now() - timedelta(days=2)).strftime("%Y-%m-%d")
+        mock_marks.return_value = {"AAPL": two_days_ago, "MSFT": two_days_ago, "XXXX": yesterday}
+        mock_alpaca.side_effect = _alpaca_bars({"AAPL": _bars([1.0])})
+        mock_post.side_effect = lambda url, data, **_: _bulk_response([201] * (data.count(b"\n") // 2))
+
+        report = ingest_stocks_eod_batch(self.COMPANIES)
+
+        assert mock_alpaca.call_args.args == (["AAPL", "MSFT"], yesterday, yesterday)
+        assert report["AAPL"]["indexed"] == 1
+        # no new bar yet is not an error, and does not hit Finnhub
+        assert report["MSFT"] == {"source": None, "indexed": 0, "failed": 0, "error": None}
+        assert report["XXXX"] == {"source": None, "indexed": 0, "failed": 0, "error": None}
+        mock_finnhub.assert_not_called()
+
+    @patch("app.utils.bulk_utils.shared_session")
+    @patch("app.utils.data_ingestion_utils._fetch_eod_finnhub")
+    @patch("app.utils.data_ingestion_utils._iter_eod_alpaca")
+    @patch("app.utils.data_ingestion_utils._eod_high_water_marks")
+    def test_alpaca_failure_falls_back_for_incremental_tickers(self, mock_marks, mock_alpaca, mock_finnhub, mock_session):
+        mock_post = mock_session.return_value.post
+        two_days_ago = (datetime.now() - timedelta(days=2)).strftime("%Y-%m-%d")
+        mock_marks.return_value = {"AAPL": two_days_ago, "MSFT": two_days_ago}
+        mock_alpaca.side_effect = requests.HTTPError("Alpaca bars request failed with 503")
+        mock_finnhub.side_effect = lambda ticker, *_: _bars([1.0]) if ticker == "AAPL" else None
+        mock_post.side_effect = lambda url, data, **_: _bulk_response([201] * (data.count(b"\n") // 2))
+
+        report = ingest_stocks_eod_batch(self.COMPANIES[:2])
+
+        assert report["AAPL"] == {"source": "finnhub", "indexed": 1, "failed": 0, "error": None}
+        # without Alpaca there is no telling whether MSFT simply has no new bar
+        assert report["MSFT"]["error"] == "fetch failed: Alpaca bars request failed with 503"
+        assert [c.args[0] for c in mock_finnhub.call_args_list] == ["AAPL", "MSFT"]
@@ -38,7 +38,7 @@ class TestGetList:
             id="att-2", file_name="notes.txt", embeddings_collection="my_col"
         )
         service = MagicMock()
-        service.get_attachments.return_value = [att1, att2]
+        service.get_attachments = AsyncMock(return_value=[att1, att2])
         user = _make_user()
 
         result = await get_list(attachment_service=service, user=user)
@@ -54,7 +54,7 @@ class TestGetList:
     @pytest.mark.asyncio
     async def test_returns_empty_list(self):
         service = MagicMock()
-        service.get_attachments.return_value = []
+        service.get_attachments = AsyncMock(return_value=[])
         user = _make_user()
 
         result = await get_list(attachment_service=service, user=user)
@@ -65,7 +65,7 @@ class TestGetList:
     @pytest.mark.asyncio
     async def test_schema_derived_from_user_id(self):
         service = MagicMock()
-        service.get_attachments.return_value = []
+        service.get_attachments = AsyncMock(return_value=[])
         user = _make_user(user_id="11-22-33-44")
 
         await get_list(attachment_service=service, user=user)
@@ -75,7 +75,7 @@ class TestGetList:
     @pytest.mark.asyncio
     async def test_public_schema_when_user_none(self):
         service = MagicMock()
-        service.get_attachments.return_value = []
+        service.get_attachments = AsyncMock(return_value=[])
 
         await get_list(attachment_service=service, user=None)
 
@@ -0,0 +1,143 @@
+import asyncio
+import json
+import threading
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services.agent_types.quaks.insights.financial_analyst.v1.market_data import (
+    collect_market_data,
+    collect_market_data_async,
+    format_market_data,
+)
+
+
+def _news_hit(headline):
+    return {
+        "_source": {
+            "text_headline": headline,
+            "text_summary": "s",
+            "key_source": "wire",
+            "date_reference": "d",
+        }
+    }
+
+
+def _sync_services():
+    stats = MagicMock()
+    stats.get_company_profile.side_effect = lambda index_name, key_ticker: {
+        "key_ticker": key_ticker
+    }
+    stats.get_stats_close_bulk.return_value = [
+        {"key_ticker": "AAPL", "close": 1.0},
+        {"key_ticker": "MSFT", "close": 2.0},
+    ]
+    stats.get_indicators_by_ticker.return_value = {
+        "AAPL": {"rsi": []},
+        "MSFT": {"rsi": []},
+    }
+    news = MagicMock()
+    news.get_news.side_effect = lambda key_ticker, **kwargs: (
+        [_news_hit(key_ticker)],
+        None,
+    )
+    return stats, news
+
+
+class TestCollectMarketData:
+    def test_assembles_one_entry_per_ticker(self):
+        stats, news = _sync_services()
+
+        data = collect_market_data(stats, news, ["AAPL", "MSFT"])
+
+        assert list(data) == ["AAPL", "MSFT"]
+        assert data["MSFT"]["profile"] == {"key_ticker": "MSFT"}
+        assert data["MSFT"]["stats_close"]["close"] == 2.0
+        assert data["AAPL"]["indicators"] == {"rsi": []}
+        assert data["AAPL"]["news"] == [
+            {"headline": "AAPL", "summary": "s", "source": "wire", "date": "d"}
+        ]
+        stats.get_stats_close_bulk.assert_called_once()
+        stats.get_indicators_by_ticker.assert_called_once()
+        assert stats.get_company_profile.call_count == 2
+
+    def test_fetches_tickers_concurrently(self):
+        stats, news = _sync_services()
+        barrier = threading.Barrier(2, timeout=5)
+
+        def profile(index_name, key_ticker):
+            barrier.wait()
+            return {"key_ticker": key_ticker}
+
+        stats.get_company_profile.side_effect = profile
+
+        data = collect_market_data(stats, news, ["AAPL", "MSFT"], max_concurrency=4)
+
+        assert data["AAPL"]["profile"] == {"key_ticker": "AAPL"}
+
+    def test_failed_lookup_is_recorded_as_missing(self):
+        stats, news = _sync_services()
+        stats.get_company_profile.side_effect = RuntimeError("es down")
+        stats.get_indicators_by_ticker.side_effect = RuntimeError("es down")
+
+        data = collect_market_data(stats, news, ["AAPL"])
+
+        assert data["AAPL"]["profile"] is None
+        assert data["AAPL"]["indicators"] is None
+        assert data["AAPL"]["stats_close"]["close"] == 1.0
+
+    def test_no_tickers(self):
+        stats, news = _sync_services()
+
+        assert collect_market_data(stats, news, []) == {}
+        stats.get_stats_close_bulk.assert_not_called()
+
+
+class TestCollectMarketDataAsync:
+    @pytest.mark.asyncio
+    async def test_caps_concurrent_lookups(self):
+        running = 0
+        peak = 0
+
+        async def profile(index_name, key_ticker):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return {"key_ticker": key_ticker}
+
+        stats = MagicMock()
+        stats.get_company_profile = profile
+        stats.get_stats_close_bulk = AsyncMock(return_value=[])
+        stats.get_indicators_by_ticker = AsyncMock(return_value={})
+        news = MagicMock()
+        news.get_news = AsyncMock(return_value=([], None))
+        tickers = ["AAPL", "MSFT", "NVDA", "AMZN", "META"]
+
+        data = await collect_market_data_async(stats, news, tickers, max_concurrency=2)
+
+        assert peak <= 2
+        assert [data[t]["profile"]["key_ticker"] for t in tickers] == tickers
+
+    @pytest.mark.asyncio
+    async def test_failed_lookup_is_recorded_as_missing(self):
+        stats = MagicMock()
+        stats.get_company_profile = AsyncMock(return_value={"key_ticker": "AAPL"})
+        stats.get_stats_close_bulk = AsyncMock(side_effect=RuntimeError("es down"))
+        stats.get_indicators_by_ticker = AsyncMock(return_value={"AAPL": {"rsi": []}})
+        news = MagicMock()
+        news.get_news = AsyncMock(return_value=([_news_hit("h")], None))
+
+        data = await collect_market_data_async(stats, news, ["AAPL"])
+
+        assert data["AAPL"]["stats_close"] is None
+        assert data["AAPL"]["indicators"] == {"rsi": []}
+        assert data["AAPL"]["news"][0]["headline"] == "h"
+
+
+def test_format_market_data_is_compact_json():
+    text = format_market_data({"AAPL": {"profile": {"pe": 30.5}, "news": []}})
+
+    assert " " not in text
+    assert json.loads(text)["AAPL"]["profile"]["pe"] == 30.5
@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -53,6 +53,13 @@ def _capturing_mcp():
     return mcp, tools, prompts, resources
 
 
+def _async_container():
+    """Container mock whose async markets services return awaitable mocks."""
+    container = MagicMock()
+    container.async_markets_stats_service.return_value = AsyncMock()
+    return container
+
+
 class TestRenderPrompt:
     def test_renders_with_current_time(self):
         result = _render_prompt(
@@ -149,8 +156,8 @@ class TestFinancialAnalystV1ToolRegistrar:
 class TestFetchCompanyProfileMcp:
     @pytest.mark.asyncio
     async def test_calls_service_with_uppercased_ticker(self):
-        container = MagicMock()
-        container.markets_stats_service.return_value.get_company_profile.return_value = {
+        container = _async_container()
+        container.async_markets_stats_service.return_value.get_company_profile.return_value = {
             "name": "Apple",
             "sector": "Technology",
         }
@@ -162,11 +169,9 @@ class TestFetchCompanyProfileMcp:
         result = await tools["fetch_company_profile_mcp"](ticker="aapl")
 
         assert result == {"name": "Apple", "sector": "Technology"}
-        call_kwargs = (
-            container.markets_stats_service.return_value.get_company_profile.call_args[
-                1
-            ]
-        )
+        call_kwargs = container.async_markets_stats_service.return_value.get_company_profile.call_args[
+            1
+        ]
         assert call_kwargs["key_ticker"] == "AAPL"
         assert call_kwargs["index_name"] == "quaks_stocks-metadata_latest"
 
@@ -174,8 +179,8 @@ class TestFetchCompanyProfileMcp:
 class TestFetchStatsCloseMcp:
     @pytest.mark.asyncio
     async def test_defaults_date_range(self):
-        container = MagicMock()
-        container.markets_stats_service.return_value.get_stats_close.return_value = {
+        container = _async_container()
+        container.async_markets_stats_service.return_value.get_stats_close.return_value = {
             "latest_close": 100
         }
         mcp, tools, _, _ = _capturing_mcp()
@@ -186,17 +191,17 @@ class TestFetchStatsCloseMcp:
         result = await tools["fetch_stats_close_mcp"](ticker="AAPL")
 
         assert result == {"latest_close": 100}
-        call_kwargs = (
-            container.markets_stats_service.return_value.get_stats_close.call_args[1]
-        )
+        call_kwargs = container.async_markets_stats_service.return_value.get_stats_close.call_args[
+            1
+        ]
         assert call_kwargs["start_date"] is not None
         assert call_kwargs["end_date"] is not None
         assert call_kwargs["key_ticker"] == "AAPL"
 
     @pytest.mark.asyncio
     async def test_explicit_date_range(self):
-        container = MagicMock()
-        container.markets_stats_service.return_value.get_stats_close.return_value = {}
+        container = _async_container()
+        container.async_markets_stats_service.return_value.get_stats_close.return_value = {}
         mcp, tools, _, _ = _capturing_mcp()
         FinancialAnalystV1ToolRegistrar(_passthrough_resolver()).register_tools(
             mcp, container
@@ -206,22 +211,24 @@ class TestFetchStatsCloseMcp:
             ticker="MSFT", start_date="2026-01-01", end_date="2026-04-01"
         )
 
-        call_kwargs = (
-            container.markets_stats_service.return_value.get_stats_close.call_args[1]
-        )
+        call_kwargs = container.async_markets_stats_service.return_value.get_stats_close.call_args[
+            1
+        ]
         assert call_kwargs["start_date"] == "2026-01-01"
         assert call_kwargs["end_date"] == "2026-04-01"
 
 
 class TestFetchTechnicalIndicatorsMcp:
     @pytest.mark.asyncio
-    async def test_calls_all_four_indicators(self):
-        container = MagicMock()
-        svc = container.markets_stats_service.return_value
-        svc.get_indicator_rsi.return_value = {"rsi": 50}
-        svc.get_indicator_macd.return_value = {"macd": 1}
-        svc.get_indicator_ema.return_value = {"ema": 2}
-        svc.get_indicator_adx.return_value = {"adx": 3}
+    async def test_fetches_all_four_indicators_in_one_call(self):
+        container = _async_container()
+        svc = container.async_markets_stats_service.return_value
+        svc.get_indicators_bulk.return_value = {
+            "rsi": [{"rsi": 50}],
+            "macd": [{"macd": 1}],
+            "ema": [{"ema_short": 2}],
+            "adx": [{"adx": 3}],
+        }
         mcp, tools, _, _ = _capturing_mcp()
         FinancialAnalystV1ToolRegistrar(_passthrough_resolver()).register_tools(
             mcp, container
@@ -230,21 +237,24 @@ class TestFetchTechnicalIndicatorsMcp:
         result = await tools["fetch_technical_indicators_mcp"](ticker="nvda")
 
         assert set(result.keys()) == {"rsi", "macd", "ema", "adx"}
-        assert svc.get_indicator_rsi.call_args[1]["key_ticker"] == "NVDA"
-        assert svc.get_indicator_rsi.call_args[1]["period"] == 14
-        assert svc.get_indicator_macd.call_args[1]["short_window"] == 12
-        assert svc.get_indicator_macd.call_args[1]["long_window"] == 26
-        assert svc.get_indicator_macd.call_args[1]["signal_window"] == 9
-        assert svc.get_indicator_ema.call_args[1]["short_window"] == 10
-        assert svc.get_indicator_ema.call_args[1]["long_window"] == 20
-        assert svc.get_indicator_adx.call_args[1]["period"] == 14
+        svc.get_indicators_bulk.assert_awaited_once()
+        call_kwargs = svc.get_indicators_bulk.call_args[1]
+        assert call_kwargs["key_ticker"] == "NVDA"
+        specs = {spec["indicator"]: spec for spec in call_kwargs["specs"]}
+        assert specs["rsi"]["period"] == 14
+        assert specs["macd"]["short_window"] == 12
+        assert specs["macd"]["long_window"] == 26
+        assert specs["macd"]["signal_window"] == 9
+        assert specs["ema"]["short_window"] == 10
+        assert specs["ema"]["long_window"] == 20
+        assert specs["adx"]["period"] == 14
 
 
 class TestFetchPortfolioXrayMcp:
     @pytest.mark.asyncio
     async def test_returns_text_summary(self):
-        container = MagicMock()
-        container.markets_stats_service.return_value.get_company_profile.return_value = {
+        container = _async_container()
+        container.async_markets_stats_service.return_value.get_company_profile.return_value = {
             "name": "Apple",
             "sector": "Technology",
             "country": "US",
@@ -263,8 +273,8 @@ class TestFetchPortfolioXrayMcp:
 
     @pytest.mark.asyncio
     async def test_empty_profiles_returns_fallback(self):
-        container = MagicMock()
-        container.markets_stats_service.return_value.get_company_profile.return_value = {}
+        container = _async_container()
+        container.async_markets_stats_service.return_value.get_company_profile.return_value = {}
         mcp, tools, _, _ = _capturing_mcp()
         FinancialAnalystV1ToolRegistrar(_passthrough_resolver()).register_tools(
             mcp, container
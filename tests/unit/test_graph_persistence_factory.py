@@ -0,0 +1,178 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+
+from app.infrastructure.database.checkpoints import (
+    CheckpointRetention,
+    CheckpointThreads,
+    GraphPersistenceFactory,
+)
+
+
+@pytest.fixture
+def factory():
+    with patch("app.infrastructure.database.checkpoints.ConnectionPool"), patch(
+        "app.infrastructure.database.checkpoints.PostgresSaver"
+    ):
+        yield GraphPersistenceFactory(
+            db_checkpoints="postgresql://localhost/checkpoints"
+        )
+
+
+class TestAsyncCheckpointSaver:
+    @pytest.mark.asyncio
+    async def test_async_pool_is_opened_once(self, factory):
+        with patch(
+            "app.infrastructure.database.checkpoints.AsyncConnectionPool"
+        ) as pool_cls:
+            pool = MagicMock()
+            pool.open = AsyncMock()
+            pool_cls.return_value = pool
+
+            first = await factory.build_async_checkpoint_saver()
+            second = await factory.build_async_checkpoint_saver()
+
+        assert isinstance(first, AsyncPostgresSaver)
+        assert first.conn is pool and second.conn is pool
+        pool_cls.assert_called_once()
+        assert pool_cls.call_args.kwargs["open"] is False
+        pool.open.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_async_pool(self, factory):
+        pool = MagicMock()
+        pool.close = AsyncMock()
+        factory.async_pool = pool
+
+        await factory.aclose()
+
+        pool.close.assert_awaited_once()
+        assert factory.async_pool is None
+
+    @pytest.mark.asyncio
+    async def test_aclose_without_async_pool(self, factory):
+        await factory.aclose()
+
+        assert factory.async_pool is None
+
+
+class TestCheckpointThreads:
+    def test_agent_mode_keeps_one_thread(self):
+        threads = CheckpointThreads()
+
+        assert threads.thread_id("agent-1") == "agent-1"
+
+    def test_run_mode_uses_a_thread_per_call(self):
+        threads = CheckpointThreads(mode="run")
+
+        first, second = threads.thread_id("agent-1"), threads.thread_id("agent-1")
+
+        assert first.startswith("agent-1:") and second.startswith("agent-1:")
+        assert first != second
+
+    def test_rolling_mode_changes_thread_per_window(self):
+        threads = CheckpointThreads(mode="rolling", rolling_hours=1)
+
+        with patch(
+            "app.infrastructure.database.checkpoints.time.time",
+            side_effect=[7200, 10799, 10800],
+        ):
+            ids = [threads.thread_id("agent-1") for _ in range(3)]
+
+        assert ids == ["agent-1:2", "agent-1:2", "agent-1:3"]
+
+    def test_unknown_mode(self):
+        with pytest.raises(ValueError):
+            CheckpointThreads(mode="forever")
+
+
+def _pool(cursor):
+    conn = MagicMock()
+    conn.cursor.return_value.__enter__.return_value = cursor
+    pool = MagicMock()
+    pool.connection.return_value.__enter__.return_value = conn
+    return pool
+
+
+class TestCheckpointRetention:
+    def test_compact_prunes_in_one_transaction(self):
+        cursor = MagicMock(rowcount=3)
+        cursor.fetchone.return_value = (True,)
+        pool = _pool(cursor)
+
+        result = CheckpointRetention(pool, keep_last=5).compact()
+
+        statements = [c.args[0] for c in cursor.execute.call_args_list]
+        assert "pg_try_advisory_xact_lock" in statements[0]
+        assert "CREATE TEMP TABLE pruned_checkpoints" in statements[1]
+        assert cursor.execute.call_args_list[1].args[1] == {
+            "keep_last": 5,
+            "cutoff": None,
+        }
+        assert [s.split()[2] for s in statements[2:]] == [
+            "checkpoint_writes",
+            "checkpoints",
+            "checkpoint_blobs",
+        ]
+        assert (result["checkpoints"], result["writes"], result["blobs"]) == (3, 3, 3)
+        pool.connection.return_value.__enter__.return_value.transaction.assert_called_once()
+
+    def test_compact_uses_age_cutoff(self):
+        cursor = MagicMock(rowcount=0)
+        cursor.fetchone.return_value = (True,)
+
+        CheckpointRetention(_pool(cursor), max_age_days=30).compact()
+
+        params = cursor.execute.call_args_list[1].args[1]
+        assert params["keep_last"] is None
+        assert (
+            timedelta(days=29)
+            < datetime.now(timezone.utc) - params["cutoff"]
+            < timedelta(days=31)
+        )
+
+    def test_compact_skips_when_another_replica_holds_the_lock(self):
+        cursor = MagicMock()
+        cursor.fetchone.return_value = (False,)
+
+        result = CheckpointRetention(_pool(cursor), keep_last=5).compact()
+
+        assert result["skipped"] is True
+        cursor.execute.assert_called_once()
+
+    def test_thread_sizes(self):
+        cursor = MagicMock()
+        cursor.fetchall.return_value = [("agent-1", 40, 1_048_576)]
+
+        sizes = CheckpointRetention(_pool(cursor)).thread_sizes(limit=5)
+
+        assert sizes == [
+            {"thread_id": "agent-1", "checkpoints": 40, "bytes": 1_048_576}
+        ]
+        assert cursor.execute.call_args.args[1] == {"limit": 5}
+
+    def test_run_once_records_metrics_and_failures(self):
+        retention = CheckpointRetention(MagicMock(), keep_last=5)
+
+        with patch.object(
+            retention, "compact", return_value={"checkpoints": 2}
+        ), patch.object(
+            retention, "thread_sizes", return_value=[{"thread_id": "agent-1"}]
+        ):
+            retention.run_once()
+        with patch.object(retention, "compact", side_effect=RuntimeError("db down")):
+            retention.run_once()
+
+        metrics = retention.metrics()
+        assert (metrics["runs"], metrics["failures"]) == (1, 1)
+        assert metrics["last_run"] == {"checkpoints": 2}
+        assert metrics["largest_threads"] == [{"thread_id": "agent-1"}]
+
+    def test_start_is_a_no_op_without_retention_rules(self):
+        retention = CheckpointRetention(MagicMock())
+
+        retention.start()
+
+        assert retention._thread is None
@@ -0,0 +1,546 @@
+import math
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from app.utils.indicator_utils import (
+    build_ohlcv_series,
+    compute_ad,
+    compute_adx,
+    compute_cci,
+    compute_ema,
+    compute_indicators,
+    compute_macd,
+    compute_obv,
+    compute_rsi,
+    compute_stoch,
+    group_ohlcv_series,
+)
+
+
+# -- Reference implementations: line-by-line ports of the Painless reduce
+# scripts formerly in terraform/01_elasticsearch/search_templates --
+
+
+def _java_round(x):
+    return math.floor(x * 100.0 + 0.5) / 100.0
+
+
+def _entries(series, fields):
+    rows = []
+    for i, d in enumerate(series["date"]):
+        if all(not np.isnan(series[f][i]) for f in fields):
+            rows.append({"date": d, **{f: float(series[f][i]) for f in fields}})
+    return rows
+
+
+def _painless_ad(series):
+    rows = _entries(series, ("high", "low", "close", "volume"))
+    results = []
+    for i, row in enumerate(rows):
+        denom = row["high"] - row["low"]
+        clv = (
+            ((row["close"] - row["low"]) - (row["high"] - row["close"])) / denom
+            if denom != 0
+            else 0.0
+        )
+        ad_contrib = clv * row["volume"]
+        ad_change = None
+        position = None
+        if i == 0:
+            ad_line = ad_contrib
+        else:
+            prev_ad_line = results[i - 1]["ad_line"]
+            ad_line = prev_ad_line + ad_contrib
+            ad_change = ad_line - prev_ad_line
+            position = 1 if ad_change > 0 else (-1 if ad_change < 0 else 0)
+        results.append(
+            {
+                "date": row["date"],
+                "ad_line": ad_line,
+                "ad_change": ad_change,
+                "position": position,
+            }
+        )
+    return [
+        {
+            "date": r["date"],
+            "ad_line": _java_round(r["ad_line"]),
+            "ad_change": _java_round(r["ad_change"])
+            if r["ad_change"] is not None
+            else None,
+            "position": r["position"],
+        }
+        for r in results
+    ]
+
+
+def _painless_adx(series, period):
+    rows = _entries(series, ("high", "low", "close"))
+    alpha = 1.0 / period
+    one_minus_alpha = 1.0 - alpha
+    n = len(rows)
+    empty = {"adx": None, "plus_di": None, "minus_di": None, "position": None}
+    if n < 2:
+        return [{"date": r["date"], **empty} for r in rows]
+    results = [{"date": rows[0]["date"], **empty}]
+    plus_dms, minus_dms, trs = [], [], []
+    for i in range(1, n):
+        prev, cur = rows[i - 1], rows[i]
+        up_move = cur["high"] - prev["high"]
+        down_move = prev["low"] - cur["low"]
+        plus_dms.append(up_move if (up_move > down_move and up_move > 0) else 0.0)
+        minus_dms.append(down_move if (down_move > up_move and down_move > 0) else 0.0)
+        trs.append(
+            max(
+                cur["high"] - cur["low"],
+                max(abs(cur["high"] - prev["close"]), abs(cur["low"] - prev["close"])),
+            )
+        )
+    m = n - 1
+    pdm_s, mdm_s, tr_s = [plus_dms[0]], [minus_dms[0]], [trs[0]]
+    for k in range(1, m):
+        pdm_s.append(pdm_s[k - 1] * one_minus_alpha + plus_dms[k] * alpha)
+        mdm_s.append(mdm_s[k - 1] * one_minus_alpha + minus_dms[k] * alpha)
+        tr_s.append(tr_s[k - 1] * one_minus_alpha + trs[k] * alpha)
+    plus_dis, minus_dis, dxs = [], [], []
+    for k in range(m):
+        plus_dis.append(100.0 * pdm_s[k] / tr_s[k] if tr_s[k] != 0 else 0.0)
+        minus_dis.append(100.0 * mdm_s[k] / tr_s[k] if tr_s[k] != 0 else 0.0)
+        di_sum = plus_dis[k] + minus_dis[k]
+        dxs.append(
+            100.0 * abs(plus_dis[k] - minus_dis[k]) / di_sum if di_sum != 0 else 0.0
+        )
+    adxs = [dxs[0]]
+    for k in range(1, m):
+        adxs.append(adxs[k - 1] * one_minus_alpha + dxs[k] * alpha)
+    for k in range(m):
+        adx, plus_di, minus_di = adxs[k], plus_dis[k], minus_dis[k]
+        position = (
+            1
+            if (adx > 25 and plus_di > minus_di)
+            else (-1 if (adx > 25 and minus_di > plus_di) else 1)
+        )
+        results.append(
+            {
+                "date": rows[k + 1]["date"],
+                "adx": _java_round(adx),
+                "plus_di": _java_round(plus_di),
+                "minus_di": _java_round(minus_di),
+                "position": position,
+            }
+        )
+    return results
+
+
+def _painless_cci(series, period, constant):
+    rows = _entries(series, ("high", "low", "close"))
+    results = []
+    for i in range(len(rows)):
+        if i < period - 1:
+            results.append({"date": rows[i]["date"], "cci": None, "position": None})
+            continue
+        tps = [
+            (rows[j]["high"] + rows[j]["low"] + rows[j]["close"]) / 3.0
+            for j in range(i - period + 1, i + 1)
+        ]
+        atp = sum(tps) / period
+        md = sum(abs(tp - atp) for tp in tps) / period
+        cci = None
+        position = None
+        if md != 0:
+            cci = (tps[-1] - atp) / (constant * md)
+            position = 1 if cci < -100 else (-1 if cci > 100 else 1)
+        results.append(
+            {
+                "date": rows[i]["date"],
+                "cci": _java_round(cci) if cci is not None else None,
+                "position": position,
+            }
+        )
+    return results
+
+
+def _painless_ema(series, short_window, long_window):
+    rows = _entries(series, ("close",))
+    alpha_short = 2.0 / (short_window + 1.0)
+    alpha_long = 2.0 / (long_window + 1.0)
+    results = []
+    ema_short = ema_long = None
+    for i, row in enumerate(rows):
+        if i == 0:
+            ema_short = ema_long = row["close"]
+        else:
+            ema_short = row["close"] * alpha_short + ema_short * (1.0 - alpha_short)
+            ema_long = row["close"] * alpha_long + ema_long * (1.0 - alpha_long)
+        results.append(
+            {
+                "date": row["date"],
+                "ema_short": _java_round(ema_short),
+                "ema_long": _java_round(ema_long),
+                "position": 1 if ema_short > ema_long else -1,
+            }
+        )
+    return results
+
+
+def _painless_macd(series, short_window, long_window, signal_window):
+    rows = _entries(series, ("close",))
+    if len(rows) < 2:
+        return []
+    alpha_short = 2.0 / (short_window + 1.0)
+    alpha_long = 2.0 / (long_window + 1.0)
+    alpha_signal = 2.0 / (signal_window + 1.0)
+    short_ema = [rows[0]["close"]]
+    long_ema = [rows[0]["close"]]
+    macd = [0.0]
+    signal = [0.0]
+    results = []
+    for i in range(1, len(rows)):
+        short_ema.append(
+            rows[i]["close"] * alpha_short + short_ema[i - 1] * (1.0 - alpha_short)
+        )
+        long_ema.append(
+            rows[i]["close"] * alpha_long + long_ema[i - 1] * (1.0 - alpha_long)
+        )
+        macd.append(short_ema[i] - long_ema[i])
+        signal.append(macd[i] * alpha_signal + signal[i - 1] * (1.0 - alpha_signal))
+        histogram = macd[i] - signal[i]
+        prev_macd, prev_signal = macd[i - 1], signal[i - 1]
+        if prev_macd < prev_signal and macd[i] > signal[i]:
+            position = 1
+        elif prev_macd > prev_signal and macd[i] < signal[i]:
+            position = -1
+        else:
+            position = 1
+        results.append(
+            {
+                "date": rows[i]["date"],
+                "short_ema": _java_round(short_ema[i]),
+                "long_ema": _java_round(long_ema[i]),
+                "macd": _java_round(macd[i]),
+                "signal": _java_round(signal[i]),
+                "histogram": _java_round(histogram),
+                "position": position,
+            }
+        )
+    return results
+
+
+def _painless_obv(series):
+    rows = _entries(series, ("close", "volume"))
+    if len(rows) < 2:
+        return []
+    obv = 0.0
+    results = []
+    for i in range(1, len(rows)):
+        close_change = rows[i]["close"] - rows[i - 1]["close"]
+        volume = rows[i]["volume"]
+        signed_volume = (
+            volume if close_change > 0 else (-volume if close_change < 0 else 0.0)
+        )
+        prev_obv = obv
+        obv += signed_volume
+        obv_change = obv - prev_obv
+        results.append(
+            {
+                "date": rows[i]["date"],
+                "obv": _java_round(obv),
+                "obv_change": _java_round(obv_change),
+                "position": 1 if obv_change > 0 else (-1 if obv_change < 0 else 0),
+            }
+        )
+    return results
+
+
+def _painless_rsi(series, period):
+    rows = _entries(series, ("close",))
+    alpha = 1.0 / period
+    if len(rows) < 2:
+        return [{"date": r["date"], "rsi": None, "position": None} for r in rows]
+    results = [{"date": rows[0]["date"], "rsi": None, "position": None}]
+    upavg = dnavg = 0.0
+    initialized = False
+    for i in range(1, len(rows)):
+        delta = rows[i]["close"] - rows[i - 1]["close"]
+        up = max(delta, 0.0)
+        dn = max(-delta, 0.0)
+        if not initialized:
+            upavg, dnavg = up, dn
+            initialized = True
+        else:
+            upavg = upavg * (1.0 - alpha) + up * alpha
+            dnavg = dnavg * (1.0 - alpha) + dn * alpha
+        if upavg == 0.0 and dnavg == 0.0:
+            rsi = None
+        elif dnavg == 0.0:
+            rsi = 100.0
+        else:
+            rsi = 100.0 - 100.0 / (1.0 + upavg / dnavg)
+        position = None if rsi is None else (1 if rsi < 30 else (-1 if rsi > 70 else 1))
+        results.append(
+            {
+                "date": rows[i]["date"],
+                "rsi": _java_round(rsi) if rsi is not None else None,
+                "position": position,
+            }
+        )
+    return results
+
+
+def _painless_stoch(series, lookback, smooth_k, smooth_d):
+    rows = _entries(series, ("high", "low", "close"))
+    n = len(rows)
+
+    def trailing_mean(values, window):
+        means = []
+        for i in range(n):
+            window_values = values[max(0, i - window + 1) : i + 1]
+            means.append(
+                math.nan
+                if any(math.isnan(v) for v in window_values)
+                else sum(window_values) / len(window_values)
+            )
+        return means
+
+    raw_ks = []
+    for i in range(n):
+        window_rows = rows[max(0, i - lookback + 1) : i + 1]
+        min_low = min(r["low"] for r in window_rows)
+        max_high = max(r["high"] for r in window_rows)
+        denom = max_high - min_low
+        raw_ks.append(
+            100 * (rows[i]["close"] - min_low) / denom if denom != 0 else math.nan
+        )
+    slow_ks = trailing_mean(raw_ks, smooth_k)
+    slow_ds = trailing_mean(slow_ks, smooth_d)
+    return [
+        {
+            "date": rows[i]["date"],
+            "slow_k": sk,
+            "slow_d": sd,
+            "position": 1 if sk > sd else -1,
+        }
+        for i, (sk, sd) in enumerate(zip(slow_ks, slow_ds))
+        if not math.isnan(sk) and not math.isnan(sd)
+    ]
+
+
+# -- Fixtures --
+
+
+def _make_hits(n=160, seed=7, flat_from=60, flat_to=70, missing_volume_at=(25,)):
+    rng = np.random.default_rng(seed)
+    closes = 100.0 + np.cumsum(rng.normal(0, 2.0, n))
+    if flat_from < n:
+        closes[flat_from:flat_to] = closes[flat_from]
+    hits = []
+    start = date(2025, 1, 1)
+    for i, close in enumerate(closes):
+        high = close + abs(rng.normal(0, 1.5))
+        low = close - abs(rng.normal(0, 1.5))
+        if flat_from <= i < flat_to:
+            high = low = close
+        fields = {
+            "key_ticker": ["AAPL"],
+            "date_reference": [(start + timedelta(days=i)).isoformat()],
+            "val_open": [round(float(close + rng.normal(0, 0.5)), 4)],
+            "val_high": [round(float(high), 4)],
+            "val_low": [round(float(low), 4)],
+            "val_close": [round(float(close), 4)],
+        }
+        if i not in missing_volume_at:
+            fields["val_volume"] = [float(rng.integers(1_000_000, 5_000_000))]
+        hits.append({"fields": fields})
+    return hits
+
+
+@pytest.fixture
+def series():
+    return build_ohlcv_series(_make_hits())
+
+
+def _assert_parity(actual, expected):
+    assert len(actual) == len(expected)
+    for actual_row, expected_row in zip(actual, expected):
+        assert actual_row.keys() == expected_row.keys()
+        for key, expected_value in expected_row.items():
+            if isinstance(expected_value, float):
+                assert actual_row[key] == pytest.approx(expected_value, abs=1e-6), (
+                    expected_row["date"],
+                    key,
+                )
+            else:
+                assert actual_row[key] == expected_value, (expected_row["date"], key)
+
+
+# -- Tests --
+
+
+class TestBuildOhlcvSeries:
+    def test_missing_values_become_nan(self):
+        series = build_ohlcv_series(_make_hits(n=30))
+        assert np.isnan(series["volume"][25])
+        assert not np.isnan(series["close"][25])
+
+    def test_empty_hits(self):
+        series = build_ohlcv_series([])
+        assert len(series["date"]) == 0
+        assert len(series["close"]) == 0
+
+
+class TestPainlessParity:
+    def test_ad(self, series):
+        _assert_parity(compute_ad(series), _painless_ad(series))
+
+    @pytest.mark.parametrize("period", [5, 14, 28])
+    def test_adx(self, series, period):
+        _assert_parity(compute_adx(series, period), _painless_adx(series, period))
+
+    @pytest.mark.parametrize("period,constant", [(5, 0.015), (20, 0.015), (14, 0.02)])
+    def test_cci(self, series, period, constant):
+        _assert_parity(
+            compute_cci(series, period, constant),
+            _painless_cci(series, period, constant),
+        )
+
+    @pytest.mark.parametrize("short_window,long_window", [(10, 20), (12, 26)])
+    def test_ema(self, series, short_window, long_window):
+        _assert_parity(
+            compute_ema(series, short_window, long_window),
+            _painless_ema(series, short_window, long_window),
+        )
+
+    @pytest.mark.parametrize("windows", [(7, 20, 6), (12, 26, 9)])
+    def test_macd(self, series, windows):
+        _assert_parity(compute_macd(series, *windows), _painless_macd(series, *windows))
+
+    def test_obv(self, series):
+        _assert_parity(compute_obv(series), _painless_obv(series))
+
+    @pytest.mark.parametrize("period", [7, 14])
+    def test_rsi(self, series, period):
+        _assert_parity(compute_rsi(series, period), _painless_rsi(series, period))
+
+    @pytest.mark.parametrize("params", [(10, 10, 10), (14, 3, 3)])
+    def test_stoch(self, series, params):
+        _assert_parity(compute_stoch(series, *params), _painless_stoch(series, *params))
+
+
+class TestEdgeCases:
+    @pytest.mark.parametrize(
+        "compute,args",
+        [
+            (compute_ad, ()),
+            (compute_adx, (14,)),
+            (compute_cci, (20, 0.015)),
+            (compute_ema, (12, 26)),
+            (compute_macd, (12, 26, 9)),
+            (compute_obv, ()),
+            (compute_rsi, (14,)),
+            (compute_stoch, (14, 3, 3)),
+        ],
+    )
+    def test_empty_series_returns_empty_list(self, compute, args):
+        assert compute(build_ohlcv_series([]), *args) == []
+
+    @pytest.mark.parametrize(
+        "compute,args,expected",
+        [
+            (
+                compute_adx,
+                (14,),
+                [
+                    {
+                        "date": "2025-01-01",
+                        "adx": None,
+                        "plus_di": None,
+                        "minus_di": None,
+                        "position": None,
+                    }
+                ],
+            ),
+            (
+                compute_rsi,
+                (14,),
+                [{"date": "2025-01-01", "rsi": None, "position": None}],
+            ),
+            (compute_macd, (12, 26, 9), []),
+            (compute_obv, (), []),
+        ],
+    )
+    def test_single_row(self, compute, args, expected):
+        assert compute(build_ohlcv_series(_make_hits(n=1)), *args) == expected
+
+    def test_cci_period_longer_than_series(self):
+        result = compute_cci(build_ohlcv_series(_make_hits(n=5)), 20, 0.015)
+        assert all(r["cci"] is None and r["position"] is None for r in result)
+
+    def test_flat_prices_yield_null_rsi(self):
+        result = compute_rsi(
+            build_ohlcv_series(_make_hits(n=10, flat_from=0, flat_to=10)), 14
+        )
+        assert all(r["rsi"] is None for r in result)
+
+    def test_values_are_native_python_types(self, series):
+        row = compute_macd(series, 12, 26, 9)[-1]
+        assert type(row["macd"]) is float
+        assert type(row["position"]) is int
+
+
+class TestComputeIndicators:
+    def test_matches_individual_calls(self, series):
+        result = compute_indicators(
+            series,
+            [
+                {"indicator": "rsi", "period": 14},
+                {"indicator": "stoch", "lookback": 14, "smooth_k": 3, "smooth_d": 3},
+            ],
+        )
+        assert result["rsi"] == compute_rsi(series, 14)
+        assert result["stoch"] == compute_stoch(series, 14, 3, 3)
+
+    def test_uses_spec_name_as_key(self, series):
+        result = compute_indicators(
+            series, [{"indicator": "rsi", "name": "rsi_7", "period": 7}]
+        )
+        assert list(result) == ["rsi_7"]
+
+    def test_does_not_mutate_specs(self, series):
+        specs = [{"indicator": "obv", "name": "volume_flow"}]
+        compute_indicators(series, specs)
+        assert specs == [{"indicator": "obv", "name": "volume_flow"}]
+
+    @pytest.mark.parametrize(
+        "spec",
+        [
+            {"indicator": "rsi", "period": -2},
+            {"indicator": "cci", "period": -1, "constant": 0.015},
+            {"indicator": "ema", "short_window": -1, "long_window": 26},
+            {"indicator": "stoch", "lookback": -3, "smooth_k": 3, "smooth_d": 3},
+        ],
+    )
+    def test_rejects_non_positive_params(self, series, spec):
+        with pytest.raises(ValueError, match="must be greater than 0"):
+            compute_indicators(series, [spec])
+
+
+class TestGroupOhlcvSeries:
+    def test_splits_by_ticker(self):
+        hits = _make_hits(n=4)
+        for hit in hits[2:]:
+            hit["fields"]["key_ticker"] = ["MSFT"]
+
+        grouped = group_ohlcv_series(hits)
+
+        assert set(grouped) == {"AAPL", "MSFT"}
+        assert grouped["AAPL"]["date"].tolist() == ["2025-01-01", "2025-01-02"]
+        assert grouped["MSFT"]["date"].tolist() == ["2025-01-03", "2025-01-04"]
+        assert grouped["MSFT"]["close"].tolist() == [
+            hits[2]["fields"]["val_close"][0],
+            hits[3]["fields"]["val_close"][0],
+        ]
+
+    def test_empty_hits(self):
+        assert group_ohlcv_series([]) == {}
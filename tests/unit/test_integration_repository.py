@@ -73,3 +73,14 @@ def test_delete_by_id_success(repository, mock_db):
 
     assert entity.is_active is False
     session.commit.assert_called_once()
+
+def test_add_primes_secret_cache(mock_db, mock_vault):
+    db, _ = mock_db
+    secret_cache = MagicMock()
+    repository = IntegrationRepository(db=db, vault_client=mock_vault, secret_cache=secret_cache)
+
+    result = repository.add("openai", "http://api", "key", "schema-1")
+
+    secret_cache.put.assert_called_once_with(
+        f"integration_{result.id}", {"api_endpoint": "http://api", "api_key": "key"}
+    )
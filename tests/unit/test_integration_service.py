@@ -29,3 +29,9 @@ def test_create_integration(service, mock_repo):
 def test_delete_integration_by_id(service, mock_repo):
     service.delete_integration_by_id("1", "schema")
     mock_repo.delete_by_id.assert_called_once_with("1", "schema")
+
+def test_delete_integration_by_id_invalidates_model_clients(mock_repo):
+    model_client_cache = MagicMock()
+    service = IntegrationService(integration_repository=mock_repo, model_client_cache=model_client_cache)
+    service.delete_integration_by_id("1", "schema")
+    model_client_cache.invalidate_integration.assert_called_once_with("1")
@@ -0,0 +1,154 @@
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.load import dumps
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from langchain_core.outputs import ChatGeneration
+
+from app.infrastructure.cache.llm_cache import LLMResponseCache
+
+
+def _reply(content, total_tokens=100):
+    return AIMessage(
+        content=content,
+        usage_metadata={
+            "input_tokens": total_tokens - 10,
+            "output_tokens": 10,
+            "total_tokens": total_tokens,
+        },
+    )
+
+
+def _model(cache, *replies):
+    return GenericFakeChatModel(messages=iter(replies), cache=cache)
+
+
+def _shared_cache(**kwargs):
+    cache = LLMResponseCache(
+        namespace="test", redis_url="redis://localhost:6379/0", shared=True, **kwargs
+    )
+    cache.redis = MagicMock()
+    return cache
+
+
+class TestChatModelCaching:
+    def test_identical_calls_are_served_from_cache(self):
+        cache = LLMResponseCache()
+        model = _model(cache, _reply("first", 120), _reply("second"))
+        messages = [SystemMessage(content="report"), HumanMessage(content="BATCH_ETL")]
+
+        assert model.invoke(messages).content == "first"
+        assert model.invoke(messages).content == "first"
+
+        assert cache.metrics() == {
+            "hits": 1,
+            "misses": 1,
+            "saved_tokens": 120,
+            "local_entries": 1,
+            "shared": False,
+        }
+
+    def test_different_messages_miss(self):
+        cache = LLMResponseCache()
+        model = _model(cache, _reply("first"), _reply("second"))
+
+        model.invoke([HumanMessage(content="one")])
+
+        assert model.invoke([HumanMessage(content="two")]).content == "second"
+        assert cache.metrics()["hits"] == 0
+
+    def test_model_configuration_is_part_of_the_key(self):
+        cache = LLMResponseCache()
+        cache.update("prompt", "model=a", [ChatGeneration(message=_reply("a"))])
+
+        assert cache.lookup("prompt", "model=b") is None
+        assert cache.lookup("prompt", "model=a")[0].message.content == "a"
+
+    def test_scopes_do_not_share_entries(self):
+        cache = LLMResponseCache()
+        _model(cache.scoped("tenant_a:int-1"), _reply("a")).invoke(
+            [HumanMessage(content="BATCH_ETL")]
+        )
+
+        tenant_b = _model(cache.scoped("tenant_b:int-1"), _reply("b"))
+
+        assert tenant_b.invoke([HumanMessage(content="BATCH_ETL")]).content == "b"
+        assert cache.scoped("tenant_a:int-1") is cache.scoped("tenant_a:int-1")
+        assert cache.metrics()["local_entries"] == 2
+
+    @pytest.mark.asyncio
+    async def test_async_calls_share_the_cache(self):
+        cache = LLMResponseCache()
+        model = _model(cache, _reply("first"), _reply("second"))
+        messages = [HumanMessage(content="BATCH_ETL")]
+
+        model.invoke(messages)
+
+        assert (await model.ainvoke(messages)).content == "first"
+
+    def test_local_entries_expire(self):
+        cache = LLMResponseCache(ttl=1)
+        cache.update("prompt", "llm", [ChatGeneration(message=_reply("a"))])
+        cache.local._entries[cache.key("prompt", "llm")] = (time.monotonic() - 1, [])
+
+        assert cache.lookup("prompt", "llm") is None
+
+    def test_local_entries_are_capped(self):
+        cache = LLMResponseCache(max_entries=2)
+        for prompt in ("a", "b", "c"):
+            cache.update(prompt, "llm", [ChatGeneration(message=_reply(prompt))])
+
+        assert cache.lookup("a", "llm") is None
+        assert len(cache.local) == 2
+
+
+class TestSharedTier:
+    def test_reads_through_to_redis(self):
+        cache = _shared_cache()
+        generations = [ChatGeneration(message=_reply("shared", 50))]
+        cache.redis.get.return_value = dumps(generations).encode()
+
+        result = cache.lookup("prompt", "llm")
+
+        assert result[0].message.content == "shared"
+        cache.redis.get.assert_called_once_with(cache.key("prompt", "llm"))
+        assert cache.metrics()["saved_tokens"] == 50
+        # the second lookup is served by the local tier
+        cache.lookup("prompt", "llm")
+        cache.redis.get.assert_called_once()
+
+    def test_writes_with_ttl_and_trims_oldest_entries(self):
+        cache = _shared_cache(max_entries=2, ttl=60)
+        pipeline = cache.redis.pipeline.return_value
+        pipeline.execute.return_value = [True, 1, 0, 3]
+        cache.redis.zpopmin.return_value = [(b"test:old", 1.0)]
+
+        cache.update("prompt", "llm", [ChatGeneration(message=_reply("a"))])
+
+        key = cache.key("prompt", "llm")
+        assert pipeline.set.call_args.args[0] == key
+        assert pipeline.set.call_args.kwargs == {"ex": 60}
+        pipeline.zadd.assert_called_once()
+        cache.redis.zpopmin.assert_called_once_with("test:index", 1)
+        cache.redis.delete.assert_called_once_with(b"test:old")
+
+    def test_redis_errors_fall_back_to_a_miss(self):
+        cache = _shared_cache()
+        cache.redis.get.side_effect = ConnectionError("redis down")
+        cache.redis.pipeline.side_effect = ConnectionError("redis down")
+
+        cache.update("prompt", "llm", [ChatGeneration(message=_reply("a"))])
+        cache.local.clear()
+
+        assert cache.lookup("prompt", "llm") is None
+        assert cache.metrics()["misses"] == 1
+
+    def test_clear_drops_indexed_keys(self):
+        cache = _shared_cache()
+        cache.redis.zrange.return_value = [b"test:a", b"test:b"]
+
+        cache.clear()
+
+        cache.redis.delete.assert_called_once_with("test:index", b"test:a", b"test:b")
@@ -1,9 +1,13 @@
 import os
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 from fastapi import FastAPI, HTTPException
 from fastapi.testclient import TestClient
 
-from app.main import app, setup_exception_handlers
+from app.domain.exceptions.base import NotModifiedError
+from app.main import app, build_lifespan, setup_exception_handlers
 
 @pytest.fixture
 def client():
@@ -47,6 +51,20 @@ class TestExceptionHandler:
         assert response.status_code == 422
         assert response.json()["detail"] == "Validation failed"
 
+    def test_not_modified_has_no_body(self):
+        test_app = FastAPI()
+        setup_exception_handlers(test_app)
+
+        @test_app.get("/test-not-modified")
+        async def trigger_not_modified():
+            raise NotModifiedError(headers={"ETag": '"v1"'})
+
+        test_client = TestClient(test_app)
+        response = test_client.get("/test-not-modified")
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == '"v1"'
+
 class TestMcpSlashRewrite:
     def test_mcp_path_rewrite(self, client):
         response = client.get("/mcp")
@@ -76,3 +94,28 @@ class TestResourceMetadata:
     def test_oauth_authorization_server_metadata_trailing_slash(self, client):
         response = client.get("/.well-known/oauth-authorization-server/mcp/")
         assert response.status_code == 200
+
+
+class TestLifespan:
+    @pytest.mark.asyncio
+    async def test_shutdown_runs_every_step_in_order(self):
+        calls = []
+        container = MagicMock()
+        container.agent_execution_service().shutdown.side_effect = lambda: calls.append("executor")
+        container.checkpoint_retention().close.side_effect = RuntimeError("retention stuck")
+        container.graph_persistence_factory().aclose = AsyncMock(side_effect=lambda: calls.append("checkpoints"))
+        container.async_es().close = AsyncMock(side_effect=lambda: calls.append("es"))
+        container.async_db().dispose = AsyncMock(side_effect=lambda: calls.append("db"))
+        container.markets_result_cache().aclose = AsyncMock()
+        container.llm_response_cache().close.side_effect = lambda: calls.append("llm cache")
+
+        @asynccontextmanager
+        async def mcp_lifespan(application):
+            yield
+
+        async with build_lifespan(container, mcp_lifespan)(FastAPI()):
+            pass
+
+        assert calls == ["executor", "checkpoints", "es", "db", "llm cache"]
+        container.markets_result_cache().aclose.assert_awaited_once()
+        container.secret_cache().close.assert_called_once()
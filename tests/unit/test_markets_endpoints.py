@@ -1,6 +1,6 @@
 """Tests for markets API endpoints."""
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 from app.domain.exceptions.base import InvalidFieldError
 from app.interface.api.markets.endpoints import (
@@ -16,6 +16,8 @@ from app.interface.api.markets.endpoints import (
     get_published_content_preview,
     cancel_published_content,
     get_indicator,
+    get_indicators_bulk,
+    get_indicators_by_ticker,
 )
 from app.interface.api.markets.schema import (
     StatsCloseRequest,
@@ -36,6 +38,8 @@ _get_insights_news = get_insights_news.__wrapped__
 _get_published_content_preview = get_published_content_preview.__wrapped__
 _cancel_published_content = cancel_published_content.__wrapped__
 _get_indicator = get_indicator.__wrapped__
+_get_indicators_bulk = get_indicators_bulk.__wrapped__
+_get_indicators_by_ticker = get_indicators_by_ticker.__wrapped__
 
 
 class TestValidateIndexName:
@@ -72,7 +76,7 @@ class TestIndicatorConfig:
 class TestGetStatsClose:
     @pytest.mark.asyncio
     async def test_returns_stats(self):
-        mock_service = MagicMock()
+        mock_service = AsyncMock()
         mock_service.get_stats_close.return_value = {
             "most_recent_close": 150.0,
             "most_recent_open": 148.0,
@@ -89,7 +93,7 @@ class TestGetStatsClose:
 
     @pytest.mark.asyncio
     async def test_uses_default_dates(self):
-        mock_service = MagicMock()
+        mock_service = AsyncMock()
         mock_service.get_stats_close.return_value = {
             "most_recent_close": 150.0,
             "most_recent_open": 148.0,
@@ -111,7 +115,7 @@ class TestGetStatsClose:
 class TestGetCompanyProfile:
     @pytest.mark.asyncio
     async def test_returns_profile(self):
-        mock_service = MagicMock()
+        mock_service = AsyncMock()
         mock_service.get_company_profile.return_value = {
             "key_ticker": "AAPL",
             "name": "Apple Inc",
@@ -125,7 +129,7 @@ class TestGetCompanyProfile:
 class TestGetStatsCloseBulk:
     @pytest.mark.asyncio
     async def test_returns_bulk_stats(self):
-        mock_service = MagicMock()
+        mock_service = AsyncMock()
         mock_service.get_stats_close_bulk.return_value = [
             {
                 "key_ticker": "AAPL",
@@ -157,7 +161,7 @@ class TestGetStatsCloseBulk:
 class TestGetMarketCapsBulk:
     @pytest.mark.asyncio
     async def test_returns_market_caps(self):
-        mock_service = MagicMock()
+        mock_service = AsyncMock()
         mock_service.get_market_caps_bulk.return_value = [
             {"key_ticker": "AAPL", "market_capitalization": 3000000000000},
         ]
@@ -169,7 +173,7 @@ class TestGetMarketCapsBulk:
 class TestGetNews:
     @pytest.mark.asyncio
     async def test_returns_news(self):
-        mock_service = MagicMock()
+        mock_service = AsyncMock()
         mock_service.get_news.return_value = (
             [
                 {
@@ -197,7 +201,7 @@ class TestGetNews:
 class TestGetInsightsNews:
     @pytest.mark.asyncio
     async def test_returns_insights(self):
-        mock_service = MagicMock()
+        mock_service = AsyncMock()
         mock_service.get_insights_news.return_value = (
             [
                 {
@@ -281,10 +285,10 @@ class TestCancelPublishedContent:
 class TestGetIndicator:
     @pytest.mark.asyncio
     async def test_returns_indicator_data(self):
-        mock_service = MagicMock()
-        mock_service.get_indicator_rsi.return_value = [
-            {"date": "2025-01-10", "value": 62.5}
-        ]
+        mock_service = AsyncMock()
+        mock_service.get_indicators_bulk.return_value = {
+            "rsi": [{"date": "2025-01-10", "value": 62.5}]
+        }
         request = IndicatorRequest(
             start_date="2025-01-01",
             end_date="2025-01-10",
@@ -294,42 +298,123 @@ class TestGetIndicator:
         assert result.indicator == "rsi"
         assert result.key_ticker == "AAPL"
         assert len(result.data) == 1
+        call_kwargs = mock_service.get_indicators_bulk.call_args.kwargs
+        assert call_kwargs["specs"] == [{"indicator": "rsi", "period": 14}]
+        assert call_kwargs["start_date"] == "2025-01-01"
 
     @pytest.mark.asyncio
     async def test_invalid_indicator_name(self):
-        mock_service = MagicMock()
+        mock_service = AsyncMock()
         request = IndicatorRequest()
         with pytest.raises(InvalidFieldError):
             await _get_indicator("xyz", "stocks-eod", "AAPL", mock_service, request)
 
     @pytest.mark.asyncio
     async def test_uses_default_dates(self):
-        mock_service = MagicMock()
-        mock_service.get_indicator_ad.return_value = []
+        mock_service = AsyncMock()
+        mock_service.get_indicators_bulk.return_value = {"ad": []}
         request = IndicatorRequest()
         result = await _get_indicator("ad", "stocks-eod", "AAPL", mock_service, request)
         assert result.indicator == "ad"
 
     @pytest.mark.asyncio
     async def test_ema_indicator(self):
-        mock_service = MagicMock()
-        mock_service.get_indicator_ema.return_value = []
+        mock_service = AsyncMock()
+        mock_service.get_indicators_bulk.return_value = {"ema": []}
         request = IndicatorRequest(short_window=12, long_window=26)
         result = await _get_indicator("ema", "stocks-eod", "AAPL", mock_service, request)
         assert result.indicator == "ema"
 
     @pytest.mark.asyncio
     async def test_macd_indicator(self):
-        mock_service = MagicMock()
-        mock_service.get_indicator_macd.return_value = []
+        mock_service = AsyncMock()
+        mock_service.get_indicators_bulk.return_value = {"macd": []}
         request = IndicatorRequest(short_window=12, long_window=26, signal_window=9)
         result = await _get_indicator("macd", "stocks-eod", "AAPL", mock_service, request)
         assert result.indicator == "macd"
 
     @pytest.mark.asyncio
     async def test_stoch_indicator(self):
-        mock_service = MagicMock()
-        mock_service.get_indicator_stoch.return_value = []
+        mock_service = AsyncMock()
+        mock_service.get_indicators_bulk.return_value = {"stoch": []}
         request = IndicatorRequest(lookback=14, smooth_k=3, smooth_d=3)
         result = await _get_indicator("stoch", "stocks-eod", "AAPL", mock_service, request)
         assert result.indicator == "stoch"
+        assert mock_service.get_indicators_bulk.call_args.kwargs["specs"] == [
+            {"indicator": "stoch", "lookback": 14, "smooth_k": 3, "smooth_d": 3}
+        ]
+
+    @pytest.mark.asyncio
+    async def test_rejects_explicit_zero_param(self):
+        mock_service = AsyncMock()
+        request = IndicatorRequest.model_construct(period=0)
+        with pytest.raises(InvalidFieldError):
+            await _get_indicator("rsi", "stocks-eod", "AAPL", mock_service, request)
+        mock_service.get_indicators_bulk.assert_not_called()
+
+
+class TestGetIndicatorsBulk:
+    @pytest.mark.asyncio
+    async def test_builds_specs_with_defaults(self):
+        mock_service = AsyncMock()
+        mock_service.get_indicators_bulk.return_value = {"rsi": [], "macd": []}
+        request = IndicatorRequest(start_date="2025-01-01", end_date="2025-01-10", period=7)
+
+        result = await _get_indicators_bulk("stocks-eod", "AAPL", "rsi, macd", mock_service, request)
+
+        assert result.key_ticker == "AAPL"
+        assert set(result.indicators) == {"rsi", "macd"}
+        call_kwargs = mock_service.get_indicators_bulk.call_args.kwargs
+        assert call_kwargs["start_date"] == "2025-01-01"
+        assert call_kwargs["end_date"] == "2025-01-10"
+        assert call_kwargs["specs"] == [
+            {"indicator": "rsi", "period": 7},
+            {"indicator": "macd", "short_window": 12, "long_window": 26, "signal_window": 9},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_deduplicates_indicators(self):
+        mock_service = AsyncMock()
+        mock_service.get_indicators_bulk.return_value = {"obv": []}
+
+        await _get_indicators_bulk("stocks-eod", "AAPL", "obv,obv", mock_service, IndicatorRequest())
+
+        assert mock_service.get_indicators_bulk.call_args.kwargs["specs"] == [{"indicator": "obv"}]
+
+    @pytest.mark.asyncio
+    async def test_invalid_indicator_name(self):
+        mock_service = AsyncMock()
+        with pytest.raises(InvalidFieldError):
+            await _get_indicators_bulk("stocks-eod", "AAPL", "rsi,xyz", mock_service, IndicatorRequest())
+        mock_service.get_indicators_bulk.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_empty_indicator_list(self):
+        mock_service = AsyncMock()
+        with pytest.raises(InvalidFieldError):
+            await _get_indicators_bulk("stocks-eod", "AAPL", " , ", mock_service, IndicatorRequest())
+
+
+class TestGetIndicatorsByTicker:
+    @pytest.mark.asyncio
+    async def test_passes_tickers_and_specs(self):
+        mock_service = AsyncMock()
+        mock_service.get_indicators_by_ticker.return_value = {
+            "AAPL": {"rsi": []},
+            "MSFT": {"rsi": []},
+        }
+
+        result = await _get_indicators_by_ticker(
+            "stocks-eod", "AAPL, MSFT,AAPL", "rsi", mock_service, IndicatorRequest()
+        )
+
+        assert set(result.items) == {"AAPL", "MSFT"}
+        call_kwargs = mock_service.get_indicators_by_ticker.call_args.kwargs
+        assert call_kwargs["key_tickers"] == ["AAPL", "MSFT"]
+        assert call_kwargs["specs"] == [{"indicator": "rsi", "period": 14}]
+
+    @pytest.mark.asyncio
+    async def test_empty_tickers(self):
+        mock_service = AsyncMock()
+        with pytest.raises(InvalidFieldError):
+            await _get_indicators_by_ticker("stocks-eod", ",", "rsi", mock_service, IndicatorRequest())
@@ -1,8 +1,8 @@
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 import pytest
 import base64
 import json
-from app.services.markets_insights import MarketsInsightsService
+from app.services.markets_insights import AsyncMarketsInsightsService, MarketsInsightsService
 
 @pytest.fixture
 def mock_es():
@@ -36,3 +36,17 @@ def test_get_insights_news_with_cursor(service, mock_es):
     # Check if search_after was passed in params
     args = mock_es.search_template.call_args
     assert args[1]['body']['params']['search_after'] == [123]
+
+
+@pytest.mark.asyncio
+async def test_async_get_insights_news_with_cursor():
+    async_es = AsyncMock()
+    async_es.search_template.return_value = {'hits': {'hits': [{'_id': '1', 'sort': [456], '_source': {}}]}}
+    cursor = base64.urlsafe_b64encode(json.dumps([123]).encode()).decode()
+
+    results, last_sort = await AsyncMarketsInsightsService(es=async_es).get_insights_news("index", cursor=cursor)
+
+    async_es.search_template.assert_awaited_once()
+    assert async_es.search_template.call_args[1]['body']['params']['search_after'] == [123]
+    assert len(results) == 1
+    assert json.loads(base64.urlsafe_b64decode(last_sort)) == [456]
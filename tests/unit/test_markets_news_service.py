@@ -1,10 +1,10 @@
 import base64
 import json
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from app.services.markets_news import MarketsNewsService
+from app.services.markets_news import AsyncMarketsNewsService, MarketsNewsService
 
 
 @pytest.fixture
@@ -143,3 +143,26 @@ class TestGetNewsResults:
 
         assert results == []
         assert last_sort is None
+
+
+class TestAsyncMarketsNewsService:
+    @pytest.mark.asyncio
+    async def test_builds_same_params_and_cursor(self):
+        async_es = AsyncMock()
+        async_es.search_template.return_value = {
+            "hits": {"hits": [_make_hit("1", 1704067200000)]}
+        }
+        service = AsyncMarketsNewsService(es=async_es)
+
+        results, last_sort = await service.get_news(
+            index_name="test-index",
+            key_ticker="AAPL",
+            cursor=_make_cursor(1704000000000),
+        )
+
+        async_es.search_template.assert_awaited_once()
+        params = async_es.search_template.call_args.kwargs["body"]["params"]
+        assert params["key_ticker"] == "AAPL"
+        assert params["search_after"] == [1704000000000]
+        assert [r["_id"] for r in results] == ["1"]
+        assert last_sort == _make_cursor(1704067200000)
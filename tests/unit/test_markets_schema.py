@@ -129,6 +129,14 @@ class TestIndicatorRequest:
         with pytest.raises(Exception):
             IndicatorRequest(start_date="2025-06-01", end_date="2025-01-01")
 
+    @pytest.mark.parametrize(
+        "params",
+        [{"period": -2}, {"period": 0}, {"short_window": -1}, {"lookback": -3}, {"constant": 0}],
+    )
+    def test_non_positive_params_raise(self, params):
+        with pytest.raises(Exception):
+            IndicatorRequest(**params)
+
 
 class TestDateRangeRequest:
     def test_valid_range(self):
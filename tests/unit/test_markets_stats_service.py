@@ -1,8 +1,13 @@
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from app.services.markets_stats import MarketsStatsService
+from app.infrastructure.cache.result_cache import ResultCache
+from app.services.markets_stats import (
+    AsyncMarketsStatsService,
+    CachedAsyncMarketsStatsService,
+    MarketsStatsService,
+)
 
 
 @pytest.fixture
@@ -265,48 +270,295 @@ class TestGetCompanyProfile:
         assert result == {}
 
 
+def _make_ohlcv_hit(ticker, date, close, open_=None, high=None, low=None, volume=1000.0):
+    return {
+        "fields": {
+            "key_ticker": [ticker],
+            "date_reference": [date],
+            "val_open": [open_ if open_ is not None else close],
+            "val_high": [high if high is not None else close + 1.0],
+            "val_low": [low if low is not None else close - 1.0],
+            "val_close": [close],
+            "val_volume": [volume],
+        },
+        "sort": [ticker, date, "quaks_stocks-eod_nasdaq"],
+    }
+
+
+def _make_ohlcv_hits(ticker="AAPL", closes=(10.0, 11.0, 10.5, 12.0, 12.5)):
+    return [
+        _make_ohlcv_hit(ticker, f"2025-01-{i + 1:02d}", close)
+        for i, close in enumerate(closes)
+    ]
+
+
+class TestGetOhlcvSeries:
+    def test_calls_template_with_correct_params(self, service, mock_es):
+        mock_es.search_template.return_value = {"hits": {"hits": []}}
+
+        service.get_ohlcv_series("stocks-eod", "AAPL", "2025-01-01", "2025-01-10")
+
+        call_kwargs = mock_es.search_template.call_args
+        assert call_kwargs.kwargs["body"]["id"] == "get_eod_ohlcv_series_template"
+        params = _extract_template_params(mock_es)
+        assert params["key_tickers"] == ["AAPL"]
+        assert params["date_gte"] == "2025-01-01"
+        assert params["date_lte"] == "2025-01-10"
+        assert "search_after" not in params
+
+    def test_builds_columns(self, service, mock_es):
+        mock_es.search_template.return_value = {"hits": {"hits": _make_ohlcv_hits()}}
+
+        series = service.get_ohlcv_series("stocks-eod", "AAPL", "2025-01-01", "2025-01-10")
+
+        assert series["date"].tolist() == [f"2025-01-0{i}" for i in range(1, 6)]
+        assert series["close"].tolist() == [10.0, 11.0, 10.5, 12.0, 12.5]
+
+    def test_pages_with_search_after(self, service, mock_es, monkeypatch):
+        monkeypatch.setattr("app.services.markets_stats.OHLCV_PAGE_SIZE", 3)
+        hits = _make_ohlcv_hits()
+        mock_es.search_template.side_effect = [
+            {"hits": {"hits": hits[:3]}},
+            {"hits": {"hits": hits[3:]}},
+        ]
+
+        series = service.get_ohlcv_series("stocks-eod", "AAPL", "2025-01-01", "2025-01-10")
+
+        assert len(series["date"]) == 5
+        second_params = mock_es.search_template.call_args_list[1].kwargs["body"]["params"]
+        assert second_params["has_search_after"] is True
+        assert second_params["search_after"] == hits[2]["sort"]
+
+
 class TestIndicators:
-    def _mock_indicator_response(self, mock_es, agg_key, value):
-        mock_es.search_template.return_value = {
-            "aggregations": {agg_key: {"value": value}}
-        }
+    @pytest.fixture(autouse=True)
+    def _mock_ohlcv(self, mock_es):
+        mock_es.search_template.return_value = {"hits": {"hits": _make_ohlcv_hits()}}
 
-    def test_get_indicator_ad(self, service, mock_es):
-        self._mock_indicator_response(mock_es, "ad_stats", [{"date": "2025-01-10", "ad": 100}])
+    def test_get_indicator_ad(self, service):
         result = service.get_indicator_ad("stocks-eod", "AAPL", "2025-01-01", "2025-01-10")
-        assert result == [{"date": "2025-01-10", "ad": 100}]
+        assert len(result) == 5
+        assert set(result[0]) == {"date", "ad_line", "ad_change", "position"}
 
-    def test_get_indicator_adx(self, service, mock_es):
-        self._mock_indicator_response(mock_es, "adx_stats", [{"date": "2025-01-10", "adx": 25}])
+    def test_get_indicator_adx(self, service):
         result = service.get_indicator_adx("stocks-eod", "AAPL", "2025-01-01", "2025-01-10", 14)
-        assert result == [{"date": "2025-01-10", "adx": 25}]
+        assert len(result) == 5
+        assert result[0]["adx"] is None
 
-    def test_get_indicator_cci(self, service, mock_es):
-        self._mock_indicator_response(mock_es, "cci_stats", [{"date": "2025-01-10", "cci": 50}])
-        result = service.get_indicator_cci("stocks-eod", "AAPL", "2025-01-01", "2025-01-10", 20, 0.015)
-        assert result == [{"date": "2025-01-10", "cci": 50}]
+    def test_get_indicator_cci(self, service):
+        result = service.get_indicator_cci("stocks-eod", "AAPL", "2025-01-01", "2025-01-10", 3, 0.015)
+        assert [r["cci"] is None for r in result] == [True, True, False, False, False]
 
-    def test_get_indicator_ema(self, service, mock_es):
-        self._mock_indicator_response(mock_es, "ema_stats", [{"date": "2025-01-10", "ema": 150}])
+    def test_get_indicator_ema(self, service):
         result = service.get_indicator_ema("stocks-eod", "AAPL", "2025-01-01", "2025-01-10", 12, 26)
-        assert result == [{"date": "2025-01-10", "ema": 150}]
+        assert result[0] == {"date": "2025-01-01", "ema_short": 10.0, "ema_long": 10.0, "position": -1}
 
-    def test_get_indicator_macd(self, service, mock_es):
-        self._mock_indicator_response(mock_es, "macd_stats", [{"date": "2025-01-10", "macd": 1.5}])
+    def test_get_indicator_macd(self, service):
         result = service.get_indicator_macd("stocks-eod", "AAPL", "2025-01-01", "2025-01-10", 12, 26, 9)
-        assert result == [{"date": "2025-01-10", "macd": 1.5}]
+        assert len(result) == 4
+        assert result[0]["date"] == "2025-01-02"
 
-    def test_get_indicator_obv(self, service, mock_es):
-        self._mock_indicator_response(mock_es, "obv_stats", [{"date": "2025-01-10", "obv": 500000}])
+    def test_get_indicator_obv(self, service):
         result = service.get_indicator_obv("stocks-eod", "AAPL", "2025-01-01", "2025-01-10")
-        assert result == [{"date": "2025-01-10", "obv": 500000}]
+        assert [r["obv"] for r in result] == [1000.0, 0.0, 1000.0, 2000.0]
 
-    def test_get_indicator_rsi(self, service, mock_es):
-        self._mock_indicator_response(mock_es, "rsi_stats", [{"date": "2025-01-10", "rsi": 62.35}])
+    def test_get_indicator_rsi(self, service):
         result = service.get_indicator_rsi("stocks-eod", "AAPL", "2025-01-01", "2025-01-10", 14)
-        assert result == [{"date": "2025-01-10", "rsi": 62.35}]
+        assert result[0] == {"date": "2025-01-01", "rsi": None, "position": None}
+        assert result[1]["rsi"] == 100.0
 
-    def test_get_indicator_stoch(self, service, mock_es):
-        self._mock_indicator_response(mock_es, "stoch_stats", [{"date": "2025-01-10", "stoch_k": 75}])
+    def test_get_indicator_stoch(self, service):
         result = service.get_indicator_stoch("stocks-eod", "AAPL", "2025-01-01", "2025-01-10", 14, 3, 3)
-        assert result == [{"date": "2025-01-10", "stoch_k": 75}]
+        assert len(result) == 5
+        assert set(result[0]) == {"date", "slow_k", "slow_d", "position"}
+
+    def test_empty_series_returns_empty(self, service, mock_es):
+        mock_es.search_template.return_value = {"hits": {"hits": []}}
+        assert service.get_indicator_rsi("stocks-eod", "AAPL", "2025-01-01", "2025-01-10", 14) == []
+
+
+class TestGetIndicatorsBulk:
+    def test_single_fetch_for_all_specs(self, service, mock_es):
+        mock_es.search_template.return_value = {"hits": {"hits": _make_ohlcv_hits()}}
+
+        result = service.get_indicators_bulk(
+            "stocks-eod",
+            "AAPL",
+            "2025-01-01",
+            "2025-01-10",
+            specs=[
+                {"indicator": "rsi", "period": 14},
+                {"indicator": "macd", "short_window": 12, "long_window": 26, "signal_window": 9},
+                {"indicator": "obv"},
+            ],
+        )
+
+        mock_es.search_template.assert_called_once()
+        assert set(result) == {"rsi", "macd", "obv"}
+        assert result["rsi"] == service.get_indicator_rsi("stocks-eod", "AAPL", "2025-01-01", "2025-01-10", 14)
+
+    def test_named_specs(self, service, mock_es):
+        mock_es.search_template.return_value = {"hits": {"hits": _make_ohlcv_hits()}}
+
+        result = service.get_indicators_bulk(
+            "stocks-eod",
+            "AAPL",
+            "2025-01-01",
+            "2025-01-10",
+            specs=[
+                {"indicator": "ema", "name": "ema_fast", "short_window": 5, "long_window": 10},
+                {"indicator": "ema", "name": "ema_slow", "short_window": 20, "long_window": 50},
+            ],
+        )
+
+        assert set(result) == {"ema_fast", "ema_slow"}
+
+
+class TestGetIndicatorsByTicker:
+    def test_single_query_for_all_tickers(self, service, mock_es):
+        hits = _make_ohlcv_hits("AAPL") + _make_ohlcv_hits("MSFT", closes=(50.0, 49.0, 48.0))
+        mock_es.search_template.return_value = {"hits": {"hits": hits}}
+
+        result = service.get_indicators_by_ticker(
+            "stocks-eod",
+            ["AAPL", "MSFT", "UNKNOWN"],
+            "2025-01-01",
+            "2025-01-10",
+            specs=[{"indicator": "obv"}],
+        )
+
+        mock_es.search_template.assert_called_once()
+        assert _extract_template_params(mock_es)["key_tickers"] == ["AAPL", "MSFT", "UNKNOWN"]
+        assert list(result) == ["AAPL", "MSFT", "UNKNOWN"]
+        assert [r["obv"] for r in result["AAPL"]["obv"]] == [1000.0, 0.0, 1000.0, 2000.0]
+        assert [r["obv"] for r in result["MSFT"]["obv"]] == [-1000.0, -2000.0]
+        assert result["UNKNOWN"] == {"obv": []}
+
+
+class TestAsyncMarketsStatsService:
+    @pytest.fixture
+    def async_es(self):
+        return AsyncMock()
+
+    @pytest.fixture
+    def async_service(self, async_es):
+        return AsyncMarketsStatsService(es=async_es)
+
+    @pytest.mark.asyncio
+    async def test_get_company_profile(self, async_service, async_es):
+        async_es.search_template.return_value = {
+            "hits": {"hits": [{"_source": {"key_ticker": "AAPL", "name": "Apple Inc"}}]}
+        }
+
+        result = await async_service.get_company_profile("stocks-metadata", "AAPL")
+
+        assert result["name"] == "Apple Inc"
+        async_es.search_template.assert_awaited_once()
+        body = async_es.search_template.call_args.kwargs["body"]
+        assert body["id"] == "get_metadata_profile_template"
+
+    @pytest.mark.asyncio
+    async def test_get_stats_close_bulk(self, async_service, async_es):
+        async_es.search_template.return_value = {
+            "aggregations": {"by_ticker": {"buckets": [
+                _make_bucket("AAPL", _make_stats()),
+                _make_bucket("EMPTY", None),
+            ]}}
+        }
+
+        result = await async_service.get_stats_close_bulk("stocks-eod", ["AAPL", "EMPTY"], "2026-01-01", "2026-03-05")
+
+        assert [r["key_ticker"] for r in result] == ["AAPL"]
+
+    @pytest.mark.asyncio
+    async def test_get_market_caps_bulk(self, async_service, async_es):
+        async_es.search_template.return_value = {
+            "aggregations": {"by_ticker": {"buckets": [_make_market_cap_bucket("AAPL", 3.0e12)]}}
+        }
+
+        result = await async_service.get_market_caps_bulk("stocks-metadata", ["AAPL"])
+
+        assert result == [{"key_ticker": "AAPL", "market_capitalization": 3.0e12}]
+
+    @pytest.mark.asyncio
+    async def test_get_indicators_by_ticker_pages(self, async_service, async_es, monkeypatch):
+        monkeypatch.setattr("app.services.markets_stats.OHLCV_PAGE_SIZE", 3)
+        hits = _make_ohlcv_hits("AAPL") + _make_ohlcv_hits("MSFT", closes=(50.0, 49.0, 48.0))
+        async_es.search_template.side_effect = [
+            {"hits": {"hits": hits[:3]}},
+            {"hits": {"hits": hits[3:6]}},
+            {"hits": {"hits": hits[6:]}},
+        ]
+
+        result = await async_service.get_indicators_by_ticker(
+            "stocks-eod",
+            ["AAPL", "MSFT"],
+            "2025-01-01",
+            "2025-01-10",
+            specs=[{"indicator": "obv"}],
+        )
+
+        assert async_es.search_template.await_count == 3
+        assert [r["obv"] for r in result["AAPL"]["obv"]] == [1000.0, 0.0, 1000.0, 2000.0]
+        assert [r["obv"] for r in result["MSFT"]["obv"]] == [-1000.0, -2000.0]
+
+    @pytest.mark.asyncio
+    async def test_matches_sync_service(self, async_service, async_es, service, mock_es):
+        response = {"hits": {"hits": _make_ohlcv_hits()}}
+        async_es.search_template.return_value = response
+        mock_es.search_template.return_value = response
+        specs = [{"indicator": "rsi", "period": 14}, {"indicator": "ad"}]
+
+        result = await async_service.get_indicators_bulk("stocks-eod", "AAPL", "2025-01-01", "2025-01-10", specs)
+
+        assert result == service.get_indicators_bulk("stocks-eod", "AAPL", "2025-01-01", "2025-01-10", specs)
+        assert async_es.search_template.call_args == mock_es.search_template.call_args
+
+
+class TestCachedAsyncMarketsStatsService:
+    @pytest.fixture
+    def async_es(self):
+        return AsyncMock()
+
+    @pytest.fixture
+    def result_cache(self):
+        return ResultCache(namespace="test:markets")
+
+    @pytest.fixture
+    def cached_service(self, async_es, result_cache):
+        return CachedAsyncMarketsStatsService(es=async_es, result_cache=result_cache)
+
+    @pytest.mark.asyncio
+    async def test_repeated_query_hits_elasticsearch_once(self, cached_service, async_es):
+        async_es.search_template.return_value = {
+            "aggregations": {"recent_stats": {"value": _make_stats()}}
+        }
+
+        first = await cached_service.get_stats_close("stocks-eod", "AAPL", "2026-01-01", "2026-03-05")
+        second = await cached_service.get_stats_close("stocks-eod", "AAPL", "2026-01-01", "2026-03-05")
+
+        assert first == second == _make_stats()
+        async_es.search_template.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_different_params_are_cached_separately(self, cached_service, async_es):
+        async_es.search_template.return_value = {
+            "hits": {"hits": [{"_source": {"key_ticker": "AAPL"}}]}
+        }
+
+        await cached_service.get_company_profile("stocks-metadata", "AAPL")
+        await cached_service.get_company_profile("stocks-metadata", "MSFT")
+
+        assert async_es.search_template.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_generation_bump_invalidates(self, cached_service, async_es, result_cache):
+        async_es.search_template.return_value = {
+            "aggregations": {"by_ticker": {"buckets": [_make_market_cap_bucket("AAPL", 3.0e12)]}}
+        }
+
+        await cached_service.get_market_caps_bulk("stocks-metadata", ["AAPL"])
+        await result_cache.bump_generation()
+        await cached_service.get_market_caps_bulk("stocks-metadata", ["AAPL"])
+
+        assert async_es.search_template.await_count == 2
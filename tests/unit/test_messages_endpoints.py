@@ -0,0 +1,202 @@
+"""Tests for the message posting and streaming endpoints."""
+
+import json
+import logging
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.domain.exceptions.base import TooManyRequestsError
+from app.interface.api.messages.endpoints import post_message, stream_message
+from app.interface.api.messages.schema import MessageRequest
+from app.services.agent_execution import TASK_FAILED_MESSAGE, AgentExecutionService
+from app.services.tasks import TaskProgress
+
+_post_message = post_message.__wrapped__
+_stream_message = stream_message.__wrapped__
+
+
+def _request():
+    return MessageRequest(
+        agent_id="agent-1", message_role="human", message_content="brief me"
+    )
+
+
+def _stored_message(message_id, role, content):
+    message = MagicMock()
+    message.id = message_id
+    message.is_active = True
+    message.created_at = "2025-01-15T10:31:00Z"
+    message.message_role = role
+    message.message_content = content
+    message.agent_id = "agent-1"
+    message.response_data = None
+    message.replies_to = "msg-human" if role == "assistant" else None
+    return message
+
+
+def _services(matching_agent):
+    agent_service = MagicMock()
+    agent_service.get_agent_by_id = AsyncMock(
+        return_value=MagicMock(agent_type="test_echo")
+    )
+    agent_registry = MagicMock()
+    agent_registry.get_agent.return_value = matching_agent
+    message_service = MagicMock()
+    message_service.create_message = AsyncMock(
+        side_effect=[
+            _stored_message("msg-human", "human", "brief me"),
+            _stored_message("msg-assistant", "assistant", "Markets rallied"),
+        ]
+    )
+    return agent_service, agent_registry, message_service
+
+
+async def _events(response):
+    body = "".join([chunk async for chunk in response.body_iterator])
+    events = []
+    for block in body.strip().split("\n\n"):
+        event, data = block.split("\n")
+        events.append(
+            (event.removeprefix("event: "), json.loads(data.removeprefix("data: ")))
+        )
+    return events
+
+
+class TestStreamMessage:
+    @pytest.mark.asyncio
+    async def test_streams_events_then_stored_message(self):
+        async def astream_message(message_request, schema, on_event):
+            await on_event(
+                TaskProgress(
+                    agent_id="agent-1",
+                    status="in_progress",
+                    event="node",
+                    node="reporter",
+                )
+            )
+            await on_event(
+                TaskProgress(
+                    agent_id="agent-1",
+                    status="in_progress",
+                    event="token",
+                    node="reporter",
+                    message_content="Markets",
+                )
+            )
+            return MagicMock(
+                message_content="Markets rallied",
+                response_data=None,
+                agent_id="agent-1",
+            )
+
+        matching_agent = MagicMock()
+        matching_agent.astream_message = astream_message
+        agent_service, agent_registry, message_service = _services(matching_agent)
+
+        response = await _stream_message(
+            _request(),
+            agent_service,
+            agent_registry,
+            message_service,
+            AgentExecutionService(MagicMock()),
+            None,
+        )
+
+        assert response.media_type == "text/event-stream"
+        events = await _events(response)
+        assert [event for event, _ in events] == ["started", "node", "token", "message"]
+        assert events[0][1] == {"agent_id": "agent-1", "replies_to": "msg-human"}
+        assert events[2][1]["message_content"] == "Markets"
+        assert events[3][1]["id"] == "msg-assistant"
+        assert (
+            message_service.create_message.call_args.kwargs["message_role"]
+            == "assistant"
+        )
+
+    @pytest.mark.asyncio
+    async def test_reports_failed_run(self, caplog):
+        matching_agent = MagicMock()
+        matching_agent.astream_message = AsyncMock(side_effect=RuntimeError("llm down"))
+        agent_service, agent_registry, message_service = _services(matching_agent)
+
+        response = await _stream_message(
+            _request(),
+            agent_service,
+            agent_registry,
+            message_service,
+            AgentExecutionService(MagicMock()),
+            None,
+        )
+
+        with caplog.at_level(
+            logging.ERROR, logger="app.interface.api.messages.endpoints"
+        ):
+            events = await _events(response)
+        # the client gets a generic message, the cause stays in the server log
+        assert events[-1] == ("error", {"detail": TASK_FAILED_MESSAGE})
+        assert "llm down" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_saturated_before_streaming(self):
+        agent_service, agent_registry, message_service = _services(MagicMock())
+        execution = MagicMock()
+        execution.reserve.side_effect = TooManyRequestsError(
+            "agent execution queue is full"
+        )
+
+        with pytest.raises(TooManyRequestsError):
+            await _stream_message(
+                _request(),
+                agent_service,
+                agent_registry,
+                message_service,
+                execution,
+                None,
+            )
+        message_service.create_message.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_releases_slot_when_human_message_is_not_stored(self):
+        agent_service, agent_registry, message_service = _services(MagicMock())
+        message_service.create_message = AsyncMock(side_effect=RuntimeError("db down"))
+        execution = AgentExecutionService(MagicMock())
+
+        with pytest.raises(RuntimeError):
+            await _stream_message(
+                _request(),
+                agent_service,
+                agent_registry,
+                message_service,
+                execution,
+                None,
+            )
+        assert execution.metrics()["async_in_flight"] == 0
+
+
+class TestPostMessage:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("sync", [False, True])
+    async def test_persists_nothing_when_saturated(self, sync):
+        agent_service, agent_registry, message_service = _services(MagicMock())
+        execution = AgentExecutionService(
+            MagicMock(), max_workers=1, queue_size=0, per_tenant_limit=1
+        )
+        execution.reserve("tenant_a")
+
+        with pytest.raises(TooManyRequestsError):
+            await _post_message(
+                _request(),
+                MagicMock(),
+                agent_service,
+                agent_registry,
+                message_service,
+                MagicMock(),
+                execution,
+                MagicMock(),
+                None,
+                sync=sync,
+                stream=False,
+            )
+        message_service.create_message.assert_not_called()
+        execution.shutdown()
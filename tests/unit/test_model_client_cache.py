@@ -0,0 +1,81 @@
+import threading
+from unittest.mock import MagicMock
+
+from app.infrastructure.cache.model_clients import ModelBinding, ModelClientCache
+
+
+def _binding(integration_id="int-1"):
+    return ModelBinding(
+        language_model_id="lm-1",
+        language_model_tag="gpt-test",
+        integration_id=integration_id,
+        integration_type="openai_api_v1",
+    )
+
+
+class TestModelClientCache:
+    def test_client_is_built_once_per_model_tag(self):
+        cache = ModelClientCache()
+        factory = MagicMock(side_effect=lambda: object())
+        credentials = ("http://llm", "key")
+
+        first = cache.client("int-1", "chat", "gpt-a", credentials, factory)
+        second = cache.client("int-1", "chat", "gpt-a", credentials, factory)
+        other = cache.client("int-1", "chat", "gpt-b", credentials, factory)
+
+        assert first is second
+        assert other is not first
+        assert factory.call_count == 2
+
+    def test_rotated_credentials_build_a_new_client(self):
+        cache = ModelClientCache()
+
+        first = cache.client("int-1", "chat", "gpt-a", ("http://llm", "old"), object)
+        second = cache.client("int-1", "chat", "gpt-a", ("http://llm", "new"), object)
+
+        assert first is not second
+
+    def test_concurrent_misses_share_one_load(self):
+        cache = ModelClientCache()
+        release = threading.Event()
+        calls = []
+
+        def load():
+            calls.append(1)
+            release.wait(5)
+            return _binding()
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(cache.binding("public", "agent-1", load))
+            )
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert results == [_binding()] * 4
+
+    def test_invalidate_integration_drops_derived_entries(self):
+        cache = ModelClientCache()
+        cache.binding("public", "agent-1", lambda: _binding("int-1"))
+        cache.binding("public", "agent-2", lambda: _binding("int-2"))
+        cache.client("int-1", "chat", "gpt-a", ("http://llm", "key"), object)
+
+        cache.invalidate_integration("int-1")
+
+        assert cache.metrics()["bindings"] == 1
+        assert cache.metrics()["clients"] == 0
+
+    def test_metrics_count_hits_and_misses(self):
+        cache = ModelClientCache()
+        cache.binding("public", "agent-1", _binding)
+        cache.binding("public", "agent-1", _binding)
+
+        assert cache.metrics()["hits"] == 1
+        assert cache.metrics()["misses"] == 1
@@ -1,11 +1,16 @@
 """Tests for QuaksNewsAnalystAgent."""
-from unittest.mock import MagicMock
+import json
+from unittest.mock import AsyncMock, MagicMock
 
+import pytest
 from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.checkpoint.memory import InMemorySaver
 from langgraph.constants import END
 
+from app.interface.api.messages.schema import MessageRequest
 from app.services.agent_types.base import AgentUtils
 from app.services.agent_types.quaks.insights.news.agent import QuaksNewsAnalystAgent
+from app.services.agent_types.quaks.insights.news.curation import NewsCurator
 
 
 def _make_agent_utils():
@@ -105,3 +110,183 @@ class TestStubMethods:
         agent = QuaksNewsAnalystAgent(utils, MagicMock(), MagicMock())
         result = agent.get_supervisor({})
         assert result.goto == END
+
+
+class TestAsyncWorkflow:
+    def test_async_builder_uses_coroutine_nodes(self):
+        utils = _make_agent_utils()
+        agent = QuaksNewsAnalystAgent(utils, MagicMock(), MagicMock())
+        builder = agent.get_async_workflow_builder("agent-1")
+        assert set(builder.nodes) == {"coordinator", "aggregator", "reporter"}
+        assert builder.compile() is not None
+
+    @pytest.mark.asyncio
+    async def test_coordinator_routes_briefing_without_llm(self):
+        utils = _make_agent_utils()
+        agent = QuaksNewsAnalystAgent(utils, MagicMock(), MagicMock())
+        agent.aget_chat_model = AsyncMock()
+        state = {"agent_id": "agent-1", "schema": "public", "query": "BATCH_ETL"}
+
+        result = await agent.aget_coordinator(state)
+
+        assert result.goto == "aggregator"
+        agent.aget_chat_model.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_aprocess_message_runs_graph_with_ainvoke(self):
+        utils = _make_agent_utils()
+        utils.graph_persistence_factory.build_async_checkpoint_saver = AsyncMock(
+            return_value=InMemorySaver()
+        )
+        markets_news_service = MagicMock()
+        markets_news_service.get_news.return_value = ([_hit("Fed holds rates", ["SPY"])], None)
+        agent = QuaksNewsAnalystAgent(utils, markets_news_service, MagicMock())
+        agent.get_input_params = MagicMock(
+            return_value={
+                "agent_id": "agent-1",
+                "schema": "public",
+                "query": "BATCH_ETL",
+                "aggregator_system_prompt": "aggregate",
+                "reporter_system_prompt": "report",
+                "messages": [HumanMessage(content="BATCH_ETL")],
+            }
+        )
+        agent.aget_chat_model = AsyncMock()
+        agent._ainvoke_chain = AsyncMock(
+            side_effect=[
+                AIMessage(content="articles", usage_metadata=_usage(1000, 800)),
+                AIMessage(content="<blockquote>Markets up</blockquote>", usage_metadata=_usage(900, 400)),
+            ]
+        )
+        request = MessageRequest(
+            agent_id="agent-1", message_role="human", message_content="BATCH_ETL"
+        )
+
+        message = await agent.aprocess_message(request, "public")
+
+        assert message.message_content == "<blockquote>Markets up</blockquote>"
+        assert message.response_data["executive_summary"] == "Markets up"
+        assert agent._ainvoke_chain.await_count == 2
+        markets_news_service.get_news.assert_called_once()
+        news_tokens = message.response_data["news_tokens"]
+        assert news_tokens["articles"] == 1
+        assert news_tokens["aggregator"] == {"input_tokens": 1000, "output_tokens": 800}
+        assert news_tokens["reporter"] == {"input_tokens": 900, "output_tokens": 400}
+        assert news_tokens["total_tokens"] == 3100
+
+    @pytest.mark.asyncio
+    async def test_qa_after_briefing_on_same_thread_drops_news_tokens(self):
+        utils = _make_agent_utils()
+        utils.graph_persistence_factory.build_async_checkpoint_saver = AsyncMock(
+            return_value=InMemorySaver()
+        )
+        utils.agent_setting_service.get_agent_settings.return_value = [
+            MagicMock(setting_key=key, setting_value=key)
+            for key in ("coordinator_system_prompt", "aggregator_system_prompt", "reporter_system_prompt")
+        ]
+        markets_news_service = MagicMock()
+        markets_news_service.get_news.return_value = ([_hit("Fed holds rates", ["SPY"])], None)
+        agent = QuaksNewsAnalystAgent(utils, markets_news_service, MagicMock())
+        agent.aget_chat_model = AsyncMock()
+        agent._ainvoke_chain = AsyncMock(
+            side_effect=[
+                AIMessage(content="articles", usage_metadata=_usage(1000, 800)),
+                AIMessage(content="<blockquote>Markets up</blockquote>", usage_metadata=_usage(900, 400)),
+            ]
+        )
+        coordinator = MagicMock()
+        coordinator.ainvoke = AsyncMock(return_value={"messages": [AIMessage(content="Rates are on hold.")]})
+        agent._coordinator_agent = MagicMock(return_value=coordinator)
+
+        briefing = await agent.aprocess_message(
+            MessageRequest(agent_id="agent-1", message_role="human", message_content="BATCH_ETL"), "public"
+        )
+        answer = await agent.aprocess_message(
+            MessageRequest(agent_id="agent-1", message_role="human", message_content="What did the Fed do?"),
+            "public",
+        )
+
+        assert briefing.response_data["news_tokens"]["total_tokens"] == 3100
+        assert answer.message_content == "Rates are on hold."
+        assert answer.response_data["executive_summary"] == ""
+        assert answer.response_data["news_tokens"] == {}
+
+
+def _hit(headline, tickers, content="Body"):
+    return {
+        "_source": {
+            "text_headline": headline,
+            "text_summary": "Summary",
+            "text_content": content,
+            "key_source": "benzinga",
+            "date_reference": "2025-01-10",
+            "key_ticker": tickers,
+        }
+    }
+
+
+def _usage(input_tokens, output_tokens):
+    return {
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+        "total_tokens": input_tokens + output_tokens,
+    }
+
+
+class TestAggregator:
+    def _agent(self, hits, curator=None):
+        markets_news_service = MagicMock()
+        markets_news_service.get_news.return_value = (hits, None)
+        return QuaksNewsAnalystAgent(_make_agent_utils(), markets_news_service, MagicMock(), curator)
+
+    def _state(self):
+        return {
+            "agent_id": "agent-1",
+            "schema": "public",
+            "aggregator_system_prompt": "aggregate",
+            "messages": [HumanMessage(content="BATCH_ETL")],
+        }
+
+    def test_sends_curated_articles_once(self):
+        agent = self._agent([
+            _hit("Apple beats earnings estimates on iPhone sales", ["AAPL"]),
+            _hit("Apple Beats Earnings Estimates On iPhone Sales", ["AAPL"]),
+            _hit("Fed holds rates steady", []),
+        ])
+        agent._invoke_chain = MagicMock(return_value=AIMessage(content="articles"))
+
+        result = agent.get_aggregator(self._state())
+
+        assert result.goto == "reporter"
+        agent.markets_news_service.get_news.assert_called_once()
+        assert agent.markets_news_service.get_news.call_args.kwargs["size"] == agent.news_curator.fetch_size
+        messages = agent._invoke_chain.call_args.args[3]["messages"]
+        articles = json.loads(messages[-1].content.split("\n", 1)[1])
+        assert [article["headline"] for article in articles] == [
+            "Apple beats earnings estimates on iPhone sales",
+            "Fed holds rates steady",
+        ]
+        assert result.update["messages"] == [AIMessage(content="articles")]
+        assert result.update["news_tokens"]["duplicates_removed"] == 1
+
+    def test_token_budget_bounds_articles(self):
+        companies = ["Apple", "Microsoft", "Nvidia", "Tesla", "Amazon", "Alphabet", "Meta", "Netflix", "Intel", "Oracle"]
+        hits = [_hit(f"{company} shares move on fresh guidance", [company], "word " * 1000) for company in companies]
+        agent = self._agent(hits, NewsCurator(token_budget=1000, article_max_tokens=300))
+        agent._invoke_chain = MagicMock(return_value=AIMessage(content="articles"))
+
+        result = agent.get_aggregator(self._state())
+
+        news_tokens = result.update["news_tokens"]
+        assert news_tokens["article_tokens"] <= 1000
+        assert news_tokens["duplicates_removed"] == 0
+        assert 0 < news_tokens["articles"] < 10
+        assert news_tokens["articles"] + news_tokens["dropped_over_budget"] == 10
+
+    def test_qa_mode_reports_no_news_tokens(self):
+        agent = self._agent([])
+        state = {"messages": [AIMessage(content="answer")]}
+
+        _, response_data = agent.format_response(state)
+
+        assert response_data["news_tokens"] == {}
@@ -0,0 +1,195 @@
+from app.services.agent_types.quaks.insights.news.curation import (
+    CHARS_PER_TOKEN,
+    NewsCurator,
+    estimate_tokens,
+    simhash,
+)
+
+
+def _article(
+    headline, tickers=(), source="benzinga", content="Body", summary="Summary"
+):
+    return {
+        "headline": headline,
+        "summary": summary,
+        "content": content,
+        "source": source,
+        "date": "2025-01-10",
+        "tickers": list(tickers),
+    }
+
+
+def _distance(a, b):
+    return bin(simhash(a) ^ simhash(b)).count("1")
+
+
+class TestSimhash:
+    def test_near_identical_headlines_are_close(self):
+        assert (
+            _distance(
+                "Apple beats earnings estimates on iPhone sales",
+                "Apple Beats Earnings Estimates On iPhone Sales!",
+            )
+            == 0
+        )
+        assert (
+            _distance(
+                "Fed holds interest rates steady, signals two cuts this year",
+                "Fed Holds Interest Rates Steady, Signals Two Cuts This Year - Reuters",
+            )
+            <= 10
+        )
+
+    def test_unrelated_headlines_are_far(self):
+        assert (
+            _distance(
+                "Apple beats earnings estimates on iPhone sales",
+                "Microsoft misses cloud revenue estimates",
+            )
+            > 10
+        )
+
+
+class TestDeduplication:
+    def test_keeps_first_copy_and_merges_tickers(self):
+        digest = NewsCurator().curate(
+            [
+                _article("Apple beats earnings estimates on iPhone sales", ["AAPL"]),
+                _article(
+                    "Apple beats earnings estimates on iPhone sales.",
+                    ["AAPL", "QCOM"],
+                    source="reuters",
+                ),
+            ]
+        )
+
+        assert digest.duplicates_removed == 1
+        assert len(digest.articles) == 1
+        assert digest.articles[0]["source"] == "benzinga"
+        assert digest.articles[0]["tickers"] == ["AAPL", "QCOM"]
+
+    def test_templated_headlines_about_other_tickers_are_kept(self):
+        digest = NewsCurator().curate(
+            [
+                _article("Apple shares rise after earnings", ["AAPL"]),
+                _article("Tesla shares rise after earnings", ["TSLA"]),
+            ]
+        )
+
+        assert digest.duplicates_removed == 0
+
+    def test_articles_without_headline_are_kept(self):
+        digest = NewsCurator().curate([_article(""), _article("")])
+
+        assert len(digest.articles) == 2
+
+    def test_does_not_mutate_input(self):
+        articles = [
+            _article("Apple beats earnings estimates", ["AAPL"]),
+            _article("Apple beats earnings estimates", ["AAPL", "QCOM"]),
+        ]
+
+        NewsCurator().curate(articles)
+
+        assert articles[0]["tickers"] == ["AAPL"]
+
+
+class TestRanking:
+    def test_widely_covered_tickers_rank_first(self):
+        digest = NewsCurator().curate(
+            [
+                _article("Oracle signs cloud deal", ["ORCL"]),
+                _article("Nvidia unveils new data center chip", ["NVDA"]),
+                _article("Chip stocks rally as Nvidia guides higher", ["NVDA", "AMD"]),
+                _article("Nvidia supplier lifts forecast", ["NVDA", "TSM"]),
+            ]
+        )
+
+        headlines = [article["headline"] for article in digest.articles]
+        assert headlines[-1] == "Oracle signs cloud deal"
+        assert headlines[0] in (
+            "Chip stocks rally as Nvidia guides higher",
+            "Nvidia supplier lifts forecast",
+        )
+
+    def test_source_weight_scales_score(self):
+        curator = NewsCurator(source_weights={"Reuters": 3.0})
+
+        digest = curator.curate(
+            [
+                _article("Oracle signs cloud deal", ["ORCL"]),
+                _article("Fed holds rates steady", [], source="reuters"),
+            ]
+        )
+
+        assert digest.articles[0]["headline"] == "Fed holds rates steady"
+
+    def test_equal_scores_keep_input_order(self):
+        digest = NewsCurator().curate(
+            [_article("First story"), _article("Second tale")]
+        )
+
+        assert [article["headline"] for article in digest.articles] == [
+            "First story",
+            "Second tale",
+        ]
+
+
+class TestTokenBudget:
+    def test_truncates_long_bodies_per_article(self):
+        digest = NewsCurator(article_max_tokens=50).curate(
+            [_article("Long read", content="word " * 1000)]
+        )
+
+        content = digest.articles[0]["content"]
+        assert content.endswith(" …")
+        assert estimate_tokens(content) <= 50
+        assert digest.tokens == sum(
+            estimate_tokens(str(value)) for value in digest.articles[0].values()
+        )
+
+    def test_short_bodies_are_untouched(self):
+        digest = NewsCurator().curate([_article("Short read", content="A short body.")])
+
+        assert digest.articles[0]["content"] == "A short body."
+
+    def test_stays_within_budget_and_counts_dropped(self):
+        companies = [
+            "Apple",
+            "Microsoft",
+            "Nvidia",
+            "Tesla",
+            "Amazon",
+            "Alphabet",
+            "Meta",
+            "Netflix",
+        ]
+        articles = [
+            _article(
+                f"{company} reports quarterly results",
+                [company.upper()],
+                content="x" * 4000,
+            )
+            for company in companies
+        ]
+
+        digest = NewsCurator(token_budget=500, article_max_tokens=200).curate(articles)
+
+        assert digest.tokens <= 500
+        assert len(digest.articles) == 3
+        assert (
+            digest.articles[-1]["content"].endswith(" …")
+            or len(digest.articles[-1]["content"]) < 4000
+        )
+        assert digest.dropped_over_budget == 5
+        assert digest.stats() == {
+            "fetched": 8,
+            "articles": 3,
+            "duplicates_removed": 0,
+            "dropped_over_budget": 5,
+            "article_tokens": digest.tokens,
+        }
+
+    def test_estimate_tokens(self):
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("x" * (CHARS_PER_TOKEN * 3 + 1)) == 4
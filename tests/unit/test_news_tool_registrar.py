@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -50,6 +50,14 @@ def _capturing_mcp():
     return mcp, tools, prompts, resources
 
 
+def _async_container():
+    """Container mock whose async markets services return awaitable mocks."""
+    container = MagicMock()
+    container.async_markets_news_service.return_value = AsyncMock()
+    container.async_markets_insights_service.return_value = AsyncMock()
+    return container
+
+
 def _news_hit(doc_id="n1", ticker=None, content=True):
     source = {
         "text_headline": "Tech Rally",
@@ -142,8 +150,8 @@ class TestNewsToolRegistrar:
 class TestGetMarketsNewsMcp:
     @pytest.mark.asyncio
     async def test_batch_default_omits_content(self):
-        container = MagicMock()
-        container.markets_news_service.return_value.get_news.return_value = (
+        container = _async_container()
+        container.async_markets_news_service.return_value.get_news.return_value = (
             [_news_hit(ticker=["AAPL"])],
             "cursor-1",
         )
@@ -156,14 +164,16 @@ class TestGetMarketsNewsMcp:
         assert result.items[0].content is None
         assert result.items[0].tickers == ["AAPL"]
         assert result.cursor == "cursor-1"
-        call_kwargs = container.markets_news_service.return_value.get_news.call_args[1]
+        call_kwargs = (
+            container.async_markets_news_service.return_value.get_news.call_args[1]
+        )
         assert call_kwargs["include_text_content"] is False
         assert call_kwargs["date_from"] is not None  # defaulted to yesterday
 
     @pytest.mark.asyncio
     async def test_batch_with_include_content_returns_full_body(self):
-        container = MagicMock()
-        container.markets_news_service.return_value.get_news.return_value = (
+        container = _async_container()
+        container.async_markets_news_service.return_value.get_news.return_value = (
             [_news_hit()],
             None,
         )
@@ -175,8 +185,8 @@ class TestGetMarketsNewsMcp:
 
     @pytest.mark.asyncio
     async def test_id_fetch_forces_full_content_and_skips_date_default(self):
-        container = MagicMock()
-        container.markets_news_service.return_value.get_news.return_value = (
+        container = _async_container()
+        container.async_markets_news_service.return_value.get_news.return_value = (
             [_news_hit(doc_id="single")],
             None,
         )
@@ -186,21 +196,28 @@ class TestGetMarketsNewsMcp:
         result = await tools["get_markets_news_mcp"](id="single")
 
         assert result.items[0].content == "Full content body"
-        call_kwargs = container.markets_news_service.return_value.get_news.call_args[1]
+        call_kwargs = (
+            container.async_markets_news_service.return_value.get_news.call_args[1]
+        )
         assert call_kwargs["id"] == "single"
         assert call_kwargs["date_from"] is None
         assert call_kwargs["include_text_content"] is True
 
     @pytest.mark.asyncio
     async def test_size_clamped_to_range(self):
-        container = MagicMock()
-        container.markets_news_service.return_value.get_news.return_value = ([], None)
+        container = _async_container()
+        container.async_markets_news_service.return_value.get_news.return_value = (
+            [],
+            None,
+        )
         mcp, tools, _, _ = _capturing_mcp()
         NewsToolRegistrar(_passthrough_resolver()).register_tools(mcp, container)
 
         await tools["get_markets_news_mcp"](size=15)
         assert (
-            container.markets_news_service.return_value.get_news.call_args[1]["size"]
+            container.async_markets_news_service.return_value.get_news.call_args[1][
+                "size"
+            ]
             == 15
         )
 
@@ -208,8 +225,8 @@ class TestGetMarketsNewsMcp:
 class TestGetInsightsNewsMcp:
     @pytest.mark.asyncio
     async def test_batch_without_report_html(self):
-        container = MagicMock()
-        container.markets_insights_service.return_value.get_insights_news.return_value = (
+        container = _async_container()
+        container.async_markets_insights_service.return_value.get_insights_news.return_value = (
             [_insights_hit(language_model_name="claude-opus-4-7")],
             "cur",
         )
@@ -225,8 +242,8 @@ class TestGetInsightsNewsMcp:
 
     @pytest.mark.asyncio
     async def test_include_report_html(self):
-        container = MagicMock()
-        container.markets_insights_service.return_value.get_insights_news.return_value = (
+        container = _async_container()
+        container.async_markets_insights_service.return_value.get_insights_news.return_value = (
             [_insights_hit()],
             None,
         )
@@ -238,8 +255,8 @@ class TestGetInsightsNewsMcp:
 
     @pytest.mark.asyncio
     async def test_id_fetch(self):
-        container = MagicMock()
-        container.markets_insights_service.return_value.get_insights_news.return_value = (
+        container = _async_container()
+        container.async_markets_insights_service.return_value.get_insights_news.return_value = (
             [_insights_hit(doc_id="brief-1")],
             None,
         )
@@ -247,11 +264,9 @@ class TestGetInsightsNewsMcp:
         NewsToolRegistrar(_passthrough_resolver()).register_tools(mcp, container)
 
         await tools["get_insights_news_mcp"](id="brief-1")
-        call_kwargs = (
-            container.markets_insights_service.return_value.get_insights_news.call_args[
-                1
-            ]
-        )
+        call_kwargs = container.async_markets_insights_service.return_value.get_insights_news.call_args[
+            1
+        ]
         assert call_kwargs["id"] == "brief-1"
 
 
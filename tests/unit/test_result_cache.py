@@ -0,0 +1,122 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.infrastructure.cache.result_cache import LRUCache, ResultCache
+
+
+class TestLRUCache:
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(max_entries=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_expires_entries(self):
+        cache = LRUCache(max_entries=2, ttl=60)
+        with patch(
+            "app.infrastructure.cache.result_cache.time.monotonic", return_value=0
+        ):
+            cache.set("a", 1)
+        with patch(
+            "app.infrastructure.cache.result_cache.time.monotonic", return_value=61
+        ):
+            assert cache.get("a", "missing") == "missing"
+        assert len(cache) == 0
+
+
+class TestResultCache:
+    @pytest.fixture
+    def cache(self):
+        return ResultCache(namespace="test")
+
+    def test_key_normalizes_param_order(self, cache):
+        assert cache.key("1", "get", {"a": 1, "b": [2]}) == cache.key(
+            "1", "get", {"b": [2], "a": 1}
+        )
+        assert cache.key("1", "get", {"a": 1}) != cache.key("2", "get", {"a": 1})
+        assert cache.key("1", "get", {"a": 1}) != cache.key("1", "other", {"a": 1})
+
+    @pytest.mark.asyncio
+    async def test_loads_once(self, cache):
+        loader = AsyncMock(return_value={"v": 1})
+
+        assert await cache.get_or_load("get", loader, ticker="AAPL") == {"v": 1}
+        assert await cache.get_or_load("get", loader, ticker="AAPL") == {"v": 1}
+
+        loader.assert_awaited_once_with(ticker="AAPL")
+        assert cache.metrics()["hits"] == 1
+        assert cache.metrics()["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_load(self, cache):
+        release = asyncio.Event()
+        calls = 0
+
+        async def loader(ticker):
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return ticker
+
+        pending = [
+            asyncio.create_task(cache.get_or_load("get", loader, ticker="AAPL"))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*pending) == ["AAPL"] * 3
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self, cache):
+        loader = AsyncMock(side_effect=[RuntimeError("es down"), "ok"])
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_load("get", loader)
+
+        assert await cache.get_or_load("get", loader) == "ok"
+
+    @pytest.mark.asyncio
+    async def test_generation_reads_shared_counter(self):
+        cache = ResultCache(
+            namespace="test", redis_url="redis://localhost:6379/0", shared=True
+        )
+        cache.redis = AsyncMock()
+        cache.redis.get.return_value = b"5"
+
+        generation = await cache.generation()
+        await cache.generation()
+
+        assert generation.startswith("5.")
+        cache.redis.get.assert_awaited_once_with("test:generation")
+
+    @pytest.mark.asyncio
+    async def test_shared_tier_is_used_on_local_miss(self):
+        cache = ResultCache(
+            namespace="test", redis_url="redis://localhost:6379/0", shared=True
+        )
+        cache.redis = AsyncMock()
+        cache.redis.get.side_effect = [b"1", b'{"v": 2}']
+        loader = AsyncMock()
+
+        assert await cache.get_or_load("get", loader) == {"v": 2}
+        loader.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_shared_tier_failure_falls_back_to_loader(self):
+        cache = ResultCache(
+            namespace="test", redis_url="redis://localhost:6379/0", shared=True
+        )
+        cache.redis = AsyncMock()
+        cache.redis.get.side_effect = ConnectionError("redis down")
+        cache.redis.set.side_effect = ConnectionError("redis down")
+
+        assert await cache.get_or_load("get", AsyncMock(return_value=3)) == 3
@@ -0,0 +1,114 @@
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.infrastructure.cache.secret_cache import SecretCache
+
+
+def _vault(*values, lease_duration=0):
+    vault_client = MagicMock()
+    vault_client.secrets.kv.read_secret_version.side_effect = [
+        {"data": {"data": value}, "lease_duration": lease_duration} for value in values
+    ]
+    return vault_client
+
+
+def _at(seconds):
+    return patch(
+        "app.infrastructure.cache.secret_cache.time.monotonic", return_value=seconds
+    )
+
+
+class TestSecretCache:
+    def test_hot_reads_are_served_from_memory(self):
+        vault_client = _vault({"api_key": "k1"})
+        cache = SecretCache(vault_client)
+
+        assert cache.read("integration_1") == {"api_key": "k1"}
+        assert cache.read("integration_1") == {"api_key": "k1"}
+
+        vault_client.secrets.kv.read_secret_version.assert_called_once_with(
+            path="integration_1", raise_on_deleted_version=False
+        )
+        assert cache.metrics()["hits"] == 1
+        assert cache.metrics()["misses"] == 1
+
+    def test_refreshes_in_background_before_expiry(self):
+        vault_client = _vault({"api_key": "k1"}, {"api_key": "k2"})
+        cache = SecretCache(vault_client, ttl=300, refresh_ahead=60)
+        cache._executor = MagicMock()
+        cache._executor.submit.side_effect = lambda fn, *args: fn(*args)
+
+        with _at(0):
+            cache.read("integration_1")
+        with _at(250):
+            # served from memory while the refresh runs
+            assert cache.read("integration_1") == {"api_key": "k1"}
+        with _at(260):
+            assert cache.read("integration_1") == {"api_key": "k2"}
+
+        assert cache.metrics()["refreshes"] == 1
+        assert cache.metrics()["misses"] == 1
+
+    def test_failed_refresh_keeps_serving_until_expiry(self):
+        vault_client = _vault({"api_key": "k1"})
+        vault_client.secrets.kv.read_secret_version.side_effect = [
+            {"data": {"data": {"api_key": "k1"}}},
+            ConnectionError("vault down"),
+            ConnectionError("vault down"),
+        ]
+        cache = SecretCache(vault_client, ttl=300, refresh_ahead=60)
+        cache._executor = MagicMock()
+        cache._executor.submit.side_effect = lambda fn, *args: fn(*args)
+
+        with _at(0):
+            cache.read("integration_1")
+        with _at(250):
+            assert cache.read("integration_1") == {"api_key": "k1"}
+        with _at(301), pytest.raises(ConnectionError):
+            cache.read("integration_1")
+
+        assert cache.metrics()["refresh_failures"] == 1
+
+    def test_lease_duration_sets_lifetime(self):
+        vault_client = _vault({"api_key": "k1"}, {"api_key": "k2"}, lease_duration=30)
+        cache = SecretCache(vault_client, ttl=300)
+
+        with _at(0):
+            cache.read("integration_1")
+        with _at(31):
+            assert cache.read("integration_1") == {"api_key": "k2"}
+
+    def test_concurrent_misses_share_one_read(self):
+        release = threading.Event()
+        vault_client = MagicMock()
+
+        def read_secret_version(path, raise_on_deleted_version):
+            release.wait(5)
+            return {"data": {"data": {"api_key": "k1"}}}
+
+        vault_client.secrets.kv.read_secret_version.side_effect = read_secret_version
+        cache = SecretCache(vault_client)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.read("integration_1")))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert results == [{"api_key": "k1"}] * 4
+        vault_client.secrets.kv.read_secret_version.assert_called_once()
+
+    def test_put_primes_the_cache(self):
+        vault_client = MagicMock()
+        cache = SecretCache(vault_client)
+
+        cache.put("integration_1", {"api_key": "k1"})
+
+        assert cache.read("integration_1") == {"api_key": "k1"}
+        vault_client.secrets.kv.read_secret_version.assert_not_called()
@@ -1,6 +1,7 @@
+import asyncio
 from unittest.mock import MagicMock, patch
 import pytest
-from app.services.tasks import TaskNotificationService, TaskProgress
+from app.services.tasks import TaskNotificationService, TaskProgress, TaskUpdateStream
 
 @pytest.fixture
 def mock_redis():
@@ -36,3 +37,44 @@ def test_close(service, mock_redis):
     mock_redis.pubsub.return_value.unsubscribe.assert_called_once()
     mock_redis.pubsub.return_value.close.assert_called_once()
     mock_redis.close.assert_called_once()
+
+
+def _token(content, node="reporter"):
+    return TaskProgress(agent_id="agent-1", status="in_progress", event="token", node=node, message_content=content)
+
+
+def _published(service):
+    return [call.kwargs["task_progress"] for call in service.publish_update.call_args_list]
+
+
+@pytest.mark.asyncio
+async def test_update_stream_merges_tokens_per_node():
+    notifications = MagicMock()
+
+    async with TaskUpdateStream(notifications, task_id="task-1", interval=60) as updates:
+        await updates.send(_token("Markets"))
+        await updates.send(_token(" rallied"))
+        await updates.send(TaskProgress(agent_id="agent-1", status="in_progress", event="node", node="editor"))
+        await updates.send(_token("Done", node="editor"))
+
+    published = _published(notifications)
+    assert [(p.event, p.node, p.message_content) for p in published] == [
+        ("token", "reporter", "Markets rallied"),
+        ("node", "editor", None),
+        ("token", "editor", "Done"),
+    ]
+    assert {p.task_id for p in published} == {"task-1"}
+
+
+@pytest.mark.asyncio
+async def test_update_stream_publishes_tokens_every_interval():
+    notifications = MagicMock()
+    updates = TaskUpdateStream(notifications, interval=0.01)
+
+    await updates.send(_token("Markets"))
+    await asyncio.sleep(0.02)
+    await updates.send(_token(" rallied"))
+
+    assert [p.message_content for p in _published(notifications)] == ["Markets rallied"]
+    await updates.flush()
+    assert len(_published(notifications)) == 1
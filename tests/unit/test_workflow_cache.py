@@ -0,0 +1,154 @@
+import timeit
+from unittest.mock import MagicMock
+
+import pytest
+
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.checkpoint.memory import InMemorySaver
+
+from app.services.agent_types.base import ReactAgentContext
+from app.services.agent_types.quaks.insights.financial_analyst.v1.agent import (
+    QuaksFinancialAnalystV1Agent,
+)
+
+
+class _ToolCallingFakeChatModel(GenericFakeChatModel):
+    seen: list = []
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+    def _generate(self, messages, *args, **kwargs):
+        self.seen.append(messages)
+        return super()._generate(messages, *args, **kwargs)
+
+
+def _fake_chat_model(reply: str):
+    return _ToolCallingFakeChatModel(messages=iter([AIMessage(content=reply)]), seen=[])
+
+
+def _agent():
+    return QuaksFinancialAnalystV1Agent(MagicMock(), MagicMock(), MagicMock())
+
+
+def _qa_state(agent_id="agent-1"):
+    return {
+        "agent_id": agent_id,
+        "schema": "tenant_a",
+        "query": "What is a P/E ratio?",
+        "tickers": [],
+        "coordinator_system_prompt": f"coordinator prompt for {agent_id}",
+        "messages": [HumanMessage(content="What is a P/E ratio?")],
+    }
+
+
+class TestCompiledWorkflow:
+    def test_compiles_once_and_binds_each_checkpointer(self):
+        agent = _agent()
+        agent.get_workflow_builder = MagicMock(wraps=agent.get_workflow_builder)
+        first_saver, second_saver = InMemorySaver(), InMemorySaver()
+
+        first = agent.get_compiled_workflow("agent-1", first_saver)
+        second = agent.get_compiled_workflow("agent-2", second_saver)
+
+        agent.get_workflow_builder.assert_called_once()
+        assert first.checkpointer is first_saver
+        assert second.checkpointer is second_saver
+        assert first.nodes.keys() == second.nodes.keys()
+
+    def test_sync_and_async_graphs_are_cached_separately(self):
+        agent = _agent()
+
+        sync_workflow = agent.get_compiled_workflow("agent-1", InMemorySaver())
+        async_workflow = agent.get_compiled_workflow(
+            "agent-1", InMemorySaver(), asynchronous=True
+        )
+
+        assert agent._compiled_workflows[False] is not agent._compiled_workflows[True]
+        assert sync_workflow.nodes.keys() == async_workflow.nodes.keys()
+
+
+class TestReactAgent:
+    def test_tools_are_built_once(self):
+        agent = _agent()
+        build_tools = MagicMock(return_value=[])
+
+        first = agent.get_react_agent("helper", build_tools)
+        second = agent.get_react_agent("helper", build_tools)
+
+        assert first is second
+        build_tools.assert_called_once()
+
+    def test_model_and_prompt_come_from_context(self):
+        agent = _agent()
+        chat_model = _fake_chat_model("answer")
+
+        result = agent.get_react_agent("helper", lambda: []).invoke(
+            {"messages": [HumanMessage(content="question")]},
+            context=ReactAgentContext(chat_model=chat_model, system_prompt="be brief"),
+        )
+
+        assert result["messages"][-1].content == "answer"
+        assert chat_model.seen[0][0].content == "be brief"
+        assert chat_model.seen[0][1].content == "question"
+
+    def test_cached_graph_serves_different_agents(self):
+        agent = _agent()
+        models = {
+            "agent-1": _fake_chat_model("one"),
+            "agent-2": _fake_chat_model("two"),
+        }
+        agent.get_chat_model = lambda agent_id, schema: models[agent_id]
+
+        for agent_id in ("agent-1", "agent-2"):
+            workflow = agent.get_compiled_workflow(agent_id, InMemorySaver())
+            result = workflow.invoke(
+                _qa_state(agent_id), {"configurable": {"thread_id": agent_id}}
+            )
+
+            assert (
+                result["messages"][-1].content
+                == {"agent-1": "one", "agent-2": "two"}[agent_id]
+            )
+            assert (
+                models[agent_id].seen[0][0].content
+                == f"coordinator prompt for {agent_id}"
+            )
+
+
+@pytest.mark.benchmark
+class TestConstructionOverhead:
+    """Benchmark of the graph construction work removed from each message."""
+
+    ROUNDS = 20
+    REPEATS = 5
+
+    def _per_message_ms(self, build) -> float:
+        # best of several runs, to keep scheduler noise out of the figure
+        return (
+            min(timeit.repeat(build, number=self.ROUNDS, repeat=self.REPEATS))
+            / self.ROUNDS
+            * 1000
+        )
+
+    def test_cached_construction_cost(self):
+        agent = _agent()
+
+        def uncached():
+            agent.get_workflow_builder("agent-1").compile(checkpointer=InMemorySaver())
+            agent._react_agents.clear()
+            agent._coordinator_agent()
+
+        def cached():
+            agent.get_compiled_workflow("agent-1", InMemorySaver())
+            agent._coordinator_agent()
+
+        cached()
+        uncached_ms = self._per_message_ms(uncached)
+        cached_ms = self._per_message_ms(cached)
+
+        print(
+            f"\nworkflow construction per message: {uncached_ms:.2f} ms uncached, "
+            f"{cached_ms:.3f} ms cached ({uncached_ms - cached_ms:.2f} ms saved)"
+        )